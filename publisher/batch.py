@@ -0,0 +1,597 @@
+"""
+batch.py
+
+Validates and publishes many scenes without the publisher interface. The
+checks configured for a task in a plugin's QA config, or given directly,
+are run on each file by a pool of headless DCC processes. Each process opens
+its files one after the other and publishes each one with its own `Manager`.
+The results are gathered in a JSON and an HTML report.
+
+A process that crashes or gets stuck is killed. The file it was publishing is
+reported as "error" or "timeout", and its remaining files are sent to a new
+process.
+
+The "stand-in" DCC runs the checks of `publisher.examples.batch_stand_in` on
+JSON scenes with the current Python, to try the batch without Maya.
+
+Usage:
+    python -m publisher.batch @layout_shots.txt --plugin task_schema.plugins.gwaio_plugin:GwaioProjectPlugin --task layout --workers 4 --json report.json --html report.html
+    python -m publisher.batch scenes/*.json --dcc stand-in --checks CheckRepeatedNameNodes CheckPastedNodes
+"""
+
+import argparse
+import html
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from importlib import import_module
+from pathlib import Path
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+
+logger: logging = logging.getLogger(__name__)
+
+# Prefix of the result lines written by the workers, as DCCs and checks may
+# print anything else to the standard output
+RESULT_PREFIX = "GWAIO_BATCH_RESULT "
+
+# Lines of the worker error output kept for the report
+STDERR_LINES = 20
+
+# Seconds to wait for the output of a finished worker, which a process it
+# started may keep open
+READER_TIMEOUT = 5.0
+
+# Root of the repository, added to the PYTHONPATH of the workers
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class DCC(NamedTuple):
+    """
+    Headless application the files are published with.
+
+    Attributes:
+        executable (str): Python interpreter of the application, such as mayapy.
+        checks_module (str): Module the check classes are read from.
+        opener (str): 'module:function' opening a file, returning the value set
+            as "scene" in the context.
+    """
+
+    executable: str
+    checks_module: str
+    opener: str
+
+
+DCCS: Dict[str, DCC] = {
+    "maya": DCC(
+        "mayapy", "publisher.utils.maya_checks", "publisher.batch:open_maya_scene"
+    ),
+    "stand-in": DCC(
+        sys.executable,
+        "publisher.examples.batch_stand_in",
+        "publisher.examples.batch_stand_in:open_scene",
+    ),
+}
+
+FILE_STATUSES = ("success", "warning", "failed", "error", "timeout")
+
+_maya_initialized = False
+
+
+def open_maya_scene(path: str) -> None:
+    """
+    Opens a scene in a standalone Maya session, starting it the first time.
+
+    Args:
+        path (str): The scene.
+    """
+    global _maya_initialized
+    if not _maya_initialized:
+        import maya.standalone  # type: ignore
+
+        maya.standalone.initialize(name="python")
+        _maya_initialized = True
+    import maya.cmds as cmds  # type: ignore
+
+    cmds.file(path, open=True, force=True)
+
+
+def _load_function(path: str) -> Callable:
+    module_name, _, function_name = path.partition(":")
+    if not function_name:
+        raise ValueError(f"Function must be 'module:function', got '{path}'")
+    return getattr(import_module(module_name), function_name)
+
+
+def load_processes(module_name: str, names: List[str]) -> List[Type]:
+    """
+    Imports the process classes of a module. The publisher modules import
+    the core as the top-level `core`, as they do inside the DCCs, which is
+    made the same module as `publisher.core`.
+
+    Args:
+        module_name (str): The module, such as "publisher.utils.maya_checks".
+        names (List[str]): Class names of the processes, in registration order.
+
+    Returns:
+        List[Type]: The classes.
+
+    Raises:
+        ValueError: If a class isn't found in the module.
+    """
+    from publisher import core
+
+    sys.modules.setdefault("core", core)
+    module = import_module(module_name)
+    missing = [name for name in names if not hasattr(module, name)]
+    if missing:
+        raise ValueError(
+            f"Unknown processes in {module_name}: {', '.join(missing)}"
+        )
+    return [getattr(module, name) for name in names]
+
+
+def _process_result(process: Any) -> Dict[str, Any]:
+    from publisher.core import StatusProcess, process_stage
+
+    status_names = {
+        StatusProcess.UNINITIALIZED: "not run",
+        StatusProcess.EXECUTING: "executing",
+        StatusProcess.SUCCESS: "success",
+        StatusProcess.WARNING: "warning",
+        StatusProcess.FAILED: "failed",
+    }
+    return {
+        "name": process.name,
+        "stage": process_stage(process),
+        "compulsory": process.compulsory,
+        "status": status_names.get(process.status, str(process.status)),
+        "wall": process.timing.wall if process.timing is not None else None,
+        "errors": [
+            {"error": e.error, "details": e.details, "items": e.items}
+            for e in process.errors
+        ],
+    }
+
+
+def publish_file(
+    path: str,
+    processes: List[Type],
+    opener: Callable[[str], Any],
+    max_workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    Opens a file and publishes it with a new manager. Runs in the worker.
+
+    Args:
+        path (str): The file, set as "file" in the context.
+        processes (List[Type]): Process classes to register.
+        opener (Callable[[str], Any]): Opens the file, returning the "scene".
+        max_workers (int): Worker threads of the manager.
+
+    Returns:
+        Dict[str, Any]: The status, error and processes of the file.
+    """
+    from publisher.core import Manager
+
+    start = time.perf_counter()
+    result = {"file": path, "status": "success", "error": None, "processes": []}
+    try:
+        scene = opener(path)
+    except Exception as e:
+        logger.exception(f"Cannot open {path}")
+        result.update(status="error", error=f"Cannot open file: {e}")
+        result["wall"] = time.perf_counter() - start
+        return result
+
+    manager = Manager(max_workers=max_workers)
+    manager.context.set_data("file", path)
+    manager.context.set_data("scene", scene)
+    for process in processes:
+        manager.register(process)
+    try:
+        manager.publish()
+    except Exception as e:
+        result.update(status="failed", error=str(e))
+
+    for stage in manager.processes().values():
+        result["processes"].extend(_process_result(p) for p in stage)
+    statuses = {p["status"] for p in result["processes"]}
+    if result["status"] == "success" and "failed" in statuses:
+        result["status"] = "failed"
+    elif result["status"] == "success" and "warning" in statuses:
+        result["status"] = "warning"
+    result["wall"] = time.perf_counter() - start
+    return result
+
+
+def run_worker(job: Dict[str, Any], output: Any = None) -> None:
+    """
+    Publishes the files of a job, writing a result line after each one.
+
+    Args:
+        job (Dict[str, Any]): "files", "processes", "checks_module", "opener"
+            and "max_workers", as sent by `run_batch`.
+        output (Any): Stream of the result lines, stdout if None.
+    """
+    output = output or sys.stdout
+
+    def write(result: Dict[str, Any]) -> None:
+        output.write(RESULT_PREFIX + json.dumps(result, default=str) + "\n")
+        output.flush()
+
+    try:
+        processes = load_processes(job["checks_module"], job["processes"])
+        opener = _load_function(job["opener"])
+    except Exception as e:
+        logger.exception("Cannot load the publish processes")
+        for path in job["files"]:
+            write(
+                {"file": path, "status": "error", "error": str(e), "processes": []}
+            )
+        return
+    for path in job["files"]:
+        write(publish_file(path, processes, opener, job.get("max_workers", 1)))
+
+
+def _worker_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    paths = env.get("PYTHONPATH", "").split(os.pathsep)
+    env["PYTHONPATH"] = os.pathsep.join([os.fspath(ROOT)] + [p for p in paths if p])
+    return env
+
+
+def _read_lines(stream: Any, lines: Any) -> None:
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def _read_tail(stream: Any, tail: deque, lock: threading.Lock) -> None:
+    for line in stream:
+        with lock:
+            tail.append(line)
+
+
+def _path_key(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _run_files(
+    files: List[str], job: Dict[str, Any], dcc: DCC, timeout: float
+) -> List[Dict[str, Any]]:
+    """
+    Publishes files in worker processes, starting a new one for the files left
+    when a worker crashes or gets stuck.
+
+    Args:
+        files (List[str]): The files.
+        job (Dict[str, Any]): The job without its files.
+        dcc (DCC): The application.
+        timeout (float): Seconds a file can take.
+
+    Returns:
+        List[Dict[str, Any]]: The result of each file.
+    """
+    results: List[Dict[str, Any]] = list()
+    remaining = list(files)
+    while remaining:
+        worker = subprocess.Popen(
+            [dcc.executable, "-m", "publisher.batch", "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=_worker_env(),
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+        lines: SimpleQueue = SimpleQueue()
+        stderr: deque = deque(maxlen=STDERR_LINES)
+        stderr_lock = threading.Lock()
+        readers = [
+            threading.Thread(target=target, args=args, daemon=True)
+            for target, args in (
+                (_read_lines, (worker.stdout, lines)),
+                (_read_tail, (worker.stderr, stderr, stderr_lock)),
+            )
+        ]
+        for reader in readers:
+            reader.start()
+        worker.stdin.write(json.dumps(dict(job, files=remaining)))
+        worker.stdin.close()
+
+        status = None
+        deadline = time.monotonic() + timeout
+        while remaining:
+            try:
+                line = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except Empty:
+                status = "timeout"
+                worker.kill()
+                break
+            if line is None:
+                status = "error"
+                break
+            if not line.startswith(RESULT_PREFIX):
+                continue
+            result = json.loads(line[len(RESULT_PREFIX):])
+            key = _path_key(str(result.get("file")))
+            path = next((p for p in remaining if _path_key(p) == key), None)
+            if path is None:
+                logger.warning(f"Ignoring a result for {result.get('file')}")
+                continue
+            remaining.remove(path)
+            result["file"] = path
+            results.append(result)
+            deadline = time.monotonic() + timeout
+        worker.wait()
+        for reader in readers:
+            reader.join(READER_TIMEOUT)
+        with stderr_lock:
+            output = "".join(stderr)
+
+        if status is not None and remaining:
+            path = remaining.pop(0)
+            if status == "timeout":
+                error = f"No result after {timeout}s, the worker was killed"
+            else:
+                error = f"Worker exited with code {worker.returncode}"
+            logger.error(f"{path}: {error}")
+            results.append(
+                {
+                    "file": path,
+                    "status": status,
+                    "error": error,
+                    "output": output,
+                    "processes": [],
+                }
+            )
+    return results
+
+
+def run_batch(
+    files: List[str],
+    checks: List[str],
+    dcc: DCC = DCCS["maya"],
+    workers: int = 4,
+    files_per_worker: int = 10,
+    timeout: float = 1800.0,
+    max_workers: int = 1,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Publishes files across a pool of headless DCC processes.
+
+    Args:
+        files (List[str]): The files.
+        checks (List[str]): Class names of the processes to run on each file.
+        dcc (DCC): The application.
+        workers (int): Processes running at the same time.
+        files_per_worker (int): Files published by a process before it exits,
+            to share the startup of the application.
+        timeout (float): Seconds a file can take before its process is killed.
+        max_workers (int): Worker threads of each manager.
+        on_result (Optional[Callable[[Dict[str, Any]], None]]): Called with the
+            result of each file as it finishes.
+
+    Returns:
+        Dict[str, Any]: The report, with the results in the order of `files`.
+    """
+    start = time.perf_counter()
+    created = datetime.now().isoformat(timespec="seconds")
+    job = {
+        "processes": list(checks),
+        "checks_module": dcc.checks_module,
+        "opener": dcc.opener,
+        "max_workers": max_workers,
+    }
+    size = max(1, files_per_worker)
+    chunks = [files[i:i + size] for i in range(0, len(files), size)]
+    by_file: Dict[str, Dict[str, Any]] = dict()
+    with ThreadPoolExecutor(max(1, workers)) as pool:
+        futures = [
+            pool.submit(_run_files, chunk, job, dcc, timeout) for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            for result in future.result():
+                by_file[result["file"]] = result
+                if on_result is not None:
+                    on_result(result)
+
+    results = [by_file[path] for path in files]
+    summary = {status: 0 for status in FILE_STATUSES}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    return {
+        "created": created,
+        "wall": time.perf_counter() - start,
+        "dcc": dcc._asdict(),
+        "checks": list(checks),
+        "summary": summary,
+        "files": results,
+    }
+
+
+def write_json_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Writes a batch report as JSON.
+
+    Args:
+        report (Dict[str, Any]): The report of `run_batch`.
+        path (str): File to write.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, default=str)
+
+
+def _items_html(items: List[Any]) -> str:
+    if not items:
+        return ""
+    rows = list()
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            item = ", ".join(map(str, item))
+        rows.append(f"<li>{html.escape(str(item))}</li>")
+    return f"<ul>{''.join(rows)}</ul>"
+
+
+def write_html_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Writes a batch report as an HTML page, one row per file with the errors
+    of its processes.
+
+    Args:
+        report (Dict[str, Any]): The report of `run_batch`.
+        path (str): File to write.
+    """
+    rows = list()
+    for result in report["files"]:
+        errors = list()
+        if result.get("error"):
+            errors.append(f"<p>{html.escape(result['error'])}</p>")
+        for process in result["processes"]:
+            for error in process["errors"]:
+                errors.append(
+                    f"<p><b>{html.escape(process['name'])}</b>: "
+                    f"{html.escape(str(error['error']))} - "
+                    f"{html.escape(str(error['details']))}</p>"
+                    f"{_items_html(error['items'])}"
+                )
+        if result.get("output"):
+            errors.append(f"<pre>{html.escape(result['output'])}</pre>")
+        wall = result.get("wall")
+        rows.append(
+            f"<tr class=\"{result['status']}\">"
+            f"<td>{html.escape(result['file'])}</td>"
+            f"<td>{result['status']}</td>"
+            f"<td>{'' if wall is None else f'{wall:.1f}s'}</td>"
+            f"<td>{''.join(errors)}</td></tr>"
+        )
+    summary = ", ".join(
+        f"{count} {status}" for status, count in report["summary"].items()
+    )
+    page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Batch publish {html.escape(report['created'])}</title>
+<style>
+body {{ font-family: sans-serif; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td, th {{ border: 1px solid #ccc; padding: 4px; text-align: left; }}
+td {{ vertical-align: top; }}
+tr.success td:nth-child(2) {{ color: #2a7d2a; }}
+tr.warning td:nth-child(2) {{ color: #b08000; }}
+tr.failed td:nth-child(2), tr.error td:nth-child(2),
+tr.timeout td:nth-child(2) {{ color: #c02020; }}
+p {{ margin: 0 0 4px 0; }}
+</style>
+</head>
+<body>
+<h1>Batch publish {html.escape(report['created'])}</h1>
+<p>{len(report['files'])} files in {report['wall']:.1f}s: {html.escape(summary)}</p>
+<p>Checks: {html.escape(', '.join(report['checks']))}</p>
+<table>
+<tr><th>File</th><th>Status</th><th>Time</th><th>Errors</th></tr>
+{chr(10).join(rows)}
+</table>
+</body>
+</html>
+"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page)
+
+
+def _plugin_checks(entry_point: str, task_name: str) -> List[str]:
+    from task_schema.headless import create_plugin
+
+    return create_plugin(entry_point).return_qa_checks(task_name)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Publish many files with headless DCC processes.",
+        fromfile_prefix_chars="@",
+    )
+    parser.add_argument(
+        "files", nargs="*", help="files to publish, @file to read a list"
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--plugin", help="module:Class of the plugin with QA config")
+    parser.add_argument("--task", help="task name in the QA config, such as layout")
+    parser.add_argument("--checks", nargs="+", help="check classes, not the QA config")
+    parser.add_argument("--dcc", choices=sorted(DCCS), default="maya")
+    parser.add_argument("--executable", help="Python interpreter of the DCC")
+    parser.add_argument("--checks-module", help="module of the check classes")
+    parser.add_argument("--opener", help="module:function opening a file")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--files-per-worker", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=1800.0, help="per file")
+    parser.add_argument("--json", help="JSON report to write")
+    parser.add_argument("--html", help="HTML report to write")
+    args = parser.parse_args()
+
+    if args.worker:
+        logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+        run_worker(json.loads(sys.stdin.read()))
+        return 0
+
+    logging.basicConfig(level=logging.INFO)
+    if args.checks:
+        checks = args.checks
+    elif args.plugin and args.task:
+        checks = _plugin_checks(args.plugin, args.task)
+    else:
+        parser.error("either --checks or --plugin and --task are required")
+    if not checks:
+        parser.error("no checks to run")
+    if not args.files:
+        parser.error("no files to publish")
+
+    dcc = DCCS[args.dcc]._replace(
+        **{
+            key: value
+            for key, value in (
+                ("executable", args.executable),
+                ("checks_module", args.checks_module),
+                ("opener", args.opener),
+            )
+            if value
+        }
+    )
+    done = list()
+
+    def on_result(result: Dict[str, Any]) -> None:
+        done.append(result)
+        logger.info(
+            f"[{len(done)}/{len(args.files)}] {result['file']}: {result['status']}"
+        )
+
+    report = run_batch(
+        args.files,
+        checks,
+        dcc,
+        workers=args.workers,
+        files_per_worker=args.files_per_worker,
+        timeout=args.timeout,
+        on_result=on_result,
+    )
+    if args.json:
+        write_json_report(report, args.json)
+    if args.html:
+        write_html_report(report, args.html)
+    print(json.dumps(report["summary"], indent=4))
+    failed = sum(report["summary"][s] for s in ("failed", "error", "timeout"))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,25 +1,321 @@
 import abc
+import json
 import logging
+import multiprocessing
+import os
+import reprlib
+import time
+import tracemalloc
 import traceback
-from typing import Callable, Dict, List, Any, Optional, Type
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import threading
+from functools import lru_cache
+from hashlib import sha1
+from queue import Empty, SimpleQueue
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple, Type
 
-# Configure logger
-logging.basicConfig(level=logging.DEBUG)
 logger: logging = logging.getLogger(__name__)
 
+# Bounds the size of the values written to the log
+_log_repr = reprlib.Repr()
+_log_repr.maxstring = 200
+_log_repr.maxother = 200
+_log_repr.maxlist = _log_repr.maxtuple = _log_repr.maxset = 10
+_log_repr.maxdict = 10
+
+
+class ProcessTiming:
+    """
+    Measures of a process run.
+
+    Attributes:
+        name (str): The name of the process.
+        kind (str): The stage of the process, such as "Check".
+        start (float): Epoch time the run started at.
+        wall (float): Seconds the run took.
+        cpu (float): CPU seconds used by the thread running the process.
+        peak_memory (Optional[int]): Peak bytes allocated by Python during the run, only
+            measured while tracemalloc is tracing, and including the processes running
+            at the same time.
+        thread (int): Identifier of the thread running the process.
+        callbacks (dict): Seconds spent in the callbacks of each type.
+        skipped (bool): Whether the run was skipped as its inputs didn't change.
+    """
+
+    def __init__(self, name: str, kind: str, skipped: bool = False) -> None:
+        self.name: str = name
+        self.kind: str = kind
+        self.start: float = time.time()
+        self.wall: float = 0.0
+        self.cpu: float = 0.0
+        self.peak_memory: Optional[int] = None
+        self.thread: int = 0
+        self.callbacks: Dict[str, float] = dict()
+        self.skipped: bool = skipped
+        self._counter: float = 0.0
+        self._thread_time: float = 0.0
+
+    def begin(self) -> None:
+        """Starts measuring, in the thread running the process."""
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self.start = time.time()
+        self.thread = threading.get_ident()
+        self._thread_time = time.thread_time()
+        self._counter = time.perf_counter()
+
+    def end(self) -> None:
+        """Stops measuring, in the thread running the process."""
+        self.wall = time.perf_counter() - self._counter
+        self.cpu = time.thread_time() - self._thread_time
+        if tracemalloc.is_tracing():
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+
+    def add_callback_time(self, callback_type: int, seconds: float) -> None:
+        """
+        Adds the duration of a callback.
+
+        Args:
+            callback_type (int): The Callback type.
+            seconds (float): Seconds it took.
+        """
+        name = CALLBACK_NAMES.get(callback_type, str(callback_type))
+        self.callbacks[name] = self.callbacks.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the measures as a dictionary."""
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "peak_memory": self.peak_memory,
+            "thread": self.thread,
+            "callbacks": dict(self.callbacks),
+            "skipped": self.skipped,
+        }
+
 
 def log_execution(func):
-    """Decorator to log the execution of process methods."""
+    """Decorator to log and time the execution of process methods."""
 
     def wrapper(self, *args, **kwargs):
         logger.info(f"Starting {self.__class__.__name__} process: {self.name}")
-        result = func(self, *args, **kwargs)
-        logger.info(f"Completed {self.__class__.__name__} process: {self.name}")
+        timing = ProcessTiming(self.name, process_stage(self))
+        self.timing = timing
+        timing.begin()
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            timing.end()
+        logger.info(
+            f"Completed {self.__class__.__name__} process: {self.name} "
+            f"in {timing.wall:.3f}s ({timing.cpu:.3f}s CPU)"
+        )
         return result
 
     return wrapper
 
 
+class PublishReport:
+    """
+    Measures of the processes run by a publish.
+
+    Attributes:
+        start (float): Epoch time the publish started at.
+        wall (float): Seconds the publish took.
+        timings (List[ProcessTiming]): Measures of each process, in start order.
+        error (Optional[str]): The error that stopped the publish.
+    """
+
+    def __init__(self) -> None:
+        self.start: float = time.time()
+        self.wall: float = 0.0
+        self.timings: List[ProcessTiming] = list()
+        self.error: Optional[str] = None
+        self._counter: float = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, timing: ProcessTiming) -> None:
+        """
+        Adds the measures of a process.
+
+        Args:
+            timing (ProcessTiming): The measures.
+        """
+        with self._lock:
+            self.timings.append(timing)
+
+    def finish(self, error: Optional[str] = None) -> None:
+        """
+        Stops measuring the publish.
+
+        Args:
+            error (Optional[str]): The error that stopped the publish.
+        """
+        self.wall = time.perf_counter() - self._counter
+        self.error = error
+
+    def slowest(self, count: int = 5) -> List[ProcessTiming]:
+        """
+        Returns the processes that took the longest.
+
+        Args:
+            count (int): Number of processes.
+
+        Returns:
+            List[ProcessTiming]: The measures, slowest first.
+        """
+        return sorted(self.timings, key=lambda t: t.wall, reverse=True)[:count]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the report as a dictionary."""
+        return {
+            "start": self.start,
+            "wall": self.wall,
+            "error": self.error,
+            "processes": [timing.to_dict() for timing in self.timings],
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Returns the report as JSON, and writes it if a path is given.
+
+        Args:
+            path (Optional[str]): File to write.
+
+        Returns:
+            str: The JSON report.
+        """
+        data = json.dumps(self.to_dict(), indent=4)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(data)
+        return data
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the report in the Chrome trace event format, which can be
+        opened in chrome://tracing or Perfetto.
+
+        Returns:
+            Dict[str, Any]: The trace.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": "publish",
+                "cat": "publish",
+                "ph": "X",
+                "ts": 0,
+                "dur": int(self.wall * 1e6),
+                "pid": pid,
+                "tid": 0,
+                "args": {"error": self.error},
+            }
+        ]
+        for timing in self.timings:
+            events.append(
+                {
+                    "name": timing.name,
+                    "cat": timing.kind,
+                    "ph": "X",
+                    "ts": int((timing.start - self.start) * 1e6),
+                    "dur": int(timing.wall * 1e6),
+                    "pid": pid,
+                    "tid": timing.thread,
+                    "args": {
+                        "cpu": timing.cpu,
+                        "peak_memory": timing.peak_memory,
+                        "callbacks": timing.callbacks,
+                        "skipped": timing.skipped,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str) -> None:
+        """
+        Writes the report in the Chrome trace event format.
+
+        Args:
+            path (str): File to write.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+@lru_cache(maxsize=4096)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    digest = sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Returns the hash of a file's contents, only read again when its
+    modification time or size changes.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        Optional[str]: The hash, or None if the file can't be read.
+    """
+    try:
+        st = os.stat(path)
+        return _file_digest(os.fspath(path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def value_digest(value: Any) -> str:
+    """
+    Returns a hash of a value, from its JSON form. Values that can't be
+    written as JSON use their repr, which may differ on every run.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The hash.
+    """
+    data = json.dumps(value, sort_keys=True, default=repr)
+    return sha1(data.encode("utf-8")).hexdigest()
+
+
+class ProcessCancelled(Exception):
+    """
+    Raised in a process when the publish is cancelled. The process goes back
+    to UNINITIALIZED instead of FAILED, and the publish raises it unchanged.
+    """
+
+
+def _run_worker(function: Callable, args: tuple, kwargs: dict, queue: Any) -> None:
+    """
+    Runs a function in a worker process, sending its progress and result.
+
+    Args:
+        function (Callable): Picklable function called with a progress callback.
+        args (tuple): Positional arguments.
+        kwargs (dict): Keyword arguments.
+        queue (Any): multiprocessing queue receiving the messages.
+    """
+
+    def progress(fraction: float, message: str = "") -> None:
+        queue.put(("progress", fraction, message))
+
+    try:
+        queue.put(("result", function(progress, *args, **kwargs)))
+    except BaseException as e:
+        queue.put(("error", f"{type(e).__name__}: {e}", traceback.format_exc()))
+
+
 class ErrorProcess:
     """
     Class to represent an error that occurs during process execution.
@@ -66,13 +362,92 @@ class StatusProcess:
     FAILED: int = 4
 
 
+class _Lazy:
+    """Value of the context computed the first time it is read."""
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory: Optional[Callable[[], Any]] = factory
+        self._value: Any = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """Computes the value once, even if read from several threads."""
+        with self._lock:
+            if self._factory is not None:
+                self._value = self._factory()
+                self._factory = None
+            return self._value
+
+
+class ContextSnapshot:
+    """
+    Immutable view of the context at a point in time, for processes reading
+    it while others write. Lazy values are shared with the context, so they
+    are only computed once.
+    """
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self._data = MappingProxyType(data)
+
+    def get_data(self, key: str) -> Any:
+        """
+        Retrieves data from the snapshot by key.
+
+        Args:
+            key (str): The key or identifier for the data.
+
+        Returns:
+            Any: The value associated with the key, or None if not found.
+        """
+        value = self._data.get(key)
+        if isinstance(value, _Lazy):
+            return value.get()
+        return value
+
+    def keys(self) -> List[str]:
+        """Returns the keys of the snapshot."""
+        return list(self._data)
+
+
 class Context:
     """
     A shared context object for storing and accessing data across different processes.
+
+    Writes replace the underlying dictionary instead of modifying it, so that
+    snapshots stay unchanged and readers never see a dictionary being resized.
+    Values can be computed lazily, and subscribers are notified of changes.
     """
 
     def __init__(self):
-        self.__data: Dict[str, Any] = {}
+        self._data: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._subscribers: Dict[Optional[str], List[Callable[[str], None]]] = dict()
+
+    def _store(self, key: str, value: Any) -> None:
+        """Replaces the data with a copy holding the new value."""
+        with self._lock:
+            data = dict(self._data)
+            data[key] = value
+            self._data = data
+
+    def _notify(self, key: str) -> None:
+        """Calls the subscribers of a key and those of every key."""
+        callbacks = self._subscribers.get(key, []) + self._subscribers.get(None, [])
+        for callback in callbacks:
+            try:
+                callback(key)
+            except Exception as e:
+                logger.error(f"Context subscriber failed for {key}: {e}")
+
+    def _evaluate(self, key: str, lazy: _Lazy) -> Any:
+        """Computes a lazy value and stores it in place of its factory."""
+        value = lazy.get()
+        with self._lock:
+            if self._data.get(key) is lazy:
+                data = dict(self._data)
+                data[key] = value
+                self._data = data
+        return value
 
     def set_data(self, key: str, value: Any) -> None:
         """
@@ -85,8 +460,25 @@ class Context:
         Example:
             context.set_data('collected_files', ['file1.txt', 'file2.txt'])
         """
-        self.__data[key] = value
-        logger.debug(f"Context updated: {key} = {value}")
+        self._store(key, value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Context updated: {key} = {_log_repr.repr(value)}")
+        self._notify(key)
+
+    def set_lazy(self, key: str, factory: Callable[[], Any]) -> None:
+        """
+        Stores a value computed by `factory` the first time it is read.
+
+        Args:
+            key (str): The key or identifier for the data.
+            factory (Callable[[], Any]): Computes the value.
+
+        Example:
+            context.set_lazy('meshes', lambda: cmds.ls(type='mesh', long=True))
+        """
+        self._store(key, _Lazy(factory))
+        logger.debug(f"Context updated: {key} = <lazy>")
+        self._notify(key)
 
     def get_data(self, key: str) -> Any:
         """
@@ -101,7 +493,46 @@ class Context:
         Example:
             files = context.get_data('collected_files')
         """
-        return self.__data.get(key)
+        value = self._data.get(key)
+        if isinstance(value, _Lazy):
+            return self._evaluate(key, value)
+        return value
+
+    def snapshot(self) -> ContextSnapshot:
+        """
+        Returns an immutable view of the current data, without copying it.
+
+        Returns:
+            ContextSnapshot: The snapshot.
+        """
+        return ContextSnapshot(self._data)
+
+    def subscribe(
+        self, callback: Callable[[str], None], key: Optional[str] = None
+    ) -> Callable[[], None]:
+        """
+        Calls `callback` with the key every time a value changes.
+
+        Args:
+            callback (Callable[[str], None]): Receives the key that changed.
+            key (Optional[str]): Only notify changes of this key, all if None.
+
+        Returns:
+            Callable[[], None]: Removes the subscription.
+        """
+        with self._lock:
+            subscribers = dict(self._subscribers)
+            subscribers[key] = subscribers.get(key, []) + [callback]
+            self._subscribers = subscribers
+
+        def unsubscribe() -> None:
+            with self._lock:
+                subscribers = dict(self._subscribers)
+                callbacks = [c for c in subscribers.get(key, []) if c is not callback]
+                subscribers[key] = callbacks
+                self._subscribers = subscribers
+
+        return unsubscribe
 
 
 class Callback:
@@ -110,6 +541,13 @@ class Callback:
     status: int = 2
 
 
+CALLBACK_NAMES: Dict[int, str] = {
+    Callback.pre_process: "pre_process",
+    Callback.post_process: "post_process",
+    Callback.status: "status",
+}
+
+
 class Process(abc.ABC):
     """
         Abstract base class for all processes in the task publishing pipeline.
@@ -122,6 +560,18 @@ class Process(abc.ABC):
             errors (list): A list of ErrorProcess objects representing errors encountered during execution.
             context (Context): A reference to the shared Context object for data exchange.
             callbacks (dict): A dict of callback functions to be executed when a specified action occurs.
+            requires (Optional[Tuple[str, ...]]): Context keys the process reads. None if unknown,
+                in which case it runs after every process registered before it.
+            provides (Tuple[str, ...]): Context keys the process writes. Collects provide their name.
+            thread_safe (bool): Whether the process can run in a worker thread, alongside others.
+                False for processes using APIs bound to the main thread, such as maya.cmds.
+            incremental (bool): Whether the process only depends on its required context keys,
+                its input files and, if `uses_scene`, the scene, so that it can be skipped when
+                they didn't change since its last successful run.
+            uses_scene (bool): Whether the fingerprint includes the manager's scene hash.
+            timing (Optional[ProcessTiming]): Measures of the last run of the process.
+            progress (Optional[float]): Progress of the process between 0 and 1, if reported.
+            progress_message (str): Description of the current progress.
     .
     """
     __context: Context = None
@@ -130,12 +580,29 @@ class Process(abc.ABC):
     compulsory: bool = True
     info: str = "..."
     name: str = "Default Process"
+    requires: Optional[Tuple[str, ...]] = None
+    provides: Tuple[str, ...] = ()
+    thread_safe: bool = False
+    incremental: bool = False
+    uses_scene: bool = False
+    timing: Optional[ProcessTiming] = None
 
     def __init__(self, manager: "Manager"):
         super().__init__()
         self.__callbacks: Dict[Type[Callback], Callable] = dict()
+        # Set by the manager while the process runs in a worker thread, so its
+        # callbacks run in the publishing thread
+        self._dispatch: Optional[Callable[[Callable[[], None]], None]] = None
+        self._manager: "Manager" = manager
+        self.progress: Optional[float] = None
+        self.progress_message: str = ""
         self._set_context(manager.context)
 
+    @property
+    def cancelled(self) -> bool:
+        """Returns whether the publish running the process was cancelled."""
+        return self._manager.cancelled
+
     @property
     def callbacks(self) -> Dict[Type[Callback], Callable]:
         """Returns the dict of registered callbacks."""
@@ -177,7 +644,7 @@ class Process(abc.ABC):
 
         try:
             self._run_callbacks(Callback.pre_process)
-            self.process(self.__context)
+            self._add_returned_errors(self.process(self.__context))
             if self.errors and self.compulsory:
                 self.set_status(StatusProcess.FAILED)
                 return
@@ -186,20 +653,53 @@ class Process(abc.ABC):
             else:
                 self.set_status(StatusProcess.SUCCESS)
             self._run_callbacks(Callback.post_process)
+        except ProcessCancelled:
+            # not failed, it runs again on the next publish
+            self.set_status(StatusProcess.UNINITIALIZED)
+            raise
         except Exception as e:
             traceback.print_exc()
             self.add_error("Failed process", str(e), [[str(e), str(e)]])
             self.set_status(StatusProcess.FAILED)
 
 
+    def _add_returned_errors(self, result: Any) -> None:
+        """
+        Records the errors of the processes returning `(status, errors)` from
+        `process` instead of calling `add_error`, like the older Maya checks,
+        whose errors are `{"text": error, "list": items}` dictionaries.
+
+        Args:
+            result (Any): What `process` returned.
+        """
+        if not isinstance(result, tuple) or len(result) != 2 or result[0] is not False:
+            return
+        errors = result[1] or [{"text": "Failed process", "list": []}]
+        for error in errors:
+            if isinstance(error, dict):
+                self.add_error(str(error.get("text")), self.info, error.get("list"))
+            else:
+                self.add_error(str(error), self.info)
+
     def _run_callbacks(self, callback_type: Callback) -> None:
         """Executes all registered callbacks after process execution."""
+        if self._dispatch is not None:
+            self._dispatch(lambda: self._call_callbacks(callback_type))
+        else:
+            self._call_callbacks(callback_type)
+
+    def _call_callbacks(self, callback_type: Callback) -> None:
+        """Calls the registered callbacks of a type."""
+        timing = self.timing
         for callback in self.__callbacks.get(callback_type, []):
+            start = time.perf_counter()
             try:
                 logger.debug(f"{self.name} callback {callback_type} executing: {callback}")
                 callback(self)
             except Exception as e:
                 logger.error(f"Callback execution failed: {e}")
+            if timing is not None:
+                timing.add_callback_time(callback_type, time.perf_counter() - start)
 
     def _set_context(self, context: Context) -> None:
         """
@@ -233,6 +733,116 @@ class Process(abc.ABC):
         """
         self.__errors.append(ErrorProcess(error, details, items or []))
 
+    def set_progress(self, fraction: float, message: str = "") -> None:
+        """
+        Reports the progress of the process to the status callbacks.
+
+        Args:
+            fraction (float): Progress between 0 and 1.
+            message (str): Description of the current step.
+        """
+        self.progress = fraction
+        self.progress_message = message
+        self._run_callbacks(Callback.status)
+
+    def run_in_worker(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Runs `function(progress, *args, **kwargs)` in a separate Python process,
+        for CPU heavy steps such as encoding or packaging. The function must be
+        picklable, defined at module level, and may call `progress(fraction, message)`,
+        which is forwarded to `set_progress`. Waiting in the publishing thread
+        keeps calling the manager's `idle` hook.
+
+        Args:
+            function (Callable): The function.
+            *args: Picklable positional arguments.
+            **kwargs: Picklable keyword arguments.
+
+        Returns:
+            Any: What the function returned.
+
+        Raises:
+            ProcessCancelled: If the publish was cancelled, the worker is terminated.
+            RuntimeError: If the function failed or the worker stopped.
+        """
+        context = multiprocessing.get_context("spawn")
+        if self._manager.worker_executable:
+            context.set_executable(self._manager.worker_executable)
+        queue = context.Queue()
+        worker = context.Process(
+            target=_run_worker, args=(function, args, kwargs, queue), daemon=True
+        )
+        idle = self._manager.idle if self._dispatch is None else None
+        self.set_progress(0.0)
+        worker.start()
+        try:
+            while True:
+                if self.cancelled:
+                    raise ProcessCancelled(f"{self.name} was cancelled")
+                try:
+                    message = queue.get(timeout=0.05)
+                except Empty:
+                    if not worker.is_alive() and queue.empty():
+                        raise RuntimeError(
+                            f"Worker of {self.name} stopped with code {worker.exitcode}"
+                        )
+                    if idle is not None:
+                        idle()
+                    continue
+                if message[0] == "progress":
+                    self.set_progress(message[1], message[2])
+                elif message[0] == "result":
+                    self.set_progress(1.0)
+                    return message[1]
+                else:
+                    logger.error(message[2])
+                    raise RuntimeError(message[1])
+        finally:
+            if worker.is_alive():
+                worker.terminate()
+            worker.join()
+            queue.close()
+
+    def return_input_files(self, context: Context) -> List[str]:
+        """
+        Returns the files the process reads, hashed in its fingerprint.
+
+        Args:
+            context (Context): The shared context.
+
+        Returns:
+            List[str]: The file paths.
+        """
+        return list()
+
+    def fingerprint(
+        self, scene_hash: Optional[Callable[[], Any]] = None
+    ) -> Optional[str]:
+        """
+        Returns a hash of the inputs of the process, to skip it when they
+        didn't change.
+
+        Args:
+            scene_hash (Optional[Callable[[], Any]]): Returns a hash of the scene.
+
+        Returns:
+            Optional[str]: The hash, or None if the process can't be skipped.
+        """
+        if not self.incremental or self.requires is None:
+            return None
+        scene = None
+        if self.uses_scene:
+            if scene_hash is None:
+                return None
+            scene = scene_hash()
+        values = {key: self.context.get_data(key) for key in self.requires}
+        files = {
+            os.fspath(f): file_digest(f) for f in self.return_input_files(self.context)
+        }
+        return value_digest(
+            [type(self).__module__, type(self).__qualname__, values, files, scene]
+        )
+
     @abc.abstractmethod
     def process(self, context: Context) -> None:
         """
@@ -270,15 +880,20 @@ class Collect(Process):
     Attributes:
         name (str): The name of the collection process.
         collect_type (Type): The expected type of the collected data (default is `str`).
+        timeout (Optional[float]): Seconds the interface waits for a thread safe collector
+            before asking for the value, None to wait until it finishes.
+        manual (bool): Whether the value was given by the user, see `set_manual_value`.
         _value (Any): The collected value, initially set to None.
     """
 
     name: str = "Default Collect"
     collect_type = str
+    timeout: Optional[float] = 10.0
 
     def __init__(self, manager):
         super().__init__(manager)
         self._value: Any = None
+        self.manual: bool = False
         self._update_context()
 
     @log_execution
@@ -291,13 +906,22 @@ class Collect(Process):
 
         Before execution, it runs all registered callbacks.
         After execution, it runs all registered callbacks.
+
+        A value given by the user is kept instead of collecting again, and
+        a run that was still going when it was given leaves it unchanged.
         """
+        if self.manual:
+            self._clear_errors()
+            self.set_status(StatusProcess.SUCCESS)
+            return
         self._clear_errors()
         self.set_status(StatusProcess.EXECUTING)
 
         try:
             self._run_callbacks(Callback.pre_process)
             self.process(self.context)
+            if self.manual:
+                return
             if self.value in [None,""]:
                 self.add_error(
                     "Failed collect", "missing value", [["missing value", "missing value"]]
@@ -310,8 +934,14 @@ class Collect(Process):
             else:
                 self.set_status(StatusProcess.SUCCESS)
             self._run_callbacks(Callback.post_process)
+        except ProcessCancelled:
+            # not failed, it runs again on the next publish
+            self.set_status(StatusProcess.UNINITIALIZED)
+            raise
         except Exception as e:
             traceback.print_exc()
+            if self.manual:
+                return
             self.add_error("Failed process", str(e), [[str(e), str(e)]])
             self.set_status(StatusProcess.FAILED)
         
@@ -326,10 +956,34 @@ class Collect(Process):
     def value(self, value: Any) -> None:
         """
         Sets a new value for the collection process and updates the context.
+        Ignored while the user's value is kept.
 
         Args:
             value (Any): The new value to be collected.
         """
+        if self.manual:
+            logger.debug(f"{self.name}: keeping the value given by the user")
+            return
+        self._set_value(value)
+
+    def set_manual_value(self, value: Any) -> None:
+        """
+        Sets a value given by the user, such as for a collector that timed
+        out. Publishing keeps it instead of collecting again, and an empty
+        value makes the collector run again.
+
+        Args:
+            value (Any): The value.
+        """
+        self._set_value(value)
+        self.manual = value not in (None, "")
+        self._clear_errors()
+        self.set_status(
+            StatusProcess.SUCCESS if self.manual else StatusProcess.UNINITIALIZED
+        )
+
+    def _set_value(self, value: Any) -> None:
+        """Checks the type of a value and stores it in the context."""
         if self.collect_type is not None and not isinstance(value, self.collect_type):
             logger.error(
                 f"{self.name}: Value must be of type {self.collect_type.__name__} -> {value}"
@@ -357,6 +1011,114 @@ class Collect(Process):
             self.context.set_data(self.name, self._value)
 
 
+class CollectRunner:
+    """
+    Runs collectors in the background, for interfaces that must show before
+    the values arrive. Thread safe collectors run concurrently in daemon
+    threads, each with its own timeout; the others are handed to `run_inline`,
+    which can defer them to the interface thread.
+
+    Attributes:
+        DONE (str): The collector finished in time.
+        TIMEOUT (str): The collector didn't finish in time. It keeps running.
+        LATE (str): The collector finished after timing out.
+    """
+
+    DONE: str = "done"
+    TIMEOUT: str = "timeout"
+    LATE: str = "late"
+
+    def __init__(
+        self,
+        collectors: List[Collect],
+        on_result: Callable[[Collect, str], None],
+        run_inline: Optional[Callable[[Callable[[], None]], None]] = None,
+    ) -> None:
+        """
+        Args:
+            collectors (List[Collect]): The collectors.
+            on_result (Callable[[Collect, str], None]): Called with each collector and
+                DONE, TIMEOUT or LATE, from the thread that ran it or timed it out.
+            run_inline (Optional[Callable[[Callable[[], None]], None]]): Runs the
+                collectors that aren't thread safe, immediately if None.
+        """
+        self.collectors: List[Collect] = collectors
+        self._on_result = on_result
+        self._run_inline = run_inline or (lambda function: function())
+        self._results: Dict[Collect, str] = dict()
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+
+    def start(self) -> None:
+        """Starts collecting."""
+        for collect in self.collectors:
+            if collect.thread_safe:
+                timer = None
+                if collect.timeout is not None:
+                    timer = threading.Timer(
+                        collect.timeout, self._timed_out, (collect,)
+                    )
+                    timer.daemon = True
+                    timer.start()
+                threading.Thread(
+                    target=self._run,
+                    args=(collect, timer),
+                    name=f"Collect {collect.name}",
+                    daemon=True,
+                ).start()
+            else:
+                self._run_inline(lambda collect=collect: self._run(collect))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every collector finished or timed out.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, forever if None.
+
+        Returns:
+            bool: True if none is pending.
+        """
+        with self._finished:
+            return self._finished.wait_for(
+                lambda: len(self._results) == len(self.collectors), timeout
+            )
+
+    @property
+    def pending(self) -> List[Collect]:
+        """
+        Returns the collectors that didn't finish yet, including those that
+        timed out and are still running.
+        """
+        with self._lock:
+            finished = (self.DONE, self.LATE)
+            return [c for c in self.collectors if self._results.get(c) not in finished]
+
+    def _run(self, collect: Collect, timer: Optional[threading.Timer] = None) -> None:
+        """Executes a collector and reports its result."""
+        try:
+            collect._execute()
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._finished:
+                late = self._results.get(collect) == self.TIMEOUT
+                result = self.LATE if late else self.DONE
+                self._results[collect] = result
+                self._finished.notify_all()
+            self._on_result(collect, result)
+
+    def _timed_out(self, collect: Collect) -> None:
+        """Reports a collector that didn't finish in time."""
+        with self._finished:
+            if collect in self._results:
+                return
+            self._results[collect] = self.TIMEOUT
+            self._finished.notify_all()
+        logger.warning(f"{collect.name} didn't finish in {collect.timeout}s")
+        self._on_result(collect, self.TIMEOUT)
+
+
 class Check(Process):
     name: str = "Default Check"
 
@@ -366,23 +1128,52 @@ class Check(Process):
 
 
 class Extract(Process):
-    """A class representing the file extraction process."""
+    """
+    A class representing the file extraction process.
+
+    CPU heavy extractions can call `run_in_worker` from `process`, and set
+    `thread_safe` so that the other processes go on meanwhile.
+    """
 
     name: str = "Default Extract"
 
 
 class Push(Process):
-    """A class representing the process to push data to the database."""
+    """
+    A class representing the process to push data to the database.
+
+    Like extractions, long uploads can call `run_in_worker` from `process`.
+    """
 
     name: str = "Default Push"
 
 
+def process_stage(process: Process) -> str:
+    """
+    Returns the stage of a process.
+
+    Args:
+        process (Process): The process.
+
+    Returns:
+        str: "Collect", "Check", "Extract", "Push" or the class name.
+    """
+    for cls in type(process).__mro__:
+        if cls in (Collect, Check, Extract, Push):
+            return cls.__name__
+    return type(process).__name__
+
+
 class Manager:
     """
     Manager class that manages the registration and execution
     of different processes, including collecting, checking,
     extraction, and pushing to the database.
 
+    Processes run stage by stage. Within a stage, a process waits for the
+    ones providing the context keys it requires, and thread safe processes
+    run concurrently in a pool of worker threads.
+
     Attributes:
         context (Context): The shared context for managing data
                            among the different processes.
@@ -390,10 +1181,43 @@ class Manager:
         checks (List[Check]): A list of checking processes.
         extractors (List[Extract]): A list of extraction processes.
         pushes (List[Push]): A list of push processes for database operations.
+        max_workers (int): Worker threads for thread safe processes, 1 to run
+                           every process in the publishing thread.
+        scene_hash (Optional[Callable[[], Any]]): Returns a hash of the scene, for
+                           the incremental processes that use it.
+        trace_memory (bool): Whether publishes measure the peak memory of the
+                           processes with tracemalloc, which slows them down.
+        last_report (Optional[PublishReport]): Measures of the last publish.
+        idle (Optional[Callable[[], None]]): Called in the publishing thread while
+                           it waits for processes, such as QApplication.processEvents
+                           to keep an interface responsive.
+        worker_executable (Optional[str]): Python executable of the worker processes,
+                           such as mayapy inside Maya. The current one if None.
     """
 
-    def __init__(self) -> None:
-        """Initializes the Manager with empty process lists."""
+    def __init__(
+        self,
+        max_workers: int = 4,
+        scene_hash: Optional[Callable[[], Any]] = None,
+        trace_memory: bool = False,
+    ) -> None:
+        """
+        Initializes the Manager with empty process lists.
+
+        Args:
+            max_workers (int): Worker threads for thread safe processes.
+            scene_hash (Optional[Callable[[], Any]]): Returns a hash of the scene.
+            trace_memory (bool): Measure the peak memory of the processes.
+        """
+        self.max_workers: int = max_workers
+        self.scene_hash: Optional[Callable[[], Any]] = scene_hash
+        self.trace_memory: bool = trace_memory
+        self.last_report: Optional[PublishReport] = None
+        self.idle: Optional[Callable[[], None]] = None
+        self.worker_executable: Optional[str] = None
+        self._cancel_event = threading.Event()
+        # Fingerprint of the last successful run of each incremental process
+        self._fingerprints: Dict[Process, str] = dict()
         self._context: Context = Context()
         self.collectors: List[Collect] = []
         self.checks: List[Check] = []
@@ -445,25 +1269,239 @@ class Manager:
             Push: self.pushes,
         }
 
-    def publish(self) -> None:
-        """Executes the registered processes in sequence."""
-        logger.info(f"Publisher starting publish...")
-        try:
-            for type_, processes in self.processes().items():
-                for process in processes:
-                    # if process.status == StatusProcess.SUCCESS:
-                    #     continue
-                    logger.info(f"Executing {type_}: {process.name}")
-                    process._execute()
-                    if process.status == StatusProcess.FAILED and process.compulsory:
-                        err_str = "\n".join(
-                            [f"{ err.error}:{ err.details}" for err in process.errors]
-                        )
-                        raise Exception(f"{process.name} failed:\n {err_str}")
+    @property
+    def cancelled(self) -> bool:
+        """Returns whether the current publish was cancelled."""
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """
+        Cancels the current publish: no other process starts, and processes
+        running in worker processes are terminated.
+        """
+        logger.info("Cancelling publish...")
+        self._cancel_event.set()
+
+    def invalidate(self, process: Optional[Process] = None) -> None:
+        """
+        Makes a process, or all of them, run on the next publish even if
+        their inputs didn't change.
+
+        Args:
+            process (Optional[Process]): The process, all if None.
+        """
+        if process is None:
+            self._fingerprints.clear()
+        else:
+            self._fingerprints.pop(process, None)
+
+    def _is_unchanged(self, process: Process, fingerprint: Optional[str]) -> bool:
+        """
+        Whether a process succeeded with the same inputs and wasn't reset since.
+
+        Args:
+            process (Process): The process.
+            fingerprint (Optional[str]): Fingerprint of its current inputs.
+
+        Returns:
+            bool: True if it can be skipped.
+        """
+        return (
+            fingerprint is not None
+            and self._fingerprints.get(process) == fingerprint
+            and process.status in (StatusProcess.SUCCESS, StatusProcess.WARNING)
+        )
 
+    def _execute(self, process: Process, fingerprint: Optional[str]) -> None:
+        """
+        Executes a process unless its inputs didn't change since its last
+        successful run, and records its fingerprint.
+
+        Args:
+            process (Process): The process.
+            fingerprint (Optional[str]): Fingerprint of its inputs, computed
+                in the publishing thread as the scene may only be read there.
+        """
+        report = self.last_report
+        if self._is_unchanged(process, fingerprint):
+            logger.info(f"Skipping {process.name}, its inputs didn't change")
+            if report is not None:
+                report.add(ProcessTiming(process.name, process_stage(process), True))
+            return
+        self._fingerprints.pop(process, None)
+        process._execute()
+        if report is not None and process.timing is not None:
+            report.add(process.timing)
+        if fingerprint is not None and process.status in (
+            StatusProcess.SUCCESS,
+            StatusProcess.WARNING,
+        ):
+            self._fingerprints[process] = fingerprint
+
+    def publish(self, force: bool = False) -> None:
+        """
+        Executes the registered processes stage by stage, running the
+        independent ones of a stage concurrently. Incremental processes whose
+        inputs didn't change since their last successful run are skipped.
+        A compulsory process that fails stops the publish once the running
+        processes finish.
 
-            logger.info(f"Publisher finished publish...")
+        Args:
+            force (bool): Run every process.
+
+        Raises:
+            ProcessCancelled: If the publish was cancelled.
+            Exception: If a compulsory process fails.
+        """
+        logger.info(f"Publisher starting publish...")
+        if force:
+            self.invalidate()
+        report = PublishReport()
+        self.last_report = report
+        self._cancel_event.clear()
+        start_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            with ThreadPoolExecutor(max(1, self.max_workers)) as pool:
+                for type_, processes in self.processes().items():
+                    logger.info(f"Executing {type_.__name__} stage")
+                    self._run_stage(processes, pool)
+
+            report.finish()
+            logger.info(f"Publisher finished publish in {report.wall:.3f}s...")
+        except ProcessCancelled as e:
+            report.finish(str(e))
+            logger.info("Publish cancelled")
+            raise
         except Exception as e:
+            report.finish(str(e))
             traceback.print_exc()
             logger.error(f"An error occurred during publishing: {e}")
             raise Exception(e)
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+            for timing in report.slowest():
+                logger.debug(f"{timing.name}: {timing.wall:.3f}s")
+
+    def _run_stage(self, processes: List[Process], pool: ThreadPoolExecutor) -> None:
+        """
+        Executes the processes of a stage in dependency order.
+
+        Args:
+            processes (List[Process]): Processes of the stage.
+            pool (ThreadPoolExecutor): Pool running the thread safe processes.
+
+        Raises:
+            ProcessCancelled: If the publish was cancelled, once the running
+                processes stop.
+            Exception: If a compulsory process fails.
+            ValueError: If the processes depend on each other in a cycle.
+        """
+        dependencies = process_dependencies(processes)
+        callbacks: SimpleQueue = SimpleQueue()
+        pending = list(range(len(processes)))
+        done: Set[int] = set()
+        running = dict()
+        failed: Optional[Process] = None
+
+        def run_callbacks() -> None:
+            while True:
+                try:
+                    callbacks.get_nowait()()
+                except Empty:
+                    return
+
+        def finish(index: int) -> None:
+            nonlocal failed
+            process = processes[index]
+            process._dispatch = None
+            done.add(index)
+            if process.status == StatusProcess.FAILED and process.compulsory:
+                failed = failed or process
+
+        while pending or running:
+            inline = None
+            if failed is None and not self.cancelled:
+                for index in [i for i in pending if dependencies[i] <= done]:
+                    process = processes[index]
+                    if process.thread_safe and self.max_workers > 1:
+                        pending.remove(index)
+                        fingerprint = process.fingerprint(self.scene_hash)
+                        process._dispatch = callbacks.put
+                        logger.info(f"Executing {process.name} in a worker thread")
+                        future = pool.submit(self._execute, process, fingerprint)
+                        running[future] = index
+                    elif inline is None:
+                        inline = index
+            if inline is not None:
+                pending.remove(inline)
+                process = processes[inline]
+                logger.info(f"Executing {process.name}")
+                try:
+                    self._execute(process, process.fingerprint(self.scene_hash))
+                except ProcessCancelled:
+                    # raised once the running processes stop
+                    self.cancel()
+                finish(inline)
+            elif running:
+                finished, _ = wait(running, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    try:
+                        future.result()
+                    except ProcessCancelled:
+                        self.cancel()
+                    finish(running.pop(future))
+                if self.idle is not None:
+                    self.idle()
+            elif failed is None and not self.cancelled:
+                names = ", ".join(processes[i].name for i in pending)
+                raise ValueError(f"Circular dependencies between {names}")
+            else:
+                break
+            run_callbacks()
+
+        if self.cancelled:
+            raise ProcessCancelled("Publish cancelled")
+        if failed is not None:
+            err_str = "\n".join(
+                [f"{ err.error}:{ err.details}" for err in failed.errors]
+            )
+            raise Exception(f"{failed.name} failed:\n {err_str}")
+
+
+def process_dependencies(processes: List[Process]) -> List[Set[int]]:
+    """
+    Returns the processes each process of a stage waits for: those providing
+    a context key it requires, or all the previous ones if its requirements
+    are unknown. Processes with unknown requirements are also waited for by
+    all the next ones, so they keep their registration order.
+
+    Args:
+        processes (List[Process]): Processes of the stage, in registration order.
+
+    Returns:
+        List[Set[int]]: Indexes of the processes each one waits for.
+    """
+    providers: Dict[str, Set[int]] = dict()
+    for index, process in enumerate(processes):
+        keys = set(process.provides)
+        if isinstance(process, Collect):
+            keys.add(process.name)
+        for key in keys:
+            providers.setdefault(key, set()).add(index)
+
+    dependencies = list()
+    barrier: Set[int] = set()
+    for index, process in enumerate(processes):
+        if process.requires is None:
+            waits = set(range(index))
+            barrier.add(index)
+        else:
+            waits = set(barrier)
+            for key in process.requires:
+                waits.update(providers.get(key, ()))
+        waits.discard(index)
+        dependencies.append(waits)
+    return dependencies
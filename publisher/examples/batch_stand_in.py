@@ -0,0 +1,95 @@
+"""
+Stand-in DCC for the batch publisher, to run it without Maya.
+
+Scenes are JSON files such as `{"nodes": ["|world|geo", "|world|pasted__geo"]}`
+listing the long names of their nodes. The checks have the names of the Maya
+checks used in the QA configs of the plugins, and read the nodes from the
+"scene" of the context instead of maya.cmds. Like its Maya check,
+`CheckLights` returns `(status, errors)` instead of calling `add_error`.
+A scene can also make the worker crash with `"crash": true` or hang with
+`"sleep": seconds`.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List, Tuple
+
+from publisher.core import Check, Context
+
+
+def open_scene(path: str) -> Dict[str, Any]:
+    """
+    Reads a stand-in scene.
+
+    Args:
+        path (str): The JSON scene.
+
+    Returns:
+        Dict[str, Any]: The scene, set as "scene" in the context.
+    """
+    with open(path, encoding="utf-8") as f:
+        scene = json.load(f)
+    if scene.get("crash"):
+        os._exit(3)
+    time.sleep(scene.get("sleep", 0))
+    return scene
+
+
+class CheckRepeatedNameNodes(Check):
+    name = "Check repeated node names"
+    info = "Checks whether there are 2 or more nodes\n" "sharing the same short name."
+    requires = ("scene",)
+    thread_safe = True
+
+    def process(self, context: Context) -> None:
+        nodes = context.get_data("scene").get("nodes", [])
+        short_names = [node.split("|")[-1] for node in nodes]
+        repeated = [
+            [short, node]
+            for short, node in zip(short_names, nodes)
+            if short_names.count(short) > 1
+        ]
+        if repeated:
+            self.add_error("Repeated node names", "Rename the nodes", repeated)
+
+
+class CheckPastedNodes(Check):
+    name = "Checks pasted nodes"
+    info = "Checks whether there is any pasted node.\n"
+    requires = ("scene",)
+    thread_safe = True
+
+    def process(self, context: Context) -> None:
+        nodes = context.get_data("scene").get("nodes", [])
+        pasted = [[node.split("|")[-1], node] for node in nodes if "pasted__" in node]
+        if pasted:
+            self.add_error("Pasted nodes", "Delete or rename the nodes", pasted)
+
+
+class CheckUnknownNodes(Check):
+    name = "Check unknown nodes"
+    info = "Checks whether there are unknown nodes."
+    compulsory = False
+    requires = ("scene",)
+    thread_safe = True
+
+    def process(self, context: Context) -> None:
+        unknown = context.get_data("scene").get("unknown", [])
+        if unknown:
+            items = [[node, node] for node in unknown]
+            self.add_error("Unknown nodes", "Delete the nodes", items)
+
+
+class CheckLights(Check):
+    name = "Check light nodes"
+    info = "Checks whether there is any light\n" "in the file."
+    requires = ("scene",)
+    thread_safe = True
+
+    def process(self, context: Context) -> Tuple[bool, List[Dict[str, Any]]]:
+        lights = context.get_data("scene").get("lights", [])
+        if not lights:
+            return True, []
+        items = [[light.split("|")[-1], light] for light in lights]
+        return False, [{"text": "Lights in file", "list": items}]
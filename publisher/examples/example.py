@@ -16,8 +16,6 @@ except:
 from publisher.core import Collect, Check, Extract, Push, Manager, StatusProcess
 from publisher.widget import ManagerWidget
 
-# Configure logger
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 # MODEL PUBLISHER manager
 
@@ -199,6 +197,7 @@ class PushSGModel(Push):
 
 def main() -> None:
     """Main entry point for the application."""
+    logging.basicConfig(level=logging.DEBUG)
     app = QApplication()
     manager = Manager()
     manager.register(CollectTask)
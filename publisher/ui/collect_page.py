@@ -12,7 +12,7 @@ try:
         QSpinBox,
         QSizePolicy,
     )
-    from PySide6.QtCore import Qt, QEvent #type: ignore
+    from PySide6.QtCore import Qt, QEvent, QTimer, Signal #type: ignore
 
 except:
     from PySide2.QtWidgets import ( #type: ignore
@@ -25,10 +25,10 @@ except:
         QSpinBox,
         QSizePolicy,
     )
-    from PySide2.QtCore import Qt, QEvent #type: ignore
+    from PySide2.QtCore import Qt, QEvent, QTimer, Signal #type: ignore
 
 from publisher.ui.qt_widgets import ProcessorPage, StatusWidget, ProcessWidget
-from publisher.core import Process, StatusProcess
+from publisher.core import CollectRunner, Process, StatusProcess
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,7 @@ class CollectWidget(ProcessWidget):
         self.status_widget = StatusWidget()
         self.label = QLabel(self.process.name)
         self.input = self.create_collector_input(self.process)
+        self.timing_label = self.create_timing_label()
 
         self.label.setMinimumWidth(100)
         self.label.setMaximumWidth(100)
@@ -48,6 +49,7 @@ class CollectWidget(ProcessWidget):
         self.central_layout.addWidget(self.status_widget)
         self.central_layout.addWidget(self.label)
         self.central_layout.addWidget(self.input)
+        self.central_layout.addWidget(self.timing_label)
 
     def create_collector_input(self, collect) -> None:
         """
@@ -86,7 +88,12 @@ class CollectWidget(ProcessWidget):
         return input_widget
     
     def set_value(self,value):
-        self.input.set_value(value)
+        # only the user's edits are manual values
+        self.input.blockSignals(True)
+        try:
+            self.input.set_value(value)
+        finally:
+            self.input.blockSignals(False)
         self.process.value = value
 
     def return_value(self):
@@ -94,8 +101,7 @@ class CollectWidget(ProcessWidget):
 
     def value_changed(self,value):
         logger.debug(f"{self.process.name} Updating value: {value} ")
-        self.process.set_status(StatusProcess.UNINITIALIZED)
-        self.process.value = value
+        self.process.set_manual_value(value)
 
 
 class CollectPage(ProcessorPage):
@@ -104,8 +110,12 @@ class CollectPage(ProcessorPage):
     of Collect processes registered in the manager publisher.
     """
 
+    on_collected = Signal(object, str)
+
     def __init__(self, list_process: List[Process], parent: QWidget = None):
         super().__init__(list_process,parent)
+        self.runner = None
+        self.on_collected.connect(self.collected)
         self.start_collection()
 
     def add_process_widget(self,process):
@@ -115,15 +125,37 @@ class CollectPage(ProcessorPage):
 
     def start_collection(self) -> None:
         """
-        Start the collection process by calling the execute method of each instance.
-        Determines whether the collect requires manual input.
+        Start the collection in the background, filling each widget as its
+        value arrives. Thread safe collectors run concurrently, the others run
+        one by one once the window is shown.
         """
-        for collect_widget in self.list_process_widgets:
-            collect = collect_widget.process
+        self.collect_widgets = {w.process: w for w in self.list_process_widgets}
+        for collect in self.collect_widgets:
             logger.info(f"Executing collection for {collect.name}")
-            collect._execute()
-            if collect.value is not None:
-                collect_widget.set_value(collect.value)
-            else:
-                logger.info(f"Manual input required for {collect.name}")
-            collect.set_status(StatusProcess.UNINITIALIZED)
\ No newline at end of file
+        self.runner = CollectRunner(
+            list(self.collect_widgets),
+            # the signal brings the results to the interface thread
+            self.on_collected.emit,
+            run_inline=lambda function: QTimer.singleShot(0, function),
+        )
+        self.runner.start()
+
+    def collected(self, collect, result: str) -> None:
+        """
+        Fill the widget of a collector, or leave it for manual input.
+
+        Args:
+            collect (Collect): The collect instance.
+            result (str): CollectRunner.DONE, TIMEOUT or LATE.
+        """
+        collect_widget = self.collect_widgets[collect]
+        if result == CollectRunner.TIMEOUT:
+            logger.info(f"Manual input required for {collect.name}, timed out")
+            return
+        if result == CollectRunner.LATE and collect.manual:
+            # what the user typed meanwhile wins over the late value
+            return
+        if collect.value is not None:
+            collect_widget.set_value(collect.value)
+        else:
+            logger.info(f"Manual input required for {collect.name}")
@@ -163,10 +163,19 @@ class ProcessWidget(QFrame):
         self.central_layout = QHBoxLayout(self)
         self.status_widget = StatusWidget()
         self.label = QLabel(self.process.name)
+        self.timing_label = self.create_timing_label()
 
     def create_layout(self):
         self.central_layout.addWidget(self.status_widget)
         self.central_layout.addWidget(self.label)
+        self.central_layout.addWidget(self.timing_label)
+
+    def create_timing_label(self):
+        timing_label = QLabel()
+        timing_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        timing_label.setMinimumWidth(60)
+        timing_label.setMaximumWidth(60)
+        return timing_label
 
     def create_connections(self):
         self.on_status.connect(self.refresh_status)
@@ -180,8 +189,28 @@ class ProcessWidget(QFrame):
         )
         self.setSizePolicy(QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed))
 
+    def refresh_timing(self):
+        timing = self.process.timing
+        if self.process.status == StatusProcess.EXECUTING:
+            progress = self.process.progress
+            self.timing_label.setText("" if progress is None else f"{progress:.0%}")
+            self.timing_label.setToolTip(self.process.progress_message)
+            return
+        if timing is None:
+            self.timing_label.setText("")
+            self.timing_label.setToolTip("")
+            return
+        self.timing_label.setText(f"{timing.wall:.2f}s")
+        tooltip = [f"Wall: {timing.wall:.3f}s", f"CPU: {timing.cpu:.3f}s"]
+        if timing.peak_memory is not None:
+            tooltip.append(f"Peak memory: {timing.peak_memory / 2**20:.1f} MB")
+        for name, seconds in timing.callbacks.items():
+            tooltip.append(f"Callbacks {name}: {seconds:.3f}s")
+        self.timing_label.setToolTip("\n".join(tooltip))
+
     def refresh_status(self):
         self.status_widget.set_status(self.process.status)
+        self.refresh_timing()
         self.parent.parent.info_panel_widget.set_process(self.process)
         self.parent.status_page()
 
@@ -1,9 +1,11 @@
+import logging
 from functools import partial
 from typing import Dict, List, Type
 from utilities.pipe_utils import thread
 
 try:
     from PySide6.QtWidgets import (  # type:ignore
+        QApplication,
         QWidget,
         QVBoxLayout,
         QHBoxLayout,
@@ -12,8 +14,10 @@ try:
         QSplitter,
     )
     from PySide6.QtCore import Qt  # type:ignore
+    from PySide6.QtGui import QCloseEvent  # type:ignore
 except:
     from PySide2.QtWidgets import (  # type:ignore
+        QApplication,
         QWidget,
         QVBoxLayout,
         QHBoxLayout,
@@ -22,6 +26,7 @@ except:
         QSplitter,
     )
     from PySide2.QtCore import Qt  # type:ignore
+    from PySide2.QtGui import QCloseEvent  # type:ignore
 
 from publisher.core import (
     Check,
@@ -30,11 +35,14 @@ from publisher.core import (
     Manager,
     Push,
     Process,
+    ProcessCancelled,
     StatusProcess,
 )
 from publisher.ui.collect_page import CollectPage
 from publisher.ui.qt_widgets import InfoPanel, ProcessorPage, STATUS_STYLE
 
+logger = logging.getLogger(__name__)
+
 
 class ManagerWidget(QWidget):
     """
@@ -72,10 +80,20 @@ class ManagerWidget(QWidget):
         self.splitter_widget.addWidget(self.info_panel_widget)  
         self.main_layout.addWidget(self.splitter_widget)
 
+        self.publish_layout = QHBoxLayout()
+        self.main_layout.addLayout(self.publish_layout)
         self.publish_button = QPushButton("Publish")
-        self.main_layout.addWidget(self.publish_button)
+        self.publish_layout.addWidget(self.publish_button)
         self.publish_button.clicked.connect(self.publish)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setEnabled(False)
+        self.publish_layout.addWidget(self.cancel_button)
+        self.cancel_button.clicked.connect(self.manager.cancel)
+        if self.manager.idle is None:
+            # keeps the window responsive while processes run in workers
+            self.manager.idle = QApplication.processEvents
         self.selected_page = None
+        self._publishing = False
 
         self.create_pages(manager.processes())
 
@@ -120,13 +138,36 @@ class ManagerWidget(QWidget):
         """
         Trigger the publishing process by calling the manager's publish method.
 
-        This method runs in a separate thread to prevent blocking the UI.
-        After publishing, it updates the status of each page based on the results.
+        This method runs in the interface thread. While the publish waits for
+        processes running in workers, the manager's idle hook processes the
+        interface events, so the window keeps updating and Cancel keeps
+        working. Every other input is blocked meanwhile, as it would run in
+        the middle of the publish.
+        The publish doesn't start while collectors without a value given by
+        the user are still running, as both would run them at once.
+        After publishing, it shows the first page with a failed process.
         """
+        for index in range(self.stacked_widget.count()):
+            page = self.stacked_widget.widget(index)
+            runner = getattr(page, "runner", None)
+            if runner is None:
+                continue
+            pending = [c.name for c in runner.pending if not c.manual]
+            if pending:
+                logger.warning(
+                    f"Collecting {', '.join(pending)}, wait or type their values"
+                )
+                self.on_tab_page(page)
+                return
+        self._set_publishing(True)
         try:
             self.manager.publish()
+        except ProcessCancelled:
+            return
         except Exception:
             pass
+        finally:
+            self._set_publishing(False)
 
         for index in range(self.stacked_widget.count()):
             page = self.stacked_widget.widget(index)
@@ -135,6 +176,36 @@ class ManagerWidget(QWidget):
                 self.on_tab_page(page)
                 return
 
+    def _set_publishing(self, publishing: bool) -> None:
+        """
+        Block the input to the window, except the Cancel button, while
+        publishing.
+
+        Args:
+            publishing (bool): Whether a publish is running.
+        """
+        self._publishing = publishing
+        self.splitter_widget.setEnabled(not publishing)
+        self.publish_button.setEnabled(not publishing)
+        self.cancel_button.setEnabled(publishing)
+        for index in range(self.stacked_widget.count()):
+            tab_button = getattr(self.stacked_widget.widget(index), "tab_button", None)
+            if tab_button is not None:
+                tab_button.setEnabled(not publishing)
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        Cancel the publish instead of closing the window while publishing.
+
+        Args:
+            event (QCloseEvent): The close event.
+        """
+        if self._publishing:
+            self.manager.cancel()
+            event.ignore()
+            return
+        super().closeEvent(event)
+
     def on_tab_page(self, page: ProcessorPage):
         if self.selected_page:
             self.selected_page.tab_button.setChecked(False)
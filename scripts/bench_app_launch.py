@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+bench_app_launch.py — Measures how long a plugin takes to prepare an app launch.
+
+Builds the plugin headless, creates a task folder with --files versions and
+times generate_environment_for_app on it: once cold, several times warm and
+once after a new version is saved, which rebuilds the task variables only.
+Prints the timings as JSON and exits with code 1 when the warm median
+exceeds --max-seconds.
+
+Usage:
+    python scripts/bench_app_launch.py task_schema.plugins.gwaio_plugin:GwaioProjectPlugin --files 500 --max-seconds 0.01
+"""
+import argparse
+import json
+import sys
+from os import environ
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+
+
+def time_call(function: Callable[[], Any]) -> float:
+    start = perf_counter()
+    function()
+    return perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("entry_point", help="module:Class of the plugin to build")
+    parser.add_argument("--files", type=int, default=500, help="versions in the task")
+    parser.add_argument("--runs", type=int, default=10, help="warm launches to time")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="warm median threshold"
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    from task_schema.headless import create_plugin
+    from task_schema.plugins.base_plugin import BaseTask, BaseThumbnail
+
+    with TemporaryDirectory() as temp:
+        environ["GWAIO_DATA_PATH"] = temp
+        plugin = create_plugin(args.entry_point)
+        task_path = Path(temp, "EP101_010_0010", "anim")
+        task_path.mkdir(parents=True)
+        for i in range(1, args.files + 1):
+            Path(task_path, f"EP101_010_0010_anim_v{i:03d}.ma").touch()
+        task = BaseTask(
+            name="anim",
+            link_name="EP101_010_0010",
+            local_path=task_path,
+            prev_task_server=Path(temp, "server", "EP101_010_0010", "anim"),
+            thumbnail=BaseThumbnail(0),
+            data_to_show=list(),
+        )
+        plugin.last_task_clicked = task
+
+        def launch():
+            return plugin.generate_environment_for_app(task)
+
+        cold = time_call(launch)
+        warm = [time_call(launch) for _ in range(args.runs)]
+        Path(task_path, f"EP101_010_0010_anim_v{args.files + 1:03d}.ma").touch()
+        changed = time_call(launch)
+
+    report = {
+        "plugin": args.entry_point,
+        "files": args.files,
+        "cold": round(cold, 4),
+        "warm_median": round(median(warm), 4),
+        "warm": [round(t, 4) for t in warm],
+        "after_new_version": round(changed, 4),
+        "max_seconds": args.max_seconds,
+    }
+    print(json.dumps(report, indent=4))
+
+    if args.max_seconds is not None and report["warm_median"] > args.max_seconds:
+        print(
+            f"Warm launch {report['warm_median']}s exceeds {args.max_seconds}s",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
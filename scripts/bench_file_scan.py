@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+bench_file_scan.py — Compares the task file filters on a large task tree.
+
+Builds a synthetic task folder (100k files by default, most of them
+caches, textures and renders that don't follow the naming conventions) and
+times the previous `rglob` + per-file `re.match` filter against the
+`scandir` scanner used by BasePlugin.filter_local_files. Both must return
+the same files. Exits with code 1 when they differ or the scanner median
+exceeds --max-seconds.
+
+Usage:
+    python scripts/bench_file_scan.py --files 100000 --runs 3
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+from re import match
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+
+NAMING_REGEX = [
+    r"^gwa_[a-z]{2}_[A-Za-z0-9]+_[A-Za-z0-9]+_[a-z]+_\d\d\d.*",
+    r"^gwa(_\d\d\d){3}_([a-z]+)_v\d\d\d.*",
+    r"^gwa(_\d\d\d){3}(_[a-z]+){1,3}_v\d\d\d.*",
+]
+EXTENSIONS = [".ma", ".mb"]
+
+
+def build_tree(root: Path, files: int) -> None:
+    """Create `files` empty files spread over shot task folders."""
+    per_folder = 100
+    for index in range(files):
+        folder = Path(
+            root, f"sh{index // (per_folder * 10):04d}", f"sub{index // per_folder % 10}"
+        )
+        shot = f"gwa_101_{index // 1000 % 1000:03d}_{index % 1000:03d}"
+        if index % per_folder == 0:
+            folder.mkdir(parents=True, exist_ok=True)
+        kind = index % 10
+        if kind == 0:
+            name = f"{shot}_layout_v001.ma"
+        elif kind == 1:
+            name = f"{shot}_anim_v001.abc"
+        else:
+            name = f"render.{index:06d}.exr"
+        Path(folder, name).touch()
+
+
+def legacy_filter(local_path: Path) -> list[Path]:
+    filtered_files = list()
+    for f in local_path.rglob("*.*"):
+        if not any(match(r, f.name) for r in NAMING_REGEX):
+            continue
+        if not any(f.suffix.endswith(e) for e in EXTENSIONS):
+            continue
+        filtered_files.append(f)
+    return filtered_files
+
+
+def scandir_filter(local_path: Path) -> list[Path]:
+    from task_schema.utils.file_scan import (
+        compile_naming_regex,
+        normalize_extensions,
+        scan_files,
+    )
+
+    has_convention = compile_naming_regex(tuple(NAMING_REGEX))
+    return [
+        f
+        for f in scan_files(local_path, normalize_extensions(EXTENSIONS))
+        if has_convention(f.name)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=100000, help="files to create")
+    parser.add_argument("--runs", type=int, default=3, help="runs per filter")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="scanner median threshold"
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    report = {"files": args.files}
+    with TemporaryDirectory() as temp:
+        build_tree(Path(temp), args.files)
+        results = dict()
+        filters = (("rglob", legacy_filter), ("scandir", scandir_filter))
+        for name, function in filters:
+            timings = list()
+            for _ in range(args.runs):
+                start = perf_counter()
+                results[name] = function(Path(temp))
+                timings.append(perf_counter() - start)
+            report[name] = {
+                "median": round(median(timings), 4),
+                "runs": [round(t, 4) for t in timings],
+                "found": len(results[name]),
+            }
+    report["same_result"] = sorted(results["rglob"]) == sorted(results["scandir"])
+    report["speedup"] = round(
+        report["rglob"]["median"] / report["scandir"]["median"], 2
+    )
+    print(json.dumps(report, indent=4))
+
+    too_slow = (
+        args.max_seconds is not None and report["scandir"]["median"] > args.max_seconds
+    )
+    return 1 if too_slow or not report["same_result"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+bench_import_time.py — Guards the import time of the plugin modules.
+
+Imports each module in a fresh interpreter with `-X importtime`, reports its
+cumulative import time and the slowest dependencies, and checks that none of
+the heavy or Qt packages is imported eagerly. Exits with code 1 on a
+forbidden import or when a module exceeds --max-ms.
+
+Usage:
+    python scripts/bench_import_time.py task_schema.plugins.base_plugin task_schema.plugins.gwaio_plugin --max-ms 300
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+
+# Packages that plugin modules must only import on demand
+FORBIDDEN = ["PySide6", "pandas", "shotgun_api3", "gspread", "launcher.qtclasses"]
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) for each -X importtime line."""
+    rows = list()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(module: str) -> dict:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    rows = parse_importtime(process.stderr)
+    cumulative = next((c for name, _, c in rows if name == module), None)
+    imported = {name for name, _, _ in rows}
+    return {
+        "module": module,
+        "ok": process.returncode == 0,
+        "error": process.stderr.strip().splitlines()[-1] if process.returncode else "",
+        "cumulative_ms": round(cumulative / 1000, 2) if cumulative else None,
+        "slowest": [
+            (name, round(c / 1000, 2))
+            for name, _, c in sorted(rows, key=lambda r: r[2], reverse=True)
+            if not module.startswith(name)
+        ][:10],
+        "forbidden": sorted(
+            f
+            for f in FORBIDDEN
+            if any(name == f or name.startswith(f + ".") for name in imported)
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="+", help="modules to import")
+    parser.add_argument("--max-ms", type=float, default=None, help="threshold per module")
+    args = parser.parse_args()
+
+    failed = False
+    reports = [measure(module) for module in args.modules]
+    for report in reports:
+        too_slow = (
+            args.max_ms is not None
+            and report["cumulative_ms"] is not None
+            and report["cumulative_ms"] > args.max_ms
+        )
+        if not report["ok"] or report["forbidden"] or too_slow:
+            failed = True
+    print(json.dumps(reports, indent=4))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+bench_plugin_startup.py — Measures how long a project plugin takes to build.
+
+Runs the plugin constructor with a cold metadata cache (removed beforehand)
+and then several times with a warm one, printing the timings as JSON.
+Exits with code 1 when the warm startup median exceeds --max-seconds, so it
+can guard against regressions in CI.
+
+Usage:
+    python scripts/bench_plugin_startup.py task_schema.plugins.gwaio_plugin:GwaioProjectPlugin --max-seconds 1.5
+"""
+import argparse
+import json
+import sys
+from importlib import import_module
+from os import environ
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+
+
+def load_class(entry_point: str) -> type:
+    module_name, class_name = entry_point.split(":")
+    return getattr(import_module(module_name), class_name)
+
+
+def time_startup(plugin_class: type) -> float:
+    start = perf_counter()
+    plugin = plugin_class()
+    elapsed = perf_counter() - start
+    thread = getattr(plugin, "_metadata_thread", None)
+    if thread is not None:
+        thread.join()
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("entry_point", help="module:Class of the plugin to build")
+    parser.add_argument("--runs", type=int, default=5, help="warm startups to time")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="warm median threshold"
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    plugin_class = load_class(args.entry_point)
+
+    with TemporaryDirectory() as data_path:
+        environ["GWAIO_DATA_PATH"] = data_path
+        cold = time_startup(plugin_class)
+        warm = [time_startup(plugin_class) for _ in range(args.runs)]
+
+    report = {
+        "plugin": args.entry_point,
+        "cold": round(cold, 4),
+        "warm_median": round(median(warm), 4),
+        "warm": [round(t, 4) for t in warm],
+        "max_seconds": args.max_seconds,
+    }
+    print(json.dumps(report, indent=4))
+
+    if args.max_seconds is not None and report["warm_median"] > args.max_seconds:
+        print(
+            f"Warm startup {report['warm_median']}s exceeds {args.max_seconds}s",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
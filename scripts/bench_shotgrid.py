@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+bench_shotgrid.py — Benchmarks the ShotGrid plugin workflows offline.
+
+Builds a synthetic project in the in-process ShotGrid stand-in
+(task_schema/utils/fake_shotgrid.py), patches the plugin to open its sessions
+on it, and times get_all_tasks_data, return_task_notes, create_pack and
+parse_edl_file with the given latency per request. Prints the timings and the
+number of requests of each scenario as JSON. Exits with code 1 when a
+scenario fails or its median exceeds --max-seconds.
+
+parse_edl_file only runs when an editorial file of the plugin's project is
+given with --edl, since its clip names must follow the plugin's conventions.
+
+Usage:
+    python scripts/bench_shotgrid.py task_schema.plugins.grisu_plugin:GrisuPlugin --tasks 50000 --latency 0.05
+"""
+import argparse
+import json
+import sys
+from collections import Counter
+from os import environ
+from pathlib import Path
+from statistics import median
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+
+REPO_ROOT = Path(__file__).parent.parent.resolve()
+
+
+def time_scenario(
+    database: Any, function: Callable[[], Any], runs: int
+) -> dict[str, Any]:
+    timings = list()
+    requests = Counter()
+    for _ in range(runs):
+        before = Counter(database.requests)
+        start = perf_counter()
+        function()
+        timings.append(perf_counter() - start)
+        requests = database.requests - before
+    return {
+        "median": round(median(timings), 4),
+        "runs": [round(t, 4) for t in timings],
+        "requests": dict(requests),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("entry_point", help="module:Class of a ShotGrid plugin")
+    parser.add_argument("--tasks", type=int, default=50000, help="tasks to generate")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per request"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="runs per scenario")
+    parser.add_argument("--entity-type", default="Shot", help="tasks to list")
+    parser.add_argument("--pack-type", default=None, help="packtype_to_status key")
+    parser.add_argument("--edl", type=Path, default=None, help="EDL for parse_edl_file")
+    parser.add_argument("--video", type=Path, default=None, help="video of the EDL")
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="median threshold"
+    )
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    from task_schema.headless import create_plugin, load_plugin_class
+    from task_schema.plugins.shotgrid_plugin import ShotgridPlugin
+    from task_schema.utils.fake_shotgrid import generate_project, use_fake_shotgun
+
+    plugin_class = load_plugin_class(args.entry_point)
+    database = generate_project(
+        tasks=args.tasks, project_id=int(plugin_class.SG_PROJECT_ID)
+    )
+    report = {
+        "plugin": args.entry_point,
+        "tasks": args.tasks,
+        "latency": args.latency,
+        "scenarios": dict(),
+    }
+
+    with TemporaryDirectory() as temp, use_fake_shotgun(
+        ShotgridPlugin, database, args.latency
+    ):
+        environ["GWAIO_DATA_PATH"] = temp
+        plugin = create_plugin(plugin_class)
+        plugin.server_root = Path(temp, "server")
+        episode = next(iter(plugin.return_all_episodes()))
+
+        def get_all_tasks_data():
+            results = dict()
+            plugin.get_all_tasks_data(
+                results, force_no_cache=True, sg_entity_type=args.entity_type
+            )
+            return results
+
+        def return_task_notes():
+            # the listed task with the most open notes
+            task = max(
+                plugin.tasks,
+                key=lambda t: len(database.get("Task", t.id).get("open_notes") or []),
+            )
+            return plugin.return_task_notes(task)
+
+        def create_pack():
+            pack_type = args.pack_type or next(iter(plugin.packtype_to_status))
+            return list(plugin.create_pack(pack_type, episode))
+
+        def parse_edl_file():
+            return list(plugin.parse_edl_file(args.edl, args.video or args.edl))
+
+        scenarios = {
+            "get_all_tasks_data": get_all_tasks_data,
+            "return_task_notes": return_task_notes,
+            "create_pack": create_pack,
+        }
+        if args.edl is not None:
+            scenarios["parse_edl_file"] = parse_edl_file
+        else:
+            report["scenarios"]["parse_edl_file"] = {"skipped": "no --edl given"}
+
+        failed = False
+        for name, function in scenarios.items():
+            try:
+                result = time_scenario(database, function, args.runs)
+            except Exception as e:
+                failed = True
+                result = {"error": f"{type(e).__name__}: {e}"}
+            else:
+                if args.max_seconds is not None and result["median"] > args.max_seconds:
+                    failed = True
+            report["scenarios"][name] = result
+
+    print(json.dumps(report, indent=4))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
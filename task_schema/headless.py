@@ -0,0 +1,122 @@
+"""
+headless.py
+
+Entry point to build project plugins without Qt, for farm jobs and mayapy
+sessions that only need path resolution. The Qt environment dialog is
+replaced by a handler reading the process environment, and the toolbars
+are never imported since nothing asks for them.
+
+Usage:
+    python -m task_schema.headless task_schema.plugins.gwaio_plugin:GwaioProjectPlugin
+"""
+
+import argparse
+import json
+from importlib import import_module
+from logging import getLogger
+from os import environ, fspath
+from typing import Any, Optional, Type, Union
+
+from task_schema.plugins.base_plugin import BasePlugin
+from task_schema.utils.lazy import LazyImport
+
+logger = getLogger(__name__)
+
+
+class HeadlessEnvironmentHandler:
+    """
+    Environment handler reading the process environment, with the same
+    interface the plugins use from the launcher's EnvironmentHandler.
+
+    Attributes:
+        app_env (dict[str, str]): Variables set by the plugin for launched apps.
+    """
+
+    def __init__(self) -> None:
+        self.app_env: dict[str, str] = dict()
+
+    def get_env(self, key: str, default: Any = None) -> Any:
+        """
+        Return an environment variable, stripped, or the default value.
+
+        Args:
+            key (str): Variable name.
+            default (Any): Value returned when the variable is not set.
+
+        Returns:
+            Any: The variable value or the default.
+        """
+        value = self.app_env.get(key, environ.get(key))
+        return default if value is None else value.strip()
+
+    def add_to_dotenv(self, key: str) -> None:
+        """Headless sessions don't persist variables, this is a no-op."""
+        logger.debug(f"Not persisting {key} in headless mode.")
+
+
+def use_headless_environment() -> None:
+    """
+    Swap the plugins' environment handler for a headless one, unless the
+    Qt one has already been created.
+    """
+    env_handler = BasePlugin.env_handler
+    if isinstance(env_handler, LazyImport) and not env_handler.loaded:
+        BasePlugin.env_handler = HeadlessEnvironmentHandler()
+
+
+def load_plugin_class(entry_point: str) -> Type[BasePlugin]:
+    """
+    Import a plugin class from its entry point.
+
+    Args:
+        entry_point (str): 'module:Class' path of the plugin.
+
+    Returns:
+        Type[BasePlugin]: The plugin class.
+    """
+    module_name, _, class_name = entry_point.partition(":")
+    if not class_name:
+        raise ValueError(f"Entry point must be 'module:Class', got '{entry_point}'")
+    return getattr(import_module(module_name), class_name)
+
+
+def create_plugin(
+    plugin: Union[str, Type[BasePlugin]], username: Optional[str] = None, **kwargs
+) -> BasePlugin:
+    """
+    Build a plugin without Qt.
+
+    Args:
+        plugin (Union[str, Type[BasePlugin]]): Plugin class or 'module:Class' entry point.
+        username (Optional[str]): Username of the current user.
+        **kwargs: Extra keyword arguments for the plugin constructor.
+
+    Returns:
+        BasePlugin: The plugin instance.
+    """
+    use_headless_environment()
+    plugin_class = load_plugin_class(plugin) if isinstance(plugin, str) else plugin
+    return plugin_class(username, **kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a project plugin without Qt.")
+    parser.add_argument("entry_point", help="module:Class of the plugin")
+    parser.add_argument("--username", default=None)
+    args = parser.parse_args()
+
+    plugin = create_plugin(args.entry_point, args.username)
+    print(
+        json.dumps(
+            {
+                "title": plugin.TITLE,
+                "local_root": fspath(plugin.local_root),
+                "server_root": fspath(plugin.server_root),
+            },
+            indent=4,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,11 @@
 from pathlib import Path
 from os import environ
-from re import sub, compile as recomp
+from re import compile as recomp
 from logging import getLogger
 from typing import Iterable, Generator
 
 logger = getLogger(__name__)
 
-import pandas
 
 if __name__ == "__main__":
     # these are only required if the module is executed stand alone
@@ -16,6 +15,15 @@ if __name__ == "__main__":
     sys.path.append(fspath(Path(__file__).parent.parent.parent))
 
 from task_schema.plugins.generic2d_plugin import Generic2DPlugin
+from task_schema.utils.bdl_validation import (
+    BDLSchema,
+    Condition,
+    Duplicated,
+    EmptyFields,
+    NonAlphanumeric,
+    NotIn,
+    existing_field,
+)
 
 
 class AnnieCarolaPlugin(Generic2DPlugin):
@@ -32,6 +40,45 @@ class AnnieCarolaPlugin(Generic2DPlugin):
     _active_entities = ["Asset", "Sequence", "Episode", "Shot"]
     _edl_target_task = "animatic"
     _shot_task_tpl_id = 640
+    bdl_schema = BDLSchema(
+        columns=["asset_type", "code", "variant", "prod_type"],
+        optional_columns=["tags"],
+        usecols=[0, 1, 2, 3, 4],
+        replace_pairs=[
+            {"regex": [" "], "value": "_"},
+            {"regex": [r"_$"], "value": ""},
+        ],
+        asset_name=lambda frame: (
+            frame["code"].str[:1].str.upper()
+            + frame["code"].str[1:]
+            + ("_" + frame["variant"]).where(frame["variant"] != "", "")
+        ),
+        episode=lambda excel, frame: excel.name.split("_")[2].replace("AC", ""),
+        rules=[
+            Duplicated(["code", "variant"]),
+            NotIn(
+                "asset_type",
+                ["PR", "CH", "SFX", "FX", "BG", "SP", "RF"],
+                "Unknown asset type '{asset_type}'",
+            ),
+            EmptyFields(["asset_type", "code", "prod_type"]),
+            NonAlphanumeric(["code", "variant"]),
+            Condition(
+                lambda frame, assets: frame["prod_type"].isin(["CR", "VR"])
+                & frame["exists"]
+                & (
+                    existing_field(frame, assets, "sg_created_for_episode.Episode.code")
+                    != frame["episode"]
+                ),
+                "Asset exists and it is marked as {prod_type}",
+            ),
+            Condition(
+                lambda frame, assets: (frame["prod_type"] == "TR") & ~frame["exists"],
+                "Asset does not exist but it is marked as TR",
+            ),
+            NotIn("prod_type", ["CR", "VR", "TR"], "Unknown production type {prod_type}"),
+        ],
+    )
 
     def __new__(cls: "AnnieCarolaPlugin", *args, **kwargs) -> "AnnieCarolaPlugin":
         cls._local_root = Path(cls.env_handler.get_env("ANNIECAROLA_LOCAL_PATH"))
@@ -185,87 +232,6 @@ class AnnieCarolaPlugin(Generic2DPlugin):
 
         return local_path, server_path
 
-    def read_excel(self, excel: Path):
-        episode = excel.name.split("_")[2].replace("AC", "")
-        existing_assets = self.return_all_assets()
-        data_frame = (
-            pandas.read_excel(excel, usecols=[0, 1, 2, 3])
-            .replace(regex=[" "], value="_")
-            .replace(regex=[r"_$"], value="")
-        )
-        data_frame.fillna("", inplace=True)
-        df_tags = pandas.read_excel(excel, usecols=[4])
-        df_tags.fillna("", inplace=True)
-        results = dict()
-        dupes = data_frame.duplicated(
-            subset=data_frame.columns[1:3].tolist(), keep=False
-        )
-
-        row: pandas.Series
-        for i, row in data_frame.iterrows():
-            tags = (
-                df_tags.iloc[i][0]
-                if df_tags.columns.to_list()[0].lower() == "tags"
-                else ""
-            )
-            asset_type, code, variant, prod_type = row[:4]
-            asset_name = f"{code}_{variant}" if variant != "" else code
-            asset_name = f"{asset_name.upper()[0]}{asset_name[1:]}"
-
-            results[i] = {
-                "series": [content for content in row[:4].tolist()] + [tags],
-                "errors": list(),
-                "episode": episode,  # AC
-                "asset_name": asset_name,
-                "exists": asset_name in existing_assets,
-                "status": True,
-            }
-
-            if dupes[i]:
-                results[i]["errors"].append("This asset is repeated.")
-
-            if asset_type not in ["PR", "CH", "SFX", "FX", "BG", "SP", "RF"]:
-                results[i]["errors"].append(f"Unknown asset type '{asset_type}'")
-
-            for content in [*row[:2], row[3]]:
-                if content in (None, ""):
-                    results[i]["errors"].append("There are some empty fields.")
-
-            for tag in (code, variant):
-                if not tag.replace("_", "").isalnum() and tag != "":
-                    results[i]["errors"].append(
-                        f"There are non alphanumeric values: "
-                        f"{sub('[^0-9a-zA-Z]+', '*', tag)}"
-                    )
-
-            if prod_type in ("CR", "VR"):
-                if asset_name in existing_assets:
-                    results[i]["exists"] = True
-                    if (
-                        existing_assets[asset_name].get(
-                            "sg_created_for_episode.Episode.code"
-                        )
-                        != episode  # AC
-                    ):
-                        results[i]["errors"].append(
-                            f"Asset exists and it is marked as {prod_type}"
-                        )
-
-            elif prod_type == "TR" and asset_name not in existing_assets:
-                results[i]["errors"].append(
-                    "Asset does not exist but it is marked as TR"
-                )
-
-            elif prod_type == "TR" and asset_name in existing_assets:
-                results[i]["exists"] = True
-
-            else:
-                results[i]["errors"].append(f"Unknown production type {prod_type}")
-
-            results[i]["status"] = len(results[i]["errors"]) == 0
-
-        return [*data_frame.columns[:4].tolist(), "Tags"], results
-
     def create_assets_from_bdl(self, dict_with_items: dict, excel_file: Path):
         created_assets = self.return_all_assets()
         created_episodes = self.return_all_episodes()
@@ -8,7 +8,6 @@ It includes the BaseThumbnail, BaseTask, and BasePlugin classes
 
 import inspect
 from os import environ, fspath, getcwd, remove, rename, pathsep
-from os.path import getmtime
 from re import match, search, sub, Match
 import os.path
 import json
@@ -25,29 +24,55 @@ from typing import (
     Iterator,
     List,
     Optional,
+    TYPE_CHECKING,
     Tuple,
     Type,
     Union,
 )
-import imghdr
 from shutil import copy2
 
 # from PIL import Image
 
 from utilities.pipe_utils import (
-    return_version_number_from_string,
     replace_root_in_path,
     return_file_name_head,
     open_file,
     open_app,
 )
-from launcher.qtclasses.dialog_env_handler import EnvironmentHandler
-
-from launcher.qtclasses.toolbar_base import BaseToolbar
-from launcher.qtclasses.toolbar_explorer import ExplorerToolbar
-
-from launcher.qtclasses.toolbar_player import PlayerToolbar
-from launcher.qtclasses.toolbar_syncer import SyncerToolbar
+from task_schema.utils.bdl_validation import BDLSchema
+from task_schema.utils.context_handoff import HANDOFF_VARIABLE, write_context
+from task_schema.utils.env_cache import PartCache, folder_mtime
+from task_schema.utils.file_scan import (
+    DEFAULT_PRUNE_DIRS,
+    compile_naming_regex,
+    normalize_extensions,
+)
+from task_schema.utils.folder_watcher import FileEvent, FolderWatcher
+from task_schema.utils.path_index import PathIndex
+from task_schema.utils.task_index import TaskIndex
+from task_schema.utils.task_list import (
+    TaskList,
+    task_changed,
+    task_changes,
+    tasks_stamp,
+)
+from task_schema.utils.task_search import TaskSearch, default_task_key
+from task_schema.utils.thumbnails import default_thumbnail_pipeline, render_thumbnail
+from task_schema.utils.scan_service import ERROR, default_scan_service
+from task_schema.utils.session_broker import default_session_broker
+from task_schema.utils.version_index import VersionIndex, VersionIndexCache
+from task_schema.utils.lazy import LazyImport
+from task_schema.utils import task_codec
+
+if TYPE_CHECKING:
+    from launcher.qtclasses.dialog_env_handler import EnvironmentHandler
+    from launcher.qtclasses.toolbar_base import BaseToolbar
+
+# Qt classes are only imported when the launcher builds the toolbars, so
+# headless sessions can use the plugins without Qt.
+ExplorerToolbar = LazyImport("launcher.qtclasses.toolbar_explorer:ExplorerToolbar")
+PlayerToolbar = LazyImport("launcher.qtclasses.toolbar_player:PlayerToolbar")
+SyncerToolbar = LazyImport("launcher.qtclasses.toolbar_syncer:SyncerToolbar")
 
 logger = getLogger(__name__)
 
@@ -99,6 +124,19 @@ class BaseThumbnail:
         return self._url
 
 
+task_codec.register_type(
+    BaseThumbnail,
+    10,
+    lambda t: {"id": t.id, "url": t._url, "path": t._path},
+    lambda data: BaseThumbnail(
+        data["id"], data.get("url"), Path(data["path"]) if data.get("path") else None
+    ),
+)
+
+
+_UNSET = object()
+
+
 class BaseTask:
     """
     Represents a unit of work within a plugin, including paths and metadata.
@@ -112,6 +150,36 @@ class BaseTask:
         data_to_show (List[Any]): Data rows to display.
     """
 
+    # Types restored on deserialization, besides those of the properties
+    _field_types = {
+        "prev_task_server": Path,
+        "server_path": Path,
+        "thumbnail": BaseThumbnail,
+    }
+
+    # Attributes the plugin task indexes are built from. Setting them again
+    # is logged in the task lists holding the task, and the indexes of those
+    # lists update its entries on their next lookup.
+    _indexed_fields = frozenset(
+        {"id", "name", "link_name", "entity_type", "local_path", "data_to_show"}
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        indexed = name in self._indexed_fields
+        old = getattr(self, name, _UNSET) if indexed else _UNSET
+        super().__setattr__(name, value)
+        # values modified in place, such as a dict field, aren't counted
+        self.__dict__["_revision"] = self.__dict__.get("_revision", 0) + 1
+        if old is not _UNSET and old is not value:
+            task_changed(self, name)
+
+    def return_revision(self) -> int:
+        """
+        Returns a number that changes every time an attribute of the task is
+        set. A method, so that it isn't serialized with the task fields.
+        """
+        return self.__dict__.get("_revision", 0)
+
     def __init__(
         self,
         name: str,
@@ -234,36 +302,39 @@ class BaseTask:
     def serialize(self) -> Dict[str, Any]:
         """
         Serialize the task object's public attributes to a dictionary.
+        Paths and dates become strings and the thumbnail a dictionary.
 
         Returns:
             Dict[str, Any]: Serialized key-value mapping.
         """
-        new_dict = {}
-        for name, value in inspect.getmembers(self):
-            if (
-                not name.startswith("_")
-                and not inspect.ismethod(value)
-                and not inspect.isfunction(value)
-            ):
-                if inspect.isdatadescriptor(value):
-                    value = getattr(self, name)  # Obtiene el valor de la propiedad
-                try:
-                    json.dumps(value)
-                    new_dict[name] = value
-                except (TypeError, OverflowError):
-                    new_dict[name] = self.stringify_class(value)
-        return new_dict
-
-    def deserialize(self, data: Union[str, Dict[str, Any]]) -> None:
-        """
-        Populate this object from serialized dictionary or JSON string.
+        return task_codec.to_dict(self)
+
+    def serialize_binary(self) -> bytes:
+        """
+        Serialize the task object's public attributes with msgpack, keeping
+        their types, to hand the task over to another process.
+
+        Returns:
+            bytes: The packed attributes.
+
+        Raises:
+            ImportError: If msgpack is not installed.
+        """
+        return task_codec.packb(self)
+
+    def deserialize(self, data: Union[str, bytes, Dict[str, Any]]) -> None:
+        """
+        Populate this object from serialized dictionary, JSON string or
+        msgpack bytes, restoring paths and the thumbnail.
 
         Args:
-            data (Union[str, Dict[str, Any]]): JSON string or dict.
+            data (Union[str, bytes, Dict[str, Any]]): JSON string, msgpack bytes or dict.
         """
-        if isinstance(data, str):
+        if isinstance(data, bytes):
+            data = task_codec.unpackb(data)
+        elif isinstance(data, str):
             data = json.loads(data)
-        for key, value in data.items():
+        for key, value in task_codec.decode_fields(type(self), data).items():
             setattr(self, key, value)
 
 
@@ -289,6 +360,21 @@ class BasePlugin:
         uses_deadline (bool): Flag indicating Deadline integration.
         create_file_ext (List[str]): Default file extensions for creation.
         task_subfolders (Dict[str, List[str]]): Default subfolders for each task.
+        bdl_schema (Optional[BDLSchema]): Declarative rules used by `read_excel`
+            to validate BDL files.
+        scan_prune_dirs (frozenset[str]): Folder names `filter_local_files`
+            doesn't descend into, besides hidden folders.
+        watcher_debounce (float): Seconds the folder watcher waits for changes
+            to settle before notifying them.
+        watcher_poll_interval (float): Seconds between polls of the folder
+            watcher on network shares or without watchdog.
+        handoff_variables (tuple[str, ...]): Variables only passed to launched
+            apps through the context file, see `context_handoff`, such as
+            "GWAIO_TASK_DATA" once the scripts of the apps read it with
+            `read_context`. Empty by default, which writes no context file.
+        session_executables (frozenset[str]): Names of the executables, such
+            as "maya", whose running sessions open the next files instead of
+            a new process, see `session_broker`. Empty by default.
     """
 
     TITLE = "Base"
@@ -298,7 +384,9 @@ class BasePlugin:
     RENDER_FARM_ROOT = _server_root
     RENDER_FARM_FFMPEG_PATH = _server_root
     super_user = "gwaio"
-    env_handler = EnvironmentHandler()
+    env_handler: "EnvironmentHandler" = LazyImport(
+        "launcher.qtclasses.dialog_env_handler:EnvironmentHandler", instantiate=True
+    )
     # This is now a Path but at the end of init it is turned to a string as
     # some Qt classes don't work well with Path class, such as QPixmap or QIcon
     TEMPLATES_FOLDER: Path = _server_root
@@ -323,6 +411,13 @@ class BasePlugin:
     add_tasks_from_plugin_kwargs = None
     create_file_ext = ["from selected"]
     bdlregex: str = None
+    bdl_schema: Optional[BDLSchema] = None
+    scan_prune_dirs: frozenset[str] = DEFAULT_PRUNE_DIRS
+    scan_timeout: Optional[float] = 20.0
+    watcher_debounce: float = 0.5
+    watcher_poll_interval: float = 5.0
+    handoff_variables: tuple[str, ...] = ()
+    session_executables: frozenset[str] = frozenset()
     task_subfolders = dict()
     _folders_to_sync = list()
 
@@ -376,11 +471,19 @@ class BasePlugin:
         # self._local_root: Path = None
         self._app_toolbars: list[BaseToolbar] = list()
         self._last_task_clicked: BaseTask = None
-        self._tasks: list[BaseTask] = []
+        self._tasks: TaskList = TaskList()
+        self._tasks_by_path: PathIndex[BaseTask] = PathIndex()
+        # stamp of the task list each index was built at, see task_list
+        self._index_stamps: dict[str, Any] = dict()
+        self._tasks_index = TaskIndex()
+        self._task_search: Optional[TaskSearch] = None
+        self._environment_parts = PartCache()
         self._current_selected_tasks: list[BaseTask] = []
         self._current_selected_files: list[Path] = []
         self._last_file_clicked: Path = None
         self._naming_regex: list[str] = list()
+        self._version_indexes = VersionIndexCache()
+        self._folder_watcher: Optional[FolderWatcher] = None
         self._version_regex = r""
         self._version_includes_entity = False
         self._dict_previous_tasks: dict[str, dict] = dict()
@@ -467,18 +570,26 @@ class BasePlugin:
             raise ValueError(f"Value must be a instance of {Path} or {str}")
 
     @property
-    def explorer_toolbar(self) -> ExplorerToolbar | None:
+    def explorer_toolbar(self) -> Optional["BaseToolbar"]:
         return next(
             (t for t in self.app_toolbars if t.title == "Explorer Toolbar"), None
         )
 
     @property
     def toolbars(self):
-        """Registered toolbars definitions."""
-        return self._toolbars
+        """Registered toolbars definitions, with their classes imported."""
+        return [
+            [
+                entry[0].resolve() if isinstance(entry[0], LazyImport) else entry[0],
+                *entry[1:],
+            ]
+            if isinstance(entry, (list, tuple))
+            else entry
+            for entry in self._toolbars
+        ]
 
     @property
-    def app_toolbars(self) -> List[BaseToolbar]:
+    def app_toolbars(self) -> List["BaseToolbar"]:
         """List[BaseToolbar]: Instantiated application toolbars."""
         return self._app_toolbars
 
@@ -489,16 +600,99 @@ class BasePlugin:
 
     @property
     def tasks(self) -> List["BaseTask"]:
-        """List[BaseTask]: Tasks managed by this plugin."""
+        """
+        List[BaseTask]: Tasks managed by this plugin. Assigned lists are
+        copied into a `TaskList`, which tells the task indexes when the list
+        changes.
+        """
         return self._tasks
 
     @tasks.setter
     def tasks(self, value: list[BaseTask]):
         if isinstance(value, list) and all(isinstance(t, BaseTask) for t in value):
+            if not isinstance(value, TaskList):
+                value = TaskList(value)
             self._tasks = value
+            self._tasks_by_path = PathIndex(value, lambda t: t.local_path)
+            self._tasks_index = TaskIndex(value)
+            self._index_stamps["path"] = self._index_stamps["task"] = tasks_stamp(
+                value
+            )
+            if self._task_search is not None:
+                self._task_search.update(value)
+                self._index_stamps["search"] = self._index_stamps["task"]
         else:
             raise ValueError(f"Value must be a {list} of {BaseTask}")
 
+    def add_tasks(self, tasks: Iterable[BaseTask]) -> None:
+        """
+        Append tasks to the plugin, updating the task indexes.
+
+        Args:
+            tasks (Iterable[BaseTask]): Tasks to add.
+        """
+        index = self._current_tasks_index()
+        for task in tasks:
+            self._tasks.append(task)
+            index.add(task)
+        self._index_stamps["task"] = tasks_stamp(self._tasks)
+
+    def remove_tasks(self, tasks: Iterable[BaseTask]) -> None:
+        """
+        Remove tasks from the plugin, updating the task indexes.
+
+        Args:
+            tasks (Iterable[BaseTask]): Tasks to remove.
+        """
+        index = self._current_tasks_index()
+        removed = {id(task) for task in tasks}
+        for task in self._tasks:
+            if id(task) in removed:
+                index.remove(task)
+        self._tasks[:] = [t for t in self._tasks if id(t) not in removed]
+        self._index_stamps["task"] = tasks_stamp(self._tasks)
+
+    def reindex_task(self, task: BaseTask) -> None:
+        """
+        Update the task indexes after changing the id, link_name, name,
+        entity_type, local_path or data_to_show of a task. Assigning these
+        attributes is noticed by the indexes on their next lookup, but the
+        `data_to_show` cells edited in place are only searched after this.
+
+        Args:
+            task (BaseTask): The modified task.
+        """
+        # None as the field, since any of them may have changed
+        task_changed(task)
+
+    def _task_changes(self, index: str) -> Optional[list[tuple[BaseTask, str]]]:
+        """
+        Returns the task changes logged since an index was last updated, or
+        None if the task list changed and the index must be rebuilt. The
+        index is then marked as current.
+
+        Args:
+            index (str): Name of the index, "task", "path" or "search".
+        """
+        changes = task_changes(self._tasks, self._index_stamps.get(index))
+        self._index_stamps[index] = tasks_stamp(self._tasks)
+        return changes
+
+    def _current_tasks_index(self) -> TaskIndex:
+        """
+        Returns the task index, rebuilt if the task list changed since it was
+        last updated, or with the entries of the modified tasks updated.
+        """
+        changes = self._task_changes("task")
+        if changes is None:
+            self._tasks_index = TaskIndex(self._tasks)
+            return self._tasks_index
+        fields = {attr for key in self._tasks_index.keys for attr in key}
+        for task, field in changes:
+            if (field is None or field in fields) and task in self._tasks_index:
+                self._tasks_index.update(task)
+        return self._tasks_index
+
     @property
     def current_selected_tasks(self) -> List[BaseTask]:
         """
@@ -763,40 +957,88 @@ class BasePlugin:
         local_path: Path,
         ext: str | Iterable[str] = [""],
         task: Optional[BaseTask] = None,
+        force_stop: Callable[[], bool] = lambda: False,
     ) -> list[Path]:
         """
         Given a path, it will return the files
-        that follow the stablished conventions
+        that follow the stablished conventions.
+        Hidden folders and `scan_prune_dirs` are not searched. If the scan
+        times out or is stopped, the files found until then are returned.
 
         Args:
             local_path (Path): The directory to search in.
             ext (Union[str, Iterable[str]]): Valid file extensions to include.
             task (BaseTask, optional): Task context to validate conventions. Defaults to last clicked task.
+            force_stop (Callable[[], bool], optional): Callback to interrupt the scan.
 
         Returns:
             list[Path]: List of files matching conventions and extensions.
         """
 
-        task = task or self.last_task_clicked
-        ext = [ext] if isinstance(ext, str) else ext
+        logger.debug("Filter files -> %s", local_path)
         try:
-            logger.debug(f"Filter files -> {local_path}")
-            filtered_files = list()
-            for f in local_path.rglob("*.*"):
-                logger.debug(f"Checking: {f}")
-                if not self.file_has_convention(f, task):
-                    logger.debug(f"Not has convention: {f}")
-                    continue
-                if not any(f.suffix.endswith(e) for e in ext):
-                    logger.debug(f"Not suffix: {f}")
-                    continue
-                logger.debug(f"Found: {f}")
-                filtered_files.append(f)
-            return filtered_files
-        except:
-            # this is because apparently there is a chance where the rglob raises a
-            # WinError3 (system cannot find the path specified)
+            index = self.return_version_index(local_path, task, force_stop)
+        except OSError as e:
+            # the folder may not exist yet, e.g. WinError3 (system cannot
+            # find the path specified)
+            logger.debug(f"Cannot scan {local_path}: {e}")
             return []
+        return index.files_with_ext(normalize_extensions(ext))
+
+    def return_version_index(
+        self,
+        path: Path,
+        task: Optional[BaseTask] = None,
+        force_stop: Callable[[], bool] = lambda: False,
+    ) -> VersionIndex:
+        """
+        Returns the index of the files following the conventions in 'path',
+        scanning the folder only if it changed since the last call.
+        The scan runs in the background for at most `scan_timeout` seconds;
+        if it is cut short the index holds the files found until then, its
+        status says why, and the folder is scanned again on the next call.
+
+        Args:
+            path (Path): The directory to index.
+            task (BaseTask, optional): Task context to validate conventions. Defaults to last clicked task.
+            force_stop (Callable[[], bool], optional): Callback to interrupt the scan.
+
+        Returns:
+            VersionIndex: Files of the folder by extension and version.
+
+        Raises:
+            OSError: If the folder can't be read.
+        """
+        task = task or self.last_task_clicked
+        entity = task.link_name if self.version_includes_entity else None
+        naming_regex = tuple(self.naming_regex)
+        version_regex = self.version_regex
+        key = (fspath(path), naming_regex, version_regex, entity, self.scan_prune_dirs)
+
+        def build() -> VersionIndex:
+            has_convention = compile_naming_regex(naming_regex)
+
+            def name_filter(name: str) -> bool:
+                return has_convention(name) and (entity is None or entity in name)
+
+            result = default_scan_service().scan(
+                path,
+                prune_dirs=self.scan_prune_dirs,
+                name_filter=name_filter,
+                timeout=self.scan_timeout,
+                force_stop=force_stop,
+            )
+            if result.status == ERROR:
+                raise result.error
+            return VersionIndex(
+                result.files,
+                version_regex,
+                result.visited,
+                result.status,
+                name_filter=name_filter,
+            )
+
+        return self._version_indexes.get(key, build)
 
     def file_has_convention(self, file: Path, task: Optional[BaseTask] = None) -> bool:
         """
@@ -810,12 +1052,9 @@ class BasePlugin:
             bool: True if file meets convention; otherwise False.
         """
         task = task or self.last_task_clicked
-        return all(
-            [
-                self.file_has_entity(file, task),
-                any(match(r, file.name) for r in self.naming_regex),
-            ]
-        )
+        return self.file_has_entity(file, task) and compile_naming_regex(
+            tuple(self.naming_regex)
+        )(file.name)
 
     def file_has_entity(self, file: Path, task: Optional[BaseTask] = None) -> bool:
         """
@@ -835,31 +1074,36 @@ class BasePlugin:
             else task.link_name in fspath(file.name)
         )
 
-    def return_last_version_number(self, path: Path) -> int:
+    def return_last_version_number(
+        self, path: Path, force_stop: Callable[[], bool] = lambda: False
+    ) -> int:
         """
         Looks at all the files in 'path' and returns as int the highest version
         number that matches the version_regex.
 
         Args:
             path (Path): Directory to search for versioned files.
+            force_stop (Callable[[], bool], optional): Callback to interrupt the scan.
 
         Returns:
             int: The maximum version number found. Returns 0 if none.
         """
-        v = 0
-        for f in self.filter_local_files(path):
-            try:
-                version_str = return_version_number_from_string(
-                    self.version_regex, f.name
-                )
-                if int(version_str) > v:
-                    v = int(version_str)
-            except Exception as e:
-                pass
-        return v
+        try:
+            index = self.return_version_index(path, force_stop=force_stop)
+        except OSError as e:
+            logger.debug(f"Cannot scan {path}: {e}")
+            return 0
+        if index.status != "complete":
+            logger.warning(
+                f"Last version of {path} may be outdated, scan {index.status}."
+            )
+        return index.max_version
 
     def return_last_version_file(
-        self, path: Path, ext: Iterable[str]
+        self,
+        path: Path,
+        ext: Iterable[str],
+        force_stop: Callable[[], bool] = lambda: False,
     ) -> Optional[Path]:
         """
         Looks at all the files with a given extension in 'path' and returns as
@@ -868,29 +1112,23 @@ class BasePlugin:
         Args:
             path (Path): Directory to search.
             ext (Iterable[str]): File extensions to match.
+            force_stop (Callable[[], bool], optional): Callback to interrupt the scan.
 
         Returns:
             Optional[Path]: Path to highest-versioned file, or None.
         """
-        v, last_file = 0, None
         logger.debug(f"Filtering possible candidates. -> {path} -> {ext}")
-        for f in self.filter_local_files(path, ext):
-            logger.debug(f"return_last_version_file: FILE FOUND: {f}")
-            try:
-                logger.debug(f"Evaluating {f} as a candidate.")
-                version_str = search(self.version_regex, f.name).group()
-                version_str = sub("[^0-9]", "", version_str)
-                if int(version_str) >= v:
-                    v, last_file = int(version_str), f
-            except:
-                pass
+        try:
+            index = self.return_version_index(path, force_stop=force_stop)
+        except OSError as e:
+            logger.debug(f"Cannot scan {path}: {e}")
+            return None
+        extensions = normalize_extensions(ext)
+        last_file = index.last_version_file(extensions)
 
         # If there are files without versioning regex, get them by date
         if last_file is None:
-            try:
-                last_file = max(self.filter_local_files(path, ext), key=getmtime)
-            except:
-                pass
+            last_file = index.newest_file(extensions)
         logger.debug(f"Candidate found @ {last_file}")
         return last_file
 
@@ -900,17 +1138,21 @@ class BasePlugin:
         subdir: Path = Path(),
         template_failed: bool = True,
         task: Optional[BaseTask] = None,
+        force_stop: Callable[[], bool] = lambda: False,
     ) -> tuple[int, Path]:
         """
         Returns a tuple with the both the version and the
         last file of a given task. Defaults to the task's localpath, but
         can receive a path (generaly a subpath of the local path).
+        The previous task's server folder is only scanned if there are no
+        local files, and like the local one, for at most `scan_timeout` seconds.
 
         Args:
             ext (Iterable[str]): Valid file extensions.
             subdir (Path, optional): Subdirectory to look inside. Defaults to Path().
             template_failed (bool, optional): If True and no file is found, try template. Defaults to True.
             task (Optional[BaseTask], optional): Task context. Defaults to last clicked.
+            force_stop (Callable[[], bool], optional): Callback to interrupt the scans.
 
         Returns:
             tuple[int, Path]: Tuple of version number and file path.
@@ -926,11 +1168,14 @@ class BasePlugin:
                 continue
 
             # last file from current path
-            last_file = self.return_last_version_file(task_path, ext)
+            last_file = self.return_last_version_file(task_path, ext, force_stop)
 
             # if task_path is local_path, find the highest version
             if i == 0:
-                v = self.return_last_version_number(task_path)
+                v = self.return_last_version_number(task_path, force_stop)
+
+            if force_stop():
+                break
 
             if last_file is not None:
                 break
@@ -958,7 +1203,10 @@ class BasePlugin:
         return True, sub("[^0-9]", "", excel.name)
 
     def read_excel(self, excel: Path) -> tuple[list[Any], dict[Any, Any]]:
-        """Base method for creating the logic for read and return contents of an Excel file.
+        """Read and validate the contents of a BDL Excel file.
+
+        Plugins declare their columns and rules in `bdl_schema`; the sheet is
+        read once and validated column-wise against the existing assets.
 
         Args:
             excel (Path): Path to the Excel file.
@@ -966,8 +1214,17 @@ class BasePlugin:
         Returns:
             tuple[list[Any], dict[str, Any]]: A list of rows and a dictionary of parsed data.
         """
+        if self.bdl_schema is None:
+            return [], dict()
+        return self.bdl_schema.validate(excel, self.return_all_assets())
 
-        return [], dict()
+    def return_all_assets(self) -> dict[str, dict[str, Any]]:
+        """Base method returning the existing assets of the project by code.
+
+        Returns:
+            dict[str, dict[str, Any]]: Asset code to asset entity dictionary.
+        """
+        return dict()
 
     def return_seq_and_shot_from_clipname(self, clip_name: str) -> Any:
         """
@@ -1138,6 +1395,33 @@ class BasePlugin:
         """
         return None
 
+    @classmethod
+    def return_thumbnail_source(
+        cls, task: BaseTask, force_stop: Callable[[], bool] = lambda: False
+    ) -> Optional[Path]:
+        """
+        Returns the image a task thumbnail is made from, the newest jpg in
+        the task folder or its direct subfolders.
+
+        Args:
+            task (BaseTask): The task.
+            force_stop (Callable[[], bool], optional): Callback to interrupt the scan.
+
+        Returns:
+            Optional[Path]: The image, or None if there is none.
+        """
+        result = default_scan_service().scan(
+            task.local_path,
+            extensions=frozenset({".jpg"}),
+            max_depth=1,
+            timeout=cls.scan_timeout,
+            force_stop=force_stop,
+        )
+        try:
+            return max(result.files, key=os.path.getmtime, default=None)
+        except OSError:
+            return None
+
     @classmethod
     def create_thumbnail(cls, task: BaseTask) -> bool:
         """
@@ -1149,30 +1433,66 @@ class BasePlugin:
             task (BaseTask): Task for which to create the thumbnail.
 
         Returns:
-            bool: True if creation and resizing succeeded, False otherwise.
+            bool: True if creation and resizing succeeded, False otherwise,
+                also when the task has no thumbnail.
         """
+        if task.thumbnail is None:
+            return False
 
-        file_path = fspath(task.thumbnail)
-        while True:
-            # Generate thumbnail from last file
-            try:
-                dir = task.local_path
-                file_path = max(
-                    [*dir.glob(f"*.jpg"), *dir.glob(f"*/*.jpg")], key=os.path.getmtime
-                )
-                if task.thumbnail.exists():
-                    remove(fspath(task.thumbnail))
-                copy2(file_path, task.thumbnail)
-                break
-            except Exception as e:
-                pass
+        # Generate thumbnail from last file
+        source = cls.return_thumbnail_source(task)
+        if source is not None:
+            return default_thumbnail_pipeline().install(source, task.thumbnail.path)
 
-            # If there are any other methods to retrieve a thumbnail
-            # they can be set here, before returning False
+        # If there are any other methods to retrieve a thumbnail
+        # they can be set here, before returning False
 
-            return False
+        return False
+
+    def create_thumbnails(
+        self,
+        tasks: Iterable[BaseTask],
+        force_stop: Callable[[], bool] = lambda: False,
+    ) -> list[BaseTask]:
+        """
+        Makes the thumbnails of many tasks from their last images, as
+        `create_thumbnail` does for one. The task folders are scanned in
+        background threads and the images reduced in worker processes;
+        images whose thumbnail is cached are not reduced again.
 
-        return cls.resize_thumbnail_image(task.thumbnail)
+        Args:
+            tasks (Iterable[BaseTask]): Tasks needing a thumbnail.
+            force_stop (Callable[[], bool], optional): Callback to stop early.
+
+        Returns:
+            list[BaseTask]: Tasks that have their thumbnail. Tasks without a
+                thumbnail are skipped.
+        """
+        service = default_scan_service()
+        jobs = [
+            (
+                task,
+                service.submit(
+                    task.local_path, extensions=frozenset({".jpg"}), max_depth=1
+                ),
+            )
+            for task in tasks
+            if task.thumbnail is not None
+        ]
+        pairs = list()
+        for task, job in jobs:
+            result = job.wait(self.scan_timeout, force_stop)
+            try:
+                source = max(result.files, key=os.path.getmtime, default=None)
+            except OSError:
+                source = None
+            if source is not None:
+                pairs.append((task, source))
+        installed = default_thumbnail_pipeline().install_many(
+            [(source, task.thumbnail.path) for task, source in pairs], force_stop
+        )
+        installed = set(installed)
+        return [task for task, _ in pairs if Path(task.thumbnail.path) in installed]
 
     def return_maya_outliner_asset_base_nodes(
         self, *args, **kwargs
@@ -1241,8 +1561,21 @@ class BasePlugin:
         ...
 
     @staticmethod
-    def resize_thumbnail_image(file_path: str):
-        return False
+    def resize_thumbnail_image(file_path: str) -> bool:
+        """
+        Reduces an image in place to the thumbnail size.
+
+        Args:
+            file_path (str): The image.
+
+        Returns:
+            bool: True if resized, False if it failed or Pillow is missing.
+        """
+        try:
+            return render_thumbnail(file_path, file_path)
+        except OSError as e:
+            logger.warning(e)
+            return False
 
     def return_filepack_exceptions(self) -> list[str]:
         """
@@ -1255,9 +1588,25 @@ class BasePlugin:
         """
         return []
 
+    def return_qa_checks(self, task_name: str) -> list[str]:
+        """
+        Names of the publisher checks configured for a task, followed by the
+        ones of every task.
+
+        Args:
+            task_name (str): Name of the task, such as "layout".
+
+        Returns:
+            list[str]: Class names of the checks.
+        """
+        qa_config = self._qa_config or dict()
+        return qa_config.get(task_name, []) + qa_config.get("all_tasks", [])
+
     def return_base_task_with_kwargs(self, **kwargs) -> Optional[BaseTask]:
         """
         Returns a task from current plugin if using kwargs as filters.
+        Filters on id, link_name, name or entity_type use the task indexes,
+        others scan the tasks.
 
         Args:
             **kwargs (Any): Attribute-value pairs to match against BaseTask attributes.
@@ -1266,13 +1615,39 @@ class BasePlugin:
             Optional[BaseTask]: Matching task or None.
 
         """
-        for task in self.tasks:
-            if all(getattr(task, k) == v for k, v in kwargs.items()):
-                return task
+        return self._current_tasks_index().find(self._tasks, **kwargs)
+
+    def search_tasks(self, query: str) -> list[BaseTask]:
+        """
+        Returns the tasks matching a search of the task tree columns, such as
+        "status:ip artist:ana ep:102". Plain terms match any column and
+        `header:text` terms a single one; see `task_schema.utils.task_search`.
+        The index is built on the first search and updated when the task list
+        or the texts of its tasks change.
+
+        Args:
+            query (str): Search terms, all of which must match.
+
+        Returns:
+            list[BaseTask]: Matching tasks, in task order.
+        """
+        changes = self._task_changes("search")
+        search = self._task_search
+        if search is None or search.headers != list(self.headers):
+            search = self._task_search = TaskSearch(self.headers, self._tasks)
+        elif changes is None:
+            # only the rows showing different texts are reindexed
+            search.update(self._tasks)
+        else:
+            for task, field in changes:
+                if field in (None, "id", "link_name", "name", "data_to_show"):
+                    search.reindex(task)
+        return search.search(query)
 
     def return_base_task_with_path(self, local_path: Path) -> Optional[BaseTask]:
         """
         Returns a task from current plugin if using local_path as filters.
+        The task whose local path is the closest parent of local_path wins.
 
         Args:
             local_path (Path): Path to match against task local paths.
@@ -1280,14 +1655,76 @@ class BasePlugin:
         Returns:
             Optional[BaseTask]: The matching BaseTask, if any.
         """
-        for part in enumerate(local_path.parts):
-            for task in self._tasks:
-                task_path = task.local_path
-                if task_path == local_path:
-                    return task
-            local_path = Path(
-                *local_path.parts[:-1],
-            )
+        local_path = Path(local_path)
+        changes = self._task_changes("path")
+        if changes is None:
+            # the task list changed since it was built
+            self._tasks_by_path = PathIndex(self._tasks, lambda t: t.local_path)
+        else:
+            for task, field in changes:
+                if field is None or field == "local_path":
+                    self._tasks_by_path.update(task)
+        return self._tasks_by_path.find(local_path)
+
+    def start_folder_watcher(
+        self, root: Optional[Path] = None, native: Optional[bool] = None
+    ) -> FolderWatcher:
+        """
+        Watch a folder tree, the local root by default, so the files added or
+        removed are applied to the cached version indexes, instead of
+        rescanning their folders, and `files_changed_callback` is notified.
+
+        Args:
+            root (Optional[Path]): Folder to watch. Defaults to the local root.
+            native (Optional[bool]): Force or disable native file system events.
+                By default they are used if watchdog is installed and the folder
+                is not on a network share, otherwise the folders are polled,
+                which reads the modification time of every folder at each poll.
+
+        Returns:
+            FolderWatcher: The running watcher.
+        """
+        self.stop_folder_watcher()
+        self._folder_watcher = FolderWatcher(
+            root or self.local_root,
+            self.on_files_changed,
+            debounce=self.watcher_debounce,
+            poll_interval=self.watcher_poll_interval,
+            native=native,
+            prune_dirs=self.scan_prune_dirs,
+        ).start()
+        return self._folder_watcher
+
+    def stop_folder_watcher(self) -> None:
+        """
+        Stop the folder watcher started with `start_folder_watcher`, if any.
+        """
+        if self._folder_watcher is not None:
+            self._folder_watcher.stop()
+            self._folder_watcher = None
+
+    def on_files_changed(self, events: list[FileEvent]) -> None:
+        """
+        Receives the changes found by the folder watcher, applies them to the
+        cached version indexes and forwards them to `files_changed_callback`.
+
+        Args:
+            events (list[FileEvent]): Files added, removed or modified.
+        """
+        self._version_indexes.apply(events)
+        self.files_changed_callback(events)
+
+    def files_changed_callback(self, events: list[FileEvent]) -> None:
+        """
+        Placeholder for refreshing views when the folder watcher finds changes.
+        It's called from the watcher's thread.
+
+        Intended to be overridden by subclasses or externally bound.
+
+        Args:
+            events (list[FileEvent]): Files added, removed or modified.
+        """
+        ...
 
     def file_added_callback(self) -> None:
         """
@@ -1302,6 +1739,11 @@ class BasePlugin:
     ) -> dict[str, str]:
         """
         Generate environment variables needed to launch an external application.
+        The variables are built from cached parts: the plugin settings, the
+        tool folders (until they are modified) and the task ones (until the
+        task or its folder changes). If the plugin sets `handoff_variables`,
+        the GWAIO variables are also written to a context file passed in
+        GWAIO_CONTEXT, and the `handoff_variables` are only passed that way.
 
         Args:
             task (Optional[BaseTask], optional): Task context to embed into environment. Defaults to None.
@@ -1310,154 +1752,217 @@ class BasePlugin:
             dict[str, str]: Dictionary of environment variables.
         """
         task = task or self.last_task_clicked
-        exe_env = {
-            # TODO: test whether we can remove this, as the get_env method from the
-            # env_handler already returns a stripped path
-            # "GWAIO_LOCAL_ROOT": sub(r"(\/|\\)$", "", fspath(self.local_root)).strip(),
-            # "GWAIO_SERVER_ROOT": sub(
-            #     r"(\/|\\)$", "", fspath(self.server_root)
-            # ).strip(),
-            "GWAIO_APP_PATH": fspath(Path(Path(__file__).parent.parent.parent)),
-            "GWAIO_PROJECT_NAME": self.TITLE,
-            "GWAIO_VERSION_REGEX": self.version_regex,
-            "GWAIO_USERNAME": self.username or "",
-            "GWAIO_MAYA_PLAYBLAST_TEMPLATE": fspath(self.TEMPLATES_FOLDER)
-            + "/maya/turntable_playblast_rig_master.ma",
-            "GWAIO_MAYA_LIGHT_TEMPLATE": fspath(self.GWAIO_MAYA_LIGHT_TEMPLATE),
-            "GWAIO_ASSET_FOLDER": self._asset_folder or "",
-            "GWAIO_ASSET_FOLDER_REGEX": self._asset_folder_regex or "",
-            # "GWAIO_SL_SERVER_PATH": fspath(self.SL_SERVER_PATH) or "",
-            "GWAIO_SL_SERVER_PATH": (
-                sub(r"(\/|\\)$", "", fspath(self.SL_SERVER_PATH) or "")
-                if self.SL_SERVER_PATH
-                else ""
-            ),
-            "GWAIO_SL_LOCAL_PATH": (
-                fspath(
-                    replace_root_in_path(
-                        self.server_root,
-                        self.local_root,
-                        self.SL_SERVER_PATH,
+        exe_env = dict(self._return_static_environment())
+        if task:
+            exe_env.update(self._return_task_environment(task))
+        if self.handoff_variables:
+            context = {k: v for k, v in exe_env.items() if k.startswith("GWAIO_")}
+            try:
+                # the file of the same context is reused
+                exe_env[HANDOFF_VARIABLE] = fspath(write_context(context))
+            except OSError as e:
+                logger.warning(f"Passing the task context in the environment: {e}")
+            else:
+                for key in self.handoff_variables:
+                    exe_env.pop(key, None)
+        exe_env.update(self._return_tools_environment())
+        return exe_env
+
+    def _return_static_environment(self) -> dict[str, str]:
+        """Variables that only depend on the plugin settings."""
+        fingerprint = (
+            self.TITLE,
+            self.version_regex,
+            self.username,
+            self.TEMPLATES_FOLDER,
+            self.GWAIO_MAYA_LIGHT_TEMPLATE,
+            self._asset_folder,
+            self._asset_folder_regex,
+            self.SL_SERVER_PATH,
+            self.server_root,
+            self.local_root,
+            self._fps,
+            self._playblast_res,
+            self.GWAIO_DEADLINE_REPO_PATH,
+        )
+
+        def build() -> dict[str, str]:
+            return {
+                # TODO: test whether we can remove this, as the get_env method from the
+                # env_handler already returns a stripped path
+                # "GWAIO_LOCAL_ROOT": sub(r"(\/|\\)$", "", fspath(self.local_root)).strip(),
+                # "GWAIO_SERVER_ROOT": sub(
+                #     r"(\/|\\)$", "", fspath(self.server_root)
+                # ).strip(),
+                "GWAIO_APP_PATH": fspath(Path(Path(__file__).parent.parent.parent)),
+                "GWAIO_PROJECT_NAME": self.TITLE,
+                "GWAIO_VERSION_REGEX": self.version_regex,
+                "GWAIO_USERNAME": self.username or "",
+                "GWAIO_MAYA_PLAYBLAST_TEMPLATE": fspath(self.TEMPLATES_FOLDER)
+                + "/maya/turntable_playblast_rig_master.ma",
+                "GWAIO_MAYA_LIGHT_TEMPLATE": fspath(self.GWAIO_MAYA_LIGHT_TEMPLATE),
+                "GWAIO_ASSET_FOLDER": self._asset_folder or "",
+                "GWAIO_ASSET_FOLDER_REGEX": self._asset_folder_regex or "",
+                # "GWAIO_SL_SERVER_PATH": fspath(self.SL_SERVER_PATH) or "",
+                "GWAIO_SL_SERVER_PATH": (
+                    sub(r"(\/|\\)$", "", fspath(self.SL_SERVER_PATH) or "")
+                    if self.SL_SERVER_PATH
+                    else ""
+                ),
+                "GWAIO_SL_LOCAL_PATH": (
+                    fspath(
+                        replace_root_in_path(
+                            self.server_root,
+                            self.local_root,
+                            self.SL_SERVER_PATH,
+                        )
                     )
-                )
-                if self.SL_SERVER_PATH
-                else ""
+                    if self.SL_SERVER_PATH
+                    else ""
+                ),
+                "GWAIO_FPS": str(self._fps),
+                "GWAIO_PLAYBLAST_RESOLUTION": self._playblast_res or "1920x1080",
+                "GWAIO_DEADLINE_REPO_PATH": self.GWAIO_DEADLINE_REPO_PATH,
+            }
+
+        return self._environment_parts.get("static", fingerprint, build)
+
+    def _return_task_environment(self, task: BaseTask) -> dict[str, str]:
+        """
+        Variables of a task, rebuilt when an attribute of the task is set.
+        The name of the next version depends on the task files, so it is
+        looked up on every call in the shared version indexes.
+        """
+        fingerprint = (
+            # kept alive by the cache, so its identity can't be reused
+            task,
+            task.return_revision(),
+            self.version_regex,
+            self._starting_frame,
+            self._preview_location,
+            self._textures_location,
+            self._export_location,
+        )
+
+        def build() -> dict[str, str]:
+            return {
+                "GWAIO_TASK": task.name,
+                "GWAIO_TASK_DATA": json.dumps(task.serialize()),
+                "GWAIO_OUTLINER_ASSET_NODES": pathsep.join(
+                    self.return_maya_outliner_asset_base_nodes(
+                        link_name=task.link_name
+                    )
+                ),
+                "GWAIO_EPISODE": task.episode or task.episodes or "",
+                "GWAIO_OUTLINER_SHOT_NODES": pathsep.join(
+                    self.return_maya_outliner_shot_base_nodes(
+                        link_name=task.link_name
+                    )
+                ),
+                "GWAIO_TASK_PREVIEW_PATH": fspath(
+                    task.local_path / self._preview_location
+                ),
+                "GWAIO_TASK_TEXTURES_PATH": fspath(
+                    task.local_path / self._textures_location
+                ),
+                "GWAIO_TASK_EXPORT_PATH": fspath(
+                    task.local_path / self._export_location
+                ),
+                "GWAIO_TASK_PATH": fspath(task.local_path),
+                "MAYA_PROJECT": fspath(task.local_path),  # internal maya var
+                "GWAIO_TASK_LINKED_ASSETS": task.assets,
+                "GWAIO_QA_CONFIG": os.pathsep.join(self.return_qa_checks(task.name)),
+                "GWAIO_START_FRAME": str(self._starting_frame or ""),
+                "GWAIO_END_FRAME": (
+                    str(self._starting_frame + task.cut_duration - 1)
+                    if all(
+                        [
+                            f is not None
+                            for f in [
+                                self._starting_frame,
+                                task.cut_duration,
+                            ]
+                        ]
+                    )
+                    else ""
+                ),
+                "GWAIO_START_FRAME_ANIMATIC": str(task.cut_in or ""),
+            }
+
+        key = ("task", default_task_key(task))
+        return {
+            **self._environment_parts.get(key, fingerprint, build),
+            "GWAIO_NAMING_HEAD": return_file_name_head(
+                self.version_regex,
+                # the extensions below are spp and ma because these are the file types
+                # that are currently using this environment variable
+                Path(self.return_next_version_name([".spp", ".ma"]).get("file_name")),
             ),
-            "GWAIO_FPS": str(self._fps),
-            "GWAIO_PLAYBLAST_RESOLUTION": self._playblast_res or "1920x1080",
-            "GWAIO_DEADLINE_REPO_PATH": self.GWAIO_DEADLINE_REPO_PATH,
         }
 
-        if task:
-            exe_env.update(
-                {
-                    "GWAIO_TASK": task.name,
-                    "GWAIO_TASK_DATA": json.dumps(task.serialize()),
-                    "GWAIO_NAMING_HEAD": return_file_name_head(
-                        self.version_regex,
-                        # the extensions below are spp and ma because these are the file types
-                        # that are currently using this environment variable
-                        Path(
-                            self.return_next_version_name([".spp", ".ma"]).get(
-                                "file_name"
-                            )
-                        ),
-                    ),
-                    "GWAIO_OUTLINER_ASSET_NODES": pathsep.join(
-                        self.return_maya_outliner_asset_base_nodes(
-                            link_name=task.link_name
-                        )
-                    ),
-                    "GWAIO_EPISODE": task.episode or task.episodes or "",
-                    "GWAIO_OUTLINER_SHOT_NODES": pathsep.join(
-                        self.return_maya_outliner_shot_base_nodes(
-                            link_name=task.link_name
-                        )
-                    ),
-                    "GWAIO_TASK_PREVIEW_PATH": fspath(
-                        task.local_path / self._preview_location
-                    ),
-                    "GWAIO_TASK_TEXTURES_PATH": fspath(
-                        task.local_path / self._textures_location
-                    ),
-                    "GWAIO_TASK_EXPORT_PATH": fspath(
-                        task.local_path / self._export_location
-                    ),
-                    "GWAIO_TASK_PATH": fspath(task.local_path),
-                    "MAYA_PROJECT": fspath(task.local_path),  # internal maya var
-                    "GWAIO_TASK_LINKED_ASSETS": task.assets,
-                    "GWAIO_QA_CONFIG": os.pathsep.join(
-                        self._qa_config.get(task.name, [])
-                        + self._qa_config.get("all_tasks", [])
-                    ),
-                    "GWAIO_START_FRAME": str(self._starting_frame or ""),
-                    "GWAIO_END_FRAME": (
-                        str(self._starting_frame + task.cut_duration - 1)
-                        if all(
-                            [
-                                f is not None
-                                for f in [
-                                    self._starting_frame,
-                                    task.cut_duration,
-                                ]
-                            ]
-                        )
-                        else ""
-                    ),
-                    "GWAIO_START_FRAME_ANIMATIC": str(task.cut_in or ""),
-                }
-            )
+    def _return_local_tool_path(self, server_path: Path) -> Path:
+        """Local copy of a tools folder of the server root."""
+        return Path(
+            self.env_handler.get_env("GWAIO_LOCAL_ROOT"),
+            *server_path.parts[
+                len(Path(self.env_handler.get_env("GWAIO_SERVER_ROOT")).parts) :
+            ],
+        )
 
-        if self.OCIO_FILE is not None:
-            exe_env["OCIO"] = fspath(
-                Path(
-                    self.env_handler.get_env("GWAIO_LOCAL_ROOT"),
-                    *self.OCIO_FILE.parts[
-                        len(Path(self.env_handler.get_env("GWAIO_SERVER_ROOT")).parts) :
-                    ],
-                )
-            )
+    def _return_tools_environment(self) -> dict[str, str]:
+        """Variables of the tool folders, rebuilt when the Nuke tools change."""
+        local_root = self.env_handler.get_env("GWAIO_LOCAL_ROOT")
+        server_root = self.env_handler.get_env("GWAIO_SERVER_ROOT")
+        custom_nuke_tools = (
+            self._return_local_tool_path(self.CUSTOM_NUKE_TOOLS)
+            if self.CUSTOM_NUKE_TOOLS is not None
+            else None
+        )
+        fingerprint = (
+            local_root,
+            server_root,
+            self.OCIO_FILE,
+            self.CUSTOM_HOUDINI_TOOLS,
+            self.CUSTOM_MAYA_TOOLS,
+            custom_nuke_tools,
+            # its subfolders are added to NUKE_PATH
+            folder_mtime(custom_nuke_tools),
+            environ.get("NUKE_PATH"),
+        )
 
-        if self.CUSTOM_HOUDINI_TOOLS is not None:
-            custom_houdini_tools = Path(
-                self.env_handler.get_env("GWAIO_LOCAL_ROOT"),
-                *self.CUSTOM_HOUDINI_TOOLS.parts[
-                    len(Path(self.env_handler.get_env("GWAIO_SERVER_ROOT")).parts) :
-                ],
-            )
-            exe_env["HOUDINI_PATH"] = f"{custom_houdini_tools};&"
-
-        if self.CUSTOM_NUKE_TOOLS is not None:
-            custom_nuke_tools = Path(
-                self.env_handler.get_env("GWAIO_LOCAL_ROOT"),
-                *self.CUSTOM_NUKE_TOOLS.parts[
-                    len(Path(self.env_handler.get_env("GWAIO_SERVER_ROOT")).parts) :
-                ],
-            )
-            subdirectories = list()
-            if custom_nuke_tools.exists():
-                subdirectories = [
-                    fspath(p) for p in custom_nuke_tools.iterdir() if p.is_dir()
-                ]
-            if environ.get("NUKE_PATH"):
-                subdirectories.append(environ.get("NUKE_PATH"))
-            exe_env["NUKE_PATH"] = (
-                fspath(custom_nuke_tools) + ";" + ";".join(subdirectories)
-            )  # f"{custom_nuke_tools}"
-
-        if self.CUSTOM_MAYA_TOOLS is not None:
-            custom_maya_tools = Path(
-                self.env_handler.get_env("GWAIO_LOCAL_ROOT"),
-                *self.CUSTOM_MAYA_TOOLS.parts[
-                    len(Path(self.env_handler.get_env("GWAIO_SERVER_ROOT")).parts) :
-                ],
-            )
-            exe_env["MAYA_MODULE_PATH"] = fspath(custom_maya_tools / "modules")
-            exe_env["MAYA_PLUG_IN_PATH"] = fspath(custom_maya_tools / "plug-ins")
-            exe_env["PYTHONPATH"] = fspath(custom_maya_tools / "scripts")
-        else:
-            exe_env["PYTHONPATH"] = ""
-        return exe_env
+        def build() -> dict[str, str]:
+            exe_env = dict()
+            if self.OCIO_FILE is not None:
+                exe_env["OCIO"] = fspath(self._return_local_tool_path(self.OCIO_FILE))
+
+            if self.CUSTOM_HOUDINI_TOOLS is not None:
+                custom_houdini_tools = self._return_local_tool_path(
+                    self.CUSTOM_HOUDINI_TOOLS
+                )
+                exe_env["HOUDINI_PATH"] = f"{custom_houdini_tools};&"
+
+            if custom_nuke_tools is not None:
+                subdirectories = list()
+                if custom_nuke_tools.exists():
+                    subdirectories = [
+                        fspath(p) for p in custom_nuke_tools.iterdir() if p.is_dir()
+                    ]
+                if environ.get("NUKE_PATH"):
+                    subdirectories.append(environ.get("NUKE_PATH"))
+                exe_env["NUKE_PATH"] = (
+                    fspath(custom_nuke_tools) + ";" + ";".join(subdirectories)
+                )  # f"{custom_nuke_tools}"
+
+            if self.CUSTOM_MAYA_TOOLS is not None:
+                custom_maya_tools = self._return_local_tool_path(self.CUSTOM_MAYA_TOOLS)
+                exe_env["MAYA_MODULE_PATH"] = fspath(custom_maya_tools / "modules")
+                exe_env["MAYA_PLUG_IN_PATH"] = fspath(custom_maya_tools / "plug-ins")
+                exe_env["PYTHONPATH"] = fspath(custom_maya_tools / "scripts")
+            else:
+                exe_env["PYTHONPATH"] = ""
+            return exe_env
+
+        return self._environment_parts.get("tools", fingerprint, build)
 
     def guess_executable_for_file(self, path: str | Path) -> Optional[str]:
         """
@@ -1516,8 +2021,10 @@ class BasePlugin:
         exe_env = self.generate_environment_for_app()
         if environ:
             executable = self.env_handler.get_env(environ)
-        logger.debug(f"Opening app {executable}")
-        open_app(executable, exe_env=exe_env)
+        exe_env = self._open_in_session(executable, None, exe_env)
+        if exe_env is not None:
+            logger.debug(f"Opening app {executable}")
+            open_app(executable, exe_env=exe_env)
         self.last_task_clicked = last_task_clicked
 
     def open_file_with_env(self, path: str | Path, executable: str) -> None:
@@ -1531,7 +2038,35 @@ class BasePlugin:
         logger.debug(f"Opening file {path}")
         self.extract_plugin_values()
         exe_env = self.generate_environment_for_app()
-        open_file(path, self, executable, exe_env=exe_env)
+        exe_env = self._open_in_session(executable, fspath(path), exe_env)
+        if exe_env is not None:
+            open_file(path, self, executable, exe_env=exe_env)
+
+    def _open_in_session(
+        self, executable: Optional[str], path: Optional[str], exe_env: dict[str, str]
+    ) -> Optional[dict[str, str]]:
+        """
+        Send a file to a running session of the executable, when it is one of
+        the `session_executables`.
+
+        Args:
+            executable (Optional[str]): Path to the application executable.
+            path (Optional[str]): File to open, None to only apply the environment.
+            exe_env (dict[str, str]): Environment to open it with.
+
+        Returns:
+            Optional[dict[str, str]]: None if a session opened it, else the
+                environment to start a new process with.
+        """
+        if not executable or Path(executable).stem.lower() not in {
+            e.lower() for e in self.session_executables
+        }:
+            return exe_env
+        broker = default_session_broker()
+        key = (self.TITLE, fspath(executable))
+        if broker.open_file(key, path, exe_env):
+            return None
+        return {**exe_env, **broker.new_session_env(key)}
 
     def copy_edl_files_to_server(self, shot_data: dict[str, Any]) -> None:
         """
@@ -1581,26 +2116,16 @@ class BasePlugin:
 
             s = time.perf_counter()
 
-            def convert(value):
-                if isinstance(value, (str, int, float, bool, type(None))):
-                    return value
-                elif isinstance(value, Path):
-                    return str(value)
-                # elif isinstance(value, BaseTask):
-                #     return {k: convert(v) for k, v in value.serialize().items()}
-                elif isinstance(value, (list, tuple)):
-                    return [convert(v) for v in value]
-                elif isinstance(value, dict):
-                    return {k: convert(v) for k, v in value.items()}
-                else:
-                    return
-
-            result = {k: convert(v) for k, v in vars(self).items()}
+            # values of other types are written as null
+            result = {
+                k: task_codec.encode(v, default=lambda _: None)
+                for k, v in vars(self).items()
+            }
             with open(
                 Path(environ["GWAIO_DATA_PATH"], f"plugin_data.json"), "w"
             ) as json_file:
                 json.dump(result, json_file, indent=4)
-            print(">>>>>>", s - time.perf_counter())
+            logger.debug(f"Plugin values extracted in {time.perf_counter() - s:.3f}s")
         except Exception as error:
             logger.error(error)
 
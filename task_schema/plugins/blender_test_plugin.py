@@ -4,10 +4,8 @@ from os import fspath, remove
 from pathlib import Path
 from shutil import copy2
 from typing import Iterable
-from re import compile, search, sub
-from difflib import SequenceMatcher as smatch
+from re import compile, search
 
-import pandas
 
 if __name__ == "__main__":
     # these are only required if the module is executed stand alone
@@ -18,8 +16,19 @@ if __name__ == "__main__":
 
 from task_schema.plugins.base_plugin import BaseTask
 from task_schema.plugins.shotgrid_plugin import ShotgridPlugin
-from launcher.qtclasses.toolbar_maya import MayaToolbar
+from task_schema.utils.bdl_validation import (
+    BDLSchema,
+    Condition,
+    Duplicated,
+    EmptyFields,
+    NonAlphanumeric,
+    NotIn,
+    ParentAssetsExist,
+)
 from utilities.pipe_utils import hash_file
+from task_schema.utils.lazy import LazyImport
+
+MayaToolbar = LazyImport("launcher.qtclasses.toolbar_maya:MayaToolbar")
 
 logger = getLogger(__name__)
 
@@ -48,6 +57,35 @@ class BlenderTestPlugin(ShotgridPlugin):
     create_file_ext = ["from selected", "psd", "ma", "spp", "xlsx"]
     uses_deadline = False
     bdlregex = r"bdt_\d\d\d_.*\.xlsx"
+    bdl_schema = BDLSchema(
+        columns=[
+            "asset_type",
+            "code",
+            "variant",
+            "parent_assets",
+            "description",
+            "tags",
+        ],
+        usecols=[0, 1, 2, 3, 4, 5],
+        asset_name=lambda frame: frame["code"] + "_" + frame["variant"],
+        episode=lambda excel, frame: excel.name.split("_")[1],
+        rules=[
+            Duplicated(["code", "variant"]),
+            NotIn(
+                "asset_type",
+                ["ch", "pr", "ve", "sp", "mp", "fx", "en"],
+                "Unknown asset type '{asset_type}'",
+            ),
+            ParentAssetsExist("parent_assets"),
+            Condition(
+                lambda frame, assets: frame["exists"],
+                "Asset already exists",
+                target="warnings",
+            ),
+            EmptyFields(["asset_type", "code"]),
+            NonAlphanumeric(["code", "variant"]),
+        ],
+    )
 
     def __new__(cls: "BlenderTestPlugin", *args, **kwargs) -> "BlenderTestPlugin":
         cls._local_root = Path(cls.env_handler.get_env("BLENDERTEST_LOCAL_PATH"))
@@ -446,89 +484,6 @@ class BlenderTestPlugin(ShotgridPlugin):
         ) = clip_name.split("_")
         return f"bdt_{ep}_{sq}", f"bdt_{ep}_{sq}_{sh}"
 
-    def read_excel(self, excel: Path):
-        episode = excel.name.split("_")[1]
-        existing_assets = self.return_all_assets()
-        data_frame = (
-            pandas.read_excel(excel, usecols=[0, 1, 2, 3, 4, 5])
-            # .replace(regex=[" "], value="_")
-            # .replace(regex=[r"_$"], value="")
-        )
-        data_frame.fillna("", inplace=True)
-        results = dict()
-        dupes = data_frame.duplicated(
-            subset=data_frame.columns[1:3].tolist(), keep=False
-        )
-
-        # row: pandas.Series
-        for i, row in data_frame.iterrows():
-            logger.debug(f"Reading data: {[*row]}")
-            try:
-                asset_type, code, variant, parent_assets, description, tags = row[:6]
-            except ValueError as e:
-                logger.debug(f"Failed to parse row: {[*row]}")
-                raise (e)
-
-            asset_name = f"{code}_{variant}"
-
-            results[i] = {
-                "series": [content for content in row[:6].tolist()],
-                "errors": list(),
-                "warnings": list(),
-                "episode": f"{episode}",
-                "asset_name": asset_name,
-                "exists": asset_name in existing_assets,
-                "status": True,
-            }
-
-            if dupes[i]:
-                results[i]["errors"].append("This asset is repeated.")
-
-            if asset_type not in ["ch", "pr", "ve", "sp", "mp", "fx", "en"]:
-                results[i]["errors"].append(f"Unknown asset type '{asset_type}'")
-
-            if parent_assets:
-                if not "," in parent_assets:
-                    parent_assets = [parent_assets]
-                else:
-                    parent_assets = parent_assets.split(",")
-
-                for parent_asset in parent_assets:
-                    if parent_asset not in existing_assets:
-                        candidate = next(
-                            (
-                                k
-                                for k in existing_assets
-                                if smatch(None, k, parent_asset).ratio() > 0.8
-                            ),
-                            None,
-                        )
-                        results[i]["errors"].append(
-                            f"Parent asset {parent_asset} "
-                            + "does not exist in SG, please create it first. "
-                            + ("\n" if candidate else "")
-                            + f"{('Maybe you meant '+ candidate + '?') if candidate is not None else ''}"
-                        )
-
-            if asset_name in existing_assets:
-                results[i]["exists"] = True
-                results[i]["warnings"].append(f"Asset already exists")
-
-            for content in [*row[:2]]:
-                if content in (None, ""):
-                    results[i]["errors"].append("There are some empty fields.")
-
-            for tag in (code, variant):
-                if not tag.replace("_", "").isalnum() and tag != "":
-                    results[i]["errors"].append(
-                        f"There are non alphanumeric values: "
-                        f"{sub('[^0-9a-zA-Z]+', '*', tag)}"
-                    )
-
-            results[i]["status"] = len(results[i]["errors"]) == 0
-
-        return [*data_frame.columns[:6].tolist()], results
-
 
 if __name__ == "__main__":
     from PySide6.QtWidgets import QApplication
@@ -23,9 +23,11 @@ if __name__ == "__main__":
     EnvironmentHandler()
 
 from task_schema.plugins.shotgrid_plugin import ShotgridPlugin, ShotgridInstance
-from launcher.qtclasses.toolbar_maya import MayaToolbar
 from utilities.pipe_utils import TimeoutPath, hash_file
 from mondo_scripts.excel_utils import read_xlsx, process_string
+from task_schema.utils.lazy import LazyImport
+
+MayaToolbar = LazyImport("launcher.qtclasses.toolbar_maya:MayaToolbar")
 
 try:
     from utilities.maya.scripts import (
@@ -1,6 +1,6 @@
 from logging import getLogger, basicConfig, DEBUG
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 from re import compile, sub, search
 from os import fspath, remove
 import os.path
@@ -25,6 +25,7 @@ if __name__ == "__main__":
     EnvironmentHandler()
 
 from task_schema.plugins.furrytails_plugin import FurryTailsPlugin
+from task_schema.utils.file_scan import normalize_extensions
 from utilities.pipe_utils import TimeoutPath
 
 if TYPE_CHECKING:
@@ -228,31 +229,29 @@ class FurryTailsNewPlugin(FurryTailsPlugin):
             file_name = f"{link}_{task_name}_V*{ext}"
             return list(self.last_task_clicked.local_path.glob(file_name))
 
-    def return_last_version_file(self, path: Path, ext: Iterable[str]) -> Path | None:
+    def return_last_version_file(
+        self,
+        path: Path,
+        ext: Iterable[str],
+        force_stop: Callable[[], bool] = lambda: False,
+    ) -> Path | None:
         """
         Looks at all the files with a given extension in 'path' and returns as
         Path the file that has the highest version number that matches the version_regex.
+        V000 files are not candidates.
         """
-        v, last_file = 0, None
         logger.debug(f"Filtering possible candidates.")
-        for f in self.filter_local_files(path, ext):
-            try:
-                logger.debug(f"Evaluating {f} as a candidate.")
-                version_str = search(self.version_regex, f.name).group()
-                version_str = sub("[^0-9]", "", version_str)
-                if int(version_str) == 0:
-                    print("OMIT:",f)
-                if int(version_str) >= v and int(version_str) != 0:
-                    v, last_file = int(version_str), f
-            except:
-                pass
+        try:
+            index = self.return_version_index(path, force_stop=force_stop)
+        except OSError as e:
+            logger.debug(f"Cannot scan {path}: {e}")
+            return None
+        extensions = normalize_extensions(ext)
+        last_file = index.last_version_file(extensions, min_version=1)
 
         # If there are files without versioning regex, get them by date
         if last_file is None:
-            try:
-                last_file = max(self.filter_local_files(path, ext), key=getmtime)
-            except:
-                pass
+            last_file = index.newest_file(extensions)
         logger.debug(f"Candidate found @ {last_file}")
         return last_file
     
@@ -11,7 +11,11 @@ sys.path.append(base_path)
 
 
 from task_schema.plugins.shotgrid_plugin import ShotgridPlugin
-from launcher.qtclasses.toolbar_meteoheroes import MeteoHeoresToolbar
+from task_schema.utils.lazy import LazyImport
+
+MeteoHeoresToolbar = LazyImport(
+    "launcher.qtclasses.toolbar_meteoheroes:MeteoHeoresToolbar"
+)
 
 logger = getLogger(__name__)
 
@@ -1,14 +1,23 @@
+from __future__ import annotations
+
 from collections.abc import Callable
 from datetime import datetime
 import logging
 from pathlib import Path
 import json
-
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from typing import TYPE_CHECKING
 
 from task_schema.plugins.base_plugin import BasePlugin, BaseTask
-from launcher.qtclasses.toolbar_google import GoogleToolbar
+from task_schema.utils.lazy import LazyImport
+
+if TYPE_CHECKING:
+    import gspread
+else:
+    gspread = LazyImport("gspread")
+ServiceAccountCredentials = LazyImport(
+    "oauth2client.service_account:ServiceAccountCredentials"
+)
+GoogleToolbar = LazyImport("launcher.qtclasses.toolbar_google:GoogleToolbar")
 
 
 class GooglePlugin(BasePlugin):
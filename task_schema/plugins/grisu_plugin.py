@@ -12,8 +12,12 @@ if __name__ == "__main__":
     sys.path.append(fspath(Path(__file__).parent.parent.parent))
 
 from task_schema.plugins.shotgrid_plugin import ShotgridPlugin
-from launcher.qtclasses.toolbar_maya import MayaToolbar
-from launcher.qtclasses.toolbar_meteoheroes import MeteoHeoresToolbar
+from task_schema.utils.lazy import LazyImport
+
+MayaToolbar = LazyImport("launcher.qtclasses.toolbar_maya:MayaToolbar")
+MeteoHeoresToolbar = LazyImport(
+    "launcher.qtclasses.toolbar_meteoheroes:MeteoHeoresToolbar"
+)
 
 logger = getLogger(__name__)
 
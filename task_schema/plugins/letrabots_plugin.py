@@ -2,8 +2,10 @@ import logging
 import os
 from pathlib import Path
 from re import match, Match, search, compile as rcomp
+from typing import TYPE_CHECKING
 
-import pandas
+if TYPE_CHECKING:
+    import pandas
 
 if __name__ == "__main__":
     # these are only required if the module is executed stand alone
@@ -13,10 +15,21 @@ if __name__ == "__main__":
     sys.path.append(fspath(Path(__file__).parent.parent.parent))
 
 from task_schema.plugins.generic2d_plugin import Generic2DPlugin
+from task_schema.utils.bdl_validation import (
+    BDLSchema,
+    Condition,
+    Duplicated,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _episode_assets(frame: "pandas.DataFrame") -> "pandas.Series":
+    """Flag the BDL rows whose asset name carries an LB1XX episode prefix."""
+    asset = frame["asset"].astype(str)
+    return asset.str.startswith("LB1") & asset.str.contains("_", regex=False)
+
+
 class LetrabotsPlugin(Generic2DPlugin):
     TITLE = "LetraBots"
     PLUGIN_UUID = "8b82740c-a1ce-44e0-b3d6-03e177b4fad5"
@@ -24,6 +37,33 @@ class LetrabotsPlugin(Generic2DPlugin):
 
     SG_PROJECT_ID = 254
     bdlregex = r"Checklist LB\d\d\d"
+    bdl_schema = BDLSchema(
+        columns=["scene", "asset", "scenes"],
+        usecols=[0, 1, 5],
+        read_kwargs={"skiprows": [0]},
+        dropna=["asset"],
+        asset_name=lambda frame: frame["asset"],
+        # only the assets with an episode prefix are looked up, as before
+        exists_name=lambda frame: frame["asset"].where(_episode_assets(frame), ""),
+        episode=lambda excel, frame: ("LB" + frame["asset"].str[2:5]).where(
+            _episode_assets(frame), "LBNone"
+        ),
+        rules=[
+            Duplicated(["asset"]),
+            Condition(
+                lambda frame, assets: _episode_assets(frame)
+                & frame["asset"].str.contains(" ", regex=False),
+                "Naming has white spaces (espacios en blanco).",
+            ),
+            Condition(
+                lambda frame, assets: ~_episode_assets(frame)
+                | ~frame["asset"].str.match(
+                    r"^LB\d\d\d_(BG|CH|FX|PR|LAYOUT)_[0-9A-Z@#_]+"
+                ),
+                "Naming of the assets seems wrong.",
+            ),
+        ],
+    )
 
     _active_entities = ["Asset", "Sequence", "Episode", "Shot"]
     title = "Letrabots Plugin"
@@ -132,59 +172,6 @@ class LetrabotsPlugin(Generic2DPlugin):
 
         return local_path, server_path
 
-    def read_excel(self, excel: Path):
-        episode = excel.name.split(" ")[1][:3]
-        existing_assets = self.return_all_assets()
-        data_frame = pandas.read_excel(excel, skiprows=[0], usecols=[0, 1, 5])
-        data_frame = data_frame.dropna(subset=data_frame.columns[1:2])
-        data_frame.fillna("", inplace=True)
-        results = dict()
-        dupes = data_frame.duplicated(
-            subset=data_frame.columns[1:2].tolist(), keep=False
-        )
-
-        row: pandas.Series
-        for i, row in data_frame.iterrows():
-            # logger.debug(f"{i} - {row}")
-            scene = row[0] or ""
-            asset_name = row[1] if row[1].startswith("LB1") and "_" in row[1] else ""
-            episode = asset_name[2:5] if asset_name != "" else None
-            # asset_name = row[1] if len(row) >= 2 else ""
-            scenes = row[2] if len(row) == 3 else ""
-
-            results[i] = {
-                "series": row.tolist(),
-                "errors": list(),
-                "episode": f"LB{episode}",
-                "asset_name": row[1],
-                "exists": asset_name in existing_assets,
-                "status": True,
-            }
-
-            if dupes[i]:
-                results[i]["errors"].append("This asset is repeated.")
-
-            if " " in asset_name:
-                # logger.debug(row[0])
-                results[i]["errors"].append(
-                    "Naming has white spaces (espacios en blanco)."
-                )
-
-            if not match(r"^LB\d\d\d_(BG|CH|FX|PR|LAYOUT)_[0-9A-Z@#_]+", asset_name):
-                # logger.debug(asset_name)
-                results[i]["errors"].append("Naming of the assets seems wrong.")
-
-            if asset_name in existing_assets:
-                results[i]["exists"] = True
-                if not asset_name.startswith(f"LB{episode}"):
-                    results[i]["errors"].append(
-                        f"Asset exists and it won't be created."
-                    )
-
-            results[i]["status"] = len(results[i]["errors"]) == 0
-
-        return data_frame.columns.tolist(), results
-
     def create_assets_from_bdl(self, dict_with_items: dict, excel_file: Path):
         created_assets = self.return_all_assets()
         created_episodes = self.return_all_episodes()
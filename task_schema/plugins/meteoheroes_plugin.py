@@ -5,8 +5,6 @@ from shutil import copy2
 from os import fspath
 from re import match, Match
 
-import pandas
-
 if __name__ == "__main__":
     # these are only required if the module is executed stand alone
     import sys
@@ -14,6 +12,13 @@ if __name__ == "__main__":
     sys.path.append(fspath(Path(__file__).parent.parent.parent))
 
 from task_schema.plugins.generic2d_plugin import Generic2DPlugin
+from task_schema.utils.bdl_validation import (
+    BDLSchema,
+    Condition,
+    Duplicated,
+    NotMatching,
+    starts_with_episode,
+)
 
 
 class MeteoHeroesPlugin(Generic2DPlugin):
@@ -29,6 +34,27 @@ class MeteoHeroesPlugin(Generic2DPlugin):
 
     title = "MeteoHeroes Plugin"
     bdlregex = r"Checklist \d\d\d"
+    bdl_schema = BDLSchema(
+        columns=["scene", "asset", "scenes"],
+        usecols=[0, 1, 5],
+        read_kwargs={"skiprows": [0]},
+        dropna=["scene", "asset"],
+        asset_name=lambda frame: frame["asset"],
+        episode=lambda excel, frame: f"MH{excel.name.split(' ')[1][:3]}",
+        rules=[
+            Duplicated(["asset"]),
+            NotMatching(
+                "asset",
+                r"^(MH\d\d\d|MH00)_(BG|CH|FX|PR|LAYOUT)_[A-Z_]+",
+                "Naming of the assets seems wrong.",
+            ),
+            Condition(
+                lambda frame, assets: frame["exists"]
+                & ~starts_with_episode(frame, "asset", "{episode}"),
+                "Asset exists and it won't be created.",
+            ),
+        ],
+    )
 
     def __new__(cls: "MeteoHeroesPlugin", *args, **kwargs) -> "MeteoHeroesPlugin":
         cls._local_root = Path(cls.env_handler.get_env("METEOHEROES_LOCAL_PATH"))
@@ -95,50 +121,6 @@ class MeteoHeroesPlugin(Generic2DPlugin):
 
         return local_path, server_path
 
-    def read_excel(self, excel: Path):
-        episode = excel.name.split(" ")[1][:3]
-        existing_assets = self.return_all_assets()
-        data_frame = pandas.read_excel(excel, skiprows=[0], usecols=[0, 1, 5])
-        data_frame = data_frame.dropna(subset=data_frame.columns[:2])
-        data_frame.fillna("", inplace=True)
-        results = dict()
-        dupes = data_frame.duplicated(
-            subset=data_frame.columns[1:2].tolist(), keep=False
-        )
-
-        row: pandas.Series
-        for i, row in data_frame.iterrows():
-            scene = row[0] or ""
-            asset_name = row[1] if len(row) >= 2 else ""
-            scenes = row[2] if len(row) == 3 else ""
-
-            results[i] = {
-                "series": row.tolist(),
-                "errors": list(),
-                "episode": f"MH{episode}",
-                "asset_name": row[1],
-                "exists": asset_name in existing_assets,
-                "status": True,
-            }
-
-            if dupes[i]:
-                results[i]["errors"].append("This asset is repeated.")
-
-            if not match(r"^(MH\d\d\d|MH00)_(BG|CH|FX|PR|LAYOUT)_[A-Z_]+", asset_name):
-                # logger.debug(asset_name)
-                results[i]["errors"].append("Naming of the assets seems wrong.")
-
-            if asset_name in existing_assets:
-                results[i]["exists"] = True
-                if not asset_name.startswith(f"MH{episode}"):
-                    results[i]["errors"].append(
-                        f"Asset exists and it won't be created."
-                    )
-
-            results[i]["status"] = len(results[i]["errors"]) == 0
-
-        return data_frame.columns.tolist(), results
-
     def create_assets_from_bdl(self, dict_with_items: dict, excel_file: Path):
         created_assets = self.return_all_assets()
         created_episodes = self.return_all_episodes()
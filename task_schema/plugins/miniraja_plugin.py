@@ -6,14 +6,19 @@ from typing import Iterable
 from os import fspath
 from re import match, Match, compile
 
-import pandas
-
 if __name__ == "__main__":
     # these are only required if the module is executed stand alone
     import sys
     sys.path.append(fspath(Path(__file__).parent.parent.parent))
 
 from task_schema.plugins.generic2d_plugin import Generic2DPlugin
+from task_schema.utils.bdl_validation import (
+    BDLSchema,
+    Condition,
+    Duplicated,
+    NotMatching,
+    starts_with_episode,
+)
 
 logger = getLogger(__file__)
 
@@ -34,6 +39,31 @@ class MiniRajaPlugin(Generic2DPlugin):
     _active_entities = ["Asset", "Sequence", "Episode", "Shot"]
     _edl_target_task = "animatic"
     _shot_task_tpl_id = 739
+    bdl_schema = BDLSchema(
+        columns=["scene", "asset", "scenes"],
+        usecols=[0, 1, 5],
+        read_kwargs={"skiprows": [0]},
+        replace_pairs=[
+            {"regex": [" "], "value": "_"},
+            {"regex": [r"_$"], "value": ""},
+        ],
+        dropna=["scene", "asset"],
+        asset_name=lambda frame: frame["asset"].astype(str),
+        episode=lambda excel, frame: excel.name.split(" ")[1][:5],
+        rules=[
+            Duplicated(["asset"]),
+            NotMatching(
+                "asset",
+                r"^(MR\d\d\d|MR00)_(BG|CH|FX|PR|LAYOUT)_[A-Z_]+",
+                "Naming of the assets seems wrong.",
+            ),
+            Condition(
+                lambda frame, assets: frame["exists"]
+                & ~starts_with_episode(frame, "asset_name", "MR{episode}", "MR00"),
+                "Asset exists and it won't be created.",
+            ),
+        ],
+    )
 
     def __new__(cls: "MiniRajaPlugin", *args, **kwargs) -> "MiniRajaPlugin":
         cls._local_root = Path(cls.env_handler.get_env("MINIRAJA_LOCAL_PATH"))
@@ -129,56 +159,6 @@ class MiniRajaPlugin(Generic2DPlugin):
 
         return local_path, server_path
 
-    def read_excel(self, excel: Path):
-        episode = excel.name.split(" ")[1][:5]
-        existing_assets = self.return_all_assets()
-        data_frame = (
-            pandas.read_excel(excel, skiprows=[0], usecols=[0, 1, 5])
-            .replace(regex=[" "], value="_")
-            .replace(regex=[r"_$"], value="")
-        )
-        data_frame = data_frame.dropna(subset=data_frame.columns[:2])
-        data_frame.fillna("", inplace=True)
-        results = dict()
-        dupes = data_frame.duplicated(
-            subset=data_frame.columns[1:2].tolist(), keep=False
-        )
-
-        row: pandas.Series
-        for i, row in data_frame.iterrows():
-            scene = row[0] or ""
-            asset_name = str(row[1]) if len(row) >= 2 else ""
-            scenes = row[2] if len(row) == 3 else ""
-
-            results[i] = {
-                "series": row.tolist(),
-                "errors": list(),
-                "episode": f"{episode}",
-                "asset_name": row[1],
-                "exists": asset_name in existing_assets,
-                "status": True,
-            }
-
-            if dupes[i]:
-                results[i]["errors"].append("This asset is repeated.")
-
-            if not match(r"^(MR\d\d\d|MR00)_(BG|CH|FX|PR|LAYOUT)_[A-Z_]+", asset_name):
-                # logger.debug(asset_name)
-                results[i]["errors"].append("Naming of the assets seems wrong.")
-
-            # logger.debug(asset_name)
-            # logger.debug(existing_assets)
-            if asset_name in existing_assets.keys():
-                results[i]["exists"] = True
-                if not asset_name.startswith(f"MR{episode}") and not asset_name.startswith(f"MR00"):
-                    results[i]["errors"].append(
-                        f"Asset exists and it won't be created."
-                    )
-
-            results[i]["status"] = len(results[i]["errors"]) == 0
-
-        return data_frame.columns.tolist(), results
-    
     def return_next_version_name(self, ext: Iterable) -> dict:
         result = super().return_next_version_name(ext)
         if self.last_task_clicked.asset_type:
@@ -1,21 +1,21 @@
+from __future__ import annotations
+
 import asyncio
 from functools import partial
 import logging
 from pprint import pprint
 from tempfile import TemporaryDirectory
-from typing import Any, Callable, Generator, Optional, Union, Iterator
+from typing import Any, Callable, Generator, Optional, Union, Iterator, TYPE_CHECKING
 from os import fspath, remove
 import os.path
 from pathlib import Path
 import json
-from time import mktime
+from threading import Thread
+from time import mktime, perf_counter
 from datetime import datetime
 from shutil import copy2
 import webbrowser as web
 
-import shotgun_api3 as sg3
-from shotgun_api3.shotgun import Shotgun
-
 from utilities.pipe_utils import (
     create_package,
     execute_mayapy,
@@ -23,9 +23,18 @@ from utilities.pipe_utils import (
     return_version_number_from_string,
 )
 from task_schema.plugins.base_plugin import BasePlugin, BaseTask, BaseThumbnail
-from launcher.qtclasses.toolbar_shotgrid import ShotgridToolbar
-from launcher import metadata
-from mondo_scripts.editorial import read_xml
+from task_schema.utils.metadata_cache import MetadataCache
+from task_schema.utils.lazy import LazyImport
+from task_schema.utils.sg_batch import send_batches, task_field_updates
+from task_schema.utils.thumbnails import default_thumbnail_pipeline
+
+if TYPE_CHECKING:
+    from shotgun_api3.shotgun import Shotgun
+
+sg3 = LazyImport("shotgun_api3")
+ShotgridToolbar = LazyImport("launcher.qtclasses.toolbar_shotgrid:ShotgridToolbar")
+metadata = LazyImport("launcher.metadata")
+read_xml = LazyImport("mondo_scripts.editorial:read_xml")
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +97,10 @@ class ShotgridPlugin(BasePlugin):
         _discarted_task_status (List[str]): List of task statuses to ignore.
         _discarted_version_status (List[str]): List of version statuses to ignore.
         asset_task_fields_dict (Optional[Dict]): Optional dictionary for customizing task fields.
+        sg_batch_size (int): Maximum number of requests per ShotGrid batch call.
+        sg_batch_workers (int): Maximum number of concurrent ShotGrid batch calls.
+        metadata_cache_ttl (int): Seconds before the cached project metadata
+            (task short names, status colors) is revalidated. 0 disables the cache.
 
     Instance Attributes:
         sg (Shotgun): ShotGrid API instance.
@@ -105,6 +118,7 @@ class ShotgridPlugin(BasePlugin):
         _upload_status (str): Default status to assign when uploading a version.
         _version_publish_fields (List[str]): Fields to include when publishing a version.
         _color_status (Dict[str, Tuple[int, int, int]]): Mapping of ShotGrid status codes to RGB colors.
+        _metadata_thread (Optional[Thread]): Background revalidation of the cached project metadata.
     """
     TITLE = "Shotgrid"
     _server_root = Path("\\\\qsrv01.mondotvcanarias.lan\\data0\\PROJECTS\\GRISU")
@@ -129,6 +143,9 @@ class ShotgridPlugin(BasePlugin):
     _discarted_task_status: list[str] = ["na"]
     _discarted_version_status: list[str] = ["na", "dct"]
     asset_task_fields_dict: dict[dict, dict[str, str]] = None
+    sg_batch_size: int = 100
+    sg_batch_workers: int = 4
+    metadata_cache_ttl: int = 86400
 
     def __new__(cls: "ShotgridPlugin", *args, **kwargs) -> "ShotgridPlugin":
         # cls.plugin_task_fields.append(cls.custom_artist_entity)
@@ -175,10 +192,9 @@ class ShotgridPlugin(BasePlugin):
         self.custom_artist_task_field = None
         self._starting_frame = 1
 
-        self.sg = self._instantiate_shogrid()
+        self.sg = self._instantiate_shogrid(connect=False)
         self._task_long_to_short_dict: dict[str, str] = dict()
-        self._set_task_long_to_short_dict()
-        self._set_color_status()
+        self._metadata_thread = self._load_project_metadata()
         self._upload_status = "rev"
         self._version_publish_fields = [
             "project",
@@ -254,31 +270,62 @@ class ShotgridPlugin(BasePlugin):
         loop.close()
         return [item for group in result for item in group]
 
-    def _set_color_status(self) -> None:
+    def _set_color_status(self, sg: Optional[Shotgun] = None) -> None:
         """
         Initializes the internal `_color_status` dictionary mapping status codes to RGB color tuples.
+
+        Args:
+            sg (Optional[Shotgun]): Session used for the query, `self.sg` by default.
+        """
+        self._color_status = self._query_color_status(sg or self.sg)
+
+    def _query_color_status(self, sg: Shotgun) -> dict[str, list[int]]:
         """
-        raw_data_status = self.sg.find(
+        Queries the status codes and their RGB colors.
+
+        Args:
+            sg (Shotgun): Session used for the query.
+
+        Returns:
+            dict[str, list[int]]: Status code to RGB color list.
+        """
+        raw_data_status = sg.find(
             "Status",
             filters=[
                 # ["sg_used_in", "is", {"type": "Project", "id": self.SG_PROJECT_ID}]
             ],
             fields=["code", "bg_color"],
         )
-        self._color_status = dict()
+        color_status = dict()
         for item in raw_data_status:
             if item["bg_color"] is None:
                 item["bg_color"] = "255,255,255"
-            self._color_status[item["code"]] = [
+            color_status[item["code"]] = [
                 int(col) for col in item["bg_color"].split(",")
             ]
+        return color_status
 
-    def _set_task_long_to_short_dict(self) -> None:
+    def _set_task_long_to_short_dict(self, sg: Optional[Shotgun] = None) -> None:
         """
         Populates `_task_long_to_short` with mappings for task and step names from ShotGrid's TaskTemplates and Steps.
+
+        Args:
+            sg (Optional[Shotgun]): Session used for the queries, `self.sg` by default.
+        """
+        self._task_long_to_short = self._query_task_long_to_short(sg or self.sg)
+
+    def _query_task_long_to_short(self, sg: Shotgun) -> dict[str, str]:
+        """
+        Queries the short names of the project's TaskTemplate tasks and Steps.
+
+        Args:
+            sg (Shotgun): Session used for the queries.
+
+        Returns:
+            dict[str, str]: Long task or step name to short name.
         """
         # project = self.sg.find("Project",[["id","is",int(self.SG_PROJECT_ID)]])
-        raw_data_task = self.sg.find(
+        raw_data_task = sg.find(
             "Task",
             filters=[
                 ["task_template", "is_not", None],
@@ -292,13 +339,56 @@ class ShotgridPlugin(BasePlugin):
             fields=["content", "sg_short_name"],
         )
 
-        raw_data_step = self.sg.find("Step", filters=[], fields=["code", "short_name"])
+        raw_data_step = sg.find("Step", filters=[], fields=["code", "short_name"])
 
-        self._task_long_to_short = {
+        return {
             **{t["content"]: t["sg_short_name"] for t in raw_data_task},
             **{s["code"]: s["short_name"] for s in raw_data_step},
         }
 
+    def _fetch_project_metadata(self) -> dict[str, Any]:
+        """
+        Queries the project level lookups with a dedicated session, so it can
+        run outside the main thread.
+
+        Returns:
+            dict[str, Any]: Task short names and status colors.
+        """
+        with ShotgridInstance(self) as sg:
+            return {
+                "task_long_to_short": self._query_task_long_to_short(sg),
+                "color_status": self._query_color_status(sg),
+            }
+
+    def _apply_project_metadata(self, data: dict[str, Any]) -> None:
+        """
+        Sets the project level lookups returned by `_fetch_project_metadata`.
+
+        Args:
+            data (dict[str, Any]): Task short names and status colors.
+        """
+        self._task_long_to_short = data["task_long_to_short"]
+        self._color_status = data["color_status"]
+
+    def _load_project_metadata(self) -> Optional[Thread]:
+        """
+        Loads the project level lookups from the local metadata cache,
+        revalidating them in the background once older than
+        `metadata_cache_ttl`. Without a cache they are queried right away.
+
+        Returns:
+            Optional[Thread]: The background revalidation thread, if any.
+        """
+        data_path = os.environ.get("GWAIO_DATA_PATH")
+        if not data_path or not self.metadata_cache_ttl:
+            self._apply_project_metadata(self._fetch_project_metadata())
+            return None
+        cache = MetadataCache(
+            Path(data_path, f"sg_metadata_{self.title}.json"),
+            ttl=self.metadata_cache_ttl,
+        )
+        return cache.get(self._fetch_project_metadata, self._apply_project_metadata)
+
     def task_long_to_short(self, task_name: str) -> str:
         """
         Returns the short alias for a given long task name.
@@ -318,10 +408,14 @@ class ShotgridPlugin(BasePlugin):
             raise Exception(f"Task '{task_name}' not found in Task templates")
 
     @classmethod
-    def _instantiate_shogrid(cls) -> Shotgun:
+    def _instantiate_shogrid(cls, connect: bool = True) -> Shotgun:
         """
         Instantiates and returns a Shotgun API session using class-level credentials.
 
+        Args:
+            connect (bool): Whether to contact the server right away. When False,
+                the connection is made on the first request.
+
         Returns:
             Shotgun: An authenticated Shotgun instance.
         """
@@ -329,6 +423,7 @@ class ShotgridPlugin(BasePlugin):
             cls.SHOTGRID_URL,
             script_name=cls.SHOTGRID_SCRIPT_NAME,
             api_key=cls.SHOTGRID_API_KEY,
+            connect=connect,
         )
 
     def browse_task_data(self, task: BaseTask) -> None:
@@ -718,7 +813,7 @@ class ShotgridPlugin(BasePlugin):
 
         self.tasks = all_tasks
 
-        return_object["results"] = (all_tasks, self.headers)
+        return_object["results"] = (self.tasks, self.headers)
         if callback is not None:
             callback()
 
@@ -1664,7 +1759,7 @@ class ShotgridPlugin(BasePlugin):
                 logger.debug(f"Saving version: {out_path}")
                 self.sg.download_attachment({"url": url}, file_path=fspath(out_path))
 
-    def create_thumbnail(self, task: BaseTask) -> Optional[Path]:
+    def create_thumbnail(self, task: BaseTask) -> bool:
         """
         Generate and set a thumbnail for the given task.
 
@@ -1675,32 +1770,27 @@ class ShotgridPlugin(BasePlugin):
             task (BaseTask): The task for which to create the thumbnail.
 
         Returns:
-            Optional[Path]: Path to the generated thumbnail or None if failed.
+            bool: True if the thumbnail was created, False otherwise, also when
+                the task has no thumbnail.
         """
-        file_path = fspath(task.thumbnail.path)
-        while True:
-            # Generate thumbnail from last file
-            try:
-                dir = task.local_path
-                file_path = max(
-                    [*dir.glob(f"*.jpg"), *dir.glob(f"*/*.jpg")], key=os.path.getmtime
-                )
-                if task.thumbnail.path.exists():
-                    remove(fspath(task.thumbnail.path))
-                copy2(file_path, task.thumbnail.path)
-                break
-            except Exception as e:
-                pass
+        if task.thumbnail is None:
+            return False
 
-            # Download from SG
-            if self.download_thumbnail_from_sg(
-                "Task", task.task_entity.get("id"), file_path
-            ):
-                break
+        # Generate thumbnail from last file
+        source = self.return_thumbnail_source(task)
+        if source is not None and default_thumbnail_pipeline().install(
+            source, task.thumbnail.path
+        ):
+            return True
 
+        # Download from SG
+        file_path = fspath(task.thumbnail.path)
+        if not self.download_thumbnail_from_sg(
+            "Task", task.task_entity.get("id"), file_path
+        ):
             return False
 
-        return self.resize_thumbnail_image(task.thumbnail.path)
+        return self.resize_thumbnail_image(file_path)
 
     def publish_last_version(self, task: Optional[BaseTask] = None) -> bool:
         """
@@ -2607,51 +2697,81 @@ class ShotgridPlugin(BasePlugin):
                 if file_to_log.exists():
                     ftw.write(f"{file_to_log.name}\n")
 
-    def update_asset_task_fields_with_task_entities(self, additional_filters: Optional[list[Any]] = None) -> None:
+    def update_asset_task_fields_with_task_entities(
+        self, additional_filters: Optional[list[Any]] = None
+    ) -> Optional[dict[str, Any]]:
         """
         Update asset task fields based on associated ShotGrid task entities.
 
+        All the tasks are queried with one request per entity type, the
+        updates are merged per entity (skipping fields that already point
+        to one of the tasks, so fields linked to another task are updated)
+        and sent as chunked batch requests.
+
         Args:
             additional_filters (Optional[list[Any]]): Additional filters for the ShotGrid query.
+
+        Returns:
+            Optional[dict[str, Any]]: Summary of the resync: tasks found, skipped
+            no-op writes, batch results and timings. None if the plugin has no
+            `asset_task_fields_dict`.
         """
         if self.asset_task_fields_dict is None:
-            return
+            return None
+
+        start = perf_counter()
+        found = skipped = 0
+        updates: list[dict[str, Any]] = list()
 
         # for each entity type: Asset, Shot, Episode, Sequence etc.
         for entity_type, values in self.asset_task_fields_dict.items():
-            # for each type of task in each entity
-            for task_name, field_name in values.items():
-                f = [
-                    ["entity", "is_not", None],
-                    [
-                        f"entity.{entity_type}.task_template.TaskTemplate.entity_type",
-                        "is",
-                        entity_type,
-                    ],
-                    [f"entity.{entity_type}.{field_name}", "is", None],
-                ]
-                filters = f if additional_filters is None else additional_filters + f
-
-                # get all tasks for each entity type and task name
-                # TODO: this loop may be optimizable... as we can get all tasks
-                # by Entity instead of by Entity and task name
-                # but we are getting only the ones with the missing field anyway
-                for task_entity in self.sg.find(
-                    "Task",
-                    filters + [["content", "is", task_name]],
-                    [f"entity.{entity_type}.{field_name}", "entity"],
-                ):
-                    try:
-                        self.sg.update(
-                            entity_type,
-                            task_entity["entity"]["id"],
-                            {field_name: task_entity},
-                        )
-                        logger.info(
-                            f"Updated {entity_type} number {task_entity['entity']['id']}'s field {field_name}"
-                        )
-                    except Exception as e:
-                        logger.exception(e)
+            f = [
+                ["entity", "is_not", None],
+                [
+                    f"entity.{entity_type}.task_template.TaskTemplate.entity_type",
+                    "is",
+                    entity_type,
+                ],
+                ["content", "in", list(values)],
+            ]
+            filters = f if additional_filters is None else additional_filters + f
+            fields = [f"entity.{entity_type}.{field}" for field in values.values()]
+
+            # get the tasks of every task name at once
+            task_entities = self.sg.find(
+                "Task", filters, ["content", "entity", *fields]
+            )
+            requests, skipped_tasks = task_field_updates(
+                entity_type, task_entities, values
+            )
+            found += len(task_entities)
+            skipped += skipped_tasks
+            updates.extend(requests)
+
+        query_time = perf_counter() - start
+        batch = send_batches(
+            lambda: ShotgridInstance(self),
+            updates,
+            chunk_size=self.sg_batch_size,
+            max_workers=self.sg_batch_workers,
+        )
+        summary = {
+            "tasks_found": found,
+            "skipped": skipped,
+            "entities_updated": batch["succeeded"],
+            "entities_failed": batch["failed"],
+            "batches": batch["chunks"],
+            "errors": batch["errors"],
+            "query_time": query_time,
+            "update_time": batch["elapsed"],
+            "total_time": perf_counter() - start,
+        }
+        logger.info(
+            f"Updated {summary['entities_updated']} entities "
+            f"({summary['skipped']} skipped, {summary['entities_failed']} failed) "
+            f"in {summary['total_time']:.2f}s"
+        )
+        return summary
 
     def create_note(
         self,
@@ -0,0 +1,169 @@
+from shutil import rmtree
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+
+import pandas
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.bdl_validation import (
+    BDLSchema,
+    Condition,
+    Duplicated,
+    EmptyFields,
+    NonAlphanumeric,
+    NotIn,
+    NotMatching,
+    ParentAssetsExist,
+    existing_field,
+)
+
+
+class BDLValidationTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the BDL validation engine returns
+    the results the BDL panel expects.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_bdl")
+        cls.TEMP_FOLDER.mkdir(exist_ok=True)
+        cls.excel = Path(cls.TEMP_FOLDER, "AC_BDL_101_test.xlsx")
+        pandas.DataFrame(
+            {
+                "TYPE": ["CH", "PR", "XX", "CH", "CH"],
+                "CODE": ["annie", "box ", "tree", "annie", "l@mp"],
+                "VARIANT": ["", "red", "", "", ""],
+                "PRODUCTION": ["CR", "TR", "CR", "CR", "VR"],
+                "Tags": ["main", "", "", "", "light"],
+            }
+        ).to_excel(cls.excel, index=False)
+        cls.existing_assets = {
+            "Box_red": {"code": "Box_red", "sg_created_for_episode.Episode.code": "100"},
+            "Tree": {"code": "Tree", "sg_created_for_episode.Episode.code": "100"},
+        }
+        cls.schema = BDLSchema(
+            columns=["asset_type", "code", "variant", "prod_type"],
+            optional_columns=["tags"],
+            usecols=[0, 1, 2, 3, 4],
+            replace_pairs=[
+                {"regex": [" "], "value": "_"},
+                {"regex": [r"_$"], "value": ""},
+            ],
+            asset_name=lambda frame: (
+                frame["code"].str[:1].str.upper()
+                + frame["code"].str[1:]
+                + ("_" + frame["variant"]).where(frame["variant"] != "", "")
+            ),
+            episode=lambda excel, frame: excel.name.split("_")[2],
+            rules=[
+                Duplicated(["code", "variant"]),
+                NotIn("asset_type", ["PR", "CH"], "Unknown asset type '{asset_type}'"),
+                EmptyFields(["asset_type", "code", "prod_type"]),
+                NonAlphanumeric(["code", "variant"]),
+                Condition(
+                    lambda frame, assets: frame["prod_type"].isin(["CR", "VR"])
+                    & frame["exists"]
+                    & (
+                        existing_field(
+                            frame, assets, "sg_created_for_episode.Episode.code"
+                        )
+                        != frame["episode"]
+                    ),
+                    "Asset exists and it is marked as {prod_type}",
+                ),
+                NotIn(
+                    "prod_type", ["CR", "VR", "TR"], "Unknown production type {prod_type}"
+                ),
+            ],
+        )
+
+    def test_headers(self):
+        headers, _ = self.schema.validate(self.excel, self.existing_assets)
+        self.assertEqual(headers, ["TYPE", "CODE", "VARIANT", "PRODUCTION", "Tags"])
+
+    def test_results_shape(self):
+        _, results = self.schema.validate(self.excel, self.existing_assets)
+        self.assertEqual(list(results), [0, 1, 2, 3, 4])
+        self.assertEqual(
+            list(results[1]),
+            ["series", "errors", "episode", "asset_name", "exists", "status"],
+        )
+        self.assertEqual(results[1]["series"], ["PR", "box", "red", "TR", ""])
+        self.assertEqual(results[1]["asset_name"], "Box_red")
+        self.assertEqual(results[1]["episode"], "101")
+        self.assertTrue(results[1]["exists"])
+        self.assertTrue(results[1]["status"])
+
+    def test_errors(self):
+        _, results = self.schema.validate(self.excel, self.existing_assets)
+        self.assertEqual(results[0]["errors"], ["This asset is repeated."])
+        self.assertEqual(
+            results[2]["errors"],
+            ["Unknown asset type 'XX'", "Asset exists and it is marked as CR"],
+        )
+        self.assertEqual(
+            results[4]["errors"], ["There are non alphanumeric values: l*mp"]
+        )
+        self.assertFalse(results[4]["status"])
+
+    def test_parent_assets_and_warnings(self):
+        schema = BDLSchema(
+            columns=["asset_type", "code", "variant", "prod_type"],
+            usecols=[0, 1, 2, 4],
+            asset_name=lambda frame: frame["code"].str.capitalize(),
+            episode=lambda excel, frame: "101",
+            rules=[
+                ParentAssetsExist("code", ratio=0.7),
+                NotMatching("asset_type", r"^(CH|PR)$", "Naming seems wrong."),
+                Condition(
+                    lambda frame, assets: frame["exists"],
+                    "Asset already exists",
+                    target="warnings",
+                ),
+            ],
+        )
+        _, results = schema.validate(self.excel, self.existing_assets)
+        self.assertEqual(results[2]["warnings"], ["Asset already exists"])
+        self.assertEqual(
+            results[2]["errors"],
+            [
+                "Parent asset tree does not exist in SG, please create it first. "
+                "\nMaybe you meant Tree?",
+                "Naming seems wrong.",
+            ],
+        )
+        self.assertEqual(results[0]["warnings"], [])
+
+    def test_exists_name(self):
+        schema = BDLSchema(
+            columns=["asset_type", "code", "variant", "prod_type"],
+            usecols=[0, 1, 2, 4],
+            asset_name=lambda frame: frame["code"].str.capitalize(),
+            # only the props are looked up in the existing assets
+            exists_name=lambda frame: frame["code"]
+            .str.capitalize()
+            .where(frame["asset_type"] == "PR", ""),
+            episode=lambda excel, frame: "101",
+            rules=[],
+        )
+        _, results = schema.validate(self.excel, self.existing_assets)
+        self.assertEqual(results[2]["asset_name"], "Tree")
+        self.assertFalse(results[2]["exists"])
+
+        schema.exists_name = schema.asset_name
+        _, results = schema.validate(self.excel, self.existing_assets)
+        self.assertTrue(results[2]["exists"])
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,93 @@
+from shutil import rmtree
+import json
+import unittest
+from os import fspath, utime
+import sys
+from pathlib import Path
+from time import time
+from unittest.mock import patch
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.context_handoff import (
+    CLEAN_INTERVAL,
+    HANDOFF_VARIABLE,
+    read_context,
+    remove_old_contexts,
+    write_context,
+)
+
+
+class ContextHandoffTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the task context is handed over
+    through a file instead of the environment.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_context_handoff")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        self.context = {
+            "GWAIO_TASK": "anim",
+            "GWAIO_TASK_DATA": json.dumps({"name": "anim", "sg_data": "x" * 40000}),
+        }
+
+    def test_write(self):
+        path = write_context(self.context, self.TEMP_FOLDER)
+        self.assertEqual(write_context(dict(self.context), self.TEMP_FOLDER), path)
+        other = write_context({"GWAIO_TASK": "layout"}, self.TEMP_FOLDER)
+        self.assertNotEqual(other, path)
+        self.assertEqual(len(list(self.TEMP_FOLDER.glob("*.json"))), 2)
+
+    def test_read(self):
+        path = write_context(self.context, self.TEMP_FOLDER)
+        env = {HANDOFF_VARIABLE: fspath(path), "GWAIO_TASK": "old", "PATH": "/bin"}
+        context = read_context(env)
+        self.assertIsNone(context._data)
+        self.assertEqual(context["GWAIO_TASK"], "anim")
+        self.assertEqual(context["PATH"], "/bin")
+        self.assertEqual(context.task_data()["name"], "anim")
+        self.assertEqual(
+            set(context),
+            {HANDOFF_VARIABLE, "GWAIO_TASK", "GWAIO_TASK_DATA", "PATH"},
+        )
+        self.assertEqual(len(context), 4)
+
+        # without a context file, the variables come from the environment
+        context = read_context({"GWAIO_TASK_DATA": '{"name": "layout"}'})
+        self.assertEqual(context.task_data(), {"name": "layout"})
+        self.assertIsNone(context.get("GWAIO_TASK"))
+
+    def test_remove_old(self):
+        path = write_context(self.context, self.TEMP_FOLDER)
+        self.assertEqual(remove_old_contexts(self.TEMP_FOLDER), 0)
+        utime(path, (0, 0))
+        self.assertEqual(remove_old_contexts(self.TEMP_FOLDER), 1)
+        self.assertFalse(path.exists())
+        self.assertEqual(remove_old_contexts(Path(self.TEMP_FOLDER, "missing")), 0)
+
+    def test_periodic_removal(self):
+        old = write_context(self.context, self.TEMP_FOLDER)
+        utime(old, (0, 0))
+        # removed by the first write after the cleaning interval
+        write_context({"GWAIO_TASK": "layout"}, self.TEMP_FOLDER)
+        self.assertTrue(old.exists())
+        with patch(
+            "task_schema.utils.context_handoff.time",
+            return_value=time() + CLEAN_INTERVAL + 1,
+        ):
+            write_context({"GWAIO_TASK": "light"}, self.TEMP_FOLDER)
+        self.assertFalse(old.exists())
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,67 @@
+from shutil import rmtree
+import unittest
+from os import fspath, utime
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.env_cache import PartCache, folder_mtime
+
+
+class EnvCacheTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the environment parts are only
+    rebuilt when what they depend on changes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_env_cache")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        self.TEMP_FOLDER.mkdir(parents=True)
+        self.builds = 0
+
+    def build(self):
+        self.builds += 1
+        return {"BUILDS": str(self.builds)}
+
+    def test_fingerprint(self):
+        cache = PartCache()
+        self.assertEqual(cache.get("static", ("a", 1), self.build), {"BUILDS": "1"})
+        self.assertEqual(cache.get("static", ("a", 1), self.build), {"BUILDS": "1"})
+        self.assertEqual(cache.get("static", ("a", 2), self.build), {"BUILDS": "2"})
+        cache.invalidate("static")
+        self.assertEqual(cache.get("static", ("a", 2), self.build), {"BUILDS": "3"})
+
+    def test_lru(self):
+        cache = PartCache(max_size=2)
+        cache.get(1, None, self.build)
+        cache.get(2, None, self.build)
+        cache.get(1, None, self.build)
+        cache.get(3, None, self.build)
+        self.assertEqual(self.builds, 3)
+        cache.get(1, None, self.build)
+        self.assertEqual(self.builds, 3)
+        cache.get(2, None, self.build)
+        self.assertEqual(self.builds, 4)
+
+    def test_folder_mtime(self):
+        self.assertIsNone(folder_mtime(None))
+        self.assertIsNone(folder_mtime(Path(self.TEMP_FOLDER, "missing")))
+        utime(self.TEMP_FOLDER, ns=(0, 10**9))
+        before = folder_mtime(self.TEMP_FOLDER)
+        Path(self.TEMP_FOLDER, "tool").mkdir()
+        self.assertNotEqual(folder_mtime(self.TEMP_FOLDER), before)
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
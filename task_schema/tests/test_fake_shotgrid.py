@@ -0,0 +1,179 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from time import perf_counter
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.fake_shotgrid import (
+    FakeShotgun,
+    FakeShotgunError,
+    generate_project,
+    use_fake_shotgun,
+)
+
+
+class FakeShotgridTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the ShotGrid stand-in answers
+    the queries the plugins make like the site.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = generate_project(tasks=400, episodes=2, sequences_per_episode=2)
+        cls.project_filter = ["project.Project.id", "is", 122]
+
+    def setUp(self):
+        self.sg = FakeShotgun(self.db)
+
+    def test_generated_project(self):
+        tasks = self.sg.find("Task", [self.project_filter])
+        self.assertAlmostEqual(len(tasks), 400, delta=8)
+        self.assertEqual(len(self.db.entities["Episode"]), 2)
+        self.assertEqual(len(self.db.entities["Version"]), len(tasks) * 2)
+        self.assertTrue(self.db.entities["Note"])
+        shot = self.sg.find_one(
+            "Shot",
+            [["code", "starts_with", "EP101_010_"]],
+            ["sg_sequence.Sequence.episode.Episode.code"],
+        )
+        self.assertEqual(shot["sg_sequence.Sequence.episode.Episode.code"], "EP101")
+
+    def test_linked_fields(self):
+        task = self.sg.find_one(
+            "Task",
+            [["step.Step.entity_type", "is", "Shot"], self.project_filter],
+            [
+                "entity",
+                "entity.Shot.code",
+                "entity.Asset.code",
+                "entity.Shot.sg_sequence.Sequence.code",
+                "task_assignees",
+            ],
+        )
+        self.assertEqual(task["entity"]["type"], "Shot")
+        self.assertEqual(task["entity"]["name"], task["entity.Shot.code"])
+        self.assertIsNone(task["entity.Asset.code"])
+        self.assertTrue(
+            task["entity.Shot.code"].startswith(
+                task["entity.Shot.sg_sequence.Sequence.code"]
+            )
+        )
+        self.assertTrue(task["task_assignees"][0]["name"].startswith("Artist"))
+
+    def test_filters(self):
+        all_tasks = self.sg.find("Task", [self.project_filter], ["sg_status_list"])
+        ip = self.sg.find("Task", [["sg_status_list", "is", "ip"], self.project_filter])
+        not_ip = self.sg.find(
+            "Task", [["sg_status_list", "not_in", ["ip"]], self.project_filter]
+        )
+        self.assertEqual(len(ip) + len(not_ip), len(all_tasks))
+        either = self.sg.find(
+            "Task",
+            [
+                self.project_filter,
+                {
+                    "filter_operator": "any",
+                    "filters": [
+                        ["sg_status_list", "is", "ip"],
+                        ["sg_status_list", "is", "rev"],
+                    ],
+                },
+            ],
+        )
+        self.assertEqual(
+            len(either),
+            len([t for t in all_tasks if t["sg_status_list"] in ("ip", "rev")]),
+        )
+        episode = self.sg.find_one("Episode", [["code", "is", "EP102"]])
+        assets = self.sg.find("Asset", [["episodes", "is", episode]], ["code"])
+        self.assertTrue(assets)
+        self.assertEqual(
+            len(assets),
+            len(
+                self.sg.find(
+                    "Asset", [["sg_created_for_episode.Episode.code", "is", "EP102"]]
+                )
+            ),
+        )
+        with self.assertRaises(FakeShotgunError):
+            self.sg.find("Task", [["content", "matches", "x"]])
+
+    def test_paging_and_summarize(self):
+        filters = [["step.Step.entity_type", "is", "Shot"], self.project_filter]
+        total = self.sg.summarize(
+            "Task", filters, summary_fields=[{"field": "id", "type": "count"}]
+        )["summaries"]["id"]
+        pages = [
+            self.sg.find("Task", filters, ["content"], page=page, limit=50)
+            for page in range(1, -(-total // 50) + 1)
+        ]
+        ids = [t["id"] for page in pages for t in page]
+        self.assertEqual(len(ids), total)
+        self.assertEqual(len(set(ids)), total)
+        ordered = self.sg.find(
+            "Shot",
+            [self.project_filter],
+            ["code"],
+            order=[{"field_name": "code", "direction": "desc"}],
+        )
+        codes = [s["code"] for s in ordered]
+        self.assertEqual(codes, sorted(codes, reverse=True))
+
+    def test_writes(self):
+        asset = self.sg.create(
+            "Asset", {"code": "fake_asset", "project": {"type": "Project", "id": 122}}
+        )
+        self.assertEqual(
+            self.sg.find_one("Asset", [["code", "is", "fake_asset"]])["id"], asset["id"]
+        )
+        results = self.sg.batch(
+            [
+                {
+                    "request_type": "update",
+                    "entity_type": "Asset",
+                    "entity_id": asset["id"],
+                    "data": {"sg_asset_type": "ch"},
+                },
+                {
+                    "request_type": "delete",
+                    "entity_type": "Asset",
+                    "entity_id": asset["id"],
+                },
+            ]
+        )
+        self.assertEqual(results[0]["sg_asset_type"], "ch")
+        self.assertIsNone(self.sg.find_one("Asset", [["code", "is", "fake_asset"]]))
+        with self.assertRaises(FakeShotgunError):
+            self.sg.update("Asset", asset["id"], {"code": "gone"})
+
+    def test_latency(self):
+        sg = FakeShotgun(self.db, latency=0.02)
+        start = perf_counter()
+        sg.find_one("Project", [["id", "is", 122]])
+        sg.find_one("Project", [["id", "is", 122]])
+        self.assertGreaterEqual(perf_counter() - start, 0.04)
+
+    def test_use_fake_shotgun(self):
+        class Plugin:
+            @classmethod
+            def _instantiate_shogrid(cls, connect=True):
+                raise ConnectionError("offline")
+
+        class ProjectPlugin(Plugin):
+            ...
+
+        with use_fake_shotgun(Plugin, self.db) as db:
+            sg = ProjectPlugin._instantiate_shogrid()
+            self.assertIsInstance(sg, FakeShotgun)
+            self.assertIs(sg.database, db)
+        with self.assertRaises(ConnectionError):
+            ProjectPlugin._instantiate_shogrid()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+from shutil import rmtree
+import unittest
+from os import fspath
+from re import match
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.file_scan import (
+    compile_naming_regex,
+    normalize_extensions,
+    scan_files,
+)
+
+
+class FileScanTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the task folder scanner finds
+    the same versions as the naming conventions.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_file_scan")
+        files = [
+            "gwa_101_010_010_layout_v001.ma",
+            "gwa_101_010_010_layout_v002.mb",
+            "work/gwa_101_010_010_anim_v001.ma",
+            "work/render.0001.exr",
+            "work/.mayaSwatches/gwa_101_010_010_layout_v001.ma.swatches",
+            "incrementalSave/gwa_101_010_010_layout_v001.ma/gwa_101_010_010_layout_v001.0001.ma",
+            "notes",
+        ]
+        for name in files:
+            path = Path(cls.TEMP_FOLDER, name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+
+    def test_compile_naming_regex(self):
+        patterns = (
+            r"^gwa(_\d\d\d){3}_([a-z]+)_v\d\d\d.*",
+            r"^(?!.*(_)\1)LB(\d\d\d)_(BG|CH)_[0-9A-Z_]+_(V\d\d\d)",
+            r"AC(_\d\d\d){1,2}_[A-Za-z0-9_]+_(V\d\d\d)",
+        )
+        names = [
+            "gwa_101_010_010_layout_v001.ma",
+            "LB101_CH_ROBOT_V001.psd",
+            "LB101_CH__ROBOT_V001.psd",
+            "AC_101_010_stb_V001.mov",
+            "xAC_101_010_stb_V001.mov",
+            "render.0001.exr",
+        ]
+        for joined in (patterns[::2], patterns):
+            has_convention = compile_naming_regex(joined)
+            for name in names:
+                self.assertEqual(
+                    has_convention(name),
+                    any(match(p, name) for p in joined),
+                    name,
+                )
+        self.assertFalse(compile_naming_regex(())("anything.ma"))
+
+    def test_normalize_extensions(self):
+        self.assertEqual(normalize_extensions("ma"), {".ma"})
+        self.assertEqual(normalize_extensions([".ma", "mb"]), {".ma", ".mb"})
+        self.assertIsNone(normalize_extensions([""]))
+
+    def test_scan_files(self):
+        found = {
+            f.relative_to(self.TEMP_FOLDER).as_posix()
+            for f in scan_files(self.TEMP_FOLDER)
+        }
+        self.assertEqual(
+            found,
+            {
+                "gwa_101_010_010_layout_v001.ma",
+                "gwa_101_010_010_layout_v002.mb",
+                "work/gwa_101_010_010_anim_v001.ma",
+                "work/render.0001.exr",
+            },
+        )
+        found = list(scan_files(self.TEMP_FOLDER, normalize_extensions(["ma"])))
+        self.assertEqual(len(found), 2)
+        with self.assertRaises(OSError):
+            list(scan_files(Path(self.TEMP_FOLDER, "missing")))
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
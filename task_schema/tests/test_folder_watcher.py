@@ -0,0 +1,97 @@
+from shutil import rmtree
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from threading import Event
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.folder_watcher import (
+    FileEvent,
+    FolderWatcher,
+    is_network_path,
+)
+
+
+class FolderWatcherTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the folder watcher reports the
+    files added and removed in debounced batches.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_folder_watcher")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        Path(self.TEMP_FOLDER, "work").mkdir(parents=True)
+        Path(self.TEMP_FOLDER, "work", "sh010_anim_v001.ma").touch()
+        self.batches = list()
+        self.received = Event()
+
+    def on_change(self, events):
+        self.batches.append(events)
+        self.received.set()
+
+    def polling_watcher(self) -> FolderWatcher:
+        return FolderWatcher(
+            self.TEMP_FOLDER,
+            self.on_change,
+            debounce=0.05,
+            poll_interval=3600,
+            native=False,
+        )
+
+    def test_is_network_path(self):
+        self.assertTrue(is_network_path("\\\\qsrv01.mondotvcanarias.lan\\proj"))
+        self.assertTrue(is_network_path("//qsrv01/proj"))
+        self.assertFalse(is_network_path("D:/projects"))
+
+    def test_polling(self):
+        watcher = self.polling_watcher().start()
+        self.assertEqual(watcher.backend, "polling")
+        self.assertTrue(watcher.wait_ready(5))
+        Path(self.TEMP_FOLDER, "work", "sh010_anim_v001.ma").unlink()
+        Path(self.TEMP_FOLDER, "work", "sh010_anim_v002.ma").touch()
+        Path(self.TEMP_FOLDER, "preview").mkdir()
+        Path(self.TEMP_FOLDER, "preview", "sh010_anim_v002.mov").touch()
+        Path(self.TEMP_FOLDER, ".hidden").mkdir()
+        Path(self.TEMP_FOLDER, ".hidden", "cache.ma").touch()
+        watcher._backend.poll()
+        self.assertTrue(self.received.wait(5))
+        watcher.stop()
+        self.assertFalse(watcher.running)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(
+            set(self.batches[0]),
+            {
+                FileEvent("removed", Path(self.TEMP_FOLDER, "work", "sh010_anim_v001.ma")),
+                FileEvent("added", Path(self.TEMP_FOLDER, "work", "sh010_anim_v002.ma")),
+                FileEvent(
+                    "added", Path(self.TEMP_FOLDER, "preview", "sh010_anim_v002.mov")
+                ),
+            },
+        )
+
+    def test_debounce(self):
+        watcher = self.polling_watcher()
+        temp_file = Path(self.TEMP_FOLDER, "work", "sh010_anim_v002.ma.tmp")
+        saved_file = Path(self.TEMP_FOLDER, "work", "sh010_anim_v002.ma")
+        watcher._emit("added", temp_file)
+        watcher._emit("removed", temp_file)
+        watcher._emit("added", saved_file)
+        watcher._emit("modified", saved_file)
+        self.assertTrue(self.received.wait(5))
+        self.assertEqual(self.batches, [[FileEvent("added", saved_file)]])
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,48 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.lazy import LazyImport
+
+
+class LazyImportTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that lazy imports are only resolved
+    when they are used.
+    """
+
+    def setUp(self):
+        sys.modules.pop("colorsys", None)
+
+    def test_module_not_imported_until_used(self):
+        colorsys = LazyImport("colorsys")
+        self.assertFalse(colorsys.loaded)
+        self.assertNotIn("colorsys", sys.modules)
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertTrue(colorsys.loaded)
+        self.assertIn("colorsys", sys.modules)
+
+    def test_attribute_call(self):
+        rgb_to_hsv = LazyImport("colorsys:rgb_to_hsv")
+        self.assertEqual(rgb_to_hsv(0.0, 0.0, 1.0), (2 / 3, 1.0, 1.0))
+
+    def test_instantiate(self):
+        counter = LazyImport("collections:Counter", instantiate=True)
+        counter.update("aab")
+        self.assertEqual(counter.most_common(1), [("a", 2)])
+        self.assertIs(counter.resolve(), counter.resolve())
+
+    def test_missing_module(self):
+        missing = LazyImport("task_schema.does_not_exist:Toolbar")
+        self.assertIn("not loaded", repr(missing))
+        with self.assertRaises(ImportError):
+            missing.resolve()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+from shutil import rmtree
+import unittest
+import json
+from os import fspath
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.metadata_cache import MetadataCache
+
+
+class MetadataCacheTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the metadata cache serves the
+    cached data and revalidates it when stale.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_metadata_cache")
+        cls.TEMP_FOLDER.mkdir(exist_ok=True)
+
+    def setUp(self):
+        self.cache_file = Path(self.TEMP_FOLDER, "sg_metadata_test.json")
+        self.cache_file.unlink(missing_ok=True)
+        self.fetched = 0
+        self.applied = list()
+
+    def fetch(self):
+        self.fetched += 1
+        return {"color_status": {"ip": [255, 0, 0]}, "fetch": self.fetched}
+
+    def test_cold_cache(self):
+        cache = MetadataCache(self.cache_file, ttl=60)
+        thread = cache.get(self.fetch, self.applied.append)
+        self.assertIsNone(thread)
+        self.assertEqual(self.fetched, 1)
+        self.assertEqual(self.applied[-1]["fetch"], 1)
+        self.assertTrue(self.cache_file.exists())
+
+    def test_fresh_cache(self):
+        cache = MetadataCache(self.cache_file, ttl=60)
+        cache.save({"fetch": 0})
+        thread = cache.get(self.fetch, self.applied.append)
+        self.assertIsNone(thread)
+        self.assertEqual(self.fetched, 0)
+        self.assertEqual(self.applied, [{"fetch": 0}])
+
+    def test_stale_cache(self):
+        cache = MetadataCache(self.cache_file, ttl=0)
+        cache.save({"fetch": 0})
+        thread = cache.get(self.fetch, self.applied.append)
+        self.assertEqual(self.applied[0], {"fetch": 0})
+        thread.join()
+        self.assertEqual(self.fetched, 1)
+        self.assertEqual(self.applied[-1]["fetch"], 1)
+        data, _ = cache.load()
+        self.assertEqual(data["fetch"], 1)
+
+    def test_failed_revalidation_keeps_cache(self):
+        def fail():
+            raise ConnectionError("offline")
+
+        cache = MetadataCache(self.cache_file, ttl=0)
+        cache.save({"fetch": 0})
+        cache.get(fail, self.applied.append).join()
+        self.assertEqual(self.applied, [{"fetch": 0}])
+        self.assertEqual(cache.load()[0], {"fetch": 0})
+
+    def test_corrupt_cache(self):
+        self.cache_file.write_text("{not json")
+        cache = MetadataCache(self.cache_file, ttl=60)
+        self.assertEqual(cache.load(), (None, False))
+        self.assertFalse(self.cache_file.exists())
+        self.cache_file.write_text(json.dumps({"data": {}}))
+        self.assertEqual(cache.load(), (None, False))
+
+    def test_corrupt_cache_not_removable(self):
+        self.cache_file.write_text("{not json")
+        cache = MetadataCache(self.cache_file, ttl=60)
+        with patch(
+            "task_schema.utils.metadata_cache.remove", side_effect=PermissionError
+        ):
+            self.assertEqual(cache.load(), (None, False))
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,68 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.path_index import PathIndex, path_key
+
+
+class PathIndexTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the path index finds the item
+    with the closest parent path.
+    """
+
+    ROOT = Path("/projects/gwaio/shots")
+
+    def setUp(self):
+        self.tasks = [
+            ["layout", Path(self.ROOT, "EP101", "EP101_010_0010", "layout")],
+            ["anim", Path(self.ROOT, "EP101", "EP101_010_0010", "anim")],
+            ["anim_dup", Path(self.ROOT, "EP101", "EP101_010_0010", "anim")],
+            ["episode", Path(self.ROOT, "EP101")],
+            ["empty", Path()],
+        ]
+        self.index = PathIndex(self.tasks, lambda t: t[1])
+
+    def find(self, *parts) -> str:
+        item = self.index.find(Path(self.ROOT, *parts))
+        return item[0] if item is not None else None
+
+    def test_find(self):
+        self.assertEqual(self.find("EP101", "EP101_010_0010", "anim"), "anim")
+        self.assertEqual(
+            self.find("EP101", "EP101_010_0010", "layout", "preview", "a_v001.mov"),
+            "layout",
+        )
+        self.assertEqual(self.find("EP101", "EP101_010_0020", "anim"), "episode")
+        self.assertIsNone(self.find("EP102"))
+        self.assertIsNone(self.index.find(Path("relative", "file.ma")))
+        self.assertEqual(self.index.size, 5)
+
+    def test_update(self):
+        anim = self.tasks[1]
+        self.assertIn(anim, self.index)
+        anim[1] = Path(self.ROOT, "EP102", "EP102_010_0010", "anim")
+        self.index.update(anim)
+        self.assertEqual(self.find("EP102", "EP102_010_0010", "anim"), "anim")
+        self.assertEqual(self.find("EP101", "EP101_010_0010", "anim"), "anim_dup")
+        # back to its path, it is found before the task indexed after it
+        anim[1] = Path(self.ROOT, "EP101", "EP101_010_0010", "anim")
+        self.index.update(anim)
+        self.assertEqual(self.find("EP101", "EP101_010_0010", "anim"), "anim")
+        self.assertIsNone(self.find("EP102"))
+        # items that aren't indexed are ignored
+        self.index.update(["fx", Path(self.ROOT, "EP103")])
+        self.assertIsNone(self.find("EP103"))
+
+    def test_path_key(self):
+        self.assertEqual(path_key("/a/b/"), path_key(Path("/a", "b")))
+        self.assertEqual(path_key(Path()), ())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,138 @@
+from shutil import rmtree
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils import plugin_registry
+from task_schema.utils.plugin_registry import PluginRegistry, scan_plugin_module
+
+PLUGIN_SOURCE = '''
+import module_that_does_not_exist
+
+
+class Helper:
+    TITLE = "Not a plugin"
+
+
+class TempPlugin(Helper):
+    TITLE = "Temp"
+    PLUGIN_UUID = "00000000-0000-0000-0000-000000000001"
+'''
+
+BASE_SOURCE = '''
+class BasePlugin:
+    TITLE = "Base"
+    PLUGIN_UUID = None
+
+
+class ProjectBase(BasePlugin):
+    TITLE = "Project"
+'''
+
+PROJECT_SOURCE = '''
+from . import base_plugin
+
+
+class ProjectPlugin(base_plugin.ProjectBase):
+    pass
+
+
+class OtherProjectPlugin(base_plugin.ProjectBase):
+    PLUGIN_UUID = "00000000-0000-0000-0000-000000000002"
+'''
+
+
+class PluginRegistryTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that plugins are listed from their
+    metadata without importing them.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_registry")
+        cls.PACKAGE = Path(cls.TEMP_FOLDER, "temp_registry_plugins")
+        cls.PACKAGE.mkdir(parents=True, exist_ok=True)
+        Path(cls.PACKAGE, "__init__.py").write_text("")
+        Path(cls.PACKAGE, "temp_plugin.py").write_text(PLUGIN_SOURCE)
+        Path(cls.PACKAGE, "base_plugin.py").write_text(BASE_SOURCE)
+        Path(cls.PACKAGE, "project_plugin.py").write_text(PROJECT_SOURCE)
+        sys.path.insert(0, fspath(cls.TEMP_FOLDER))
+
+    def setUp(self):
+        self.cache_file = Path(self.TEMP_FOLDER, "plugin_registry.json")
+        self.cache_file.unlink(missing_ok=True)
+
+    def test_project_plugins_not_imported(self):
+        modules = set(sys.modules)
+        registry = PluginRegistry(cache_file=self.cache_file)
+        by_uuid = {p.uuid: p for p in registry.plugins}
+        self.assertEqual(
+            by_uuid["fc55a55d-32f7-46c2-af1b-7d524017d21c"].entry_point,
+            "task_schema.plugins.anniecarola_plugin:AnnieCarolaPlugin",
+        )
+        self.assertEqual(registry.find("MeteoHeroes").class_name, "MeteoHeroesPlugin")
+        # plugins without a PLUGIN_UUID are listed by class name
+        self.assertEqual(registry.find("GwaioProjectPlugin").title, "Gwaio")
+        self.assertEqual(registry.find("Piloto").uuid, "PilotoPlugin")
+        self.assertNotIn("ShotgridPlugin", {p.class_name for p in registry.plugins})
+        self.assertFalse(
+            any(m.startswith("task_schema.plugins.") for m in set(sys.modules) - modules)
+        )
+
+    def test_scan_plugin_module(self):
+        plugins = scan_plugin_module(PLUGIN_SOURCE, "pkg.temp_plugin")
+        self.assertEqual(len(plugins), 1)
+        self.assertEqual(plugins[0].title, "Temp")
+        self.assertEqual(plugins[0].entry_point, "pkg.temp_plugin:TempPlugin")
+
+    def test_inherited_metadata(self):
+        registry = PluginRegistry(self.PACKAGE, "temp_registry_plugins", self.cache_file)
+        by_name = {p.class_name: p for p in registry.plugins}
+        self.assertEqual(
+            sorted(by_name), ["OtherProjectPlugin", "ProjectPlugin", "TempPlugin"]
+        )
+        self.assertEqual(by_name["ProjectPlugin"].title, "Project")
+        self.assertEqual(registry.find("ProjectPlugin"), by_name["ProjectPlugin"])
+        self.assertEqual(
+            registry.find("00000000-0000-0000-0000-000000000002"),
+            by_name["OtherProjectPlugin"],
+        )
+        # both inherit the title, so it can't tell them apart
+        with self.assertRaises(KeyError):
+            registry.find("Project")
+
+    def test_cache_reused(self):
+        PluginRegistry(self.PACKAGE, "temp_registry_plugins", self.cache_file).scan()
+        self.assertTrue(self.cache_file.exists())
+        scanned = list()
+        original = plugin_registry.scan_plugin_module
+        plugin_registry.scan_plugin_module = lambda *a: scanned.append(a) or original(*a)
+        try:
+            registry = PluginRegistry(self.PACKAGE, "temp_registry_plugins", self.cache_file)
+            self.assertEqual(registry.find("Temp").class_name, "TempPlugin")
+        finally:
+            plugin_registry.scan_plugin_module = original
+        self.assertEqual(scanned, list())
+
+    def test_load_only_selected(self):
+        registry = PluginRegistry(self.PACKAGE, "temp_registry_plugins", self.cache_file)
+        info = registry.find("00000000-0000-0000-0000-000000000001")
+        with self.assertRaises(ModuleNotFoundError):
+            registry.load(info)
+        with self.assertRaises(KeyError):
+            registry.find("Not a plugin")
+
+    @classmethod
+    def tearDownClass(cls):
+        sys.path.remove(fspath(cls.TEMP_FOLDER))
+        rmtree(cls.TEMP_FOLDER)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+from shutil import rmtree
+import json
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from publisher.batch import (
+    DCCS,
+    load_processes,
+    run_batch,
+    write_html_report,
+    write_json_report,
+)
+
+CHECKS = ["CheckRepeatedNameNodes", "CheckPastedNodes", "CheckUnknownNodes"]
+
+
+class PublisherBatchTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the batch publisher runs the checks
+    on every file in stand-in DCC processes and reports
+    the files whose process crashed or got stuck.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_publisher_batch")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        self.TEMP_FOLDER.mkdir()
+
+    def write_scene(self, name, scene):
+        path = Path(self.TEMP_FOLDER, name)
+        path.write_text(json.dumps(scene), "utf-8")
+        return fspath(path)
+
+    def test_load_processes(self):
+        classes = load_processes(DCCS["stand-in"].checks_module, CHECKS)
+        self.assertEqual([c.__name__ for c in classes], CHECKS)
+        with self.assertRaises(ValueError):
+            load_processes(DCCS["stand-in"].checks_module, ["CheckMissing"])
+
+    def test_batch(self):
+        files = [
+            self.write_scene("sh0010.json", {"nodes": ["|world|geo", "|cam|camera"]}),
+            self.write_scene("sh0020.json", {"nodes": ["|a|geo", "|b|geo"]}),
+            self.write_scene("sh0030.json", {"nodes": ["|a|geo"], "unknown": ["x"]}),
+            self.write_scene("sh0040.json", {"crash": True}),
+            self.write_scene("sh0050.json", {"nodes": ["|pasted__geo"]}),
+            fspath(Path(self.TEMP_FOLDER, "missing.json")),
+        ]
+        results = list()
+        report = run_batch(
+            files,
+            CHECKS,
+            DCCS["stand-in"],
+            workers=2,
+            files_per_worker=2,
+            timeout=60.0,
+            on_result=results.append,
+        )
+        self.assertEqual(len(results), 6)
+        self.assertEqual([r["file"] for r in report["files"]], files)
+        statuses = [r["status"] for r in report["files"]]
+        self.assertEqual(
+            statuses, ["success", "failed", "warning", "error", "failed", "error"]
+        )
+        self.assertEqual(report["summary"]["failed"], 2)
+
+        repeated = report["files"][1]["processes"][0]
+        self.assertEqual(repeated["status"], "failed")
+        self.assertEqual(repeated["errors"][0]["items"][0], ["geo", "|a|geo"])
+        # the file after the crash is published by a new worker
+        self.assertIn("exited", report["files"][3]["error"])
+        self.assertIn("Cannot open", report["files"][5]["error"])
+
+        json_path = Path(self.TEMP_FOLDER, "report.json")
+        html_path = Path(self.TEMP_FOLDER, "report.html")
+        write_json_report(report, fspath(json_path))
+        write_html_report(report, fspath(html_path))
+        written = json.loads(json_path.read_text("utf-8"))
+        self.assertEqual(written["summary"], report["summary"])
+        page = html_path.read_text("utf-8")
+        self.assertIn("sh0050.json", page)
+        self.assertIn("|pasted__geo", page)
+
+    def test_timeout(self):
+        files = [
+            self.write_scene("sh0010.json", {"sleep": 30}),
+            self.write_scene("sh0020.json", {"nodes": ["|world|geo"]}),
+        ]
+        report = run_batch(files, CHECKS, DCCS["stand-in"], workers=1, timeout=2.0)
+        statuses = [r["status"] for r in report["files"]]
+        self.assertEqual(statuses, ["timeout", "success"])
+
+    def test_duplicate_files(self):
+        path = self.write_scene("sh0010.json", {"nodes": ["|world|geo"]})
+        files = [path, path, f"{fspath(self.TEMP_FOLDER)}/./sh0010.json"]
+        report = run_batch(files, CHECKS, DCCS["stand-in"], workers=1)
+        self.assertEqual([r["status"] for r in report["files"]], ["success"] * 3)
+
+    def test_returned_errors(self):
+        files = [
+            self.write_scene("sh0010.json", {"nodes": ["|world|geo"]}),
+            self.write_scene("sh0020.json", {"lights": ["|world|key"]}),
+        ]
+        report = run_batch(files, ["CheckLights"], DCCS["stand-in"], workers=1)
+        statuses = [r["status"] for r in report["files"]]
+        self.assertEqual(statuses, ["success", "failed"])
+        errors = report["files"][1]["processes"][0]["errors"]
+        self.assertEqual(errors[0]["error"], "Lights in file")
+        self.assertEqual(errors[0]["items"], [["key", "|world|key"]])
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
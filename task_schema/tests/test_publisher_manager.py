@@ -0,0 +1,399 @@
+from shutil import rmtree
+import json
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from threading import Event, Timer, current_thread, main_thread
+from time import sleep
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from publisher.core import (
+    Callback,
+    Check,
+    Collect,
+    CollectRunner,
+    Context,
+    Extract,
+    Manager,
+    ProcessCancelled,
+    StatusProcess,
+    process_dependencies,
+)
+
+STARTED = Event()
+
+
+def encode(progress, frames):
+    for frame in range(frames):
+        progress(frame / frames, f"Frame {frame}")
+    return frames * 2
+
+
+def encode_forever(progress):
+    while True:
+        sleep(0.1)
+
+
+class CollectFile(Collect):
+    name = "file"
+    requires = ()
+
+    def process(self, context):
+        self.value = "/test_folder/file.ma"
+
+
+class CollectPreview(Collect):
+    name = "preview"
+    requires = ("file",)
+
+    def process(self, context):
+        self.value = context.get_data("file").replace(".ma", ".jpg")
+
+
+class CheckSlow(Check):
+    name = "Slow check"
+    requires = ()
+    thread_safe = True
+
+    def process(self, context):
+        # only finishes if the fast check runs at the same time
+        if not STARTED.wait(5):
+            self.add_error("Not concurrent", "The fast check didn't start")
+
+
+class CheckFast(Check):
+    name = "Fast check"
+    requires = ()
+    thread_safe = True
+
+    def process(self, context):
+        STARTED.set()
+
+
+class CheckFailing(Check):
+    name = "Failing check"
+    requires = ()
+
+    def process(self, context):
+        self.add_error("Failed", "Always fails")
+
+
+class CheckLegacy(Check):
+    name = "Legacy check"
+    requires = ()
+
+    def process(self, context):
+        # like the Maya checks, which don't call add_error
+        return False, [{"text": "Lights in file", "list": [["key", "|key"]]}]
+
+
+class ExtractFile(Extract):
+    name = "Extract file"
+
+    def process(self, context):
+        context.set_data("extracted", True)
+
+
+class ExtractIncremental(Extract):
+    name = "Extract incremental"
+    requires = ("file",)
+    incremental = True
+    runs = 0
+
+    def return_input_files(self, context):
+        return [context.get_data("source")]
+
+    def process(self, context):
+        type(self).runs += 1
+
+
+class CheckScene(Check):
+    name = "Scene check"
+    requires = ()
+    incremental = True
+    uses_scene = True
+    runs = 0
+
+    def process(self, context):
+        type(self).runs += 1
+
+
+class ExtractPreview(Extract):
+    name = "Extract preview"
+    requires = ()
+
+    def process(self, context):
+        context.set_data("frames", self.run_in_worker(encode, 3))
+
+
+class ExtractForever(Extract):
+    name = "Extract forever"
+    requires = ()
+
+    def process(self, context):
+        self.run_in_worker(encode_forever)
+
+
+class PublisherManagerTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the publisher runs independent
+    processes concurrently and keeps failing fast.
+    """
+
+    def setUp(self):
+        STARTED.clear()
+        self.manager = Manager(max_workers=2)
+        for process in (CollectPreview, CollectFile, CheckSlow, CheckFast):
+            self.manager.register(process)
+        self.callback_threads = list()
+        for process in self.manager.checks:
+            process.add_callback(
+                Callback.status,
+                lambda p: self.callback_threads.append(current_thread()),
+            )
+
+    def test_dependencies(self):
+        self.assertEqual(process_dependencies(self.manager.collectors), [{1}, set()])
+        self.manager.register(ExtractFile)
+        self.manager.register(ExtractFile)
+        self.assertEqual(process_dependencies(self.manager.extractors), [set(), {0}])
+
+    def test_publish(self):
+        self.manager.register(ExtractFile)
+        self.manager.publish()
+        preview = self.manager.context.get_data("preview")
+        self.assertEqual(preview, "/test_folder/file.jpg")
+        for process in self.manager.checks:
+            self.assertEqual(process.status, StatusProcess.SUCCESS)
+        self.assertTrue(self.manager.context.get_data("extracted"))
+        # status callbacks run in the publishing thread
+        self.assertEqual(set(self.callback_threads), {main_thread()})
+        self.assertEqual(len(self.callback_threads), 4)
+
+    def test_incremental(self):
+        temp_folder = Path(Path(__file__).parent, "temp_publisher_manager")
+        rmtree(temp_folder, ignore_errors=True)
+        temp_folder.mkdir()
+        self.addCleanup(rmtree, temp_folder, True)
+        source = Path(temp_folder, "file.ma")
+        source.write_text("v1")
+        scene = ["v1"]
+        ExtractIncremental.runs = CheckScene.runs = 0
+        self.manager.scene_hash = lambda: scene[0]
+        self.manager.context.set_data("source", fspath(source))
+        self.manager.register(ExtractIncremental)
+        self.manager.register(CheckScene)
+
+        self.manager.publish()
+        self.manager.publish()
+        self.assertEqual((ExtractIncremental.runs, CheckScene.runs), (1, 1))
+
+        # a changed input, scene or status runs the process again
+        source.write_text("v2 with changes")
+        scene[0] = "v2"
+        self.manager.publish()
+        self.assertEqual((ExtractIncremental.runs, CheckScene.runs), (2, 2))
+        self.manager.extractors[0].set_status(StatusProcess.UNINITIALIZED)
+        self.manager.publish()
+        self.assertEqual(ExtractIncremental.runs, 3)
+        self.manager.publish(force=True)
+        self.assertEqual((ExtractIncremental.runs, CheckScene.runs), (4, 3))
+
+    def test_report(self):
+        self.manager.trace_memory = True
+        self.manager.register(ExtractFile)
+        self.manager.publish()
+        report = self.manager.last_report
+        self.assertEqual(
+            [t.name for t in report.timings if t.kind == "Collect"],
+            ["file", "preview"],
+        )
+        self.assertEqual(len(report.timings), 5)
+        self.assertGreaterEqual(report.wall, max(t.wall for t in report.timings))
+        slow = self.manager.checks[0].timing
+        self.assertIn("status", slow.callbacks)
+        self.assertIsNotNone(slow.peak_memory)
+        self.assertEqual(json.loads(report.to_json())["processes"][0]["name"], "file")
+        events = report.to_chrome_trace()["traceEvents"]
+        self.assertEqual([e["ph"] for e in events], ["X"] * 6)
+        self.assertEqual(events[0]["name"], "publish")
+
+    def test_worker(self):
+        self.manager.register(ExtractPreview)
+        progress = list()
+        self.manager.extractors[0].add_callback(
+            Callback.status, lambda p: progress.append(p.progress)
+        )
+        idle = list()
+        self.manager.idle = lambda: idle.append(1)
+        self.manager.publish()
+        self.assertEqual(self.manager.context.get_data("frames"), 6)
+        self.assertEqual(progress[1:-1], [0.0, 0.0, 1 / 3, 2 / 3, 1.0])
+        self.assertTrue(idle)
+
+    def test_cancel(self):
+        self.manager.register(ExtractForever)
+        self.manager.register(ExtractFile)
+        timer = Timer(0.5, self.manager.cancel)
+        timer.start()
+        with self.assertRaises(ProcessCancelled):
+            self.manager.publish()
+        timer.join()
+        self.assertEqual(
+            self.manager.extractors[0].status, StatusProcess.UNINITIALIZED
+        )
+        self.assertEqual(self.manager.extractors[0].errors, [])
+        self.assertEqual(self.manager.extractors[1].status, StatusProcess.UNINITIALIZED)
+        self.assertEqual(self.manager.last_report.error, "Publish cancelled")
+
+    def test_fail_fast(self):
+        self.manager.register(CheckFailing)
+        self.manager.register(ExtractFile)
+        with self.assertRaises(Exception):
+            self.manager.publish()
+        self.assertEqual(self.manager.checks[2].status, StatusProcess.FAILED)
+        self.assertEqual(
+            self.manager.extractors[0].status, StatusProcess.UNINITIALIZED
+        )
+        self.assertIsNone(self.manager.context.get_data("extracted"))
+
+    def test_returned_errors(self):
+        self.manager.register(CheckLegacy)
+        with self.assertRaises(Exception):
+            self.manager.publish()
+        check = self.manager.checks[2]
+        self.assertEqual(check.status, StatusProcess.FAILED)
+        self.assertEqual(check.errors[0].error, "Lights in file")
+        self.assertEqual(check.errors[0].items, [["key", "|key"]])
+        check.compulsory = False
+        self.manager.publish()
+        self.assertEqual(check.status, StatusProcess.WARNING)
+
+
+class CollectShotgrid(Collect):
+    name = "shotgrid"
+    thread_safe = True
+    timeout = 0.2
+    release = Event()
+
+    def process(self, context):
+        self.release.wait(5)
+        self.value = "sg"
+
+
+class CollectRunnerTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that collectors run in the background
+    and the slow ones time out.
+    """
+
+    def test_timeout(self):
+        CollectShotgrid.release.clear()
+        manager = Manager()
+        for process in (CollectFile, CollectShotgrid):
+            manager.register(process)
+        results = list()
+        inline = list()
+        runner = CollectRunner(
+            manager.collectors,
+            lambda collect, result: results.append((collect.name, result)),
+            run_inline=inline.append,
+        )
+        runner.start()
+        self.assertFalse(runner.wait(0.5))
+        self.assertEqual(results, [("shotgrid", CollectRunner.TIMEOUT)])
+        self.assertIsNone(manager.context.get_data("file"))
+
+        # the collectors that aren't thread safe run where run_inline says
+        inline[0]()
+        self.assertTrue(runner.wait(0))
+        self.assertEqual(results[-1], ("file", CollectRunner.DONE))
+        CollectShotgrid.release.set()
+        for _ in range(100):
+            if len(results) == 3:
+                break
+            sleep(0.05)
+        self.assertEqual(results[-1], ("shotgrid", CollectRunner.LATE))
+        self.assertEqual(manager.context.get_data("shotgrid"), "sg")
+
+    def test_manual_value(self):
+        CollectShotgrid.release.clear()
+        manager = Manager()
+        manager.register(CollectShotgrid)
+        collect = manager.collectors[0]
+        results = list()
+        runner = CollectRunner(
+            manager.collectors, lambda collect, result: results.append(result)
+        )
+        runner.start()
+        self.assertTrue(runner.wait(1))
+        self.assertEqual(runner.pending, [collect])
+
+        # typed after timing out, neither the late result nor publish replace it
+        collect.set_manual_value("typed")
+        manager.publish()
+        self.assertEqual(collect.status, StatusProcess.SUCCESS)
+        CollectShotgrid.release.set()
+        for _ in range(100):
+            if runner.pending == []:
+                break
+            sleep(0.05)
+        self.assertEqual(results, [CollectRunner.TIMEOUT, CollectRunner.LATE])
+        self.assertEqual(manager.context.get_data("shotgrid"), "typed")
+        self.assertEqual(collect.status, StatusProcess.SUCCESS)
+
+        # an empty value collects again
+        collect.set_manual_value("")
+        self.assertFalse(collect.manual)
+        manager.publish()
+        self.assertEqual(manager.context.get_data("shotgrid"), "sg")
+
+
+class PublisherContextTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the context computes lazy values
+    once and keeps its snapshots unchanged.
+    """
+
+    def test_lazy(self):
+        context = Context()
+        calls = list()
+        context.set_lazy("meshes", lambda: calls.append(1) or ["|a", "|b"])
+        snapshot = context.snapshot()
+        self.assertEqual(calls, [])
+        self.assertEqual(snapshot.get_data("meshes"), ["|a", "|b"])
+        self.assertEqual(context.get_data("meshes"), ["|a", "|b"])
+        self.assertEqual(calls, [1])
+
+    def test_snapshot(self):
+        context = Context()
+        context.set_data("file", "v001.ma")
+        snapshot = context.snapshot()
+        context.set_data("file", "v002.ma")
+        context.set_data("preview", "v002.jpg")
+        self.assertEqual(snapshot.get_data("file"), "v001.ma")
+        self.assertIsNone(snapshot.get_data("preview"))
+        self.assertEqual(snapshot.keys(), ["file"])
+        self.assertEqual(context.get_data("file"), "v002.ma")
+
+    def test_subscribe(self):
+        context = Context()
+        changes, file_changes = list(), list()
+        context.subscribe(changes.append)
+        unsubscribe = context.subscribe(file_changes.append, "file")
+        context.set_data("file", "v001.ma")
+        context.set_data("meshes", list(range(10**5)))
+        unsubscribe()
+        context.set_data("file", "v002.ma")
+        self.assertEqual(changes, ["file", "meshes", "file"])
+        self.assertEqual(file_changes, ["file"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
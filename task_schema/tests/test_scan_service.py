@@ -0,0 +1,124 @@
+from shutil import rmtree
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from threading import Event
+from unittest import mock
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils import scan_service
+from task_schema.utils.file_scan import scan_files
+from task_schema.utils.scan_service import (
+    CANCELLED,
+    COMPLETE,
+    ERROR,
+    TIMEOUT,
+    ScanService,
+)
+
+
+class ScanServiceTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the scan service returns partial
+    results when scans time out or are stopped.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_scan_service")
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+        for name in [
+            "sh010_anim_v001.ma",
+            "sh010_anim_v002.ma",
+            "thumb.jpg",
+            "preview/sh010_anim_v002.jpg",
+            "preview/old/sh010_anim_v001.jpg",
+        ]:
+            path = Path(cls.TEMP_FOLDER, name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        cls.service = ScanService(max_workers=2)
+
+    def test_complete(self):
+        result = self.service.scan(
+            self.TEMP_FOLDER, name_filter=lambda name: "_v00" in name, timeout=10
+        )
+        self.assertEqual(result.status, COMPLETE)
+        self.assertTrue(result.complete)
+        self.assertEqual(len(result.files), 4)
+        self.assertIn(fspath(Path(self.TEMP_FOLDER, "preview")), result.visited)
+
+    def test_max_depth(self):
+        jpgs = frozenset({".jpg"})
+        names = {f.name for f in scan_files(self.TEMP_FOLDER, jpgs, max_depth=1)}
+        self.assertEqual(names, {"thumb.jpg", "sh010_anim_v002.jpg"})
+        names = {f.name for f in scan_files(self.TEMP_FOLDER, jpgs, max_depth=0)}
+        self.assertEqual(names, {"thumb.jpg"})
+
+    def test_error(self):
+        result = self.service.scan(Path(self.TEMP_FOLDER, "missing"), timeout=10)
+        self.assertEqual(result.status, ERROR)
+        self.assertIsInstance(result.error, OSError)
+        self.assertEqual(result.files, [])
+
+    def hanging_scan(self, release: Event):
+        def scan(root, *args, **kwargs):
+            # the first folder is listed and then the share stops answering
+            yield Path(root, "sh010_anim_v001.ma")
+            release.wait(10)
+
+        return mock.patch.object(scan_service, "scan_files", scan)
+
+    def test_timeout(self):
+        release = Event()
+        with self.hanging_scan(release):
+            result = self.service.scan(self.TEMP_FOLDER, timeout=0.2)
+        release.set()
+        self.assertEqual(result.status, TIMEOUT)
+        self.assertEqual([f.name for f in result.files], ["sh010_anim_v001.ma"])
+
+    def test_force_stop(self):
+        release, stop = Event(), Event()
+        with self.hanging_scan(release):
+            job = self.service.submit(self.TEMP_FOLDER)
+            stop.set()
+            result = job.wait(force_stop=stop.is_set)
+        release.set()
+        self.assertEqual(result.status, CANCELLED)
+        self.assertTrue(job._cancel.is_set())
+
+    def test_stuck_workers_are_replaced(self):
+        release = Event()
+        real_scan_files = scan_service.scan_files
+
+        def scan(root, *args, **kwargs):
+            if Path(root).name.startswith("dead"):
+                release.wait(10)
+                return
+            yield from real_scan_files(root, *args, **kwargs)
+
+        service = ScanService(max_workers=2)
+        try:
+            with mock.patch.object(scan_service, "scan_files", scan):
+                dead = [Path(self.TEMP_FOLDER, f"dead{i}") for i in range(3)]
+                jobs = [service.submit(root) for root in dead]
+                for job in jobs:
+                    self.assertEqual(job.wait(0.2).status, TIMEOUT)
+                result = service.scan(self.TEMP_FOLDER, timeout=5)
+            self.assertEqual(result.status, COMPLETE)
+            self.assertEqual(len(result.files), 5)
+            self.assertEqual(service.abandoned, 3)
+        finally:
+            release.set()
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+from shutil import rmtree
+import json
+import subprocess
+import unittest
+from os import environ, fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.session_broker import (
+    SessionBroker,
+    SessionServer,
+    send_command,
+)
+
+
+class SessionBrokerTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that files are opened in running
+    sessions and new ones started when needed.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_session_broker")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        self.TEMP_FOLDER.mkdir(parents=True)
+        self.log = Path(self.TEMP_FOLDER, "opened.jsonl")
+        self.broker = SessionBroker(command_timeout=5, startup_timeout=0)
+        self.key = ("Test", "maya")
+        self.process = None
+
+    def tearDown(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+
+    def start_stand_in(self, path):
+        env = {**environ, **self.broker.new_session_env(self.key)}
+        self.port_file = Path(env["GWAIO_SESSION_PORT_FILE"])
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "task_schema.utils.session_broker",
+                fspath(path),
+                "--log",
+                fspath(self.log),
+            ],
+            cwd=fspath(base_path),
+            env=env,
+        )
+
+    def opened(self):
+        lines = self.log.read_text().splitlines()
+        return [json.loads(line) for line in lines]
+
+    def test_reuse(self):
+        self.assertFalse(self.broker.open_file(self.key, "first.ma", {}))
+        self.start_stand_in("first.ma")
+        self.assertTrue(self.broker.wait_ready(self.key, timeout=20))
+        env = {"GWAIO_CONTEXT": "context.json"}
+        self.assertTrue(self.broker.open_file(self.key, "second.ma", env))
+        self.assertFalse(self.broker.open_file(("Test", "nuke"), "a.nk", env))
+        opened = self.opened()
+        self.assertEqual([o["path"] for o in opened], ["first.ma", "second.ma"])
+        self.assertEqual(opened[1]["env"], env)
+
+        # closed sessions are forgotten
+        self.process.kill()
+        self.process.wait()
+        self.process = None
+        self.assertFalse(self.broker.open_file(self.key, "third.ma", env))
+        self.assertEqual(self.broker._sessions[self.key], [])
+        self.assertFalse(self.port_file.exists())
+
+    def test_server(self):
+        opened = list()
+        server = SessionServer(lambda path, env: opened.append(path), 0, "secret")
+        self.assertEqual(server.handle_request({"command": "ping"})["ok"], False)
+        request = {"token": "secret", "command": "open", "path": "a.ma"}
+        self.assertEqual(server.handle_request(request), {"ok": True})
+        request["command"] = "quit"
+        self.assertEqual(server.handle_request(request)["ok"], False)
+        self.assertEqual(opened, ["a.ma"])
+
+    def test_port_file(self):
+        port_file = Path(self.TEMP_FOLDER, "session.port")
+        server = SessionServer(lambda path, env: None, 0, "secret", port_file)
+        server.start()
+        try:
+            self.assertNotEqual(server.port, 0)
+            self.assertEqual(port_file.read_text(), str(server.port))
+            response = send_command(server.port, "secret", "ping")
+            self.assertEqual(response, {"ok": True})
+        finally:
+            server.stop()
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
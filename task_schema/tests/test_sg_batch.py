@@ -0,0 +1,168 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from threading import Lock
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.fake_shotgrid import FakeDatabase, FakeShotgun
+from task_schema.utils.sg_batch import chunked, send_batches, task_field_updates
+
+
+class RecordingConnection:
+    """
+    Minimal stand-in for a ShotGrid session that records the batch calls
+    and fails the chunks holding a given entity id.
+    """
+
+    def __init__(self, calls: list, lock: Lock, fail_id: int = None) -> None:
+        self.calls = calls
+        self.lock = lock
+        self.fail_id = fail_id
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.closed = True
+
+    def batch(self, requests):
+        with self.lock:
+            self.calls.append(requests)
+        if any(r["entity_id"] == self.fail_id for r in requests):
+            raise RuntimeError("batch failed")
+        return [dict(id=r["entity_id"], type=r["entity_type"]) for r in requests]
+
+
+class SGBatchTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the batch helper chunks and
+    reports the ShotGrid requests.
+    """
+
+    def setUp(self):
+        self.calls = list()
+        self.lock = Lock()
+        self.connections = list()
+        self.requests = [
+            {
+                "request_type": "update",
+                "entity_type": "Asset",
+                "entity_id": i,
+                "data": {"sg_asset_line_task": {"type": "Task", "id": i}},
+            }
+            for i in range(25)
+        ]
+
+    def connect(self, fail_id=None):
+        connection = RecordingConnection(self.calls, self.lock, fail_id)
+        self.connections.append(connection)
+        return connection
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+        with self.assertRaises(ValueError):
+            list(chunked([1], 0))
+
+    def test_send_batches(self):
+        summary = send_batches(self.connect, self.requests, chunk_size=10, max_workers=2)
+        self.assertEqual(summary["requests"], 25)
+        self.assertEqual(summary["chunks"], 3)
+        self.assertEqual(summary["succeeded"], 25)
+        self.assertEqual(summary["failed"], 0)
+        self.assertEqual(sorted(len(c) for c in self.calls), [5, 10, 10])
+        self.assertLessEqual(len(self.connections), 2)
+        self.assertTrue(all(c.closed for c in self.connections))
+
+    def test_failed_chunk(self):
+        summary = send_batches(
+            lambda: self.connect(fail_id=12), self.requests, chunk_size=10
+        )
+        self.assertEqual(summary["succeeded"], 15)
+        self.assertEqual(summary["failed"], 10)
+        self.assertEqual(summary["errors"], ["batch failed"])
+
+    def test_no_requests(self):
+        summary = send_batches(self.connect, list())
+        self.assertEqual(summary["chunks"], 0)
+        self.assertEqual(self.connections, list())
+
+
+class TaskFieldUpdatesTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the asset task fields resync
+    only links the fields not linked yet.
+    """
+
+    FIELDS = {"layout": "sg_layout_task", "rig": "sg_rig_task"}
+
+    def setUp(self):
+        self.db = FakeDatabase()
+        self.sg = FakeShotgun(self.db)
+        self.assets = [self.db.add("Asset", {"code": f"char{i}"}) for i in range(3)]
+        self.tasks = dict()
+        for asset in self.assets:
+            for name in self.FIELDS:
+                task = self.db.add(
+                    "Task",
+                    {"content": name, "entity": {"type": "Asset", "id": asset["id"]}},
+                )
+                self.tasks[asset["code"], name] = {"type": "Task", "id": task["id"]}
+
+    def find_tasks(self):
+        return self.sg.find(
+            "Task",
+            [["content", "in", list(self.FIELDS)]],
+            ["content", "entity"]
+            + [f"entity.Asset.{field}" for field in self.FIELDS.values()],
+        )
+
+    def link(self, asset, task):
+        self.sg.update("Asset", asset["id"], {"sg_layout_task": task})
+
+    def resync(self):
+        requests, skipped = task_field_updates("Asset", self.find_tasks(), self.FIELDS)
+        for request in requests:
+            self.sg.update("Asset", request["entity_id"], request["data"])
+        return requests, skipped
+
+    def test_updates(self):
+        char0, char1, char2 = self.assets
+        self.link(char0, self.tasks["char0", "layout"])
+        # linked to another asset's task, so it is linked again
+        self.link(char1, self.tasks["char2", "layout"])
+        requests, skipped = self.resync()
+        self.assertEqual(skipped, 1)
+        data = {r["entity_id"]: r["data"] for r in requests}
+        self.assertEqual(data[char0["id"]], {"sg_rig_task": self.tasks["char0", "rig"]})
+        self.assertEqual(
+            data[char1["id"]],
+            {
+                "sg_layout_task": self.tasks["char1", "layout"],
+                "sg_rig_task": self.tasks["char1", "rig"],
+            },
+        )
+        self.assertEqual(len(data[char2["id"]]), 2)
+        # everything is linked now
+        self.assertEqual(self.resync(), ([], 6))
+
+    def test_duplicate_task_names(self):
+        char0 = self.assets[0]
+        duplicate = self.db.add(
+            "Task",
+            {"content": "layout", "entity": {"type": "Asset", "id": char0["id"]}},
+        )
+        self.link(char0, {"type": "Task", "id": duplicate["id"]})
+        requests, skipped = self.resync()
+        # any of the asset's layout tasks is fine, so the link isn't switched
+        self.assertNotIn("sg_layout_task", requests[0]["data"])
+        self.assertEqual(self.resync(), ([], 7))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
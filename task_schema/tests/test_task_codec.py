@@ -0,0 +1,134 @@
+import json
+import unittest
+from datetime import datetime
+from os import fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils import task_codec
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class Preview:
+    def __init__(self, id, path=None):
+        self.id = id
+        self.path = path
+
+
+task_codec.register_type(
+    Preview,
+    100,
+    lambda p: {"id": p.id, "path": p.path},
+    lambda data: Preview(data["id"], Path(data["path"])),
+)
+
+
+class Task:
+    _field_types = {"server_path": Path, "preview": Preview}
+
+    def __init__(self, name: str, local_path: Path, **kwargs) -> None:
+        self._name = name
+        self.local_path = local_path
+        self.__dict__.update(kwargs)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+
+    @property
+    def root(self) -> Path:
+        return self.local_path.parent
+
+    @root.setter
+    def root(self, value: Path) -> None:
+        pass
+
+    def method(self) -> None:
+        pass
+
+
+class TaskCodecTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that tasks are serialized with their
+    field plans and restored with their types.
+    """
+
+    def setUp(self):
+        self.task = Task(
+            "anim",
+            Path("/projects/sh010/anim"),
+            id=12,
+            server_path=Path("/server/sh010/anim"),
+            preview=Preview(3, Path("/projects/sh010/anim/thumbnail")),
+            created=datetime(2024, 5, 1, 10, 30),
+            frames=(1001, 1100),
+            assets=[{"code": "chr_ana", "path": Path("/assets/ana")}],
+            callback=lambda: None,
+        )
+
+    def test_to_dict(self):
+        data = task_codec.to_dict(self.task)
+        self.assertEqual(
+            list(data),
+            [
+                "assets",
+                "created",
+                "frames",
+                "id",
+                "local_path",
+                "name",
+                "preview",
+                "root",
+                "server_path",
+            ],
+        )
+        self.assertEqual(data["root"], fspath(Path("/projects/sh010")))
+        self.assertEqual(data["created"], "2024-05-01T10:30:00")
+        self.assertEqual(data["frames"], [1001, 1100])
+        self.assertEqual(data["assets"][0]["path"], fspath(Path("/assets/ana")))
+        self.assertEqual(data["preview"]["id"], 3)
+        json.dumps(data)
+
+    def test_json_round_trip(self):
+        data = json.loads(json.dumps(task_codec.to_dict(self.task)))
+        fields = task_codec.decode_fields(Task, data)
+        self.assertEqual(fields["server_path"], self.task.server_path)
+        self.assertEqual(fields["root"], Path("/projects/sh010"))
+        self.assertIsInstance(fields["preview"], Preview)
+        self.assertEqual(fields["preview"].path, self.task.preview.path)
+
+    def test_field_plan(self):
+        plan = task_codec.field_plan(Task)
+        self.assertIs(plan, task_codec.field_plan(Task))
+        self.assertEqual(plan.class_fields, ("name", "root"))
+        self.assertEqual(plan.types["root"], Path)
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_binary_round_trip(self):
+        data = task_codec.unpackb(task_codec.packb(self.task))
+        self.assertEqual(data["created"], self.task.created)
+        self.assertEqual(data["server_path"], self.task.server_path)
+        self.assertEqual(data["assets"][0]["path"], Path("/assets/ana"))
+        self.assertIsInstance(data["preview"], Preview)
+
+    def test_binary_requires_msgpack(self):
+        if msgpack is not None:
+            self.skipTest("msgpack is installed")
+        with self.assertRaises(ImportError):
+            task_codec.packb(self.task)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
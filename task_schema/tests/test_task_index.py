@@ -0,0 +1,74 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.task_index import TaskIndex
+
+
+class TaskIndexTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the task index returns the same
+    task as scanning the task list.
+    """
+
+    def setUp(self):
+        self.tasks = [
+            SimpleNamespace(
+                id=i,
+                link_name=f"EP101_010_{i // 3:04d}",
+                name=["layout", "anim", "lighting"][i % 3],
+                entity_type="Shot",
+                sg_step={"type": "Step", "id": i % 3},
+            )
+            for i in range(30)
+        ]
+        self.tasks.append(
+            SimpleNamespace(id=30, link_name="EP101_010_0000", name="anim")
+        )
+        self.index = TaskIndex(self.tasks)
+
+    def scan(self, **kwargs):
+        for task in self.tasks:
+            if all(getattr(task, k, None) == v for k, v in kwargs.items()):
+                return task
+
+    def test_find(self):
+        for kwargs in [
+            dict(id=7),
+            dict(link_name="EP101_010_0002", name="lighting"),
+            dict(name="anim"),
+            dict(link_name="EP101_010_0000", name="anim", entity_type="Shot"),
+            dict(sg_step={"type": "Step", "id": 2}),
+            dict(name="anim", sg_step={"type": "Step", "id": 1}),
+            dict(id=99),
+            dict(name="comp"),
+        ]:
+            self.assertIs(self.index.find(self.tasks, **kwargs), self.scan(**kwargs))
+        self.assertIsNone(self.index.candidates(sg_step={"type": "Step", "id": 2}))
+        self.assertEqual(len(self.index.candidates(id=7, name="lighting")), 1)
+
+    def test_incremental(self):
+        task = self.tasks[1]
+        self.index.remove(task)
+        self.assertEqual(self.index.size, 30)
+        self.assertIs(self.index.find(self.tasks, name="anim"), self.tasks[4])
+
+        self.index.add(task)
+        self.assertIs(self.index.find(self.tasks, name="anim"), self.tasks[4])
+
+        first = self.tasks[0]
+        first.name = "anim"
+        self.index.update(first)
+        self.assertIs(self.index.find(self.tasks, name="anim"), first)
+        self.assertIsNone(self.index.find(self.tasks, id=0, name="layout"))
+        self.assertEqual(self.index.size, 31)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
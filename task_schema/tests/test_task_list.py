@@ -0,0 +1,100 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.task_list import (
+    TaskList,
+    MIN_LOGGED_CHANGES,
+    task_changed,
+    task_changes,
+    tasks_stamp,
+)
+
+
+class Task:
+    def __init__(self, name):
+        self.name = name
+
+
+class TaskListTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the task list stamps change with
+    every change of the list or of its tasks.
+    """
+
+    def test_mutations(self):
+        tasks = TaskList(["layout", "anim", "light"])
+        mutations = [
+            lambda: tasks.append("comp"),
+            lambda: tasks.extend(["fx"]),
+            lambda: tasks.insert(0, "model"),
+            lambda: tasks.remove("fx"),
+            lambda: tasks.pop(),
+            lambda: tasks.sort(),
+            lambda: tasks.reverse(),
+            lambda: tasks.__setitem__(0, "rig"),
+            lambda: tasks.__setitem__(slice(None), ["a", "b", "c"]),
+            lambda: tasks.__delitem__(0),
+            lambda: tasks.__iadd__(["d"]),
+            lambda: tasks.__imul__(1),
+            lambda: tasks.clear(),
+        ]
+        for mutate in mutations:
+            stamp = tasks_stamp(tasks)
+            mutate()
+            self.assertNotEqual(tasks_stamp(tasks), stamp)
+        self.assertEqual(tasks_stamp(tasks), tasks_stamp(tasks))
+
+    def test_in_place_operators(self):
+        tasks = TaskList(["layout"])
+        alias = tasks
+        tasks += ["anim"]
+        self.assertIs(tasks, alias)
+        self.assertIsInstance(tasks, TaskList)
+        self.assertEqual(tasks, ["layout", "anim"])
+
+    def test_replaced_list(self):
+        old = TaskList(["layout", "anim"])
+        stamp = tasks_stamp(old)
+        self.assertNotEqual(tasks_stamp(TaskList(["layout", "anim"])), stamp)
+        # plain lists can't be tracked, so they never match
+        plain = ["layout"]
+        self.assertNotEqual(tasks_stamp(plain), tasks_stamp(plain))
+
+    def test_task_changed(self):
+        layout, anim = Task("layout"), Task("anim")
+        tasks = TaskList([layout])
+        other = TaskList([anim])
+        stamp, other_stamp = tasks_stamp(tasks), tasks_stamp(other)
+        task_changed(layout, "name")
+        self.assertNotEqual(tasks_stamp(tasks), stamp)
+        self.assertEqual(task_changes(tasks, stamp), [(layout, "name")])
+        self.assertEqual(task_changes(tasks, tasks_stamp(tasks)), [])
+        # the lists not holding the task are left alone
+        self.assertEqual(tasks_stamp(other), other_stamp)
+        tasks.append(anim)
+        self.assertIsNone(task_changes(tasks, stamp))
+        stamp = tasks_stamp(tasks)
+        task_changed(anim)
+        self.assertEqual(task_changes(tasks, stamp), [(anim, None)])
+        self.assertEqual(task_changes(other, other_stamp), [(anim, None)])
+        self.assertIsNone(task_changes(["layout"], stamp))
+
+    def test_changes_limit(self):
+        task = Task("layout")
+        tasks = TaskList([task])
+        stamp = tasks_stamp(tasks)
+        for _ in range(MIN_LOGGED_CHANGES):
+            task_changed(task, "name")
+        self.assertEqual(len(task_changes(tasks, stamp)), MIN_LOGGED_CHANGES)
+        task_changed(task, "name")
+        # too many changes to apply one by one
+        self.assertIsNone(task_changes(tasks, stamp))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+import unittest
+from os import fspath
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils.task_search import TaskSearch
+
+HEADERS = ["link", "task", "task status", "artist", "tags", "sequence", "episode"]
+
+
+def make_task(id, link, task, status, artist, tags=""):
+    episode, sequence = link[:5], link[:9]
+    texts = [link, task, status, artist, tags, sequence, episode]
+    return SimpleNamespace(
+        id=id,
+        link_name=link,
+        name=task,
+        data_to_show=[{"text": t, "icon": None} for t in texts],
+    )
+
+
+class TaskSearchTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the task search matches the
+    same rows as filtering their texts.
+    """
+
+    def setUp(self):
+        self.tasks = [
+            make_task(1, "EP101_010_0010", "layout", "ip", "Ana Maria", "retake"),
+            make_task(2, "EP101_010_0010", "anim", "wtg", "Luis"),
+            make_task(3, "EP102_020_0010", "layout", "ip", "Ana Maria"),
+            make_task(4, "EP102_020_0020", "anim", "ip", "Juana", "retake"),
+            make_task(5, "EP102_030_0010", "lighting", "fin", "Luis"),
+        ]
+        self.search = TaskSearch(HEADERS, self.tasks)
+
+    def ids(self, query):
+        return [t.id for t in self.search.search(query)]
+
+    def test_search(self):
+        self.assertEqual(self.ids(""), [1, 2, 3, 4, 5])
+        self.assertEqual(self.ids("status:ip artist:ana ep:102"), [3, 4])
+        self.assertEqual(self.ids("task_status:IP layout"), [1, 3])
+        self.assertEqual(self.ids('artist:"ana maria"'), [1, 3])
+        self.assertEqual(self.ids('artist:"ana ma'), [1, 3])
+        self.assertEqual(self.ids("seq:EP102_02"), [3, 4])
+        self.assertEqual(self.ids("retake"), [1, 4])
+        self.assertEqual(self.ids("i"), [1, 2, 3, 4, 5])
+        self.assertEqual(self.ids("unknown:x"), [])
+        self.assertEqual(self.ids("status:ip status:fin"), [])
+
+    def test_update(self):
+        self.assertEqual(self.ids("luis"), [2, 5])
+        changed = make_task(2, "EP101_010_0010", "anim", "ip", "Marta")
+        self.search.update([changed, *self.tasks[2:]])
+        self.assertEqual(self.ids("luis"), [5])
+        self.assertEqual(self.ids("artist:marta"), [2])
+        self.assertEqual(self.ids("layout"), [3])
+        self.assertEqual(self.search.size, 4)
+        self.assertIsNone(self.search._columns[2]._grams.get("wtg"))
+
+    def test_reindex(self):
+        task = self.tasks[1]
+        task.data_to_show[3]["text"] = "Marta"
+        self.assertEqual(self.ids("artist:marta"), [])
+        self.search.reindex(task)
+        self.assertEqual(self.ids("artist:marta"), [2])
+        self.assertEqual(self.ids("luis"), [5])
+        # tasks not indexed are ignored
+        self.search.reindex(make_task(9, "EP103_010_0010", "anim", "ip", "Marta"))
+        self.assertEqual(self.ids("artist:marta"), [2])
+
+    def test_duplicate_keys(self):
+        tasks = [
+            make_task(None, "EP101_010_0010", "layout", "ip", "Ana Maria"),
+            make_task(None, "EP101_010_0010", "layout", "wtg", "Luis"),
+            make_task(None, "EP101_010_0010", "layout", "fin", "Juana"),
+        ]
+        self.search.update(tasks)
+        self.assertEqual(self.search.size, 3)
+        self.assertEqual(self.search.search(""), tasks)
+        self.assertEqual(self.search.search("luis"), [tasks[1]])
+        tasks[2].data_to_show[3]["text"] = "Marta"
+        self.search.reindex(tasks[2])
+        self.assertEqual(self.search.search("artist:marta"), [tasks[2]])
+        self.search.update(tasks[1:])
+        self.assertEqual(self.search.search("layout"), tasks[1:])
+
+    def test_reindex_key(self):
+        task = self.tasks[1]
+        task.id = 9
+        task.data_to_show[3]["text"] = "Marta"
+        self.search.reindex(task)
+        self.assertEqual(self.ids("artist:marta"), [9])
+        self.assertEqual(self.ids(""), [1, 9, 3, 4, 5])
+        # the key is taken by another task, so both rows are kept
+        task.id = 1
+        self.search.reindex(task)
+        self.assertEqual(self.ids("ep101"), [1, 1])
+        self.search.update(self.tasks)
+        self.assertEqual(self.ids(""), [1, 1, 3, 4, 5])
+        self.assertEqual(self.ids("artist:marta"), [1])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,105 @@
+from shutil import rmtree
+import unittest
+from os import fspath, utime
+import sys
+from pathlib import Path
+from time import time
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from PIL import Image
+
+from task_schema.utils.thumbnails import ThumbnailPipeline, render_thumbnail
+
+
+class ThumbnailsTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the thumbnails are reduced in
+    parallel and reused while the images don't change.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_thumbnails")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        self.sources = list()
+        for i in range(6):
+            source = Path(self.TEMP_FOLDER, f"sh{i:03d}0", "sh_anim_v001.jpg")
+            source.parent.mkdir(parents=True)
+            Image.new("RGB", (1920, 1080), (i * 40, 0, 0)).save(source)
+            self.sources.append(source)
+        self.pipeline = ThumbnailPipeline(
+            Path(self.TEMP_FOLDER, "cache"), size=(160, 160), max_workers=2
+        )
+
+    def tearDown(self):
+        self.pipeline.close()
+
+    def test_render(self):
+        target = Path(self.TEMP_FOLDER, "thumbnail.jpg")
+        self.assertTrue(render_thumbnail(self.sources[0], target, (160, 160)))
+        with Image.open(target) as image:
+            self.assertEqual(image.size, (160, 90))
+        with self.assertRaises(OSError):
+            render_thumbnail(Path(self.TEMP_FOLDER, "missing.jpg"), target)
+
+    def test_cache(self):
+        targets = [Path(s.parent, "thumbnail", "thumb.jpg") for s in self.sources]
+        installed = self.pipeline.install_many(zip(self.sources, targets))
+        self.assertEqual(installed, targets)
+        cached = self.pipeline.generate(self.sources)
+        self.assertEqual(len(set(cached.values())), 6)
+        for thumbnail in cached.values():
+            with Image.open(thumbnail) as image:
+                self.assertEqual(image.size, (160, 90))
+
+        # unchanged images keep their thumbnail, a modified one gets a new one
+        first = cached[self.sources[0]]
+        utime(self.sources[0], ns=(0, first.stat().st_mtime_ns + 10**9))
+        self.assertNotEqual(self.pipeline.cached_path(self.sources[0]), first)
+        self.assertEqual(
+            self.pipeline.cached_path(self.sources[1]), cached[self.sources[1]]
+        )
+        self.assertTrue(self.pipeline.install(self.sources[0], targets[0]))
+        self.assertEqual(
+            targets[0].stat().st_mtime_ns,
+            self.pipeline.cached_path(self.sources[0]).stat().st_mtime_ns,
+        )
+
+    def test_missing_source(self):
+        missing = Path(self.TEMP_FOLDER, "missing.jpg")
+        self.assertEqual(self.pipeline.generate([missing]), {missing: None})
+        target = Path(self.TEMP_FOLDER, "thumbnail.jpg")
+        self.assertFalse(self.pipeline.install(missing, target))
+
+    def test_remove_old_thumbnails(self):
+        cached = self.pipeline.generate(self.sources)
+        thumbnails = [cached[s] for s in self.sources]
+        now = time()
+        for age, thumbnail in enumerate(thumbnails):
+            utime(thumbnail, (now - age * 3600, now - age * 3600))
+        stale = Path(self.pipeline.cache_dir, "stale.jpg.123.tmp")
+        stale.write_bytes(b"")
+        utime(stale, (0, 0))
+
+        self.assertEqual(self.pipeline.remove_old_thumbnails(max_age=4.5 * 3600), 2)
+        self.assertEqual([t.exists() for t in thumbnails], [True] * 5 + [False])
+        self.assertFalse(stale.exists())
+        # the oldest ones go while the cache is too large
+        max_size = sum(t.stat().st_size for t in thumbnails[:2])
+        self.assertEqual(self.pipeline.remove_old_thumbnails(max_size=max_size), 3)
+        self.assertEqual([t.exists() for t in thumbnails[:3]], [True, True, False])
+        missing = ThumbnailPipeline(Path(self.TEMP_FOLDER, "missing"))
+        self.assertEqual(missing.remove_old_thumbnails(), 0)
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
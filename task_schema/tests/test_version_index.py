@@ -0,0 +1,185 @@
+from shutil import rmtree
+import unittest
+from os import fspath, utime
+import sys
+from pathlib import Path
+from time import time_ns
+
+base_path = Path(__file__).parent.parent.parent
+sys.path.insert(0, fspath(base_path))
+
+from task_schema.utils import version_index
+from task_schema.utils.file_scan import normalize_extensions, scan_files
+from task_schema.utils.version_index import (
+    VersionIndex,
+    VersionIndexCache,
+    parse_version,
+)
+
+
+class VersionIndexTests(unittest.TestCase):
+    """
+    This class will run different tests to
+    check that the version index finds the
+    last versions and notices folder changes.
+    """
+
+    VERSION_REGEX = r"_[vV]\d\d\d"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.TEMP_FOLDER = Path(Path(__file__).parent, "temp_version_index")
+
+    def setUp(self):
+        rmtree(self.TEMP_FOLDER, ignore_errors=True)
+        for name in [
+            "sh010_anim_v000.ma",
+            "sh010_anim_v001.ma",
+            "sh010_anim_v002.ma",
+            "sh010_anim_v002.mb",
+            "preview/sh010_anim_v003.mov",
+            "sh010_anim.ma",
+        ]:
+            path = Path(self.TEMP_FOLDER, name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        self.resolution = version_index.MTIME_RESOLUTION_NS
+        version_index.MTIME_RESOLUTION_NS = 0
+        self.scans = 0
+
+    def tearDown(self):
+        version_index.MTIME_RESOLUTION_NS = self.resolution
+
+    def build(self) -> VersionIndex:
+        self.scans += 1
+        visited = dict()
+        files = list(scan_files(self.TEMP_FOLDER, visited=visited))
+        return VersionIndex(files, self.VERSION_REGEX, visited)
+
+    def build_filtered(self) -> VersionIndex:
+        self.scans += 1
+        visited = dict()
+        files = [
+            f
+            for f in scan_files(self.TEMP_FOLDER, visited=visited)
+            if self.has_version(f.name)
+        ]
+        return VersionIndex(
+            files, self.VERSION_REGEX, visited, name_filter=self.has_version
+        )
+
+    def has_version(self, name: str) -> bool:
+        return parse_version(self.VERSION_REGEX, name) is not None
+
+    def test_parse_version(self):
+        self.assertEqual(parse_version(self.VERSION_REGEX, "a_v012.ma"), 12)
+        self.assertIsNone(parse_version(self.VERSION_REGEX, "a.ma"))
+        self.assertIsNone(parse_version("", "a_v012.ma"))
+
+    def test_queries(self):
+        index = self.build()
+        self.assertEqual(index.max_version, 3)
+        ma = normalize_extensions("ma")
+        self.assertEqual(index.last_version_file(ma).name, "sh010_anim_v002.ma")
+        self.assertIn(
+            index.last_version_file(normalize_extensions(["ma", "mb"])).name,
+            ["sh010_anim_v002.ma", "sh010_anim_v002.mb"],
+        )
+        self.assertEqual(len(index.files_with_ext(ma)), 4)
+        self.assertEqual(len(index.by_version[2]), 2)
+        self.assertIsNone(index.last_version_file(normalize_extensions("psd")))
+
+        unversioned = Path(self.TEMP_FOLDER, "sh010_anim.ma")
+        utime(unversioned, (0, 4102444800))
+        self.assertEqual(index.newest_file(ma), unversioned)
+
+    def test_min_version(self):
+        for name in ["v001.ma", "v002.ma", "v002.mb"]:
+            Path(self.TEMP_FOLDER, f"sh010_anim_{name}").unlink()
+        index = self.build()
+        ma = normalize_extensions("ma")
+        self.assertEqual(index.last_version_file(ma).name, "sh010_anim_v000.ma")
+        self.assertIsNone(index.last_version_file(ma, min_version=1))
+
+    def test_cache(self):
+        cache = VersionIndexCache()
+        key = fspath(self.TEMP_FOLDER)
+        first = cache.get(key, self.build)
+        self.assertIs(cache.get(key, self.build), first)
+        self.assertEqual(self.scans, 1)
+
+        # a new file in a subfolder changes that folder's mtime
+        new_file = Path(self.TEMP_FOLDER, "preview", "sh010_anim_v004.mov")
+        new_file.touch()
+        utime(new_file.parent, ns=(0, first.visited[fspath(new_file.parent)] + 1))
+        second = cache.get(key, self.build)
+        self.assertEqual(self.scans, 2)
+        self.assertEqual(second.max_version, 4)
+
+        cache.invalidate(Path(self.TEMP_FOLDER, "preview"))
+        cache.get(key, self.build)
+        self.assertEqual(self.scans, 3)
+
+    def test_apply_changes(self):
+        cache = VersionIndexCache()
+        key = fspath(self.TEMP_FOLDER)
+        first = cache.get(key, self.build_filtered)
+
+        added = Path(self.TEMP_FOLDER, "preview", "sh010_anim_v004.mov")
+        added.touch()
+        ignored = Path(self.TEMP_FOLDER, "preview", "notes.txt")
+        ignored.touch()
+        removed = Path(self.TEMP_FOLDER, "sh010_anim_v002.mb")
+        removed.unlink()
+        cache.apply(
+            [
+                ("added", added),
+                ("added", ignored),
+                ("removed", removed),
+                ("modified", Path(self.TEMP_FOLDER, "sh010_anim_v001.ma")),
+            ]
+        )
+        second = cache.get(key, self.build_filtered)
+        self.assertIsNot(second, first)
+        self.assertEqual(self.scans, 1)
+        self.assertEqual(second.max_version, 4)
+        self.assertIn(added, second.files)
+        self.assertNotIn(ignored, second.files)
+        self.assertNotIn(removed, second.files)
+        self.assertEqual(second.files_with_ext(normalize_extensions(["mb"])), [])
+
+        # files in a folder the index didn't scan need a new scan
+        new_file = Path(self.TEMP_FOLDER, "render", "sh010_anim_v005.exr")
+        new_file.parent.mkdir()
+        new_file.touch()
+        cache.apply([("added", new_file)])
+        self.assertEqual(cache.get(key, self.build_filtered).max_version, 5)
+        self.assertEqual(self.scans, 2)
+
+    def test_recent_scans_are_not_reused(self):
+        version_index.MTIME_RESOLUTION_NS = self.resolution
+        cache = VersionIndexCache()
+        cache.get("key", self.build)
+        cache.get("key", self.build)
+        self.assertEqual(self.scans, 2)
+
+    def test_applied_changes_are_reused(self):
+        old = time_ns() - 10 * self.resolution
+        for folder in (self.TEMP_FOLDER, Path(self.TEMP_FOLDER, "preview")):
+            utime(folder, ns=(old, old))
+        cache = VersionIndexCache()
+        cache.get("key", self.build_filtered)
+        version_index.MTIME_RESOLUTION_NS = self.resolution
+        added = Path(self.TEMP_FOLDER, "sh010_anim_v005.ma")
+        added.touch()
+        cache.apply([("added", added)])
+        self.assertEqual(cache.get("key", self.build_filtered).max_version, 5)
+        self.assertEqual(self.scans, 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        rmtree(cls.TEMP_FOLDER, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,438 @@
+"""
+bdl_validation.py
+
+This module provides the shared validation engine for BDL Excel files.
+Plugins declare a BDLSchema (the columns of the sheet and the rules that
+apply to them) instead of looping over the rows. The schema reads the sheet
+once and evaluates every rule as a column operation, returning the same
+`results` dictionary the BDL panel expects from `read_excel`.
+"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher as smatch
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union
+
+from task_schema.utils.lazy import LazyImport
+
+if TYPE_CHECKING:
+    import pandas
+else:
+    # plugins declare their schemas at class level, pandas is only needed
+    # once a BDL is actually validated
+    pandas = LazyImport("pandas")
+
+logger = getLogger(__name__)
+
+
+def existing_field(
+    frame: pandas.DataFrame, existing_assets: dict[str, dict[str, Any]], field: str
+) -> pandas.Series:
+    """
+    Map each row's asset name to a field of its existing asset entity.
+
+    Args:
+        frame (pandas.DataFrame): Frame holding an `asset_name` column.
+        existing_assets (dict[str, dict[str, Any]]): Asset code to entity dict.
+        field (str): Entity field to look up.
+
+    Returns:
+        pandas.Series: Field values, None for assets that don't exist.
+    """
+    lookup = {code: entity.get(field) for code, entity in existing_assets.items()}
+    return frame["asset_name"].map(lookup)
+
+
+def starts_with_episode(
+    frame: pandas.DataFrame, column: str, *prefixes: str
+) -> pandas.Series:
+    """
+    Check row-wise whether a column starts with any of the given prefixes.
+
+    Prefixes may use an `{episode}` placeholder, filled with the row episode.
+
+    Args:
+        frame (pandas.DataFrame): Frame holding `column` and `episode` columns.
+        column (str): Column to check.
+        *prefixes (str): Prefix templates, e.g. 'MR{episode}' or 'MR00'.
+
+    Returns:
+        pandas.Series: Boolean Series, True where a prefix matches.
+    """
+    return pandas.Series(
+        [
+            str(value).startswith(tuple(p.format(episode=ep) for p in prefixes))
+            for value, ep in zip(frame[column], frame["episode"])
+        ],
+        index=frame.index,
+        dtype=bool,
+    )
+
+
+class BDLRule:
+    """
+    Base class for a vectorized BDL rule.
+
+    A rule flags rows through a boolean mask and formats its message only
+    for the flagged rows. Messages may use `{column}` placeholders, which
+    are filled with the values of the flagged row.
+
+    Attributes:
+        message (str): Message added to each flagged row.
+        target (str): Results key the message goes to ('errors' or 'warnings').
+    """
+
+    def __init__(self, message: str, target: str = "errors") -> None:
+        self.message = message
+        self.target = target
+
+    def mask(
+        self, frame: pandas.DataFrame, existing_assets: dict[str, dict[str, Any]]
+    ) -> pandas.Series:
+        """
+        Return a boolean Series flagging the rows that break the rule.
+
+        Raises:
+            NotImplementedError: Must be implemented in subclass.
+        """
+        raise NotImplementedError("This method needs to be implemented.")
+
+    def evaluate(
+        self, frame: pandas.DataFrame, existing_assets: dict[str, dict[str, Any]]
+    ) -> list[pandas.Series]:
+        """
+        Evaluate the rule over the whole frame.
+
+        Args:
+            frame (pandas.DataFrame): Prepared BDL frame.
+            existing_assets (dict[str, dict[str, Any]]): Asset code to entity dict.
+
+        Returns:
+            list[pandas.Series]: Messages indexed by the flagged rows.
+        """
+        return [self.format(frame.loc[self.mask(frame, existing_assets)])]
+
+    def format(self, flagged: pandas.DataFrame) -> pandas.Series:
+        """
+        Format the rule message for the flagged rows.
+
+        Args:
+            flagged (pandas.DataFrame): Rows that broke the rule.
+
+        Returns:
+            pandas.Series: One message per flagged row.
+        """
+        if "{" not in self.message:
+            return pandas.Series(self.message, index=flagged.index, dtype=object)
+        return pandas.Series(
+            [self.message.format_map(row) for row in flagged.to_dict("records")],
+            index=flagged.index,
+            dtype=object,
+        )
+
+
+class Duplicated(BDLRule):
+    """Flags rows repeated on the given columns."""
+
+    def __init__(
+        self,
+        columns: list[str],
+        message: str = "This asset is repeated.",
+        target: str = "errors",
+    ) -> None:
+        super().__init__(message, target)
+        self.columns = columns
+
+    def mask(self, frame, existing_assets):
+        return frame.duplicated(subset=self.columns, keep=False)
+
+
+class NotIn(BDLRule):
+    """Flags rows whose column value is not one of the allowed values."""
+
+    def __init__(
+        self,
+        column: str,
+        values: Iterable[Any],
+        message: str,
+        normalize: Optional[Callable[[pandas.Series], pandas.Series]] = None,
+        target: str = "errors",
+    ) -> None:
+        super().__init__(message, target)
+        self.column = column
+        self.values = list(values)
+        self.normalize = normalize
+
+    def mask(self, frame, existing_assets):
+        series = frame[self.column]
+        if self.normalize is not None:
+            series = self.normalize(series.astype(str))
+        return ~series.isin(self.values)
+
+
+class EmptyFields(BDLRule):
+    """Flags empty cells, adding one message per empty column."""
+
+    def __init__(
+        self,
+        columns: list[str],
+        message: str = "There are some empty fields.",
+        target: str = "errors",
+    ) -> None:
+        super().__init__(message, target)
+        self.columns = columns
+
+    def evaluate(self, frame, existing_assets):
+        return [
+            self.format(frame.loc[frame[c].isna() | (frame[c] == "")])
+            for c in self.columns
+        ]
+
+
+class NonAlphanumeric(BDLRule):
+    """
+    Flags non-empty cells with characters other than letters, digits
+    or underscores. The offending characters are starred in the message.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        message: str = "There are non alphanumeric values: ",
+        target: str = "errors",
+    ) -> None:
+        super().__init__(message, target)
+        self.columns = columns
+
+    def evaluate(self, frame, existing_assets):
+        found = list()
+        for column in self.columns:
+            series = frame[column].astype(str)
+            alnum = series.str.replace("_", "", regex=False).str.isalnum()
+            mask = (series != "") & ~alnum
+            starred = series[mask].str.replace("[^0-9a-zA-Z]+", "*", regex=True)
+            found.append((self.message + starred).astype(object))
+        return found
+
+
+class NotMatching(BDLRule):
+    """Flags rows whose column value doesn't match a regex from its start."""
+
+    def __init__(
+        self, column: str, pattern: str, message: str, target: str = "errors"
+    ) -> None:
+        super().__init__(message, target)
+        self.column = column
+        self.pattern = pattern
+
+    def mask(self, frame, existing_assets):
+        return ~frame[self.column].astype(str).str.match(self.pattern)
+
+
+class Matching(NotMatching):
+    """Flags rows whose column value matches a regex from its start."""
+
+    def mask(self, frame, existing_assets):
+        return ~super().mask(frame, existing_assets)
+
+
+class Condition(BDLRule):
+    """
+    Flags rows through a plugin-defined vectorized condition, used for the
+    project specific rules (production types, episode prefixes, etc.).
+
+    Attributes:
+        condition (Callable): Receives the frame and the existing assets and
+            returns a boolean Series.
+    """
+
+    def __init__(
+        self,
+        condition: Callable[[pandas.DataFrame, dict], pandas.Series],
+        message: str,
+        target: str = "errors",
+    ) -> None:
+        super().__init__(message, target)
+        self.condition = condition
+
+    def mask(self, frame, existing_assets):
+        return pandas.Series(
+            self.condition(frame, existing_assets), index=frame.index, dtype=bool
+        )
+
+
+class ParentAssetsExist(BDLRule):
+    """
+    Flags comma separated parent assets that don't exist yet, suggesting
+    the closest existing asset name when there is one.
+    """
+
+    def __init__(
+        self,
+        column: str,
+        message: str = "Parent asset {parent} does not exist in SG, please create it first. ",
+        ratio: float = 0.8,
+        target: str = "errors",
+    ) -> None:
+        super().__init__(message, target)
+        self.column = column
+        self.ratio = ratio
+
+    def evaluate(self, frame, existing_assets):
+        parents = frame[self.column].astype(str)
+        parents = parents[parents != ""].str.split(",").explode()
+        missing = parents[~parents.isin(list(existing_assets))]
+        messages = list()
+        for parent in missing:
+            candidate = next(
+                (
+                    k
+                    for k in existing_assets
+                    if smatch(None, k, parent).ratio() > self.ratio
+                ),
+                None,
+            )
+            messages.append(
+                self.message.format(parent=parent)
+                + (f"\nMaybe you meant {candidate}?" if candidate else "")
+            )
+        return [pandas.Series(messages, index=missing.index, dtype=object)]
+
+
+class BDLSchema:
+    """
+    Declarative description of a BDL sheet and the rules that validate it.
+
+    Attributes:
+        columns (list[str]): Names given to the validated columns, in sheet order.
+        usecols (list[int]): Sheet columns to read, validated columns first.
+        rules (list[BDLRule]): Rules evaluated in order.
+        asset_name (Callable): Builds the asset name Series from the frame.
+        episode (Callable): Returns the episode from the excel path and the
+            frame, either as a string or as a per-row Series.
+        optional_columns (list[str]): Trailing columns only kept when their
+            header matches the name, otherwise left empty (e.g. 'tags').
+        read_kwargs (dict): Extra keyword arguments for `pandas.read_excel`.
+        replace_pairs (list[dict]): `DataFrame.replace` keyword arguments
+            applied to the validated columns.
+        dropna (list[str]): Columns whose empty rows are dropped.
+        exists_name (Callable): Builds the names looked up in the existing
+            assets for "exists", `asset_name` if None.
+    """
+
+    def __init__(
+        self,
+        columns: list[str],
+        usecols: list[int],
+        rules: list[BDLRule],
+        asset_name: Callable[[pandas.DataFrame], pandas.Series],
+        episode: Callable[[Path, pandas.DataFrame], Union[str, pandas.Series]],
+        optional_columns: Optional[list[str]] = None,
+        read_kwargs: Optional[dict[str, Any]] = None,
+        replace_pairs: Optional[list[dict[str, Any]]] = None,
+        dropna: Optional[list[str]] = None,
+        exists_name: Optional[Callable[[pandas.DataFrame], pandas.Series]] = None,
+    ) -> None:
+        self.columns = columns
+        self.usecols = usecols
+        self.rules = rules
+        self.asset_name = asset_name
+        self.episode = episode
+        self.optional_columns = optional_columns or list()
+        self.read_kwargs = read_kwargs or dict()
+        self.replace_pairs = replace_pairs or list()
+        self.dropna = dropna
+        self.exists_name = exists_name or asset_name
+
+    @property
+    def targets(self) -> list[str]:
+        """Results keys the rules write messages to."""
+        if any(rule.target == "warnings" for rule in self.rules):
+            return ["errors", "warnings"]
+        return ["errors"]
+
+    def read(self, excel: Path) -> tuple[pandas.DataFrame, list[str]]:
+        """
+        Read the sheet once and prepare it for validation.
+
+        Args:
+            excel (Path): Path to the BDL Excel file.
+
+        Returns:
+            tuple[pandas.DataFrame, list[str]]: The prepared frame, with the
+            schema column names, and the headers to display.
+        """
+        frame = pandas.read_excel(excel, usecols=self.usecols, **self.read_kwargs)
+        sheet_headers = frame.columns.tolist()
+        frame.columns = [*self.columns, *self.optional_columns]
+
+        for pair in self.replace_pairs:
+            frame[self.columns] = frame[self.columns].replace(**pair)
+        if self.dropna:
+            frame = frame.dropna(subset=self.dropna)
+        frame = frame.fillna("")
+
+        optional_headers = sheet_headers[len(self.columns) :]
+        for header, name in zip(optional_headers, self.optional_columns):
+            if str(header).lower() != name:
+                frame[name] = ""
+
+        headers = [
+            *sheet_headers[: len(self.columns)],
+            *[name.capitalize() for name in self.optional_columns],
+        ]
+        return frame, headers
+
+    def validate(
+        self, excel: Path, existing_assets: dict[str, dict[str, Any]]
+    ) -> tuple[list[str], dict[Any, dict[str, Any]]]:
+        """
+        Validate a BDL Excel file against the schema rules.
+
+        Args:
+            excel (Path): Path to the BDL Excel file.
+            existing_assets (dict[str, dict[str, Any]]): Asset code to entity dict,
+                as returned by `return_all_assets`.
+
+        Returns:
+            tuple[list[str], dict[Any, dict[str, Any]]]: The headers and a
+            dictionary with the parsed data and the errors of each row.
+        """
+        frame, headers = self.read(excel)
+        rows = frame[[*self.columns, *self.optional_columns]].values.tolist()
+
+        frame["asset_name"] = self.asset_name(frame)
+        frame["exists"] = self.exists_name(frame).isin(list(existing_assets))
+        episode = self.episode(excel, frame)
+        frame["episode"] = (
+            episode if isinstance(episode, pandas.Series) else str(episode)
+        )
+
+        index = frame.index.tolist()
+        messages = {target: {i: list() for i in index} for target in self.targets}
+        for rule in self.rules:
+            for found in rule.evaluate(frame, existing_assets):
+                bucket = messages[rule.target]
+                for i, message in found.items():
+                    bucket[i].append(message)
+
+        results = dict()
+        for i, series, episode, asset_name, exists in zip(
+            index,
+            rows,
+            frame["episode"].tolist(),
+            frame["asset_name"].tolist(),
+            frame["exists"].tolist(),
+        ):
+            results[i] = {
+                "series": series,
+                **{target: messages[target][i] for target in self.targets},
+                "episode": episode,
+                "asset_name": asset_name,
+                "exists": bool(exists),
+                "status": len(messages["errors"][i]) == 0,
+            }
+        logger.debug(f"BDL {excel.name} validated: {len(results)} rows.")
+        return headers, results
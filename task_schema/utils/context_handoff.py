@@ -0,0 +1,207 @@
+"""
+context_handoff.py
+
+Hands the task context over to the applications launched from a plugin
+without putting it in their environment. The serialized task, with its raw
+tracker record, made launched processes inherit very large variables and
+could exceed the 32 KB limit of Windows environments. The context is now
+written once to a local file named after its contents, and only the path of
+that file is passed in `GWAIO_CONTEXT`.
+
+In the application, `read_context` returns a mapping that reads the file
+the first time a value is needed, and falls back to the process environment
+for the variables that aren't in it, so the scripts work with both launchers.
+"""
+
+import json
+from collections.abc import Mapping
+from hashlib import sha1
+from logging import getLogger
+from os import environ, fspath, getpid, replace, scandir, utime
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Lock
+from time import time
+from typing import Any, Iterator, Optional, Union
+
+logger = getLogger(__name__)
+
+# Variable holding the path of the context file
+HANDOFF_VARIABLE = "GWAIO_CONTEXT"
+
+# Context files not used for this long are removed
+MAX_CONTEXT_AGE = 7 * 24 * 3600
+
+# Seconds between removals of the old context files of a folder
+CLEAN_INTERVAL = 3600
+
+# Last removal of the old context files of each folder
+_cleaned_folders: dict[str, float] = dict()
+_cleaned_lock = Lock()
+
+
+def context_folder() -> Path:
+    """
+    Folder of the context files, in GWAIO_DATA_PATH when set.
+
+    Returns:
+        Path: The folder, which may not exist yet.
+    """
+    return Path(environ.get("GWAIO_DATA_PATH") or gettempdir(), "task_context")
+
+
+def remove_old_contexts(
+    folder: Union[str, Path, None] = None, max_age: float = MAX_CONTEXT_AGE
+) -> int:
+    """
+    Remove the context files not used for `max_age` seconds.
+
+    Args:
+        folder (Union[str, Path, None]): Folder of the files, `context_folder()`
+            if None.
+        max_age (float): Age in seconds.
+
+    Returns:
+        int: Number of files removed.
+    """
+    folder = Path(folder) if folder is not None else context_folder()
+    limit = time() - max_age
+    removed = 0
+    try:
+        with scandir(folder) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < limit:
+                        Path(entry.path).unlink()
+                        removed += 1
+                except OSError as e:
+                    logger.debug(f"Cannot remove context {entry.path}: {e}")
+    except OSError:
+        return 0
+    return removed
+
+
+def write_context(
+    context: dict[str, Any], folder: Union[str, Path, None] = None
+) -> Path:
+    """
+    Write a context to a file named after its contents. Launching twice with
+    the same context reuses the file.
+
+    Args:
+        context (dict[str, Any]): Variables, JSON serializable.
+        folder (Union[str, Path, None]): Folder of the files, `context_folder()`
+            if None.
+
+    Returns:
+        Path: The context file.
+
+    Raises:
+        OSError: If the file can't be written.
+    """
+    folder = Path(folder) if folder is not None else context_folder()
+    data = json.dumps(context, sort_keys=True).encode("utf-8")
+    path = Path(folder, sha1(data).hexdigest() + ".json")
+    if path.exists():
+        # keeps it from being removed as unused
+        utime(path)
+        return path
+
+    with _cleaned_lock:
+        now = time()
+        clean = now - _cleaned_folders.get(fspath(folder), 0) > CLEAN_INTERVAL
+        if clean:
+            _cleaned_folders[fspath(folder)] = now
+    if clean:
+        remove_old_contexts(folder)
+
+    folder.mkdir(parents=True, exist_ok=True)
+    tmp = Path(folder, f"{path.name}.{getpid()}.tmp")
+    tmp.write_bytes(data)
+    replace(tmp, path)
+    logger.debug(f"Wrote task context {path}")
+    return path
+
+
+class TaskContext(Mapping):
+    """
+    Read-only view of the context handed over by the launcher, loaded the
+    first time a value is read.
+
+    Attributes:
+        path (Optional[Path]): The context file, None if there isn't one.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None],
+        fallback: Optional[Mapping] = None,
+    ) -> None:
+        """
+        Args:
+            path (Union[str, Path, None]): The context file.
+            fallback (Optional[Mapping]): Variables read when missing from
+                the file, the process environment if None.
+        """
+        self.path = Path(path) if path else None
+        self._fallback = environ if fallback is None else fallback
+        self._data: Optional[dict[str, Any]] = None
+        self._lock = Lock()
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    data = dict()
+                    if self.path is not None:
+                        try:
+                            data = json.loads(self.path.read_text("utf-8"))
+                        except (OSError, ValueError) as e:
+                            logger.warning(f"Cannot read task context: {e}")
+                    self._data = data
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        data = self._load()
+        if key in data:
+            return data[key]
+        return self._fallback[key]
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._load()
+        yield from data
+        for key in self._fallback:
+            if key not in data:
+                yield key
+
+    def __len__(self) -> int:
+        data = self._load()
+        return len(data) + sum(1 for key in self._fallback if key not in data)
+
+    def task_data(self) -> dict[str, Any]:
+        """
+        Serialized task of the context, to build a task with `deserialize`.
+
+        Returns:
+            dict[str, Any]: The task fields, empty if there is no task.
+        """
+        value = self.get("GWAIO_TASK_DATA")
+        if not value:
+            return dict()
+        return json.loads(value) if isinstance(value, str) else value
+
+
+def read_context(env: Optional[Mapping] = None) -> TaskContext:
+    """
+    Context handed over to this process by the launcher.
+
+    Args:
+        env (Optional[Mapping]): Environment to read, the process one if None.
+
+    Returns:
+        TaskContext: The context, falling back to the environment.
+    """
+    env = environ if env is None else env
+    return TaskContext(env.get(HANDOFF_VARIABLE), env)
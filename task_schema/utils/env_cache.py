@@ -0,0 +1,97 @@
+"""
+env_cache.py
+
+Cache of the parts an application environment is built from. Launching an
+app used to rebuild every variable, scanning the task folder and listing
+the tool folders each time. Each part is now kept with a fingerprint of
+what it depends on (plugin settings, folder modification times, the
+revision of the task) and only rebuilt when the fingerprint changes.
+"""
+
+from collections import OrderedDict
+from logging import getLogger
+from os import fspath, stat
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, Union
+
+logger = getLogger(__name__)
+
+
+def folder_mtime(path: Union[str, Path, None]) -> Optional[int]:
+    """
+    Modification time of a folder, to tell when its listing changes.
+
+    Args:
+        path (Union[str, Path, None]): The folder.
+
+    Returns:
+        Optional[int]: The mtime in ns, or None if it doesn't exist.
+    """
+    if not path:
+        return None
+    try:
+        return stat(fspath(path)).st_mtime_ns
+    except OSError:
+        return None
+
+
+class PartCache:
+    """
+    Thread safe LRU cache of environment parts and their fingerprints.
+
+    Attributes:
+        max_size (int): Number of parts kept, task parts being one per task.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self._parts: "OrderedDict[Hashable, tuple[Any, dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def get(
+        self,
+        key: Hashable,
+        fingerprint: Any,
+        build: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        Return the cached part for `key` if built with an equal fingerprint,
+        or build it.
+
+        Args:
+            key (Hashable): Name of the part.
+            fingerprint (Any): Everything the part depends on, compared with ==.
+            build (Callable[[], dict[str, Any]]): Builds the variables.
+
+        Returns:
+            dict[str, Any]: The variables, not to be modified.
+        """
+        with self._lock:
+            cached = self._parts.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self._parts.move_to_end(key)
+                return cached[1]
+        logger.debug(f"Building environment part {key}")
+        part = build()
+        with self._lock:
+            self._parts[key] = fingerprint, part
+            self._parts.move_to_end(key)
+            while len(self._parts) > self.max_size:
+                self._parts.popitem(last=False)
+        return part
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop a cached part, or all of them.
+
+        Args:
+            key (Optional[Hashable]): Name of the part, all if None.
+        """
+        with self._lock:
+            if key is None:
+                self._parts.clear()
+            else:
+                self._parts.pop(key, None)
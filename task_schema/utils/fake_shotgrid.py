@@ -0,0 +1,860 @@
+"""
+fake_shotgrid.py
+
+In-process stand-in for the ShotGrid API, used to test and benchmark the
+ShotGrid plugins offline. `FakeShotgun` implements the subset of
+`shotgun_api3.Shotgun` the plugins use (find, find_one, summarize, create,
+update, delete, batch, uploads and attachments) on top of a `FakeDatabase`
+held in memory, with a configurable latency per request to mimic the round
+trip to the site. `generate_project` fills a database with a synthetic
+production (episodes, sequences, shots, assets, tasks, notes and versions).
+
+mockgun, shipped with shotgun_api3, needs schema pickles generated from a
+live site, so this module carries its own minimal data model instead.
+"""
+
+import random
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from logging import getLogger
+from pathlib import Path
+from threading import RLock
+from time import sleep
+from typing import Any, Iterator, Optional, Union
+
+logger = getLogger(__name__)
+
+# Fields used as the display name of linked entities
+NAME_FIELDS = ("code", "content", "name", "login")
+
+
+class FakeShotgunError(Exception):
+    """Raised for requests the real API would reject."""
+
+
+def _key(value: Any) -> Any:
+    """Comparable key of a value, entities compare by type and id."""
+    if isinstance(value, dict) and "type" in value and "id" in value:
+        return (value["type"], value["id"])
+    return value
+
+
+def _compare(actual: Any, relation: str, expected: Any) -> bool:
+    """
+    Evaluate a single filter relation.
+
+    Args:
+        actual (Any): Value of the field in the record.
+        relation (str): ShotGrid filter operator (e.g. "is", "in").
+        expected (Any): Value given in the filter.
+
+    Returns:
+        bool: Whether the record value satisfies the relation.
+    """
+    if relation in ("in", "not_in"):
+        expected = expected if isinstance(expected, (list, tuple)) else [expected]
+        keys = {_key(e) for e in expected}
+        if isinstance(actual, list):
+            found = any(_key(a) in keys for a in actual)
+        else:
+            found = _key(actual) in keys
+        return found if relation == "in" else not found
+
+    if isinstance(actual, list):
+        # multi-entity fields match when any of their entities does
+        if relation == "is":
+            return _key(expected) in {_key(a) for a in actual}
+        if relation == "is_not":
+            return _key(expected) not in {_key(a) for a in actual}
+        return any(_compare(a, relation, expected) for a in actual)
+
+    if relation == "is":
+        return _key(actual) == _key(expected)
+    if relation == "is_not":
+        return _key(actual) != _key(expected)
+    if actual is None:
+        return relation == "not_contains"
+    if isinstance(actual, dict):
+        actual = next((actual[f] for f in NAME_FIELDS if f in actual), "")
+    if relation == "contains":
+        return str(expected).lower() in str(actual).lower()
+    if relation == "not_contains":
+        return str(expected).lower() not in str(actual).lower()
+    if relation == "starts_with":
+        return str(actual).lower().startswith(str(expected).lower())
+    if relation == "ends_with":
+        return str(actual).lower().endswith(str(expected).lower())
+    if relation == "greater_than":
+        return actual > expected
+    if relation == "less_than":
+        return actual < expected
+    if relation == "between":
+        return expected[0] <= actual <= expected[1]
+    raise FakeShotgunError(f"Unsupported filter relation '{relation}'")
+
+
+class FakeDatabase:
+    """
+    Entities of the fake site, shared by all its `FakeShotgun` sessions.
+
+    Attributes:
+        entities (dict[str, dict[int, dict]]): Records by entity type and id.
+        requests (Counter): Number of requests served, by API method.
+        base_url (str): URL used to build attachment and thumbnail links.
+    """
+
+    def __init__(self, base_url: str = "https://fake.shotgunstudio.com") -> None:
+        self.entities: dict[str, dict[int, dict]] = defaultdict(dict)
+        self.requests: Counter = Counter()
+        self.base_url = base_url
+        self._last_ids: Counter = Counter()
+        self._queries: dict[tuple, list[int]] = dict()
+        self._lock = RLock()
+
+    def add(self, entity_type: str, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Store a new record, assigning it the next id unless `data` has one.
+
+        Args:
+            entity_type (str): Entity type of the record.
+            data (dict[str, Any]): Field values.
+
+        Returns:
+            dict[str, Any]: The stored record.
+        """
+        with self._lock:
+            entity_id = data.get("id") or self._last_ids[entity_type] + 1
+            self._last_ids[entity_type] = max(self._last_ids[entity_type], entity_id)
+            now = datetime.now()
+            record = {
+                "created_at": now,
+                "updated_at": now,
+                **data,
+                "type": entity_type,
+                "id": entity_id,
+            }
+            self.entities[entity_type][entity_id] = record
+            self._queries.clear()
+        return record
+
+    def get(self, entity_type: str, entity_id: int) -> dict[str, Any]:
+        """
+        Return a stored record.
+
+        Raises:
+            FakeShotgunError: If the record doesn't exist.
+        """
+        try:
+            return self.entities[entity_type][entity_id]
+        except KeyError:
+            raise FakeShotgunError(f"{entity_type} {entity_id} does not exist")
+
+    def set(self, entity_type: str, entity_id: int, data: dict[str, Any]) -> dict:
+        """Update the fields of a stored record and return it."""
+        with self._lock:
+            record = self.get(entity_type, entity_id)
+            record.update(data, updated_at=datetime.now())
+            self._queries.clear()
+        return record
+
+    def remove(self, entity_type: str, entity_id: int) -> bool:
+        """Delete a stored record, returning whether it existed."""
+        with self._lock:
+            self._queries.clear()
+            return self.entities[entity_type].pop(entity_id, None) is not None
+
+    def resolve(self, record: dict[str, Any], field: str) -> Any:
+        """
+        Value of a field, following linked fields such as
+        "entity.Shot.sg_sequence.Sequence.code".
+
+        Args:
+            record (dict[str, Any]): Record to read.
+            field (str): Field name, dotted for linked fields.
+
+        Returns:
+            Any: The value, or None when a link is missing or of another type.
+        """
+        parts = field.split(".")
+        value = record.get(parts[0])
+        for index in range(1, len(parts) - 1, 2):
+            if not isinstance(value, dict) or value.get("type") != parts[index]:
+                return None
+            linked = self.entities[parts[index]].get(value["id"])
+            if linked is None:
+                return None
+            value = linked.get(parts[index + 1])
+        return value
+
+    def link(self, value: Any) -> Any:
+        """Format entity values as the API returns them, with their name."""
+        if isinstance(value, list):
+            return [self.link(v) for v in value]
+        if isinstance(value, dict) and "type" in value and "id" in value:
+            linked = self.entities[value["type"]].get(value["id"], {})
+            name = next((linked[f] for f in NAME_FIELDS if f in linked), None)
+            return {"type": value["type"], "id": value["id"], "name": name}
+        return value
+
+    def matches(
+        self, record: dict[str, Any], filters: list, operator: str = "all"
+    ) -> bool:
+        """
+        Whether a record satisfies a filter list.
+
+        Args:
+            record (dict[str, Any]): Record to test.
+            filters (list): Filter conditions and nested filter groups.
+            operator (str): "all" or "any".
+
+        Returns:
+            bool: Whether the record matches.
+        """
+        results = (self._matches_condition(record, f) for f in filters)
+        return any(results) if operator in ("any", "or") else all(results)
+
+    def _matches_condition(self, record: dict[str, Any], condition: Any) -> bool:
+        if isinstance(condition, dict):
+            return self.matches(
+                record,
+                condition["filters"],
+                condition.get("filter_operator", "all"),
+            )
+        field, relation, *values = condition
+        expected = values[0] if len(values) == 1 else values
+        return _compare(self.resolve(record, field), relation, expected)
+
+    def query(
+        self,
+        entity_type: str,
+        filters: Union[list, dict],
+        order: Optional[list[dict[str, str]]] = None,
+        filter_operator: Optional[str] = None,
+    ) -> list[int]:
+        """
+        Ids of the records matching the filters, in the requested order.
+        Results are kept until the next write, so paged requests for the
+        same query only scan the records once.
+
+        Args:
+            entity_type (str): Entity type to search.
+            filters (Union[list, dict]): Filter list or filter group.
+            order (Optional[list[dict[str, str]]]): Sort fields.
+            filter_operator (Optional[str]): "all" or "any".
+
+        Returns:
+            list[int]: Matching record ids.
+        """
+        if isinstance(filters, dict):
+            filter_operator = filters.get("filter_operator", filter_operator)
+            filters = filters["filters"]
+        cache_key = (entity_type, repr(filters), filter_operator, repr(order))
+        with self._lock:
+            if (ids := self._queries.get(cache_key)) is not None:
+                return ids
+            records = [
+                r
+                for r in self.entities[entity_type].values()
+                if self.matches(r, filters, filter_operator or "all")
+            ]
+            for sort in reversed(order or []):
+                field = sort.get("field_name") or sort.get("column")
+                records.sort(
+                    key=lambda r: (
+                        (value := _key(self.resolve(r, field))) is not None,
+                        value,
+                    ),
+                    reverse=sort.get("direction", "asc") == "desc",
+                )
+            ids = [r["id"] for r in records]
+            self._queries[cache_key] = ids
+        return ids
+
+
+class FakeShotgun:
+    """
+    Session on a `FakeDatabase`, with the interface of `shotgun_api3.Shotgun`
+    used by the plugins.
+
+    Attributes:
+        database (FakeDatabase): Data of the fake site.
+        latency (float): Seconds each request waits, to mimic a round trip.
+        closed (bool): Whether `close` has been called.
+    """
+
+    def __init__(self, database: FakeDatabase, latency: float = 0.0) -> None:
+        self.database = database
+        self.latency = latency
+        self.closed = False
+        self.base_url = database.base_url
+
+    def _request(self, method: str) -> None:
+        self.database.requests[method] += 1
+        if self.latency:
+            sleep(self.latency)
+
+    def _format(self, record: dict[str, Any], fields: Optional[list[str]]) -> dict:
+        result = {"type": record["type"], "id": record["id"]}
+        for field in fields or []:
+            result[field] = self.database.link(self.database.resolve(record, field))
+        return result
+
+    def find(
+        self,
+        entity_type: str,
+        filters: Union[list, dict],
+        fields: Optional[list[str]] = None,
+        order: Optional[list[dict[str, str]]] = None,
+        filter_operator: Optional[str] = None,
+        limit: int = 0,
+        retired_only: bool = False,
+        page: int = 0,
+        *args,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """
+        Find the records matching the filters.
+
+        Args:
+            entity_type (str): Entity type to search.
+            filters (Union[list, dict]): Filter list or filter group.
+            fields (Optional[list[str]]): Fields to return.
+            order (Optional[list[dict[str, str]]]): Sort fields.
+            filter_operator (Optional[str]): "all" or "any".
+            limit (int): Maximum records to return, 0 for all.
+            retired_only (bool): Not supported, retired records are deleted.
+            page (int): Page of `limit` records to return, starting at 1.
+
+        Returns:
+            list[dict[str, Any]]: The records with the requested fields.
+        """
+        self._request("find")
+        return self._find(
+            entity_type, filters, fields, order, filter_operator, limit, page
+        )
+
+    def _find(
+        self,
+        entity_type: str,
+        filters: Union[list, dict],
+        fields: Optional[list[str]] = None,
+        order: Optional[list[dict[str, str]]] = None,
+        filter_operator: Optional[str] = None,
+        limit: int = 0,
+        page: int = 0,
+    ) -> list[dict[str, Any]]:
+        ids = self.database.query(entity_type, filters, order, filter_operator)
+        if limit:
+            start = (max(page, 1) - 1) * limit
+            ids = ids[start : start + limit]
+        records = self.database.entities[entity_type]
+        return [self._format(records[i], fields) for i in ids if i in records]
+
+    def find_one(
+        self,
+        entity_type: str,
+        filters: Union[list, dict],
+        fields: Optional[list[str]] = None,
+        order: Optional[list[dict[str, str]]] = None,
+        filter_operator: Optional[str] = None,
+        *args,
+        **kwargs,
+    ) -> Optional[dict[str, Any]]:
+        """Find the first record matching the filters, or None."""
+        self._request("find_one")
+        result = self._find(entity_type, filters, fields, order, filter_operator, 1)
+        return result[0] if result else None
+
+    def summarize(
+        self,
+        entity_type: str,
+        filters: Union[list, dict],
+        summary_fields: list[dict[str, str]],
+        filter_operator: Optional[str] = None,
+        grouping: Optional[list] = None,
+        *args,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Summarize the records matching the filters. Only ungrouped "count",
+        "record_count", "sum", "min" and "max" summaries are supported.
+
+        Returns:
+            dict[str, Any]: {"summaries": {field: value}, "groups": []}
+        """
+        self._request("summarize")
+        if grouping:
+            raise FakeShotgunError("Grouped summaries are not supported")
+        ids = self.database.query(entity_type, filters, None, filter_operator)
+        records = [self.database.entities[entity_type][i] for i in ids]
+        summaries = dict()
+        for summary in summary_fields:
+            field, kind = summary["field"], summary["type"]
+            values = [self.database.resolve(r, field) for r in records]
+            if kind == "record_count":
+                summaries[field] = len(values)
+            elif kind == "count":
+                summaries[field] = len([v for v in values if v is not None])
+            elif kind in ("sum", "min", "max"):
+                values = [v for v in values if v is not None]
+                function = {"sum": sum, "min": min, "max": max}[kind]
+                summaries[field] = function(values) if values else None
+            else:
+                raise FakeShotgunError(f"Unsupported summary type '{kind}'")
+        return {"summaries": summaries, "groups": []}
+
+    def _create(
+        self,
+        entity_type: str,
+        data: dict[str, Any],
+        return_fields: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        record = self.database.add(entity_type, dict(data))
+        return {
+            **self._format(record, list(data) + list(return_fields or [])),
+            "type": entity_type,
+            "id": record["id"],
+        }
+
+    def create(
+        self,
+        entity_type: str,
+        data: dict[str, Any],
+        return_fields: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """Create a record and return its data and `return_fields`."""
+        self._request("create")
+        return self._create(entity_type, data, return_fields)
+
+    def _update(
+        self, entity_type: str, entity_id: int, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        record = self.database.set(entity_type, entity_id, data)
+        return self._format(record, list(data))
+
+    def update(
+        self, entity_type: str, entity_id: int, data: dict[str, Any], *args, **kwargs
+    ) -> dict[str, Any]:
+        """Update a record and return the updated fields."""
+        self._request("update")
+        return self._update(entity_type, entity_id, data)
+
+    def delete(self, entity_type: str, entity_id: int) -> bool:
+        """Delete a record, returning whether it existed."""
+        self._request("delete")
+        return self.database.remove(entity_type, entity_id)
+
+    def batch(self, requests: list[dict[str, Any]]) -> list[Any]:
+        """
+        Run create, update and delete requests in a single call.
+
+        Args:
+            requests (list[dict[str, Any]]): Requests as accepted by
+                `shotgun_api3.Shotgun.batch`.
+
+        Returns:
+            list[Any]: The result of each request.
+        """
+        self._request("batch")
+        results = list()
+        for request in requests:
+            kind = request["request_type"]
+            if kind == "create":
+                results.append(
+                    self._create(
+                        request["entity_type"],
+                        request["data"],
+                        request.get("return_fields"),
+                    )
+                )
+            elif kind == "update":
+                results.append(
+                    self._update(
+                        request["entity_type"], request["entity_id"], request["data"]
+                    )
+                )
+            elif kind == "delete":
+                results.append(
+                    self.database.remove(request["entity_type"], request["entity_id"])
+                )
+            else:
+                raise FakeShotgunError(f"Unsupported batch request '{kind}'")
+        return results
+
+    def get_attachment_download_url(self, attachment: Union[int, dict]) -> str:
+        """URL of an attachment, given as an id or an attachment dict."""
+        self._request("get_attachment_download_url")
+        if isinstance(attachment, dict):
+            return attachment.get("url") or (
+                f"{self.base_url}/file_serve/attachment/{attachment['id']}"
+            )
+        return f"{self.base_url}/file_serve/attachment/{attachment}"
+
+    def download_attachment(
+        self,
+        attachment: Union[int, dict, bool] = False,
+        file_path: Optional[str] = None,
+        attachment_id: Optional[int] = None,
+    ) -> Union[bytes, str]:
+        """
+        Download an attachment's content, writing it to `file_path` if given.
+
+        Returns:
+            Union[bytes, str]: The content, or the file path it was written to.
+        """
+        self._request("download_attachment")
+        if attachment_id is None:
+            attachment_id = (
+                attachment.get("id") if isinstance(attachment, dict) else attachment
+            )
+        record = self.database.entities["Attachment"].get(attachment_id, {})
+        content = record.get("content", f"attachment {attachment_id}".encode())
+        if file_path is None:
+            return content
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        Path(file_path).write_bytes(content)
+        return file_path
+
+    def upload(
+        self,
+        entity_type: str,
+        entity_id: int,
+        path: str,
+        field_name: Optional[str] = None,
+        display_name: Optional[str] = None,
+        tag_list: Optional[str] = None,
+    ) -> int:
+        """
+        Store a file as an attachment of a record, in `field_name` if given.
+
+        Returns:
+            int: Id of the created attachment.
+        """
+        self._request("upload")
+        self.database.get(entity_type, entity_id)
+        name = display_name or Path(path).name
+        attachment = self.database.add(
+            "Attachment",
+            {
+                "name": name,
+                "content": Path(path).read_bytes(),
+                "attachment_links": [{"type": entity_type, "id": entity_id}],
+            },
+        )
+        url = f"{self.base_url}/file_serve/attachment/{attachment['id']}"
+        self.database.set("Attachment", attachment["id"], {"image": url})
+        if field_name is not None:
+            self.database.set(
+                entity_type,
+                entity_id,
+                {
+                    field_name: {
+                        "type": "Attachment",
+                        "id": attachment["id"],
+                        "name": name,
+                        "url": url,
+                        "link_type": "upload",
+                    }
+                },
+            )
+        return attachment["id"]
+
+    def upload_thumbnail(self, entity_type: str, entity_id: int, path: str) -> int:
+        """Upload a file as the thumbnail ("image") of a record."""
+        attachment_id = self.upload(entity_type, entity_id, path)
+        self.database.set(
+            entity_type,
+            entity_id,
+            {"image": f"{self.base_url}/thumbnail/attachment/{attachment_id}"},
+        )
+        return attachment_id
+
+    def close(self) -> None:
+        """Close the session."""
+        self.database.requests["close"] += 1
+        self.closed = True
+
+
+@contextmanager
+def use_fake_shotgun(
+    plugin_class: type, database: FakeDatabase, latency: float = 0.0
+) -> Iterator[FakeDatabase]:
+    """
+    Make a ShotGrid plugin class, and its subclasses, open `FakeShotgun`
+    sessions on `database` instead of connecting to the site.
+
+    Args:
+        plugin_class (type): Plugin class defining `_instantiate_shogrid`.
+        database (FakeDatabase): Data of the fake site.
+        latency (float): Seconds each request waits.
+
+    Yields:
+        FakeDatabase: The database, to inspect its requests.
+    """
+    previous = plugin_class.__dict__.get("_instantiate_shogrid")
+    plugin_class._instantiate_shogrid = classmethod(
+        lambda cls, connect=True: FakeShotgun(database, latency)
+    )
+    try:
+        yield database
+    finally:
+        if previous is None:
+            del plugin_class._instantiate_shogrid
+        else:
+            plugin_class._instantiate_shogrid = previous
+
+
+def generate_project(
+    tasks: int = 50000,
+    project_id: int = 122,
+    episodes: int = 10,
+    sequences_per_episode: int = 10,
+    asset_ratio: float = 0.3,
+    notes_per_task: float = 0.2,
+    versions_per_task: int = 2,
+    seed: int = 0,
+    database: Optional[FakeDatabase] = None,
+) -> FakeDatabase:
+    """
+    Build a synthetic production in a fake database.
+
+    Assets and shots get one task per step of their entity type, so the
+    number of entities follows from `tasks`. Episodes are named "EP101",
+    sequences "EP101_010" and shots "EP101_010_0010".
+
+    Args:
+        tasks (int): Approximate number of production tasks.
+        project_id (int): Id of the project, the plugins' SG_PROJECT_ID.
+        episodes (int): Number of episodes.
+        sequences_per_episode (int): Number of sequences in each episode.
+        asset_ratio (float): Share of the tasks that belong to assets.
+        notes_per_task (float): Average number of open notes per task.
+        versions_per_task (int): Number of versions of each task.
+        seed (int): Seed of the random generator, for repeatable projects.
+        database (Optional[FakeDatabase]): Database to fill, a new one by default.
+
+    Returns:
+        FakeDatabase: The filled database.
+    """
+    rand = random.Random(seed)
+    db = database or FakeDatabase()
+    project = {"type": "Project", "id": project_id}
+    db.add("Project", {"id": project_id, "name": f"Project {project_id}"})
+
+    statuses = {
+        "wtg": "200,200,200",
+        "rdy": "255,255,0",
+        "ip": "0,128,255",
+        "rev": "255,128,0",
+        "apr": "0,200,0",
+        "fin": "0,128,0",
+        "na": None,
+    }
+    for code, color in statuses.items():
+        db.add("Status", {"code": code, "bg_color": color})
+    task_statuses = ["rdy", "ip", "rev", "apr", "fin"]
+
+    users = [
+        db.add("HumanUser", {"name": f"Artist {i:02d}", "login": f"artist{i:02d}"})
+        for i in range(1, 51)
+    ]
+    steps = {
+        entity_type: [
+            db.add(
+                "Step",
+                {"code": code, "short_name": code[:3], "entity_type": entity_type},
+            )
+            for code in codes
+        ]
+        for entity_type, codes in (
+            ("Asset", ["concept", "model", "rig", "surfacing"]),
+            ("Shot", ["layout", "animation", "lighting", "comp"]),
+        )
+    }
+
+    asset_types = ["ch", "pr", "bg", "fx"]
+    templates = dict()
+    for asset_type in asset_types:
+        templates[asset_type] = db.add(
+            "TaskTemplate",
+            {
+                "code": f"Asset - {asset_type}",
+                "sg_asset_type": asset_type,
+                "projects": [project],
+            },
+        )
+        for step in steps["Asset"]:
+            db.add(
+                "Task",
+                {
+                    "content": step["code"],
+                    "sg_short_name": step["short_name"],
+                    "task_template": {
+                        "type": "TaskTemplate",
+                        "id": templates[asset_type]["id"],
+                    },
+                    "step": {"type": "Step", "id": step["id"]},
+                },
+            )
+
+    episode_links = [
+        {
+            "type": "Episode",
+            "id": db.add("Episode", {"code": f"EP{101 + e}", "project": project})["id"],
+        }
+        for e in range(episodes)
+    ]
+    base_date = datetime(2024, 1, 1)
+
+    def add_tasks(entity: dict[str, Any], entity_type: str) -> None:
+        for step in steps[entity_type]:
+            task = db.add(
+                "Task",
+                {
+                    "content": step["code"],
+                    "entity": {"type": entity_type, "id": entity["id"]},
+                    "step": {"type": "Step", "id": step["id"]},
+                    "project": project,
+                    "sg_status_list": rand.choice(task_statuses),
+                    "task_assignees": [
+                        {"type": "HumanUser", "id": rand.choice(users)["id"]}
+                    ],
+                    "image": None,
+                    "open_notes": [],
+                },
+            )
+            task_link = {"type": "Task", "id": task["id"]}
+            for number in range(1, versions_per_task + 1):
+                db.add(
+                    "Version",
+                    {
+                        "code": (
+                            f"{entity['code']}_{step['short_name']}_v{number:03d}.mov"
+                        ),
+                        "entity": {"type": entity_type, "id": entity["id"]},
+                        "sg_task": task_link,
+                        "project": project,
+                        "sg_status_list": rand.choice(task_statuses),
+                        "sg_path_to_jpg_file": None,
+                        "sg_uploaded_movie": {
+                            "name": f"{entity['code']}_{step['short_name']}.mov",
+                            "url": f"{db.base_url}/file_serve/{task['id']}/{number}",
+                            "link_type": "upload",
+                        },
+                        "created_at": base_date + timedelta(days=number),
+                    },
+                )
+            notes = int(notes_per_task) + (rand.random() < notes_per_task % 1)
+            for _ in range(notes):
+                task["open_notes"].append(add_note(task_link))
+
+    def add_note(task_link: dict[str, Any]) -> dict[str, Any]:
+        attachments = [
+            {
+                "type": "Attachment",
+                "id": db.add("Attachment", {"name": "annotation.png"})["id"],
+            }
+            for _ in range(rand.randint(0, 2))
+        ]
+        for attachment in attachments:
+            db.set(
+                "Attachment",
+                attachment["id"],
+                {"image": f"{db.base_url}/thumbnail/attachment/{attachment['id']}"},
+            )
+        note = db.add(
+            "Note",
+            {
+                "content": "Please review the silhouette.",
+                "user": {"type": "HumanUser", "id": rand.choice(users)["id"]},
+                "tasks": [task_link],
+                "project": project,
+                "attachments": attachments,
+                "replies": [],
+                "created_at": base_date + timedelta(hours=rand.randint(0, 5000)),
+            },
+        )
+        for _ in range(rand.randint(0, 2)):
+            reply = db.add(
+                "Reply",
+                {
+                    "content": "Fixed.",
+                    "user": {"type": "HumanUser", "id": rand.choice(users)["id"]},
+                    "entity": {"type": "Note", "id": note["id"]},
+                    "attachments": [],
+                    "replies": [],
+                    "sg_sk_note_id": None,
+                    "created_at": note["created_at"] + timedelta(hours=1),
+                },
+            )
+            note["replies"].append({"type": "Reply", "id": reply["id"]})
+        return {"type": "Note", "id": note["id"]}
+
+    asset_count = max(1, int(tasks * asset_ratio) // len(steps["Asset"]))
+    for index in range(asset_count):
+        asset_type = asset_types[index % len(asset_types)]
+        episode = episode_links[index % len(episode_links)]
+        asset = db.add(
+            "Asset",
+            {
+                "code": f"{asset_type}_asset{index:05d}",
+                "sg_asset_type": asset_type,
+                "sg_2d_asset_type": None,
+                "task_template": {
+                    "type": "TaskTemplate",
+                    "id": templates[asset_type]["id"],
+                },
+                "sg_created_for_episode": episode,
+                "episodes": [episode],
+                "tags": [],
+                "project": project,
+            },
+        )
+        add_tasks(asset, "Asset")
+
+    shot_tasks = tasks - asset_count * len(steps["Asset"])
+    shot_count = max(1, shot_tasks // len(steps["Shot"]))
+    sequence_count = episodes * sequences_per_episode
+    for sequence_index in range(sequence_count):
+        episode = episode_links[sequence_index // sequences_per_episode]
+        episode_code = db.get("Episode", episode["id"])["code"]
+        sequence_number = (sequence_index % sequences_per_episode + 1) * 10
+        sequence = db.add(
+            "Sequence",
+            {
+                "code": f"{episode_code}_{sequence_number:03d}",
+                "episode": episode,
+                "project": project,
+                "shots": [],
+                "assets": [],
+            },
+        )
+        shots_in_sequence = shot_count // sequence_count + (
+            sequence_index < shot_count % sequence_count
+        )
+        cut_in = 1001
+        for shot_index in range(shots_in_sequence):
+            duration = rand.randint(24, 240)
+            shot = db.add(
+                "Shot",
+                {
+                    "code": f"{sequence['code']}_{(shot_index + 1) * 10:04d}",
+                    "sg_sequence": {"type": "Sequence", "id": sequence["id"]},
+                    "sg_status_list": rand.choice(task_statuses),
+                    "sg_cut_in": cut_in,
+                    "sg_cut_out": cut_in + duration - 1,
+                    "sg_cut_duration": duration,
+                    "assets": [],
+                    "tags": [],
+                    "episodes": [],
+                    "project": project,
+                },
+            )
+            cut_in += duration
+            sequence["shots"].append({"type": "Shot", "id": shot["id"]})
+            add_tasks(shot, "Shot")
+
+    counts = {entity_type: len(records) for entity_type, records in db.entities.items()}
+    logger.debug(f"Generated project {project_id}: {counts}")
+    return db
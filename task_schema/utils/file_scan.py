@@ -0,0 +1,137 @@
+"""
+file_scan.py
+
+Helpers to list the versions of a task folder quickly. Folders are walked
+once with `os.scandir`, which returns the entry types without an extra
+`stat` per file, and skipping the folders that never hold versions. The
+plugin naming conventions are compiled into a single pattern, so each file
+name is matched once instead of once per convention.
+"""
+
+import re
+from functools import lru_cache
+from logging import DEBUG, getLogger
+from os import fspath, scandir, stat
+from os.path import splitext
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+logger = getLogger(__name__)
+
+# Folders created by the DCCs and tools that never hold versions
+DEFAULT_PRUNE_DIRS = frozenset({"__pycache__", "incrementalSave"})
+
+# Conventions using back references or global flags can't be joined with
+# others, as group numbers shift and flags would apply to every pattern
+_UNJOINABLE = re.compile(r"\\[1-9]|\(\?P=|^\(\?[aiLmsux]+\)")
+
+
+@lru_cache(maxsize=64)
+def compile_naming_regex(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build a function telling if a file name follows any of the conventions,
+    with the same result as `any(re.match(p, name) for p in patterns)`.
+
+    Args:
+        patterns (tuple[str, ...]): Naming convention regexes.
+
+    Returns:
+        Callable[[str], bool]: Function matching a file name.
+    """
+    if not patterns:
+        return lambda name: False
+    if any(_UNJOINABLE.search(p) for p in patterns):
+        compiled = [re.compile(p) for p in patterns]
+        return lambda name: any(c.match(name) for c in compiled)
+    combined = re.compile("|".join(f"(?:{p})" for p in patterns))
+    return lambda name: combined.match(name) is not None
+
+
+def normalize_extensions(ext: Union[str, Iterable[str]]) -> Optional[frozenset[str]]:
+    """
+    Turn the extensions given to the file filters into a set of suffixes.
+
+    Args:
+        ext (Union[str, Iterable[str]]): Extensions, with or without the dot.
+            An empty extension accepts every file.
+
+    Returns:
+        Optional[frozenset[str]]: Suffixes such as ".ma", or None for any.
+    """
+    ext = [ext] if isinstance(ext, str) else list(ext)
+    if not ext or any(e in ("", ".") for e in ext):
+        return None
+    return frozenset("." + e.lstrip(".") for e in ext)
+
+
+def scan_files(
+    root: Union[str, Path],
+    extensions: Optional[frozenset[str]] = None,
+    prune_dirs: Iterable[str] = DEFAULT_PRUNE_DIRS,
+    visited: Optional[dict[str, int]] = None,
+    max_depth: Optional[int] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> Iterator[Path]:
+    """
+    Recursively yield the files with an extension under a folder.
+
+    Hidden folders and folders named in `prune_dirs` are skipped, and
+    symlinked folders are not followed. Subfolders that can't be read are
+    logged and skipped.
+
+    Args:
+        root (Union[str, Path]): Folder to scan.
+        extensions (Optional[frozenset[str]]): Suffixes to keep, all if None.
+        prune_dirs (Iterable[str]): Folder names not to descend into.
+        visited (Optional[dict[str, int]]): If given, filled with the
+            modification time (ns) of every folder scanned, taken before
+            listing it, to tell later if the result is outdated.
+        max_depth (Optional[int]): Levels of subfolders to descend, 0 to list
+            only `root`. Unlimited if None.
+        should_stop (Optional[Callable[[], bool]]): Checked before listing
+            each folder, the walk ends when it returns True.
+
+    Yields:
+        Path: Files found.
+
+    Raises:
+        OSError: If `root` can't be read.
+    """
+    prune_dirs = frozenset(prune_dirs)
+    debug = logger.isEnabledFor(DEBUG)
+    pending = [(fspath(root), 0)]
+    is_root = True
+    while pending:
+        if should_stop is not None and should_stop():
+            return
+        folder, depth = pending.pop()
+        try:
+            if visited is not None:
+                visited[folder] = stat(folder).st_mtime_ns
+            entries = list(scandir(folder))
+        except OSError as e:
+            if is_root:
+                raise
+            logger.warning("Skipping unreadable folder %s: %s", folder, e)
+            continue
+        is_root = False
+        subfolders = list()
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                if name.startswith(".") or name in prune_dirs:
+                    if debug:
+                        logger.debug("Pruned: %s", entry.path)
+                    continue
+                subfolders.append((entry.path, depth + 1))
+            elif entry.is_file():
+                suffix = splitext(name)[1]
+                if not suffix:
+                    continue
+                if extensions is not None and suffix not in extensions:
+                    continue
+                yield Path(entry.path)
+        # walk in the same order as a recursive scandir would
+        pending.extend(reversed(subfolders))
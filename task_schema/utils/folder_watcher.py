@@ -0,0 +1,327 @@
+"""
+folder_watcher.py
+
+Watches a folder tree (usually the plugin's local root) and reports the
+files added, removed and modified, so views and version indexes update
+when something changes instead of rescanning on every click.
+
+Native file system events come from the `watchdog` package. Polling the
+folders' modification times is only a fallback, for network shares, where
+native events are unreliable or missing, and for installs without
+`watchdog`: it lists the whole tree once, in its own thread, and then reads
+the modification time of every folder at each poll. Events are debounced,
+so a burst of changes (a save writing a temp file and renaming it, a sync
+copying a folder) is delivered as a single batch.
+"""
+
+from logging import getLogger
+from os import fspath, scandir, stat
+from pathlib import Path
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Callable, Iterable, NamedTuple, Optional, Union
+
+from task_schema.utils.file_scan import DEFAULT_PRUNE_DIRS
+
+logger = getLogger(__name__)
+
+
+class FileEvent(NamedTuple):
+    """A change of a file, kind being "added", "removed" or "modified"."""
+
+    kind: str
+    path: Path
+
+
+def is_network_path(path: Union[str, Path]) -> bool:
+    """Whether a path is on a UNC network share."""
+    return fspath(path).replace("\\", "/").startswith("//")
+
+
+class _PollingBackend:
+    """
+    Detects changes by comparing folder modification times every
+    `interval` seconds, listing again only the folders that changed. Files
+    edited in place don't change their folder, so they aren't reported.
+    The first listing of the tree is made in the polling thread, so starting
+    doesn't block the caller, and changes are reported once it is `ready`.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        emit: Callable[[str, Path], None],
+        interval: float,
+        prune_dirs: frozenset[str],
+    ) -> None:
+        self.root = root
+        self.emit = emit
+        self.interval = interval
+        self.prune_dirs = prune_dirs
+        self._folders: dict[str, tuple[int, set[str], set[str]]] = dict()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self.ready = Event()
+
+    def _list(self, folder: str) -> tuple[int, set[str], set[str]]:
+        mtime = stat(folder).st_mtime_ns
+        files, subfolders = set(), set()
+        for entry in scandir(folder):
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not name.startswith(".") and name not in self.prune_dirs:
+                    subfolders.add(entry.path)
+            elif entry.is_file():
+                files.add(name)
+        return mtime, files, subfolders
+
+    def _add_tree(self, folder: str, emit: bool) -> None:
+        try:
+            listing = self._list(folder)
+        except OSError:
+            return
+        self._folders[folder] = listing
+        if emit:
+            for name in listing[1]:
+                self.emit("added", Path(folder, name))
+        for subfolder in listing[2]:
+            self._add_tree(subfolder, emit)
+
+    def _remove_tree(self, folder: str) -> None:
+        listing = self._folders.pop(folder, None)
+        if listing is None:
+            return
+        for name in listing[1]:
+            self.emit("removed", Path(folder, name))
+        for subfolder in listing[2]:
+            self._remove_tree(subfolder)
+
+    def poll(self) -> None:
+        """Compare the folders with the last poll and emit the changes."""
+        for folder, (mtime, files, subfolders) in list(self._folders.items()):
+            if folder not in self._folders:
+                continue  # removed while handling its parent
+            try:
+                if stat(folder).st_mtime_ns == mtime:
+                    continue
+                listing = self._list(folder)
+            except OSError:
+                self._remove_tree(folder)
+                continue
+            self._folders[folder] = listing
+            _, new_files, new_subfolders = listing
+            for name in new_files - files:
+                self.emit("added", Path(folder, name))
+            for name in files - new_files:
+                self.emit("removed", Path(folder, name))
+            for subfolder in subfolders - new_subfolders:
+                self._remove_tree(subfolder)
+            for subfolder in new_subfolders - subfolders:
+                self._add_tree(subfolder, emit=True)
+
+    def _run(self) -> None:
+        self._add_tree(fspath(self.root), emit=False)
+        self.ready.set()
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"Polling {self.root} failed: {e}")
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._run, name="FolderWatcherPoll", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class _NativeBackend:
+    """Receives the changes from the operating system through watchdog."""
+
+    def __init__(
+        self, root: Path, emit: Callable[[str, Path], None], prune_dirs: frozenset[str]
+    ) -> None:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        def ignored(path: str) -> bool:
+            try:
+                parts = Path(path).relative_to(root).parts[:-1]
+            except ValueError:
+                return True
+            return any(p.startswith(".") or p in prune_dirs for p in parts)
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event) -> None:
+                if event.is_directory:
+                    return
+                if event.event_type == "moved":
+                    if not ignored(event.src_path):
+                        emit("removed", Path(event.src_path))
+                    if not ignored(event.dest_path):
+                        emit("added", Path(event.dest_path))
+                    return
+                kind = {
+                    "created": "added",
+                    "deleted": "removed",
+                    "modified": "modified",
+                }.get(event.event_type)
+                if kind is not None and not ignored(event.src_path):
+                    emit(kind, Path(event.src_path))
+
+        self._observer = Observer()
+        self._observer.schedule(Handler(), fspath(root), recursive=True)
+        self.ready = Event()
+        self.ready.set()
+
+    def start(self) -> None:
+        self._observer.start()
+
+    def stop(self) -> None:
+        self._observer.stop()
+        self._observer.join()
+
+
+class FolderWatcher:
+    """
+    Watches a folder tree and reports debounced batches of file changes.
+
+    Attributes:
+        root (Path): Folder watched, recursively.
+        on_change (Callable[[list[FileEvent]], None]): Receives each batch,
+            called from the watcher's thread.
+        debounce (float): Seconds without changes before a batch is sent.
+        poll_interval (float): Seconds between polls when polling.
+        native (Optional[bool]): Whether to use native events. By default
+            they are used when watchdog is installed and `root` isn't on a
+            network share.
+        prune_dirs (frozenset[str]): Folder names not watched, besides
+            hidden folders.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        on_change: Callable[[list[FileEvent]], None],
+        debounce: float = 0.5,
+        poll_interval: float = 5.0,
+        native: Optional[bool] = None,
+        prune_dirs: Iterable[str] = DEFAULT_PRUNE_DIRS,
+    ) -> None:
+        self.root = Path(root)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.native = native
+        self.prune_dirs = frozenset(prune_dirs)
+        self._pending: dict[Path, str] = dict()
+        self._lock = Lock()
+        self._deadline = 0.0
+        self._flusher: Optional[Thread] = None
+        self._backend = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the watcher has been started and not stopped."""
+        return self._backend is not None
+
+    @property
+    def backend(self) -> Optional[str]:
+        """"native" or "polling" while running, None otherwise."""
+        if self._backend is None:
+            return None
+        return "native" if isinstance(self._backend, _NativeBackend) else "polling"
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until changes are reported, after the first listing of the tree
+        when polling.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, forever if None.
+
+        Returns:
+            bool: True if the watcher is ready.
+        """
+        if self._backend is None:
+            return False
+        return self._backend.ready.wait(timeout)
+
+    def _emit(self, kind: str, path: Path) -> None:
+        with self._lock:
+            previous = self._pending.get(path)
+            if previous == "added" and kind == "removed":
+                # created and deleted within the same batch, like temp files
+                del self._pending[path]
+            elif previous == "removed" and kind == "added":
+                self._pending[path] = "modified"
+            elif previous != "added":
+                self._pending[path] = kind
+            self._deadline = monotonic() + self.debounce
+            if self._flusher is None:
+                self._flusher = Thread(
+                    target=self._flush_when_quiet,
+                    name="FolderWatcherFlush",
+                    daemon=True,
+                )
+                self._flusher.start()
+
+    def _flush_when_quiet(self) -> None:
+        while True:
+            with self._lock:
+                remaining = self._deadline - monotonic()
+                if remaining <= 0:
+                    self._flusher = None
+                    break
+            sleep(remaining)
+        self.flush()
+
+    def flush(self) -> None:
+        """Send the pending changes right away."""
+        with self._lock:
+            events = [FileEvent(kind, path) for path, kind in self._pending.items()]
+            self._pending.clear()
+        if not events:
+            return
+        try:
+            self.on_change(events)
+        except Exception as e:
+            logger.error(f"Failed to handle the changes in {self.root}: {e}")
+
+    def start(self) -> "FolderWatcher":
+        """
+        Start watching.
+
+        Returns:
+            FolderWatcher: The watcher itself.
+        """
+        if self._backend is not None:
+            return self
+        native = self.native
+        if native is None:
+            native = not is_network_path(self.root)
+        backend = None
+        if native:
+            try:
+                backend = _NativeBackend(self.root, self._emit, self.prune_dirs)
+            except ImportError:
+                logger.debug("watchdog is not installed, polling for changes.")
+        if backend is None:
+            backend = _PollingBackend(
+                self.root, self._emit, self.poll_interval, self.prune_dirs
+            )
+        backend.start()
+        self._backend = backend
+        logger.debug(f"Watching {self.root} ({self.backend})")
+        return self
+
+    def stop(self) -> None:
+        """Stop watching, sending the pending changes."""
+        if self._backend is None:
+            return
+        self._backend.stop()
+        self._backend = None
+        self.flush()
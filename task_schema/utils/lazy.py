@@ -0,0 +1,70 @@
+"""
+lazy.py
+
+Deferred imports for plugin modules. Qt toolbars and heavy libraries
+(pandas, shotgun_api3, gspread...) are only needed by some code paths, so
+plugins reference them through a `LazyImport` that imports the target the
+first time it is called or one of its attributes is accessed. Headless
+sessions (farm jobs, mayapy) that only resolve paths never pay for them.
+"""
+
+from importlib import import_module
+from logging import getLogger
+from threading import Lock
+from typing import Any
+
+logger = getLogger(__name__)
+
+
+class LazyImport:
+    """
+    Proxy to a module or module attribute imported on first use.
+
+    Attributes:
+        path (str): 'module' or 'module:attribute' to import.
+        instantiate (bool): Whether the proxy stands for an instance of the
+            imported class, created without arguments on first use.
+    """
+
+    def __init__(self, path: str, instantiate: bool = False) -> None:
+        self.path = path
+        self.instantiate = instantiate
+        self._target = None
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the target has already been imported."""
+        return self._target is not None
+
+    def resolve(self) -> Any:
+        """
+        Import (once) and return the target.
+
+        Returns:
+            Any: The module, attribute or instance the proxy stands for.
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    module_name, _, attribute = self.path.partition(":")
+                    target = import_module(module_name)
+                    if attribute:
+                        target = getattr(target, attribute)
+                    if self.instantiate:
+                        target = target()
+                    logger.debug(f"Lazily imported {self.path}")
+                    self._target = target
+        return self._target
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name in ("_target", "_lock"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyImport {self.path} ({state})>"
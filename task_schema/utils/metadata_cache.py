@@ -0,0 +1,135 @@
+"""
+metadata_cache.py
+
+Local JSON cache with a time to live for project level lookups (task short
+names, status colors, etc.) that rarely change but are slow to query. Plugins
+start from the cached values and refresh them in the background once stale.
+"""
+
+import json
+from datetime import datetime
+from logging import getLogger
+from os import fspath, remove
+from pathlib import Path
+from threading import Thread
+from time import time
+from typing import Any, Callable, Optional
+
+logger = getLogger(__name__)
+
+
+class MetadataCache:
+    """
+    JSON file holding a dictionary of metadata and the time it was saved.
+
+    Attributes:
+        path (Path): Cache file path.
+        ttl (float): Seconds after which the cached data is considered stale.
+    """
+
+    def __init__(self, path: Path, ttl: float = 86400) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+
+    def load(self) -> tuple[Optional[dict[str, Any]], bool]:
+        """
+        Read the cached metadata.
+
+        Returns:
+            tuple[Optional[dict[str, Any]], bool]: The cached data (None if
+            missing or unreadable) and whether it is still within the TTL.
+        """
+        if not self.path.exists():
+            return None, False
+        try:
+            content = json.loads(self.path.read_text())
+            data, saved_at = content["data"], float(content["saved_at"])
+        except Exception as e:
+            logger.error(f"Failed to read metadata cache {self.path}: {e}")
+            try:
+                remove(fspath(self.path))
+            except OSError as e:
+                logger.debug(f"Cannot remove metadata cache {self.path}: {e}")
+            return None, False
+        return data, time() - saved_at < self.ttl
+
+    def save(self, data: dict[str, Any]) -> None:
+        """
+        Write the metadata to the cache file, replacing it atomically.
+
+        Args:
+            data (dict[str, Any]): JSON serializable metadata.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = Path(
+            fspath(self.path) + f".{datetime.now().strftime('%Y%m%d%H%M%S%f')}.tmp"
+        )
+        with tmp_file.open("w") as ftw:
+            json.dump({"saved_at": time(), "data": data}, ftw)
+        tmp_file.replace(self.path)
+        logger.debug(f"Metadata cached into {self.path}.")
+
+    def get(
+        self,
+        fetch: Callable[[], dict[str, Any]],
+        apply: Callable[[dict[str, Any]], None],
+    ) -> Optional[Thread]:
+        """
+        Apply the cached metadata and revalidate it when needed.
+
+        With no usable cache, `fetch` runs synchronously. With a stale cache,
+        the cached data is applied right away and `fetch` runs in a daemon
+        thread, applying and saving its result once done.
+
+        Args:
+            fetch (Callable[[], dict[str, Any]]): Queries the fresh metadata.
+            apply (Callable[[dict[str, Any]], None]): Sets the metadata on its owner.
+
+        Returns:
+            Optional[Thread]: The background revalidation thread, if one started.
+        """
+        data, fresh = self.load()
+        if data is None:
+            self.refresh(fetch, apply)
+            return None
+        apply(data)
+        if fresh:
+            return None
+        thread = Thread(
+            target=self._revalidate,
+            args=(fetch, apply),
+            name=f"revalidate-{self.path.stem}",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _revalidate(
+        self,
+        fetch: Callable[[], dict[str, Any]],
+        apply: Callable[[dict[str, Any]], None],
+    ) -> None:
+        """Background refresh, keeping the cached data if the fetch fails."""
+        try:
+            self.refresh(fetch, apply)
+        except Exception as e:
+            logger.error(f"Failed to revalidate metadata cache {self.path}: {e}")
+
+    def refresh(
+        self,
+        fetch: Callable[[], dict[str, Any]],
+        apply: Callable[[dict[str, Any]], None],
+    ) -> None:
+        """
+        Fetch, apply and save the metadata.
+
+        Args:
+            fetch (Callable[[], dict[str, Any]]): Queries the fresh metadata.
+            apply (Callable[[dict[str, Any]], None]): Sets the metadata on its owner.
+        """
+        data = fetch()
+        apply(data)
+        try:
+            self.save(data)
+        except OSError as e:
+            logger.error(f"Failed to write metadata cache {self.path}: {e}")
@@ -0,0 +1,105 @@
+"""
+path_index.py
+
+Finds the task owning a file. Instead of comparing the file's folders with
+the local path of every task, the tasks are indexed by the parts of their
+paths, so a lookup checks at most one dict entry per folder level.
+"""
+
+from bisect import insort
+from os import fspath
+from os.path import normcase
+from pathlib import Path, PurePath
+from typing import Callable, Generic, Iterable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+def path_key(path: Union[str, Path]) -> tuple[str, ...]:
+    """
+    Parts of a path, case folded where the file system ignores case, so
+    paths equal as `Path` objects have the same key.
+
+    Args:
+        path (Union[str, Path]): The path.
+
+    Returns:
+        tuple[str, ...]: Normalized path parts.
+    """
+    return PurePath(normcase(fspath(path))).parts
+
+
+class PathIndex(Generic[T]):
+    """
+    Items indexed by a path, looked up by that path or any path under it.
+    Each path keeps its items in the order they were indexed, so the first
+    one is found even after the paths of others change.
+
+    Attributes:
+        size (int): Number of items the index was built from.
+    """
+
+    def __init__(
+        self, items: Iterable[T] = (), path: Callable[[T], Path] = lambda i: i
+    ) -> None:
+        """
+        Args:
+            items (Iterable[T]): Items to index. When several share a path
+                the first one is found.
+            path (Callable[[T], Path]): Returns the path of an item.
+        """
+        self.path = path
+        self._items: dict[tuple[str, ...], list[T]] = dict()
+        # order and key of each item, and the item itself, which keeps its
+        # id valid
+        self._entries: dict[int, tuple[int, tuple[str, ...], T]] = dict()
+        self.size = 0
+        for item in items:
+            self._insert(item, self.size)
+            self.size += 1
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._entries
+
+    def _insert(self, item: T, order: int) -> None:
+        key = path_key(self.path(item))
+        self._entries[id(item)] = order, key, item
+        if key:
+            bucket = self._items.setdefault(key, [])
+            insort(bucket, item, key=lambda i: self._entries[id(i)][0])
+
+    def update(self, item: T) -> None:
+        """
+        Index an item again after its path changed, keeping its position.
+        Items that aren't indexed are ignored.
+
+        Args:
+            item (T): The item.
+        """
+        entry = self._entries.get(id(item))
+        if entry is None:
+            return
+        order, key, _ = entry
+        bucket = self._items.get(key)
+        if bucket is not None:
+            bucket[:] = [i for i in bucket if i is not item]
+            if not bucket:
+                del self._items[key]
+        self._insert(item, order)
+
+    def find(self, path: Union[str, Path]) -> Optional[T]:
+        """
+        Item whose path is `path` or its closest parent.
+
+        Args:
+            path (Union[str, Path]): The path.
+
+        Returns:
+            Optional[T]: The item, or None if no parent is indexed.
+        """
+        key = path_key(path)
+        for depth in range(len(key), 0, -1):
+            bucket = self._items.get(key[:depth])
+            if bucket:
+                return bucket[0]
+        return None
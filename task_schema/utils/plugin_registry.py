@@ -0,0 +1,361 @@
+"""
+plugin_registry.py
+
+Registry of the project plugins built from their source code. The plugin
+modules are parsed with `ast` to read each class' bases and its TITLE and
+PLUGIN_UUID literals, so listing the plugins doesn't import any of them
+(nor their dependencies, credentials or class level state). Only the
+plugin selected with `load` is imported. The parsed classes are cached on
+disk and each module is parsed again only when it changes.
+
+The bases are resolved through the imports of each module, so a plugin
+inherits the TITLE and PLUGIN_UUID of its bases as it does once imported.
+"""
+
+import ast
+import json
+import warnings
+from datetime import datetime
+from importlib import import_module
+from logging import getLogger
+from os import environ, fspath
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+logger = getLogger(__name__)
+
+PLUGINS_PATH = Path(__file__).parent.parent / "plugins"
+CACHE_VERSION = 2
+
+# Class attributes read from the plugin classes
+METADATA = ("TITLE", "PLUGIN_UUID")
+
+
+class PluginInfo(NamedTuple):
+    """Static metadata of a plugin class."""
+
+    title: Optional[str]
+    uuid: Optional[str]
+    class_name: str
+    module: str
+
+    @property
+    def entry_point(self) -> str:
+        """'module:Class' path used to import the plugin."""
+        return f"{self.module}:{self.class_name}"
+
+
+class ClassInfo(NamedTuple):
+    """A class declared in a plugin module, as written in its source."""
+
+    entry_point: str
+    bases: list[str]
+    values: dict[str, Any]
+
+
+def _imported_names(tree: ast.Module, module: str) -> dict[str, str]:
+    """Dotted path of the names imported by a module."""
+    names = dict()
+    package = module.rpartition(".")[0].split(".")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            parts = package[: len(package) - node.level + 1] if node.level else []
+            source = ".".join(parts + ([node.module] if node.module else []))
+            for alias in node.names:
+                names[alias.asname or alias.name] = f"{source}.{alias.name}"
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    top = alias.name.split(".")[0]
+                    names[top] = top
+    return names
+
+
+def _base_entry_point(
+    node: ast.expr, module: str, local: set[str], imported: dict[str, str]
+) -> Optional[str]:
+    """'module:Class' path of a base class expression, if it names one."""
+    parts = list()
+    while isinstance(node, ast.Attribute):
+        parts.insert(0, node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    if not parts and node.id in local:
+        return f"{module}:{node.id}"
+    if node.id not in imported:
+        return None
+    path = ".".join([imported[node.id], *parts])
+    source, _, name = path.rpartition(".")
+    return f"{source}:{name}" if source else None
+
+
+def scan_plugin_classes(source: str, module: str) -> list[ClassInfo]:
+    """
+    Read the classes declared in a module's source code.
+
+    Args:
+        source (str): Python source of the module.
+        module (str): Dotted name of the module.
+
+    Returns:
+        list[ClassInfo]: Classes with their bases, as 'module:Class' paths,
+        and the TITLE and PLUGIN_UUID literals assigned in their body.
+    """
+    with warnings.catch_warnings():
+        # plugin modules may hold invalid escape sequences in regex strings
+        warnings.simplefilter("ignore", (DeprecationWarning, SyntaxWarning))
+        tree = ast.parse(source)
+    nodes = [node for node in tree.body if isinstance(node, ast.ClassDef)]
+    local = {node.name for node in nodes}
+    imported = _imported_names(tree, module)
+    classes = list()
+    for node in nodes:
+        values = dict()
+        for statement in node.body:
+            if not isinstance(statement, ast.Assign):
+                continue
+            for target in statement.targets:
+                if (
+                    isinstance(target, ast.Name)
+                    and target.id in METADATA
+                    and isinstance(statement.value, ast.Constant)
+                ):
+                    values[target.id] = statement.value.value
+        bases = [_base_entry_point(b, module, local, imported) for b in node.bases]
+        classes.append(
+            ClassInfo(f"{module}:{node.name}", [b for b in bases if b], values)
+        )
+    return classes
+
+
+def resolve_plugins(
+    classes: list[ClassInfo], base_class: Optional[str] = None
+) -> list[PluginInfo]:
+    """
+    Pick the plugin classes and resolve their inherited metadata.
+
+    A class is a plugin if it assigns a PLUGIN_UUID literal, or if it
+    derives from `base_class` and no other class derives from it, as the
+    classes other plugins derive from, such as ShotgridPlugin, are not
+    projects. Plugins without a PLUGIN_UUID of their own inherit it, or use
+    their class name if none of their bases has one.
+
+    Args:
+        classes (list[ClassInfo]): Classes of all the plugin modules.
+        base_class (Optional[str]): 'module:Class' path of the plugin base.
+
+    Returns:
+        list[PluginInfo]: The plugins.
+    """
+    by_entry_point = {c.entry_point: c for c in classes}
+    derived = {base for c in classes for base in c.bases}
+
+    def lookup(entry_point: str, name: str, seen: set[str]) -> Any:
+        """First value of an attribute in a class and its bases."""
+        info = by_entry_point.get(entry_point)
+        if info is None or entry_point in seen:
+            return None
+        seen.add(entry_point)
+        if name in info.values:
+            return info.values[name]
+        for base in info.bases:
+            value = lookup(base, name, seen)
+            if value is not None:
+                return value
+        return None
+
+    def is_plugin(info: ClassInfo) -> bool:
+        if info.values.get("PLUGIN_UUID"):
+            return True
+        if base_class is None or info.entry_point in (base_class, *derived):
+            return False
+        pending, seen = list(info.bases), set()
+        while pending:
+            base = pending.pop()
+            if base == base_class:
+                return True
+            if base not in seen and base in by_entry_point:
+                seen.add(base)
+                pending.extend(by_entry_point[base].bases)
+        return False
+
+    plugins = list()
+    for info in classes:
+        if not is_plugin(info):
+            continue
+        module, _, class_name = info.entry_point.partition(":")
+        title = lookup(info.entry_point, "TITLE", set())
+        uuid = lookup(info.entry_point, "PLUGIN_UUID", set()) or class_name
+        plugins.append(PluginInfo(title, uuid, class_name, module))
+    return plugins
+
+
+def scan_plugin_module(source: str, module: str) -> list[PluginInfo]:
+    """
+    Read the plugin classes declared in a module's source code. Only the
+    bases declared in the module itself are resolved; `PluginRegistry`
+    resolves them across all the plugin modules.
+
+    Args:
+        source (str): Python source of the module.
+        module (str): Dotted name of the module.
+
+    Returns:
+        list[PluginInfo]: Plugins declared in the module.
+    """
+    return resolve_plugins(scan_plugin_classes(source, module))
+
+
+class PluginRegistry:
+    """
+    Lists the plugins of a plugins package without importing them.
+
+    Attributes:
+        plugins_path (Path): Folder holding the plugin modules.
+        package (str): Dotted name of the plugins package.
+        cache_file (Optional[Path]): JSON cache of the parsed metadata.
+        base_class (str): 'module:Class' path of the class plugins derive from.
+    """
+
+    def __init__(
+        self,
+        plugins_path: Path = PLUGINS_PATH,
+        package: str = "task_schema.plugins",
+        cache_file: Optional[Path] = None,
+        base_class: Optional[str] = None,
+    ) -> None:
+        self.plugins_path = Path(plugins_path)
+        self.package = package
+        self.base_class = base_class or f"{package}.base_plugin:BasePlugin"
+        if cache_file is None and environ.get("GWAIO_DATA_PATH"):
+            cache_file = Path(environ["GWAIO_DATA_PATH"], "plugin_registry.json")
+        self.cache_file = cache_file
+        self._plugins: Optional[list[PluginInfo]] = None
+
+    def _read_cache(self) -> dict[str, Any]:
+        if self.cache_file is None or not self.cache_file.exists():
+            return dict()
+        try:
+            cache = json.loads(self.cache_file.read_text())
+            if (
+                cache.get("version") == CACHE_VERSION
+                and cache.get("package") == self.package
+            ):
+                return cache["modules"]
+        except Exception as e:
+            logger.error(f"Failed to read plugin registry cache: {e}")
+        return dict()
+
+    def _write_cache(self, modules: dict[str, Any]) -> None:
+        if self.cache_file is None:
+            return
+        tmp_file = Path(
+            fspath(self.cache_file)
+            + f".{datetime.now().strftime('%Y%m%d%H%M%S%f')}.tmp"
+        )
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache = {
+                "version": CACHE_VERSION,
+                "package": self.package,
+                "modules": modules,
+            }
+            tmp_file.write_text(json.dumps(cache))
+            tmp_file.replace(self.cache_file)
+        except OSError as e:
+            logger.error(f"Failed to write plugin registry cache: {e}")
+
+    def scan(self) -> list[PluginInfo]:
+        """
+        Parse the plugin modules, reusing the cached metadata of the
+        modules that didn't change.
+
+        Returns:
+            list[PluginInfo]: Plugins sorted by title.
+        """
+        cached = self._read_cache()
+        modules = dict()
+        changed = False
+        for path in sorted(self.plugins_path.glob("*.py")):
+            if path.name == "__init__.py":
+                continue
+            stat = path.stat()
+            key = [stat.st_mtime_ns, stat.st_size]
+            entry = cached.get(path.name)
+            if entry is None or entry["key"] != key:
+                module = f"{self.package}.{path.stem}"
+                try:
+                    source = path.read_text(encoding="utf-8")
+                    found = scan_plugin_classes(source, module)
+                except (SyntaxError, UnicodeDecodeError) as e:
+                    logger.error(f"Failed to parse plugin module {path}: {e}")
+                    found = list()
+                entry = {"key": key, "classes": [list(c) for c in found]}
+                changed = True
+            modules[path.name] = entry
+        if changed or modules.keys() != cached.keys():
+            self._write_cache(modules)
+
+        classes = [
+            ClassInfo(*c) for entry in modules.values() for c in entry["classes"]
+        ]
+        self._plugins = sorted(
+            resolve_plugins(classes, self.base_class),
+            key=lambda p: (p.title or "", p.class_name),
+        )
+        titles = dict()
+        for plugin in self._plugins:
+            titles.setdefault(plugin.title, list()).append(plugin.class_name)
+        for title, names in titles.items():
+            if title is not None and len(names) > 1:
+                logger.warning(
+                    f"Plugins {', '.join(names)} share the title '{title}', "
+                    "select them by UUID"
+                )
+        return self._plugins
+
+    @property
+    def plugins(self) -> list[PluginInfo]:
+        """Plugins found on the last scan, scanning on first access."""
+        if self._plugins is None:
+            return self.scan()
+        return self._plugins
+
+    def find(self, key: str) -> PluginInfo:
+        """
+        Find a plugin by UUID or title. UUIDs are matched first.
+
+        Args:
+            key (str): PLUGIN_UUID or TITLE of the plugin.
+
+        Returns:
+            PluginInfo: The plugin metadata.
+
+        Raises:
+            KeyError: If no plugin matches, or several share the key.
+        """
+        for field in ("uuid", "title"):
+            found = [p for p in self.plugins if getattr(p, field) == key]
+            if len(found) > 1:
+                names = ", ".join(p.entry_point for p in found)
+                raise KeyError(f"Plugin '{key}' is ambiguous, it matches {names}")
+            if found:
+                return found[0]
+        raise KeyError(f"Plugin '{key}' not found in {self.plugins_path}")
+
+    def load(self, plugin: Union[str, PluginInfo]) -> type:
+        """
+        Import the selected plugin's module and return its class.
+
+        Args:
+            plugin (Union[str, PluginInfo]): Plugin metadata, UUID or title.
+
+        Returns:
+            type: The plugin class.
+        """
+        info = plugin if isinstance(plugin, PluginInfo) else self.find(plugin)
+        logger.debug(f"Loading plugin {info.title} from {info.entry_point}")
+        return getattr(import_module(info.module), info.class_name)
@@ -0,0 +1,308 @@
+"""
+scan_service.py
+
+Runs folder scans in background threads, so a slow or unreachable share
+(the previous task's folder on the server, a disconnected mapped drive)
+can't freeze the caller. Every scan is given a timeout and a `force_stop`
+callback, the same cancellation contract as the notes APIs, and returns
+the files found so far together with the reason it ended.
+
+Workers are daemon threads: a call stuck inside `os.scandir` on a dead
+share can't be interrupted from Python, so the caller is released and the
+worker is left behind, but it won't keep the application from closing as
+`concurrent.futures` workers would. A worker left behind no longer counts
+towards the pool size and a new one takes its place, so scans on a dead
+share can't hold up the others.
+"""
+
+from logging import getLogger
+from pathlib import Path
+from queue import Queue
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Callable, Iterable, NamedTuple, Optional, Union
+
+from task_schema.utils.file_scan import DEFAULT_PRUNE_DIRS, scan_files
+
+logger = getLogger(__name__)
+
+COMPLETE = "complete"
+TIMEOUT = "timeout"
+CANCELLED = "cancelled"
+ERROR = "error"
+
+
+class ScanResult(NamedTuple):
+    """
+    Outcome of a scan.
+
+    Attributes:
+        files (list[Path]): Files found, all of them only if complete.
+        status (str): "complete", "timeout", "cancelled" or "error".
+        visited (dict[str, int]): Modification time of each folder listed.
+        error (Optional[OSError]): Why the root folder couldn't be read.
+    """
+
+    files: list[Path]
+    status: str
+    visited: dict[str, int]
+    error: Optional[OSError] = None
+
+    @property
+    def complete(self) -> bool:
+        """Whether the whole folder was scanned."""
+        return self.status == COMPLETE
+
+
+class ScanJob:
+    """
+    A scan queued or running in the service.
+
+    Attributes:
+        root (Path): Folder scanned.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        extensions: Optional[frozenset[str]],
+        prune_dirs: frozenset[str],
+        max_depth: Optional[int],
+        name_filter: Optional[Callable[[str], bool]],
+    ) -> None:
+        self.root = root
+        self._extensions = extensions
+        self._prune_dirs = prune_dirs
+        self._max_depth = max_depth
+        self._name_filter = name_filter
+        self._files: list[Path] = list()
+        self._visited: dict[str, int] = dict()
+        self._error: Optional[OSError] = None
+        self._cancel = Event()
+        self._started = Event()
+        self._done = Event()
+        # set by the service to release the worker of a scan given up on
+        self._abandon: Optional[Callable[["ScanJob"], None]] = None
+        self.abandoned = False
+
+    def run(self) -> None:
+        """Walk the folder, called from a worker."""
+        self._started.set()
+        try:
+            if self._cancel.is_set():
+                return
+            for f in scan_files(
+                self.root,
+                self._extensions,
+                self._prune_dirs,
+                self._visited,
+                self._max_depth,
+                self._cancel.is_set,
+            ):
+                if self._name_filter is None or self._name_filter(f.name):
+                    self._files.append(f)
+                if self._cancel.is_set():
+                    return
+        except OSError as e:
+            self._error = e
+        except Exception as e:
+            logger.error(f"Scanning {self.root} failed: {e}")
+            self._error = OSError(str(e))
+        finally:
+            self._done.set()
+
+    def cancel(self) -> None:
+        """Ask the worker to stop at the next folder or file."""
+        self._cancel.set()
+
+    def done(self) -> bool:
+        """Whether the worker finished, completely or not."""
+        return self._done.is_set()
+
+    def wait(
+        self,
+        timeout: Optional[float] = None,
+        force_stop: Callable[[], bool] = lambda: False,
+        poll_interval: float = 0.05,
+    ) -> ScanResult:
+        """
+        Wait for the scan to end, cancelling it on timeout or when
+        `force_stop` returns True.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, forever if None.
+            force_stop (Callable[[], bool]): Callback to interrupt the scan.
+            poll_interval (float): Seconds between `force_stop` checks.
+
+        Returns:
+            ScanResult: The files found so far and why the scan ended.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        status = COMPLETE
+        while not self._done.wait(poll_interval):
+            if force_stop():
+                status = CANCELLED
+                break
+            if deadline is not None and monotonic() >= deadline:
+                status = TIMEOUT
+                break
+        if status == COMPLETE and self._cancel.is_set():
+            status = CANCELLED
+        if status != COMPLETE:
+            self.cancel()
+            logger.warning(f"Scan of {self.root} stopped ({status}).")
+            if self._abandon is not None and self._started.is_set():
+                self._abandon(self)
+        elif self._error is not None:
+            status = ERROR
+        return ScanResult(
+            list(self._files), status, dict(self._visited), self._error
+        )
+
+
+class ScanService:
+    """
+    Pool of daemon threads running folder scans.
+
+    Attributes:
+        max_workers (int): Scans running at the same time. Workers are
+            started as scans are queued, up to this number. The workers of
+            the scans that timed out or were cancelled while stuck aren't
+            counted, so they are replaced.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._queue: "Queue[ScanJob]" = Queue()
+        self._started = 0
+        self._workers = 0
+        self._exited = 0
+        self._idle = 0
+        self._lock = Lock()
+
+    @property
+    def abandoned(self) -> int:
+        """Workers still stuck in a scan that was given up on."""
+        with self._lock:
+            return self._started - self._workers - self._exited
+
+    def _start_worker(self) -> None:
+        """Start a worker if none is idle and the pool isn't full, under lock."""
+        if self._idle == 0 and self._workers < self.max_workers:
+            worker = Thread(
+                target=self._work,
+                name=f"ScanService-{self._started}",
+                daemon=True,
+            )
+            self._started += 1
+            self._workers += 1
+            self._idle += 1
+            worker.start()
+
+    def _work(self) -> None:
+        while True:
+            job = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+            job.run()
+            with self._lock:
+                if job.abandoned:
+                    # replaced while stuck, the new worker takes the next scans
+                    self._exited += 1
+                    return
+                self._idle += 1
+
+    def _abandon(self, job: ScanJob) -> None:
+        """
+        Stop counting the worker of a scan given up on while it runs, and
+        start another one if scans are waiting.
+        """
+        with self._lock:
+            if job.done() or job.abandoned:
+                return
+            job.abandoned = True
+            self._workers -= 1
+            logger.warning(
+                f"Worker scanning {job.root} is stuck, starting another one."
+            )
+            if not self._queue.empty():
+                self._start_worker()
+
+    def submit(
+        self,
+        root: Union[str, Path],
+        extensions: Optional[frozenset[str]] = None,
+        prune_dirs: Iterable[str] = DEFAULT_PRUNE_DIRS,
+        max_depth: Optional[int] = None,
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> ScanJob:
+        """
+        Queue a scan and return right away.
+
+        Args:
+            root (Union[str, Path]): Folder to scan.
+            extensions (Optional[frozenset[str]]): Suffixes to keep, all if None.
+            prune_dirs (Iterable[str]): Folder names not to descend into.
+            max_depth (Optional[int]): Levels of subfolders to descend.
+            name_filter (Optional[Callable[[str], bool]]): Keeps the files
+                whose name it accepts, all if None.
+
+        Returns:
+            ScanJob: The queued scan.
+        """
+        job = ScanJob(
+            Path(root), extensions, frozenset(prune_dirs), max_depth, name_filter
+        )
+        job._abandon = self._abandon
+        with self._lock:
+            self._start_worker()
+        self._queue.put(job)
+        return job
+
+    def scan(
+        self,
+        root: Union[str, Path],
+        extensions: Optional[frozenset[str]] = None,
+        prune_dirs: Iterable[str] = DEFAULT_PRUNE_DIRS,
+        max_depth: Optional[int] = None,
+        name_filter: Optional[Callable[[str], bool]] = None,
+        timeout: Optional[float] = None,
+        force_stop: Callable[[], bool] = lambda: False,
+    ) -> ScanResult:
+        """
+        Scan a folder in the background and wait for it, at most `timeout`
+        seconds or until `force_stop` returns True.
+
+        Args:
+            root (Union[str, Path]): Folder to scan.
+            extensions (Optional[frozenset[str]]): Suffixes to keep, all if None.
+            prune_dirs (Iterable[str]): Folder names not to descend into.
+            max_depth (Optional[int]): Levels of subfolders to descend.
+            name_filter (Optional[Callable[[str], bool]]): Keeps the files
+                whose name it accepts, all if None.
+            timeout (Optional[float]): Seconds to wait, forever if None.
+            force_stop (Callable[[], bool]): Callback to interrupt the scan.
+
+        Returns:
+            ScanResult: The files found and why the scan ended.
+        """
+        job = self.submit(root, extensions, prune_dirs, max_depth, name_filter)
+        return job.wait(timeout, force_stop)
+
+
+_default_service: Optional[ScanService] = None
+_default_lock = Lock()
+
+
+def default_scan_service() -> ScanService:
+    """
+    Service shared by the plugins, created on first use.
+
+    Returns:
+        ScanService: The shared service.
+    """
+    global _default_service
+    with _default_lock:
+        if _default_service is None:
+            _default_service = ScanService()
+        return _default_service
@@ -0,0 +1,381 @@
+"""
+session_broker.py
+
+Reuses running applications to open files instead of starting a new process
+for each one, which takes Maya, Houdini or Nuke up to a minute and a half.
+
+The launcher side, `SessionBroker`, adds `GWAIO_SESSION_PORT_FILE` and
+`GWAIO_SESSION_TOKEN` to the environment of the applications it starts.
+Their startup script runs a `SessionServer`, which listens on a port chosen
+by the system and writes it to that file, and the next files of the same
+plugin and application are sent to it with the environment they would have
+been launched with. When no session answers, a new process is started as
+before.
+
+Protocol: one JSON object per line over a local TCP connection. Requests are
+`{"token", "command", "path", "env"}` with the commands "ping" and "open"
+(`path` may be null to only apply `env`), and responses `{"ok", "error"}`.
+
+Running this module starts a stand-in session that logs the files it is
+asked to open, to test the broker without the applications:
+
+Usage:
+    GWAIO_SESSION_PORT_FILE=session.port GWAIO_SESSION_TOKEN=secret python -m task_schema.utils.session_broker --log opened.jsonl
+"""
+
+import argparse
+import json
+import socket
+import sys
+from logging import getLogger
+from os import environ, fspath, getpid, replace
+from pathlib import Path
+from secrets import token_hex
+from tempfile import gettempdir
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Union
+
+logger = getLogger(__name__)
+
+PORT_FILE_VARIABLE = "GWAIO_SESSION_PORT_FILE"
+TOKEN_VARIABLE = "GWAIO_SESSION_TOKEN"
+HOST = "127.0.0.1"
+
+# Seconds a new session has to start listening before it is forgotten
+STARTUP_TIMEOUT = 180.0
+
+
+def session_folder() -> Path:
+    """
+    Folder of the files the sessions write their port to, in
+    GWAIO_DATA_PATH when set.
+
+    Returns:
+        Path: The folder, which may not exist yet.
+    """
+    return Path(environ.get("GWAIO_DATA_PATH") or gettempdir(), "sessions")
+
+
+def send_command(
+    port: int,
+    token: str,
+    command: str,
+    path: Optional[str] = None,
+    env: Optional[dict[str, str]] = None,
+    timeout: float = 10.0,
+) -> dict[str, Any]:
+    """
+    Send a command to a session and wait for its response.
+
+    Args:
+        port (int): Port of the session.
+        token (str): Token the session was started with.
+        command (str): "ping" or "open".
+        path (Optional[str]): File to open.
+        env (Optional[dict[str, str]]): Environment to open it with.
+        timeout (float): Seconds to wait for the connection and the response.
+
+    Returns:
+        dict[str, Any]: The response.
+
+    Raises:
+        OSError: If the session can't be reached or doesn't answer.
+    """
+    request = {"token": token, "command": command, "path": path, "env": env or {}}
+    with socket.create_connection((HOST, port), timeout=timeout) as sock:
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise OSError(f"Session on port {port} closed the connection")
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise OSError(f"Invalid response from session on port {port}") from e
+
+
+class Session(NamedTuple):
+    """Session started for a plugin and application."""
+
+    port_file: Path
+    token: str
+    started: float
+
+
+class SessionBroker:
+    """
+    Keeps the sessions started by the launcher and sends files to them.
+
+    Attributes:
+        command_timeout (float): Seconds to wait for a session to answer.
+        startup_timeout (float): Seconds a session has to start listening.
+    """
+
+    def __init__(
+        self, command_timeout: float = 10.0, startup_timeout: float = STARTUP_TIMEOUT
+    ) -> None:
+        self.command_timeout = command_timeout
+        self.startup_timeout = startup_timeout
+        self._sessions: dict[Hashable, list[Session]] = dict()
+        # ports read from the port files, by token
+        self._ports: dict[str, int] = dict()
+        self._lock = Lock()
+
+    def new_session_env(self, key: Hashable) -> dict[str, str]:
+        """
+        Register a session for an application about to be started.
+
+        Args:
+            key (Hashable): Plugin and application the session is for.
+
+        Returns:
+            dict[str, str]: Variables to add to the application environment.
+        """
+        folder = session_folder()
+        folder.mkdir(parents=True, exist_ok=True)
+        session = Session(
+            Path(folder, f"{token_hex(8)}.port"), token_hex(16), monotonic()
+        )
+        with self._lock:
+            self._sessions.setdefault(key, list()).append(session)
+        return {
+            PORT_FILE_VARIABLE: fspath(session.port_file),
+            TOKEN_VARIABLE: session.token,
+        }
+
+    def _port(self, session: Session) -> int:
+        """
+        Port a session listens on, written by it once listening.
+
+        Raises:
+            OSError: If the session didn't write its port yet.
+        """
+        port = self._ports.get(session.token)
+        if port is None:
+            try:
+                port = int(session.port_file.read_text("utf-8"))
+            except ValueError as e:
+                raise OSError(f"Invalid port file {session.port_file}") from e
+            self._ports[session.token] = port
+        return port
+
+    def open_file(
+        self, key: Hashable, path: Optional[str], env: dict[str, str]
+    ) -> bool:
+        """
+        Ask a running session to open a file, newest session first. Sessions
+        that stopped answering are forgotten.
+
+        Args:
+            key (Hashable): Plugin and application the session is for.
+            path (Optional[str]): File to open, None to only apply `env`.
+            env (dict[str, str]): Environment to open it with.
+
+        Returns:
+            bool: True if a session opened it, False if a new process is needed.
+        """
+        with self._lock:
+            sessions = list(reversed(self._sessions.get(key, [])))
+        for session in sessions:
+            port = None
+            try:
+                port = self._port(session)
+                response = send_command(
+                    port, session.token, "open", path, env, self.command_timeout
+                )
+            except OSError as e:
+                if monotonic() - session.started > self.startup_timeout:
+                    logger.debug(f"Forgetting session on port {port}: {e}")
+                    self._forget(key, session)
+                continue
+            if response.get("ok"):
+                logger.debug(f"Opened {path} in session on port {port}")
+                return True
+            logger.warning(
+                f"Session on port {port} can't open {path}: {response.get('error')}"
+            )
+        return False
+
+    def wait_ready(self, key: Hashable, timeout: float) -> bool:
+        """
+        Wait for a session of `key` to answer.
+
+        Args:
+            key (Hashable): Plugin and application the session is for.
+            timeout (float): Seconds to wait.
+
+        Returns:
+            bool: True if a session answered.
+        """
+        deadline = monotonic() + timeout
+        while True:
+            with self._lock:
+                sessions = list(self._sessions.get(key, []))
+            for session in sessions:
+                try:
+                    port = self._port(session)
+                    send_command(port, session.token, "ping", timeout=0.5)
+                    return True
+                except OSError:
+                    pass
+            if monotonic() >= deadline:
+                return False
+            sleep(0.05)
+
+    def _forget(self, key: Hashable, session: Session) -> None:
+        with self._lock:
+            sessions = self._sessions.get(key, [])
+            if session in sessions:
+                sessions.remove(session)
+            self._ports.pop(session.token, None)
+        try:
+            session.port_file.unlink()
+        except OSError:
+            pass
+
+
+class _Server(ThreadingTCPServer):
+    daemon_threads = True
+
+
+class _Handler(StreamRequestHandler):
+    def handle(self) -> None:
+        server: "SessionServer" = self.server.session
+        try:
+            request = json.loads(self.rfile.readline())
+            response = server.handle_request(request)
+        except ValueError as e:
+            response = {"ok": False, "error": f"Invalid request: {e}"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class SessionServer:
+    """
+    Runs in the application and opens the files sent by the launcher.
+
+    Attributes:
+        port (int): Port listened on, known once started.
+        token (str): Token the requests must carry.
+        port_file (Optional[Path]): File the port is written to when started.
+    """
+
+    def __init__(
+        self,
+        open_file: Callable[[Optional[str], dict[str, str]], None],
+        port: int = 0,
+        token: Optional[str] = None,
+        port_file: Union[str, Path, None] = None,
+    ) -> None:
+        """
+        Args:
+            open_file (Callable[[Optional[str], dict[str, str]], None]):
+                Applies the environment and opens the file, if any. Called
+                from the server thread, so applications that require it must
+                defer to their main thread.
+            port (int): Port, 0 to let the system choose a free one.
+            token (Optional[str]): Token, GWAIO_SESSION_TOKEN if None.
+            port_file (Union[str, Path, None]): File to write the port to,
+                GWAIO_SESSION_PORT_FILE if None and set.
+        """
+        self.port = port
+        self.token = token if token is not None else environ[TOKEN_VARIABLE]
+        if port_file is None:
+            port_file = environ.get(PORT_FILE_VARIABLE)
+        self.port_file = Path(port_file) if port_file else None
+        self._open_file = open_file
+        self._server: Optional[_Server] = None
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a request of the launcher.
+
+        Args:
+            request (dict[str, Any]): The request.
+
+        Returns:
+            dict[str, Any]: The response.
+        """
+        if request.get("token") != self.token:
+            return {"ok": False, "error": "Invalid token"}
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True}
+        if command == "open":
+            try:
+                self._open_file(request.get("path"), request.get("env") or {})
+            except Exception as e:
+                logger.exception(f"Cannot open {request.get('path')}")
+                return {"ok": False, "error": str(e)}
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command {command}"}
+
+    def start(self) -> None:
+        """
+        Listen for requests in a daemon thread, and tell the launcher the
+        port through the port file.
+        """
+        self._server = _Server((HOST, self.port), _Handler)
+        self._server.session = self
+        self.port = self._server.server_address[1]
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        if self.port_file is not None:
+            # written whole, the launcher may read it at any time
+            tmp = Path(f"{fspath(self.port_file)}.{getpid()}.tmp")
+            tmp.write_text(str(self.port), "utf-8")
+            replace(tmp, self.port_file)
+        logger.debug(f"Session listening on port {self.port}")
+
+    def stop(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+_default_broker: Optional[SessionBroker] = None
+_default_lock = Lock()
+
+
+def default_session_broker() -> SessionBroker:
+    """
+    Broker shared by the plugins.
+
+    Returns:
+        SessionBroker: The shared broker.
+    """
+    global _default_broker
+    with _default_lock:
+        if _default_broker is None:
+            _default_broker = SessionBroker()
+        return _default_broker
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stand-in application session.")
+    parser.add_argument("file", nargs="?", help="file opened at startup")
+    parser.add_argument("--log", required=True, help="JSON lines of opened files")
+    args = parser.parse_args()
+
+    log_lock = Lock()
+
+    def open_file(path: Optional[str], env: dict[str, str]) -> None:
+        with log_lock, open(args.log, "a", encoding="utf-8") as log:
+            log.write(json.dumps({"path": path, "env": env}) + "\n")
+
+    if args.file:
+        open_file(args.file, dict(environ))
+    server = SessionServer(open_file)
+    server.start()
+    try:
+        while True:
+            sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+sg_batch.py
+
+Helpers for sending many ShotGrid write requests as chunked `batch` calls.
+ShotGrid connections are not thread safe, so each worker opens its own
+session through the `connect` factory (e.g. `lambda: ShotgridInstance(plugin)`)
+and keeps it for the chunks it sends.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging import getLogger
+from threading import local
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Iterator
+
+logger = getLogger(__name__)
+
+
+def chunked(items: list[Any], size: int) -> Iterator[list[Any]]:
+    """
+    Split a list into consecutive chunks.
+
+    Args:
+        items (list[Any]): Items to split.
+        size (int): Maximum length of each chunk.
+
+    Yields:
+        list[Any]: The next chunk of items.
+    """
+    if size < 1:
+        raise ValueError(f"Chunk size must be positive, got {size}")
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def task_field_updates(
+    entity_type: str,
+    task_entities: list[dict[str, Any]],
+    task_fields: dict[str, str],
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Batch requests linking entities to their tasks through the entity
+    fields named after the task names, e.g. `sg_layout_task` for "layout".
+
+    A field already pointing to one of the entity's tasks with that name is
+    left alone, and among several such tasks the first one is linked, so
+    running the resync again changes nothing.
+
+    Args:
+        entity_type (str): Type of the linked entities, e.g. "Asset".
+        task_entities (list[dict[str, Any]]): Tasks with their `content`,
+            `entity` and `entity.<entity_type>.<field>` values.
+        task_fields (dict[str, str]): Entity field of each task name.
+
+    Returns:
+        tuple[list[dict[str, Any]], int]: One update request per entity with
+        all its fields, and the number of tasks skipped.
+    """
+    linked = set()
+    tasks: dict[tuple[int, str], int] = dict()
+    for task in task_entities:
+        field_name = task_fields.get(task["content"])
+        if field_name is None or task.get("entity") is None:
+            continue
+        key = (task["entity"]["id"], field_name)
+        current = task.get(f"entity.{entity_type}.{field_name}")
+        if current is not None and current.get("id") == task["id"]:
+            linked.add(key)
+        tasks.setdefault(key, task["id"])
+
+    requests: dict[int, dict[str, Any]] = dict()
+    for (entity_id, field_name), task_id in tasks.items():
+        if (entity_id, field_name) in linked:
+            continue
+        request = requests.setdefault(
+            entity_id,
+            {
+                "request_type": "update",
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "data": dict(),
+            },
+        )
+        request["data"][field_name] = {"type": "Task", "id": task_id}
+    updated = sum(len(r["data"]) for r in requests.values())
+    return list(requests.values()), len(task_entities) - updated
+
+
+def send_batches(
+    connect: Callable[[], ContextManager[Any]],
+    requests: list[dict[str, Any]],
+    chunk_size: int = 100,
+    max_workers: int = 4,
+) -> dict[str, Any]:
+    """
+    Send ShotGrid batch requests in chunks with bounded concurrency.
+
+    Each chunk is one `sg.batch` call, which ShotGrid runs as a single
+    transaction: a failing chunk is logged and reported without stopping
+    the remaining ones.
+
+    Args:
+        connect (Callable[[], ContextManager[Any]]): Factory returning a
+            context manager that yields a ShotGrid connection.
+        requests (list[dict[str, Any]]): Batch requests, as accepted by `sg.batch`.
+        chunk_size (int): Maximum number of requests per batch call.
+        max_workers (int): Maximum number of concurrent batch calls.
+
+    Returns:
+        dict[str, Any]: Summary with the number of requests, chunks, succeeded
+        and failed requests, the errors and the elapsed seconds.
+    """
+    start = perf_counter()
+    chunks = list(chunked(requests, chunk_size))
+    summary = {
+        "requests": len(requests),
+        "chunks": len(chunks),
+        "succeeded": 0,
+        "failed": 0,
+        "errors": list(),
+        "elapsed": 0.0,
+    }
+    if not chunks:
+        return summary
+
+    sessions = local()
+    opened = list()
+
+    def send(chunk: list[dict[str, Any]]) -> list[Any]:
+        if not hasattr(sessions, "sg"):
+            context = connect()
+            sessions.sg = context.__enter__()
+            opened.append(context)
+        return sessions.sg.batch(chunk)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {executor.submit(send, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.exception(e)
+                    summary["failed"] += len(chunk)
+                    summary["errors"].append(str(e))
+                else:
+                    summary["succeeded"] += len(result)
+    finally:
+        for context in opened:
+            try:
+                context.__exit__(None, None, None)
+            except Exception as e:
+                logger.debug(e)
+
+    summary["elapsed"] = perf_counter() - start
+    logger.debug(
+        f"Sent {summary['requests']} requests in {summary['chunks']} batches "
+        f"({summary['failed']} failed) in {summary['elapsed']:.2f}s"
+    )
+    return summary
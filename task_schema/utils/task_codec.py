@@ -0,0 +1,273 @@
+"""
+task_codec.py
+
+Serialization of tasks for the applications they are launched with
+(`GWAIO_TASK_DATA`) and other processes. The public fields of a class are
+listed once and cached as a `FieldPlan`, and values are converted in a
+single pass, with `Path`, dates and the types registered with
+`register_type` handled directly instead of trying `json.dumps` on every
+field.
+
+Two formats are supported: plain dictionaries ready for JSON, where
+registered types become strings or dictionaries and are restored from the
+field types of the class, and a compact binary format using the optional
+`msgpack` package, which keeps the exact types.
+"""
+
+import inspect
+from datetime import date, datetime
+from functools import lru_cache
+from logging import getLogger
+from pathlib import Path, PurePath
+from typing import Any, Callable, NamedTuple, Optional, get_type_hints
+
+logger = getLogger(__name__)
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+class _Codec(NamedTuple):
+    code: int
+    to_plain: Callable[[Any], Any]
+    from_plain: Callable[[Any], Any]
+
+
+# Registered types by class, in registration order so subclasses can be
+# matched with isinstance
+_CODECS: dict[type, _Codec] = dict()
+_BY_CODE: dict[int, tuple[type, _Codec]] = dict()
+
+
+@lru_cache(maxsize=None)
+def _codec_for(cls: type) -> Optional[_Codec]:
+    codec = _CODECS.get(cls)
+    if codec is not None:
+        return codec
+    for registered, codec in _CODECS.items():
+        if issubclass(cls, registered):
+            return codec
+    return None
+
+
+def register_type(
+    cls: type,
+    code: int,
+    to_plain: Callable[[Any], Any],
+    from_plain: Callable[[Any], Any],
+) -> None:
+    """
+    Teach the codec to handle a type.
+
+    Args:
+        cls (type): The type, its subclasses are handled too.
+        code (int): Identifier of the type in the binary format (0-127).
+        to_plain (Callable[[Any], Any]): Turns a value into JSON data.
+        from_plain (Callable[[Any], Any]): Builds the value back.
+    """
+    if code in _BY_CODE and _BY_CODE[code][0] is not cls:
+        raise ValueError(f"Code {code} is already used by {_BY_CODE[code][0]}")
+    codec = _Codec(code, to_plain, from_plain)
+    _CODECS[cls] = codec
+    _BY_CODE[code] = cls, codec
+    _codec_for.cache_clear()
+    field_plan.cache_clear()
+
+
+def encode(
+    value: Any, typed: bool = False, default: Callable[[Any], Any] = str
+) -> Any:
+    """
+    Convert a value into data that can be written as JSON or msgpack.
+
+    Args:
+        value (Any): The value.
+        typed (bool): Keep the registered types for the binary format.
+        default (Callable[[Any], Any]): Converts unknown types, str by default.
+
+    Returns:
+        Any: The converted value, tuples becoming lists.
+    """
+    cls = type(value)
+    if cls in _SCALARS:
+        return value
+    if cls is list or cls is tuple:
+        return [encode(v, typed, default) for v in value]
+    if cls is dict:
+        return {k: encode(v, typed, default) for k, v in value.items()}
+    codec = _codec_for(cls)
+    if codec is not None:
+        return value if typed else encode(codec.to_plain(value), typed, default)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [encode(v, typed, default) for v in value]
+    if isinstance(value, dict):
+        return {k: encode(v, typed, default) for k, v in value.items()}
+    if isinstance(value, (str, int, float)):
+        return value
+    return default(value)
+
+
+class FieldPlan:
+    """
+    Public fields of a class and the types they are restored as.
+
+    Attributes:
+        class_fields (tuple[str, ...]): Public properties and class attributes
+            read from every instance.
+        types (dict[str, type]): Registered type of each field known, from
+            the property annotations and the class `_field_types`.
+    """
+
+    def __init__(self, cls: type) -> None:
+        fields = list()
+        types = dict()
+        for name, member in inspect.getmembers(cls):
+            if name.startswith("_"):
+                continue
+            if isinstance(member, property):
+                fields.append(name)
+                try:
+                    hint = get_type_hints(member.fget).get("return")
+                except Exception:
+                    hint = None
+                if isinstance(hint, type) and _codec_for(hint) is not None:
+                    types[name] = hint
+            elif not callable(member) and not inspect.ismethoddescriptor(member):
+                fields.append(name)
+        types.update(getattr(cls, "_field_types", {}))
+        self.class_fields = tuple(fields)
+        self.types = types
+
+    def names(self, obj: Any) -> list[str]:
+        """
+        Public fields of an instance, sorted.
+
+        Args:
+            obj (Any): The instance.
+
+        Returns:
+            list[str]: The field names.
+        """
+        names = set(self.class_fields)
+        names.update(k for k in vars(obj) if not k.startswith("_"))
+        return sorted(names)
+
+
+@lru_cache(maxsize=None)
+def field_plan(cls: type) -> FieldPlan:
+    """Cached field plan of a class."""
+    return FieldPlan(cls)
+
+
+def to_dict(obj: Any, typed: bool = False) -> dict[str, Any]:
+    """
+    Public fields of an object with their converted values.
+
+    Args:
+        obj (Any): The object.
+        typed (bool): Keep the registered types for the binary format.
+
+    Returns:
+        dict[str, Any]: Field names and values.
+    """
+    plan = field_plan(type(obj))
+    values = vars(obj)
+    result = dict()
+    for name in plan.names(obj):
+        if name in plan.class_fields:
+            value = getattr(obj, name)
+        else:
+            value = values[name]
+        if inspect.ismethod(value) or inspect.isfunction(value):
+            continue
+        result[name] = encode(value, typed)
+    return result
+
+
+def decode_fields(cls: type, data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Restore the registered types of the fields in plain data.
+
+    Args:
+        cls (type): Class the data was serialized from.
+        data (dict[str, Any]): Field names and plain values.
+
+    Returns:
+        dict[str, Any]: Field names and values.
+    """
+    types = field_plan(cls).types
+    result = dict()
+    for name, value in data.items():
+        field_type = types.get(name)
+        if field_type is None or value is None or isinstance(value, field_type):
+            result[name] = value
+            continue
+        codec = _codec_for(field_type)
+        if codec is not None:
+            value = codec.from_plain(value)
+        result[name] = value
+    return result
+
+
+def _msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "The binary task format requires the msgpack package."
+        ) from e
+    return msgpack
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Serialize the public fields of an object with msgpack.
+
+    Args:
+        obj (Any): The object.
+
+    Returns:
+        bytes: The packed fields.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+    """
+    msgpack = _msgpack()
+
+    def default(value: Any) -> Any:
+        codec = _codec_for(type(value))
+        if codec is None:
+            return str(value)
+        plain = encode(codec.to_plain(value), typed=True)
+        return msgpack.ExtType(codec.code, msgpack.packb(plain, default=default))
+
+    return msgpack.packb(to_dict(obj, typed=True), default=default)
+
+
+def unpackb(data: bytes) -> dict[str, Any]:
+    """
+    Read fields packed by `packb`, with their original types.
+
+    Args:
+        data (bytes): The packed fields.
+
+    Returns:
+        dict[str, Any]: Field names and values.
+
+    Raises:
+        ImportError: If msgpack is not installed.
+    """
+    msgpack = _msgpack()
+
+    def ext_hook(code: int, payload: bytes) -> Any:
+        if code not in _BY_CODE:
+            return msgpack.ExtType(code, payload)
+        codec = _BY_CODE[code][1]
+        plain = msgpack.unpackb(payload, ext_hook=ext_hook, strict_map_key=False)
+        return codec.from_plain(plain)
+
+    return msgpack.unpackb(data, ext_hook=ext_hook, strict_map_key=False)
+
+
+register_type(PurePath, 1, str, Path)
+register_type(datetime, 2, datetime.isoformat, datetime.fromisoformat)
+register_type(date, 3, date.isoformat, date.fromisoformat)
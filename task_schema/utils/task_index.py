@@ -0,0 +1,156 @@
+"""
+task_index.py
+
+Hash indexes of the plugin tasks on the attributes they are usually looked
+up by, so finding a task by id, entity or name doesn't compare every task.
+Queries on other attributes narrow the candidates with the indexed ones
+they include, or scan all the tasks if they include none.
+"""
+
+from bisect import insort
+from itertools import count
+from typing import Any, Hashable, Iterable, Optional
+
+# Attributes, alone or combined, the tasks are indexed by
+INDEXED_KEYS: tuple[tuple[str, ...], ...] = (
+    ("id",),
+    ("link_name",),
+    ("name",),
+    ("entity_type",),
+    ("link_name", "name"),
+)
+
+_MISSING = object()
+
+
+class TaskIndex:
+    """
+    Tasks by the values of their indexed attributes. Each bucket keeps the
+    tasks in the order they were added, so lookups return the same task a
+    scan of the task list would.
+
+    Attributes:
+        keys (tuple[tuple[str, ...], ...]): Attribute combinations indexed.
+        size (int): Number of tasks indexed.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Any] = (),
+        keys: tuple[tuple[str, ...], ...] = INDEXED_KEYS,
+    ) -> None:
+        self.keys = keys
+        self.size = 0
+        self._indexes: dict[tuple[str, ...], dict[Hashable, list]] = {
+            key: dict() for key in keys
+        }
+        # order, indexed values and the task itself, which keeps its id valid
+        self._entries: dict[int, tuple[int, dict, Any]] = dict()
+        self._counter = count()
+        for task in tasks:
+            self.add(task)
+
+    def __contains__(self, task: Any) -> bool:
+        return id(task) in self._entries
+
+    def _order(self, task: Any) -> int:
+        return self._entries[id(task)][0]
+
+    def _insert(self, task: Any, order: int) -> None:
+        values = dict()
+        self._entries[id(task)] = order, values, task
+        for key, index in self._indexes.items():
+            value = tuple(getattr(task, attr, _MISSING) for attr in key)
+            if any(v is _MISSING for v in value):
+                continue
+            try:
+                insort(index.setdefault(value, []), task, key=self._order)
+            except TypeError:
+                # unhashable values, such as entity dicts, are not indexed
+                continue
+            values[key] = value
+
+    def add(self, task: Any) -> None:
+        """
+        Index a task after the ones already indexed.
+
+        Args:
+            task (Any): The task.
+        """
+        if id(task) in self._entries:
+            return
+        self._insert(task, next(self._counter))
+        self.size += 1
+
+    def remove(self, task: Any) -> None:
+        """
+        Drop a task from the indexes.
+
+        Args:
+            task (Any): The task.
+        """
+        entry = self._entries.pop(id(task), None)
+        if entry is None:
+            return
+        for key, value in entry[1].items():
+            bucket = self._indexes[key][value]
+            bucket[:] = [t for t in bucket if t is not task]
+            if not bucket:
+                del self._indexes[key][value]
+        self.size -= 1
+
+    def update(self, task: Any) -> None:
+        """
+        Index a task again after its indexed attributes changed, keeping
+        its position.
+
+        Args:
+            task (Any): The task.
+        """
+        entry = self._entries.get(id(task))
+        if entry is None:
+            self.add(task)
+            return
+        self.remove(task)
+        self._insert(task, entry[0])
+        self.size += 1
+
+    def candidates(self, **kwargs: Any) -> Optional[list]:
+        """
+        Tasks that may match the filters, from the most selective index
+        the filters include.
+
+        Args:
+            **kwargs (Any): Attribute-value pairs.
+
+        Returns:
+            Optional[list]: The candidates in order, or None if no index applies.
+        """
+        best = None
+        for key, index in self._indexes.items():
+            if not all(attr in kwargs for attr in key):
+                continue
+            try:
+                bucket = index.get(tuple(kwargs[attr] for attr in key), [])
+            except TypeError:
+                continue
+            if best is None or len(bucket) < len(best):
+                best = bucket
+        return best
+
+    def find(self, tasks: Iterable[Any], **kwargs: Any) -> Optional[Any]:
+        """
+        First task with all the given attribute values.
+
+        Args:
+            tasks (Iterable[Any]): All the tasks, scanned when no index applies.
+            **kwargs (Any): Attribute-value pairs.
+
+        Returns:
+            Optional[Any]: The task, or None.
+        """
+        candidates = self.candidates(**kwargs)
+        for task in tasks if candidates is None else candidates:
+            if all(getattr(task, k, _MISSING) == v for k, v in kwargs.items()):
+                return task
+        return None
@@ -0,0 +1,170 @@
+"""
+task_list.py
+
+Change tracking for the plugin task list, so the task indexes (by path, by
+attribute and for searches) know when they are outdated. Comparing the
+length of the list missed the lists replaced in place with as many tasks
+and the tasks whose attributes changed.
+
+`TaskList` is a list whose every mutation takes a new `version`. The tasks
+it holds remember it, and `task_changed` logs their attribute changes in
+the lists holding them only, so editing the tasks of a plugin leaves the
+indexes of the others alone. An index built at `tasks_stamp(tasks)` applies
+the `task_changes` logged since, or is rebuilt when they return None.
+"""
+
+from itertools import count
+from typing import Any, Hashable, Iterable, Optional
+from weakref import ref
+
+# Versions are unique across lists, so a new list never matches the stamp of
+# the one it replaced
+_versions = count(1)
+
+# Changes logged before a list takes a new version, as applying more of them
+# one by one costs as much as rebuilding the indexes
+MIN_LOGGED_CHANGES = 64
+
+
+def _track(tasks: "TaskList", items: Iterable[Any]) -> None:
+    """Make the tasks log their changes in `tasks`."""
+    for task in items:
+        try:
+            lists = vars(task).setdefault("_task_lists", dict())
+        except TypeError:
+            # objects without attributes can't change
+            continue
+        lists[id(tasks)] = ref(tasks)
+
+
+def task_changed(task: Any, field: Optional[str] = None) -> None:
+    """
+    Log a change of a task in the task lists holding it.
+
+    Args:
+        task (Any): The task.
+        field (Optional[str]): The attribute that changed, None for any.
+    """
+    try:
+        lists = vars(task).get("_task_lists")
+    except TypeError:
+        return
+    if not lists:
+        return
+    for key, list_ref in list(lists.items()):
+        tasks = list_ref()
+        if tasks is None:
+            del lists[key]
+        else:
+            tasks._log_change(task, field)
+
+
+def tasks_stamp(tasks: Any) -> Hashable:
+    """
+    Stamp of a task list and the changes of its tasks, equal while neither
+    changes.
+
+    Args:
+        tasks (Any): The task list, a `TaskList` to notice its changes.
+
+    Returns:
+        Hashable: The stamp. Lists other than `TaskList` never match an
+            older stamp, so their indexes are always rebuilt.
+    """
+    if isinstance(tasks, TaskList):
+        return tasks.version, len(tasks._changes)
+    return next(_versions), 0
+
+
+def task_changes(tasks: Any, stamp: Any) -> Optional[list[tuple[Any, Optional[str]]]]:
+    """
+    Task changes logged since a stamp.
+
+    Args:
+        tasks (Any): The task list.
+        stamp (Any): Stamp the index was built or last updated at.
+
+    Returns:
+        Optional[list[tuple[Any, Optional[str]]]]: Each changed task and the
+            attribute that changed (None for any), in order. None if the
+            list itself changed, so the index must be rebuilt.
+    """
+    if not isinstance(tasks, TaskList) or not isinstance(stamp, tuple):
+        return None
+    version, position = stamp
+    if version != tasks.version:
+        return None
+    return tasks._changes[position:]
+
+
+def _mutating(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._new_version()
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class TaskList(list):
+    """
+    List of tasks taking a new version on every change.
+
+    Attributes:
+        version (int): Changes on every mutation of the list.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self._changes: list[tuple[Any, Optional[str]]] = list()
+        self._new_version()
+        _track(self, self)
+
+    def _new_version(self) -> None:
+        self.version = next(_versions)
+        self._changes = list()
+
+    def _log_change(self, task: Any, field: Optional[str]) -> None:
+        if len(self._changes) >= max(MIN_LOGGED_CHANGES, len(self)):
+            self._new_version()
+        else:
+            self._changes.append((task, field))
+
+    def append(self, task: Any) -> None:
+        list.append(self, task)
+        self._new_version()
+        _track(self, (task,))
+
+    def insert(self, index: int, task: Any) -> None:
+        list.insert(self, index, task)
+        self._new_version()
+        _track(self, (task,))
+
+    def extend(self, tasks: Iterable[Any]) -> None:
+        tasks = list(tasks)
+        list.extend(self, tasks)
+        self._new_version()
+        _track(self, tasks)
+
+    def __iadd__(self, tasks: Iterable[Any]) -> "TaskList":
+        self.extend(tasks)
+        return self
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+        list.__setitem__(self, index, value)
+        self._new_version()
+        _track(self, value if isinstance(index, slice) else (value,))
+
+    remove = _mutating("remove")
+    pop = _mutating("pop")
+    clear = _mutating("clear")
+    sort = _mutating("sort")
+    reverse = _mutating("reverse")
+    __delitem__ = _mutating("__delitem__")
+    __imul__ = _mutating("__imul__")
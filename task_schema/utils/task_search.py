@@ -0,0 +1,331 @@
+"""
+task_search.py
+
+Search engine for the task tree. Filtering used to match the query against
+the `data_to_show` text of every row on each keystroke. Here every column
+keeps an inverted index from its distinct texts to the rows showing them,
+and an n-gram index from short substrings to those texts, so a query only
+looks at the few texts sharing its n-grams and the rows are gathered from
+the index.
+
+Queries are made of terms separated by spaces. A plain term matches rows
+with the text in any column, while `column:text` only looks at a column,
+named by its header (spaces as underscores) or one of `COLUMN_ALIASES`:
+
+    status:ip artist:ana ep:102 layout
+
+Terms are case insensitive substrings and all of them must match. Values
+with spaces can be quoted, e.g. `artist:"ana maria"`.
+"""
+
+import shlex
+from collections import OrderedDict
+from logging import getLogger
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+logger = getLogger(__name__)
+
+# Short column names accepted in queries
+COLUMN_ALIASES = {
+    "status": "task status",
+    "artist": "artist",
+    "tag": "tags",
+    "ep": "episode",
+    "seq": "sequence",
+    "type": "asset type",
+}
+
+
+def default_task_key(task: Any) -> Hashable:
+    """Identity of a task across refreshes, its id if it has one."""
+    task_id = getattr(task, "id", None)
+    return task_id if task_id is not None else (task.link_name, task.name)
+
+
+def row_texts(task: Any, columns: int) -> tuple[str, ...]:
+    """
+    Lower case texts a task shows in each column.
+
+    Args:
+        task (Any): The task.
+        columns (int): Number of columns.
+
+    Returns:
+        tuple[str, ...]: One text per column, empty if missing.
+    """
+    data = task.data_to_show if isinstance(task.data_to_show, list) else []
+    texts = list()
+    for i in range(columns):
+        cell = data[i] if i < len(data) else None
+        text = cell.get("text") if isinstance(cell, dict) else cell
+        texts.append("" if text is None else str(text).lower())
+    return tuple(texts)
+
+
+class ColumnIndex:
+    """
+    Inverted and n-gram indexes of the texts in a column.
+
+    Attributes:
+        ngram (int): Longest substring indexed.
+    """
+
+    def __init__(self, ngram: int = 3) -> None:
+        self.ngram = ngram
+        self._rows: dict[str, set[Hashable]] = dict()
+        self._grams: dict[str, set[str]] = dict()
+
+    def _text_grams(self, text: str) -> set[str]:
+        return {
+            text[i : i + n]
+            for n in range(1, self.ngram + 1)
+            for i in range(len(text) - n + 1)
+        }
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index a row showing `text`."""
+        rows = self._rows.get(text)
+        if rows is None:
+            rows = self._rows[text] = set()
+            for gram in self._text_grams(text):
+                self._grams.setdefault(gram, set()).add(text)
+        rows.add(key)
+
+    def remove(self, key: Hashable, text: str) -> None:
+        """Drop a row showing `text`."""
+        rows = self._rows.get(text)
+        if rows is None:
+            return
+        rows.discard(key)
+        if rows:
+            return
+        del self._rows[text]
+        for gram in self._text_grams(text):
+            texts = self._grams[gram]
+            texts.discard(text)
+            if not texts:
+                del self._grams[gram]
+
+    def match(self, query: str) -> set[Hashable]:
+        """
+        Rows whose text contains `query`.
+
+        Args:
+            query (str): Lower case substring.
+
+        Returns:
+            set[Hashable]: Keys of the matching rows.
+        """
+        if len(query) <= self.ngram:
+            texts = self._grams.get(query, ())
+        else:
+            grams = [
+                query[i : i + self.ngram]
+                for i in range(len(query) - self.ngram + 1)
+            ]
+            candidates = [self._grams.get(g, set()) for g in grams]
+            candidates.sort(key=len)
+            texts = [
+                t
+                for t in candidates[0].intersection(*candidates[1:])
+                if query in t
+            ]
+        rows = set()
+        for text in texts:
+            rows |= self._rows[text]
+        return rows
+
+
+class TaskSearch:
+    """
+    Searches a task list by the texts shown in its columns.
+
+    Attributes:
+        headers (list[str]): Column headers, in the order of `data_to_show`.
+    """
+
+    def __init__(
+        self,
+        headers: Iterable[str],
+        tasks: Iterable[Any] = (),
+        task_key: Callable[[Any], Hashable] = default_task_key,
+        ngram: int = 3,
+        cache_size: int = 128,
+    ) -> None:
+        """
+        Args:
+            headers (Iterable[str]): Column headers.
+            tasks (Iterable[Any]): Tasks to index.
+            task_key (Callable[[Any], Hashable]): Identity of a task, used to
+                tell which tasks changed when the list is refreshed. Tasks
+                sharing a key are told apart by their order.
+            ngram (int): Longest substring indexed.
+            cache_size (int): Term results kept, as typing repeats them.
+        """
+        self.headers = list(headers)
+        self.task_key = task_key
+        self.cache_size = cache_size
+        self._columns = [ColumnIndex(ngram) for _ in self.headers]
+        self._names: dict[str, int] = dict()
+        for i, header in enumerate(self.headers):
+            self._names[header.lower()] = i
+            self._names[header.lower().replace(" ", "_")] = i
+        for alias, header in COLUMN_ALIASES.items():
+            if header in self._names:
+                self._names.setdefault(alias, self._names[header])
+        # rows are keyed by the task key and how many tasks before had it
+        self._tasks: dict[tuple[Hashable, int], Any] = dict()
+        self._texts: dict[tuple[Hashable, int], tuple[str, ...]] = dict()
+        self._order: dict[tuple[Hashable, int], int] = dict()
+        self._rows: dict[int, tuple[Hashable, int]] = dict()
+        self._cache: "OrderedDict[tuple, frozenset]" = OrderedDict()
+        self.update(tasks)
+
+    @property
+    def size(self) -> int:
+        """Number of tasks indexed."""
+        return len(self._tasks)
+
+    def _index(self, key: Hashable, texts: tuple[str, ...]) -> None:
+        for column, text in zip(self._columns, texts):
+            column.add(key, text)
+        self._texts[key] = texts
+
+    def _unindex(self, key: Hashable) -> None:
+        for column, text in zip(self._columns, self._texts.pop(key)):
+            column.remove(key, text)
+
+    def update(self, tasks: Iterable[Any]) -> None:
+        """
+        Replace the indexed tasks, reindexing only the rows that were added,
+        removed or show different texts.
+
+        Args:
+            tasks (Iterable[Any]): The current task list.
+        """
+        new_tasks = dict()
+        order = dict()
+        rows = dict()
+        counts: dict[Hashable, int] = dict()
+        for position, task in enumerate(tasks):
+            if id(task) in rows:
+                continue
+            key = self.task_key(task)
+            row = key, counts.get(key, 0)
+            counts[key] = row[1] + 1
+            new_tasks[row] = task
+            order[row] = position
+            rows[id(task)] = row
+        changed = 0
+        for key in [k for k in self._tasks if k not in new_tasks]:
+            self._unindex(key)
+            changed += 1
+        columns = len(self.headers)
+        for key, task in new_tasks.items():
+            texts = row_texts(task, columns)
+            old_texts = self._texts.get(key)
+            if old_texts == texts:
+                continue
+            if old_texts is not None:
+                self._unindex(key)
+            self._index(key, texts)
+            changed += 1
+        self._tasks = new_tasks
+        self._order = order
+        self._rows = rows
+        self._cache.clear()
+        logger.debug(f"Task search: {changed} of {len(new_tasks)} rows reindexed.")
+
+    def reindex(self, task: Any) -> None:
+        """
+        Index again a task whose `data_to_show` was edited in place, or
+        whose key changed, which `update` can't tell from the task list.
+
+        Args:
+            task (Any): The task, already indexed.
+        """
+        row = self._rows.get(id(task))
+        if row is None or self._tasks.get(row) is not task:
+            return
+        key = self.task_key(task)
+        texts = row_texts(task, len(self.headers))
+        if row[0] == key and self._texts.get(row) == texts:
+            return
+        self._unindex(row)
+        if row[0] != key:
+            new_row = key, 0
+            while new_row in self._tasks:
+                new_row = key, new_row[1] + 1
+            del self._tasks[row]
+            self._order[new_row] = self._order.pop(row)
+            self._tasks[new_row] = task
+            self._rows[id(task)] = row = new_row
+        self._index(row, texts)
+        self._cache.clear()
+
+    def _column(self, name: str) -> Optional[int]:
+        return self._names.get(name.lower())
+
+    def _match(self, column: Optional[int], text: str) -> frozenset:
+        cache_key = (column, text)
+        rows = self._cache.get(cache_key)
+        if rows is not None:
+            self._cache.move_to_end(cache_key)
+            return rows
+        if column is None:
+            found = set()
+            for index in self._columns:
+                found |= index.match(text)
+        else:
+            found = self._columns[column].match(text)
+        rows = frozenset(found)
+        self._cache[cache_key] = rows
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return rows
+
+    def parse(self, query: str) -> list[tuple[Optional[int], str]]:
+        """
+        Split a query into terms.
+
+        Args:
+            query (str): The query, such as "status:ip artist:ana".
+
+        Returns:
+            list[tuple[Optional[int], str]]: Column (None for any) and lower
+                case text of each term.
+        """
+        try:
+            words = shlex.split(query)
+        except ValueError:
+            # a quote still being typed
+            try:
+                words = shlex.split(query + '"')
+            except ValueError:
+                words = query.replace('"', " ").replace("'", " ").split()
+        terms = list()
+        for word in words:
+            name, sep, text = word.partition(":")
+            column = self._column(name) if sep else None
+            if column is None:
+                text = word
+            if text:
+                terms.append((column, text.lower()))
+        return terms
+
+    def search(self, query: str) -> list[Any]:
+        """
+        Tasks matching every term of a query, in task list order.
+
+        Args:
+            query (str): The query. An empty query matches every task.
+
+        Returns:
+            list[Any]: The matching tasks.
+        """
+        terms = self.parse(query)
+        if not terms:
+            return [self._tasks[k] for k in sorted(self._tasks, key=self._order.get)]
+        results = sorted((self._match(c, t) for c, t in terms), key=len)
+        rows = set(results[0]).intersection(*results[1:])
+        return [self._tasks[k] for k in sorted(rows, key=self._order.__getitem__)]
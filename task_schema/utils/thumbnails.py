@@ -0,0 +1,336 @@
+"""
+thumbnails.py
+
+Thumbnail generation for many tasks at once. The newest image of each task
+is reduced in a pool of worker processes, decoding JPEGs at a fraction of
+their size with Pillow's draft mode, and written to a cache named after
+the source path, modification time and size. Sources that didn't change
+since their thumbnail was made are skipped, so opening a view again only
+copies the small cached files into the tasks. The thumbnails of images that
+changed stay behind, so the shared cache removes the old ones when created.
+
+Pillow is optional: without it thumbnails are plain copies of the sources.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from hashlib import sha1
+from logging import getLogger
+from os import environ, fspath, getpid, remove, replace, scandir, stat
+from pathlib import Path
+from shutil import copy2, copyfile
+from tempfile import gettempdir
+from threading import Lock
+from time import time
+from typing import Callable, Iterable, Optional, Union
+
+logger = getLogger(__name__)
+
+# Largest width and height of a thumbnail, the aspect ratio is kept
+THUMBNAIL_SIZE = (320, 320)
+
+# Thumbnails made longer ago than this are removed, as well as the oldest
+# ones while the cache is larger than MAX_CACHE_SIZE bytes
+MAX_THUMBNAIL_AGE = 30 * 24 * 3600
+MAX_CACHE_SIZE = 512 * 1024 * 1024
+
+# Below this many images, starting the worker processes takes longer than
+# reducing them in the calling thread
+MIN_POOL_JOBS = 4
+
+
+def render_thumbnail(
+    source: Union[str, Path],
+    target: Union[str, Path],
+    size: tuple[int, int] = THUMBNAIL_SIZE,
+) -> bool:
+    """
+    Write a reduced copy of an image as JPEG, replacing `target` atomically.
+    Runs in the worker processes, so it only takes picklable arguments.
+
+    Args:
+        source (Union[str, Path]): Image to reduce.
+        target (Union[str, Path]): Thumbnail file, may be `source` itself.
+        size (tuple[int, int]): Largest width and height.
+
+    Returns:
+        bool: True if resized, False if copied because Pillow is missing.
+
+    Raises:
+        OSError: If the image can't be read or the thumbnail written.
+    """
+    tmp = f"{fspath(target)}.{getpid()}.tmp"
+    try:
+        from PIL import Image
+    except ImportError:
+        copyfile(source, tmp)
+        replace(tmp, target)
+        return False
+    try:
+        with Image.open(source) as image:
+            # JPEGs are decoded straight at 1/2, 1/4 or 1/8 of their size
+            image.draft("RGB", size)
+            image = image.convert("RGB")
+            image.thumbnail(size)
+            image.save(tmp, "JPEG", quality=85)
+        replace(tmp, target)
+    except Exception as e:
+        if Path(tmp).exists():
+            remove(tmp)
+        raise OSError(f"Cannot make a thumbnail of {source}: {e}") from e
+    return True
+
+
+class ThumbnailPipeline:
+    """
+    Makes cached thumbnails in a pool of worker processes.
+
+    Attributes:
+        cache_dir (Path): Folder holding the thumbnails.
+        size (tuple[int, int]): Largest width and height.
+        max_workers (Optional[int]): Worker processes, one per CPU if None.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        size: tuple[int, int] = THUMBNAIL_SIZE,
+        max_workers: Optional[int] = None,
+        executor_factory: Callable[[Optional[int]], Executor] = ProcessPoolExecutor,
+    ) -> None:
+        """
+        Args:
+            cache_dir (Union[str, Path]): Folder holding the thumbnails.
+            size (tuple[int, int]): Largest width and height.
+            max_workers (Optional[int]): Worker processes, one per CPU if None.
+            executor_factory (Callable[[Optional[int]], Executor]): Creates
+                the pool from `max_workers`, a process pool by default.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.size = size
+        self.max_workers = max_workers
+        self._executor_factory = executor_factory
+        self._executor: Optional[Executor] = None
+        self._lock = Lock()
+
+    def cached_path(self, source: Union[str, Path]) -> Path:
+        """
+        Cache file of an image's thumbnail, which changes with the image.
+
+        Args:
+            source (Union[str, Path]): The image.
+
+        Returns:
+            Path: The thumbnail path, which may not exist yet.
+
+        Raises:
+            OSError: If the image can't be accessed.
+        """
+        st = stat(source)
+        key = f"{fspath(source)}|{st.st_mtime_ns}|{st.st_size}|{self.size}"
+        return Path(self.cache_dir, sha1(key.encode()).hexdigest() + ".jpg")
+
+    def _pool(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_factory(self.max_workers)
+            return self._executor
+
+    def generate(
+        self,
+        sources: Iterable[Union[str, Path]],
+        force_stop: Callable[[], bool] = lambda: False,
+    ) -> dict[Path, Optional[Path]]:
+        """
+        Make the thumbnails of the images missing from the cache.
+
+        Args:
+            sources (Iterable[Union[str, Path]]): Images.
+            force_stop (Callable[[], bool]): Callback to stop waiting, the
+                thumbnails not started yet are cancelled.
+
+        Returns:
+            dict[Path, Optional[Path]]: Thumbnail of each image, None if it
+                failed or was cancelled.
+        """
+        results: dict[Path, Optional[Path]] = dict()
+        pending: dict[Path, Path] = dict()
+        for source in map(Path, sources):
+            if source in results or source in pending:
+                continue
+            try:
+                target = self.cached_path(source)
+            except OSError as e:
+                logger.debug(f"Skipping thumbnail of {source}: {e}")
+                results[source] = None
+                continue
+            if target.exists():
+                results[source] = target
+            else:
+                pending[source] = target
+        if not pending:
+            return results
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        logger.debug(
+            f"Making {len(pending)} thumbnails, {len(results)} already cached."
+        )
+
+        if len(pending) < MIN_POOL_JOBS:
+            for source, target in pending.items():
+                if force_stop():
+                    results[source] = None
+                    continue
+                try:
+                    render_thumbnail(source, target, self.size)
+                    results[source] = target
+                except OSError as e:
+                    logger.warning(e)
+                    results[source] = None
+            return results
+
+        pool = self._pool()
+        futures = {
+            pool.submit(render_thumbnail, fspath(s), fspath(t), self.size): s
+            for s, t in pending.items()
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                future.result()
+                results[source] = pending[source]
+            except Exception as e:
+                logger.warning(e)
+                results[source] = None
+            if force_stop():
+                for f in futures:
+                    f.cancel()
+                break
+        for source in pending:
+            results.setdefault(source, None)
+        return results
+
+    def install(self, source: Union[str, Path], target: Union[str, Path]) -> bool:
+        """
+        Make the thumbnail of an image if needed and copy it to `target`,
+        unless `target` already is that thumbnail.
+
+        Args:
+            source (Union[str, Path]): The image.
+            target (Union[str, Path]): Where the task expects its thumbnail.
+
+        Returns:
+            bool: True if `target` holds the thumbnail.
+        """
+        return bool(self.install_many([(source, target)]))
+
+    def install_many(
+        self,
+        pairs: Iterable[tuple[Union[str, Path], Union[str, Path]]],
+        force_stop: Callable[[], bool] = lambda: False,
+    ) -> list[Path]:
+        """
+        Like `install` for many images, reducing them in parallel.
+
+        Args:
+            pairs (Iterable[tuple[Union[str, Path], Union[str, Path]]]):
+                Image and thumbnail path of each task.
+            force_stop (Callable[[], bool]): Callback to stop early.
+
+        Returns:
+            list[Path]: Thumbnail paths holding their thumbnail.
+        """
+        pairs = [(Path(s), Path(t)) for s, t in pairs]
+        cached = self.generate([s for s, _ in pairs], force_stop)
+        installed = list()
+        for source, target in pairs:
+            thumbnail = cached.get(source)
+            if thumbnail is None:
+                continue
+            try:
+                if target.exists():
+                    if stat(target).st_mtime_ns == stat(thumbnail).st_mtime_ns:
+                        installed.append(target)
+                        continue
+                    remove(fspath(target))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                # copy2 keeps the mtime, which tells the copy is current
+                copy2(thumbnail, target)
+                installed.append(target)
+            except OSError as e:
+                logger.warning(f"Cannot copy thumbnail to {target}: {e}")
+        return installed
+
+    def remove_old_thumbnails(
+        self, max_age: float = MAX_THUMBNAIL_AGE, max_size: int = MAX_CACHE_SIZE
+    ) -> int:
+        """
+        Remove the thumbnails made `max_age` seconds ago, and the oldest ones
+        while the cache is larger than `max_size`. Removed thumbnails still
+        in use are made again when needed.
+
+        Args:
+            max_age (float): Age in seconds.
+            max_size (int): Size of the cache in bytes.
+
+        Returns:
+            int: Number of files removed.
+        """
+        limit = time() - max_age
+        files = list()
+        try:
+            with scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if entry.name.endswith(".jpg"):
+                        files.append((st.st_mtime, st.st_size, entry.path))
+                    elif entry.name.endswith(".tmp") and st.st_mtime < limit:
+                        # left by a worker that was stopped while writing
+                        files.append((st.st_mtime, 0, entry.path))
+        except OSError:
+            return 0
+        removed = 0
+        kept_size = 0
+        for mtime, size, path in sorted(files, reverse=True):
+            if mtime >= limit and kept_size + size <= max_size:
+                kept_size += size
+                continue
+            # older files are removed too, to keep the newest thumbnails
+            limit = float("inf")
+            try:
+                remove(path)
+                removed += 1
+            except OSError as e:
+                logger.debug(f"Cannot remove thumbnail {path}: {e}")
+        if removed:
+            logger.debug(f"Removed {removed} thumbnails from {self.cache_dir}")
+        return removed
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_default_pipeline: Optional[ThumbnailPipeline] = None
+_default_lock = Lock()
+
+
+def default_thumbnail_pipeline() -> ThumbnailPipeline:
+    """
+    Pipeline shared by the plugins, caching in GWAIO_DATA_PATH when set.
+    The old thumbnails of the cache are removed when it is created.
+
+    Returns:
+        ThumbnailPipeline: The shared pipeline.
+    """
+    global _default_pipeline
+    with _default_lock:
+        if _default_pipeline is None:
+            root = environ.get("GWAIO_DATA_PATH") or gettempdir()
+            _default_pipeline = ThumbnailPipeline(Path(root, "thumbnail_cache"))
+            _default_pipeline.remove_old_thumbnails()
+        return _default_pipeline
@@ -0,0 +1,309 @@
+"""
+version_index.py
+
+Index of the versions in a task folder. Finding the last file of a task
+used to walk the folder three or four times (the versioned files, the mtime
+fallback, the highest version number and the file by extension), often on
+the server share. A `VersionIndex` is built with a single walk and answers
+all those queries, and `VersionIndexCache` keeps one per folder until any
+of the scanned folders is modified. The changes reported by a folder
+watcher are applied to the cached indexes, so they don't need a new scan.
+"""
+
+from collections import OrderedDict
+from logging import getLogger
+from os import stat
+from os.path import getmtime
+from pathlib import Path
+from re import search, sub
+from threading import Lock
+from time import time_ns
+from typing import Callable, Hashable, Iterable, Optional
+
+logger = getLogger(__name__)
+
+# Folder mtimes this close to the scan may hide a later change on file systems
+# with coarse timestamps (FAT, some SMB servers), so those scans aren't reused
+MTIME_RESOLUTION_NS = 2_000_000_000
+
+
+def parse_version(version_regex: str, name: str) -> Optional[int]:
+    """
+    Version number in a file name, as the digits of the `version_regex` match.
+
+    Args:
+        version_regex (str): Regex matching the version tag, e.g. "_V\\d{3}".
+        name (str): File name.
+
+    Returns:
+        Optional[int]: The version number, or None if the name has none.
+    """
+    found = search(version_regex, name)
+    if found is None:
+        return None
+    digits = sub("[^0-9]", "", found.group())
+    return int(digits) if digits else None
+
+
+class VersionIndex:
+    """
+    Files of a task folder grouped by extension and version.
+
+    Attributes:
+        files (list[Path]): Files following the conventions, in scan order.
+        versions (dict[Path, Optional[int]]): Version number of each file.
+        by_version (dict[int, dict[str, list[Path]]]): Files by version and suffix.
+        max_version (int): Highest version number found, 0 if none.
+        visited (dict[str, int]): Modification time of each scanned folder.
+        status (str): How the scan ended, "complete" unless it was cut short,
+            in which case the index holds the files found until then.
+        name_filter (Optional[Callable[[str], bool]]): Names of the files the
+            scan kept, needed to apply file changes to the index.
+    """
+
+    def __init__(
+        self,
+        files: Iterable[Path],
+        version_regex: str,
+        visited: Optional[dict[str, int]] = None,
+        status: str = "complete",
+        name_filter: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        self.files = list(files)
+        self.visited = visited or dict()
+        self.status = status
+        self.version_regex = version_regex
+        self.name_filter = name_filter
+        self.built_at = time_ns()
+        # folders whose mtime was read when applying watched changes, which
+        # the watcher keeps reporting, so they don't need the resolution guard
+        self._applied: frozenset[str] = frozenset()
+        self.versions: dict[Path, Optional[int]] = dict()
+        self.by_version: dict[int, dict[str, list[Path]]] = dict()
+        self._by_suffix: dict[str, list[Path]] = dict()
+        for f in self.files:
+            version = parse_version(version_regex, f.name)
+            self.versions[f] = version
+            self._by_suffix.setdefault(f.suffix, []).append(f)
+            if version is not None:
+                self.by_version.setdefault(version, {}).setdefault(
+                    f.suffix, []
+                ).append(f)
+        self.max_version = max(self.by_version, default=0)
+
+    def is_current(self) -> bool:
+        """
+        Whether none of the scanned folders changed since the index was built.
+
+        Returns:
+            bool: False if a folder was modified, removed or never scanned,
+                or if the scan didn't complete.
+        """
+        if not self.visited or self.status != "complete":
+            return False
+        scanned = [m for f, m in self.visited.items() if f not in self._applied]
+        if scanned and self.built_at - max(scanned) < MTIME_RESOLUTION_NS:
+            return False
+        try:
+            return all(
+                stat(folder).st_mtime_ns == mtime
+                for folder, mtime in self.visited.items()
+            )
+        except OSError:
+            return False
+
+    def updated(self, events: Iterable[tuple[str, Path]]) -> Optional["VersionIndex"]:
+        """
+        New index with file changes applied, the folders they happened in
+        being read again only for their modification time. "modified"
+        changes are ignored, as the index only depends on the file names.
+
+        Args:
+            events (Iterable[tuple[str, Path]]): Kind ("added", "removed" or
+                "modified") and path of each change, such as `FileEvent`s.
+
+        Returns:
+            Optional[VersionIndex]: The new index, or None if the changes
+                can't be applied and the folder must be scanned again: the
+                index doesn't know its name filter, its scan didn't
+                complete, or a change is in a folder it didn't scan.
+        """
+        if self.name_filter is None or self.status != "complete":
+            return None
+        folders = {Path(folder): folder for folder in self.visited}
+        files = list(self.files)
+        known = set(files)
+        touched = set()
+        for kind, path in events:
+            if kind == "modified":
+                continue
+            folder = folders.get(path.parent)
+            if folder is None:
+                return None
+            touched.add(folder)
+            if kind == "added" and path not in known and self.name_filter(path.name):
+                files.append(path)
+                known.add(path)
+            elif kind == "removed" and path in known:
+                files.remove(path)
+                known.discard(path)
+        visited = dict(self.visited)
+        try:
+            for folder in touched:
+                visited[folder] = stat(folder).st_mtime_ns
+        except OSError:
+            return None
+        index = VersionIndex(
+            files, self.version_regex, visited, self.status, self.name_filter
+        )
+        index.built_at = self.built_at
+        index._applied = self._applied | touched
+        return index
+
+    def files_with_ext(self, extensions: Optional[frozenset[str]]) -> list[Path]:
+        """
+        Files with the given suffixes, in scan order.
+
+        Args:
+            extensions (Optional[frozenset[str]]): Suffixes, all files if None.
+
+        Returns:
+            list[Path]: The files.
+        """
+        if extensions is None:
+            return list(self.files)
+        if len(extensions) == 1:
+            return list(self._by_suffix.get(next(iter(extensions)), []))
+        return [f for f in self.files if f.suffix in extensions]
+
+    def last_version_file(
+        self, extensions: Optional[frozenset[str]], min_version: int = 0
+    ) -> Optional[Path]:
+        """
+        File with the highest version among the given suffixes. Of the files
+        sharing that version, the last one scanned is returned.
+
+        Args:
+            extensions (Optional[frozenset[str]]): Suffixes, all files if None.
+            min_version (int): Versions below this one are ignored.
+
+        Returns:
+            Optional[Path]: The file, or None if no file has a version.
+        """
+        last_version, last_file = None, None
+        for f in self.files_with_ext(extensions):
+            version = self.versions[f]
+            if version is None or version < min_version:
+                continue
+            if last_version is None or version >= last_version:
+                last_version, last_file = version, f
+        return last_file
+
+    def newest_file(self, extensions: Optional[frozenset[str]]) -> Optional[Path]:
+        """
+        Most recently modified file among the given suffixes. Modification
+        times are read on each call, as editing a file doesn't change the
+        folder's.
+
+        Args:
+            extensions (Optional[frozenset[str]]): Suffixes, all files if None.
+
+        Returns:
+            Optional[Path]: The file, or None if there are no files.
+        """
+        try:
+            return max(self.files_with_ext(extensions), key=getmtime, default=None)
+        except OSError:
+            return None
+
+
+class VersionIndexCache:
+    """
+    Thread safe LRU cache of version indexes, rebuilt when outdated.
+
+    Attributes:
+        max_size (int): Number of indexes kept.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self._indexes: "OrderedDict[Hashable, VersionIndex]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, build: Callable[[], VersionIndex]) -> VersionIndex:
+        """
+        Return the cached index for `key` if it is still current, or build it.
+
+        Args:
+            key (Hashable): Folder and scanning rules the index depends on.
+            build (Callable[[], VersionIndex]): Function scanning the folder.
+
+        Returns:
+            VersionIndex: The index.
+        """
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+        if index is not None and index.is_current():
+            return index
+        index = build()
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self.max_size:
+                self._indexes.popitem(last=False)
+        return index
+
+    def apply(self, events: Iterable[tuple[str, Path]]) -> None:
+        """
+        Apply file changes to the cached indexes covering them, dropping the
+        indexes they can't be applied to.
+
+        Args:
+            events (Iterable[tuple[str, Path]]): Kind and path of each change.
+        """
+        events = [(kind, Path(path)) for kind, path in events if kind != "modified"]
+        if not events:
+            return
+        with self._lock:
+            for key, index in list(self._indexes.items()):
+                roots = [Path(folder) for folder in index.visited]
+                relevant = [
+                    (kind, path)
+                    for kind, path in events
+                    if any(
+                        root == path.parent or root in path.parent.parents
+                        for root in roots
+                    )
+                ]
+                if not relevant:
+                    continue
+                new_index = index.updated(relevant)
+                if new_index is None:
+                    logger.debug(f"Dropping the version index of {key}")
+                    del self._indexes[key]
+                else:
+                    self._indexes[key] = new_index
+
+    def invalidate(self, folder: Optional[Path] = None) -> None:
+        """
+        Drop the cached indexes, or only those covering `folder`.
+
+        Args:
+            folder (Optional[Path]): Folder whose indexes are outdated.
+        """
+        with self._lock:
+            if folder is None:
+                self._indexes.clear()
+                return
+            folder = Path(folder)
+            for key in [
+                k
+                for k, index in self._indexes.items()
+                if any(
+                    folder == Path(f) or Path(f) in folder.parents
+                    for f in index.visited
+                )
+            ]:
+                del self._indexes[key]